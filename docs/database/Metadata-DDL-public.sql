@@ -49,6 +49,7 @@ DROP TABLE IF EXISTS public.batch;
 DROP TABLE IF EXISTS public.partner_catalog_part;
 DROP TABLE IF EXISTS public.catalog_part;
 DROP TABLE IF EXISTS public.twin_registration;
+DROP TABLE IF EXISTS public.twin_aspect_registration_job;
 DROP TABLE IF EXISTS public.twin_aspect_registration;
 DROP TABLE IF EXISTS public.twin_exchange;
 DROP TABLE IF EXISTS public.twin_aspect;
@@ -60,6 +61,9 @@ DROP TABLE IF EXISTS public.enablement_service_stack;
 DROP TABLE IF EXISTS public.legal_entity;
 DROP TABLE IF EXISTS public.pcf_exchanges;
 DROP TABLE IF EXISTS public.pcf_relationships;
+DROP TABLE IF EXISTS public.pcf_part_edges;
+DROP TABLE IF EXISTS public.pcf_rollups;
+DROP TABLE IF EXISTS public.notification_outbox;
 DROP TABLE IF EXISTS public.notifications;
 DROP TABLE IF EXISTS public.ccm_inbound_request;
 DROP TABLE IF EXISTS public.certificate_share;
@@ -70,6 +74,8 @@ DROP TABLE IF EXISTS public.ccm;
 DROP TABLE IF EXISTS ichub.edr_connections;
 DROP TABLE IF EXISTS ichub.known_connectors;
 DROP TABLE IF EXISTS ichub.known_dtrs;
+DROP TABLE IF EXISTS ichub.known_offers;
+DROP TABLE IF EXISTS ichub.discovery_tasks;
 
 --
 -- Name: edr_connections; Type: TABLE; Schema: ichub; Owner: ichub
@@ -94,7 +100,8 @@ ALTER TABLE ichub.edr_connections OWNER TO ichub;
 CREATE TABLE ichub.known_connectors (
     bpnl character varying NOT NULL,
     connectors json,
-    expires_at timestamp without time zone NOT NULL
+    expires_at timestamp without time zone NOT NULL,
+    updated_at timestamp without time zone NOT NULL DEFAULT now()
 );
 
 ALTER TABLE ichub.known_connectors OWNER TO ichub;
@@ -113,6 +120,33 @@ CREATE TABLE ichub.known_dtrs (
 
 ALTER TABLE ichub.known_dtrs OWNER TO ichub;
 
+--
+-- Name: known_offers; Type: TABLE; Schema: ichub; Owner: ichub
+--
+
+CREATE TABLE ichub.known_offers (
+    offer_id character varying NOT NULL,
+    offer_type character varying NOT NULL,
+    fingerprint character varying,
+    verified_at timestamp without time zone NOT NULL
+);
+
+ALTER TABLE ichub.known_offers OWNER TO ichub;
+
+--
+-- Name: discovery_tasks; Type: TABLE; Schema: ichub; Owner: ichub
+--
+
+CREATE TABLE ichub.discovery_tasks (
+    task_id character varying NOT NULL,
+    task json,
+    version integer NOT NULL,
+    expires_at timestamp without time zone NOT NULL,
+    updated_at timestamp without time zone NOT NULL DEFAULT now()
+);
+
+ALTER TABLE ichub.discovery_tasks OWNER TO ichub;
+
 
 CREATE TABLE public.batch (
     id integer NOT NULL,
@@ -208,6 +242,22 @@ CREATE TABLE public.twin_aspect_registration (
     modified_date timestamp without time zone DEFAULT (now() AT TIME ZONE 'utc'::text) NOT NULL
 );
 
+CREATE TABLE public.twin_aspect_registration_job (
+    id integer NOT NULL,
+    job_id uuid DEFAULT gen_random_uuid() NOT NULL,
+    twin_aspect_id integer NOT NULL,
+    enablement_service_stack_id integer NOT NULL,
+    payload json,
+    status character varying DEFAULT 'queued'::character varying NOT NULL,
+    attempts integer DEFAULT 0 NOT NULL,
+    next_attempt_date timestamp without time zone DEFAULT (now() AT TIME ZONE 'utc'::text) NOT NULL,
+    locked_by character varying,
+    locked_until timestamp without time zone,
+    last_error character varying,
+    created_date timestamp without time zone DEFAULT (now() AT TIME ZONE 'utc'::text) NOT NULL,
+    modified_date timestamp without time zone DEFAULT (now() AT TIME ZONE 'utc'::text) NOT NULL
+);
+
 CREATE TABLE public.notifications (
     id integer NOT NULL,
     created_date timestamp without time zone DEFAULT (now() AT TIME ZONE 'utc'::text) NOT NULL,
@@ -221,6 +271,24 @@ CREATE TABLE public.notifications (
     category character varying
 );
 
+CREATE TABLE public.notification_outbox (
+    id integer NOT NULL,
+    message_id uuid NOT NULL,
+    receiver_bpn character varying NOT NULL,
+    provider_dsp_url character varying,
+    endpoint_path character varying,
+    policies json,
+    dct_type character varying,
+    status character varying DEFAULT 'queued'::character varying NOT NULL,
+    attempts integer DEFAULT 0 NOT NULL,
+    next_attempt_date timestamp without time zone DEFAULT (now() AT TIME ZONE 'utc'::text) NOT NULL,
+    locked_by character varying,
+    locked_until timestamp without time zone,
+    last_error character varying,
+    created_date timestamp without time zone DEFAULT (now() AT TIME ZONE 'utc'::text) NOT NULL,
+    modified_date timestamp without time zone DEFAULT (now() AT TIME ZONE 'utc'::text) NOT NULL
+);
+
 CREATE TABLE public.pcf_exchanges (
     id integer NOT NULL,
     request_id uuid DEFAULT gen_random_uuid() NOT NULL,
@@ -245,6 +313,22 @@ CREATE TABLE public.pcf_relationships (
     list_sub_manufacturer_part_id json NOT NULL
 );
 
+CREATE TABLE public.pcf_part_edges (
+    id integer NOT NULL,
+    parent_manufacturer_part_id character varying NOT NULL,
+    child_manufacturer_part_id character varying NOT NULL,
+    quantity double precision NOT NULL DEFAULT 1,
+    created_at timestamp without time zone DEFAULT (now() AT TIME ZONE 'utc'::text) NOT NULL
+);
+
+CREATE TABLE public.pcf_rollups (
+    manufacturer_part_id character varying NOT NULL,
+    received_pcf double precision,
+    total_pcf double precision,
+    missing_parts integer NOT NULL DEFAULT 0,
+    updated_at timestamp without time zone DEFAULT (now() AT TIME ZONE 'utc'::text) NOT NULL
+);
+
 CREATE TABLE public.twin_exchange (
     twin_id integer NOT NULL,
     data_exchange_agreement_id integer NOT NULL,
@@ -376,6 +460,15 @@ ALTER TABLE public.notifications ALTER COLUMN id ADD GENERATED ALWAYS AS IDENTIT
     CACHE 1
 );
 
+ALTER TABLE public.notification_outbox ALTER COLUMN id ADD GENERATED ALWAYS AS IDENTITY (
+    SEQUENCE NAME public.notification_outbox_id_seq
+    START WITH 1
+    INCREMENT BY 1
+    NO MINVALUE
+    NO MAXVALUE
+    CACHE 1
+);
+
 ALTER TABLE public.pcf_exchanges ALTER COLUMN id ADD GENERATED ALWAYS AS IDENTITY (
     SEQUENCE NAME public.pcf_exchange_id_seq
     START WITH 1
@@ -394,6 +487,15 @@ ALTER TABLE public.pcf_relationships ALTER COLUMN id ADD GENERATED ALWAYS AS IDE
     CACHE 1
 );
 
+ALTER TABLE public.pcf_part_edges ALTER COLUMN id ADD GENERATED ALWAYS AS IDENTITY (
+    SEQUENCE NAME public.pcf_part_edge_id_seq
+    START WITH 1
+    INCREMENT BY 1
+    NO MINVALUE
+    NO MAXVALUE
+    CACHE 1
+);
+
 ALTER TABLE public.ccm ALTER COLUMN id ADD GENERATED ALWAYS AS IDENTITY (
     SEQUENCE NAME public.ccm_id_seq
     START WITH 1
@@ -545,6 +647,15 @@ ALTER TABLE public.twin_aspect ALTER COLUMN id ADD GENERATED ALWAYS AS IDENTITY
     CACHE 1
 );
 
+ALTER TABLE public.twin_aspect_registration_job ALTER COLUMN id ADD GENERATED ALWAYS AS IDENTITY (
+    SEQUENCE NAME public.twin_aspect_registration_job_id_seq
+    START WITH 1
+    INCREMENT BY 1
+    NO MINVALUE
+    NO MAXVALUE
+    CACHE 1
+);
+
 
 ALTER TABLE public.twin ALTER COLUMN id ADD GENERATED ALWAYS AS IDENTITY (
     SEQUENCE NAME public.twin_twin_id_seq
@@ -604,6 +715,9 @@ ALTER TABLE ONLY public.twin_aspect
 ALTER TABLE ONLY public.twin_aspect_registration
     ADD CONSTRAINT pk_twin_aspect_registration PRIMARY KEY (twin_aspect_id, enablement_service_stack_id);
 
+ALTER TABLE ONLY public.twin_aspect_registration_job
+    ADD CONSTRAINT pk_twin_aspect_registration_job PRIMARY KEY (id);
+
 ALTER TABLE ONLY public.twin_exchange
     ADD CONSTRAINT pk_twin_exchange PRIMARY KEY (data_exchange_agreement_id, twin_id);
 
@@ -613,6 +727,9 @@ ALTER TABLE ONLY public.twin_registration
 ALTER TABLE ONLY public.notifications
     ADD CONSTRAINT pk_notifications PRIMARY KEY (id);
 
+ALTER TABLE ONLY public.notification_outbox
+    ADD CONSTRAINT pk_notification_outbox PRIMARY KEY (id);
+
 ALTER TABLE ONLY public.pcf_exchanges
     ADD CONSTRAINT pk_pcf_exchanges PRIMARY KEY (id);
 ALTER TABLE ONLY public.pcf_exchanges
@@ -623,6 +740,14 @@ ALTER TABLE ONLY public.pcf_relationships
 ALTER TABLE ONLY public.pcf_relationships
     ADD CONSTRAINT uk_pcf_relationships_main_manufacturer_part_id UNIQUE (main_manufacturer_part_id);
 
+ALTER TABLE ONLY public.pcf_part_edges
+    ADD CONSTRAINT pk_pcf_part_edges PRIMARY KEY (id);
+ALTER TABLE ONLY public.pcf_part_edges
+    ADD CONSTRAINT uk_pcf_part_edges_parent_child UNIQUE (parent_manufacturer_part_id, child_manufacturer_part_id);
+
+ALTER TABLE ONLY public.pcf_rollups
+    ADD CONSTRAINT pk_pcf_rollups PRIMARY KEY (manufacturer_part_id);
+
 ALTER TABLE ONLY public.ccm
     ADD CONSTRAINT pk_ccm PRIMARY KEY (id);
 
@@ -690,6 +815,10 @@ ALTER TABLE ONLY public.twin_aspect
     ADD CONSTRAINT uk_twin_aspect_submodel_id UNIQUE (submodel_id);
 ALTER TABLE ONLY public.twin_aspect
     ADD CONSTRAINT uk_twin_aspect_twin_id_semantic_id UNIQUE (twin_id, semantic_id);
+ALTER TABLE ONLY public.twin_aspect_registration_job
+    ADD CONSTRAINT uk_twin_aspect_registration_job_job_id UNIQUE (job_id);
+ALTER TABLE ONLY public.notification_outbox
+    ADD CONSTRAINT uk_notification_outbox_message_id UNIQUE (message_id);
 
 
 CREATE INDEX idx_batch_batch_id ON public.batch USING btree (batch_id) WITH (deduplicate_items='true');
@@ -722,6 +851,8 @@ CREATE INDEX idx_twin_aspect_registration_created_date ON public.twin_aspect_reg
 CREATE INDEX idx_twin_aspect_registration_modified_date ON public.twin_aspect_registration USING btree (modified_date) WITH (deduplicate_items='true');
 CREATE INDEX idx_twin_aspect_registration_status ON public.twin_aspect_registration USING btree (status);
 CREATE INDEX idx_twin_aspect_registration_registration_mode ON public.twin_aspect_registration USING btree (registration_mode);
+CREATE INDEX idx_twin_aspect_registration_job_twin_aspect_id ON public.twin_aspect_registration_job USING btree (twin_aspect_id);
+CREATE INDEX idx_twin_aspect_registration_job_status_next_attempt_date ON public.twin_aspect_registration_job USING btree (status, next_attempt_date);
 
 CREATE INDEX idx_twin_aspect_semantic_id ON public.twin_aspect USING btree (semantic_id) WITH (deduplicate_items='true');
 CREATE INDEX idx_twin_aspect_twin_id ON public.twin_aspect USING btree (twin_id);
@@ -734,6 +865,9 @@ CREATE INDEX idx_twin_exchange_twin_id ON public.twin_exchange USING btree (twin
 
 CREATE INDEX idx_twin_registration_dtr_registered ON public.twin_registration USING btree (dtr_registered);
 
+CREATE INDEX idx_notification_outbox_receiver_bpn ON public.notification_outbox USING btree (receiver_bpn);
+CREATE INDEX idx_notification_outbox_status_next_attempt_date ON public.notification_outbox USING btree (status, next_attempt_date);
+
 CREATE INDEX idx_pcf_exchanges_request_id ON public.pcf_exchanges USING btree (request_id);
 CREATE INDEX idx_pcf_exchanges_direction ON public.pcf_exchanges USING btree (direction);
 CREATE INDEX idx_pcf_exchanges_status ON public.pcf_exchanges USING btree (status);
@@ -745,6 +879,8 @@ CREATE INDEX idx_pcf_exchanges_correlation_id ON public.pcf_exchanges USING btre
 CREATE INDEX idx_pcf_exchanges_version ON public.pcf_exchanges USING btree (version);
 
 CREATE INDEX idx_pcf_relationships_main_manufacturer_part_id ON public.pcf_relationships USING btree (main_manufacturer_part_id);
+CREATE INDEX idx_pcf_part_edges_parent_manufacturer_part_id ON public.pcf_part_edges USING btree (parent_manufacturer_part_id);
+CREATE INDEX idx_pcf_part_edges_child_manufacturer_part_id ON public.pcf_part_edges USING btree (child_manufacturer_part_id);
 
 CREATE INDEX idx_ccm_bpnl ON public.ccm USING btree (bpnl);
 CREATE INDEX idx_ccm_certificate_type ON public.ccm USING btree (certificate_type);
@@ -825,6 +961,10 @@ ALTER TABLE ONLY public.twin_aspect_registration
     ADD CONSTRAINT fk_twin_aspect_registration_twin_aspect_id FOREIGN KEY (twin_aspect_id) REFERENCES public.twin_aspect(id) ON UPDATE RESTRICT ON DELETE RESTRICT;
 ALTER TABLE ONLY public.twin_aspect_registration
     ADD CONSTRAINT fk_twin_aspect_registration_enablement_service_stack_id FOREIGN KEY (enablement_service_stack_id) REFERENCES public.enablement_service_stack(id) ON UPDATE RESTRICT ON DELETE RESTRICT;
+ALTER TABLE ONLY public.twin_aspect_registration_job
+    ADD CONSTRAINT fk_twin_aspect_registration_job_twin_aspect_id FOREIGN KEY (twin_aspect_id) REFERENCES public.twin_aspect(id) ON UPDATE RESTRICT ON DELETE RESTRICT;
+ALTER TABLE ONLY public.twin_aspect_registration_job
+    ADD CONSTRAINT fk_twin_aspect_registration_job_enablement_service_stack_id FOREIGN KEY (enablement_service_stack_id) REFERENCES public.enablement_service_stack(id) ON UPDATE RESTRICT ON DELETE RESTRICT;
 
 ALTER TABLE ONLY public.twin_exchange
     ADD CONSTRAINT fk_twin_exchange_data_exchange_agreement_id FOREIGN KEY (data_exchange_agreement_id) REFERENCES public.data_exchange_agreement(id) ON UPDATE RESTRICT ON DELETE RESTRICT;
@@ -855,10 +995,13 @@ ALTER SEQUENCE public.legal_entity_id_seq RESTART WITH 1;
 ALTER SEQUENCE public.part_share_id_seq RESTART WITH 1;
 ALTER SEQUENCE public.serialized_part_id_seq RESTART WITH 1;
 ALTER SEQUENCE public.twin_aspect_id_seq RESTART WITH 1;
+ALTER SEQUENCE public.twin_aspect_registration_job_id_seq RESTART WITH 1;
 ALTER SEQUENCE public.twin_twin_id_seq RESTART WITH 1;
 ALTER SEQUENCE public.notifications_id_seq RESTART WITH 1;
+ALTER SEQUENCE public.notification_outbox_id_seq RESTART WITH 1;
 ALTER SEQUENCE public.pcf_exchange_id_seq RESTART WITH 1;
 ALTER SEQUENCE public.pcf_relationship_id_seq RESTART WITH 1;
+ALTER SEQUENCE public.pcf_part_edge_id_seq RESTART WITH 1;
 ALTER SEQUENCE public.ccm_id_seq RESTART WITH 1;
 ALTER SEQUENCE public.ccm_site_id_seq RESTART WITH 1;
 ALTER SEQUENCE public.certificate_share_id_seq RESTART WITH 1;
@@ -882,4 +1025,14 @@ ALTER TABLE ONLY ichub.known_connectors
     ADD CONSTRAINT pk_known_connectors PRIMARY KEY (bpnl);
 
 ALTER TABLE ONLY ichub.known_dtrs
-    ADD CONSTRAINT pk_known_dtrs PRIMARY KEY (bpnl);
+    ADD CONSTRAINT pk_known_dtrs PRIMARY KEY (bpnl, asset_id);
+
+ALTER TABLE ONLY ichub.known_offers
+    ADD CONSTRAINT pk_known_offers PRIMARY KEY (offer_id);
+
+CREATE INDEX idx_known_offers_offer_type ON ichub.known_offers USING btree (offer_type);
+
+ALTER TABLE ONLY ichub.discovery_tasks
+    ADD CONSTRAINT pk_discovery_tasks PRIMARY KEY (task_id);
+
+CREATE INDEX idx_discovery_tasks_expires_at ON ichub.discovery_tasks USING btree (expires_at);
@@ -25,11 +25,14 @@ from tractusx_sdk.dataspace.services.discovery import ConnectorDiscoveryService,
 from tractusx_sdk.dataspace.services.connector import ServiceFactory, BaseConnectorService
 from database import engine, wait_for_db_connection
 from managers.enablement_services import ConnectorManager
-from managers.enablement_services.provider import ConnectorProviderManager
+from managers.enablement_services.provider import ConnectorProviderManager, KnownOfferCache, KnownOfferPostgresCache
 from managers.config.config_manager import ConfigManager
 from tractusx_sdk.dataspace.managers import OAuth2Manager
+from tools.exceptions import NotAvailableError
+from utils.service_container import ServiceContainer, ServiceProxy
 
 from managers.enablement_services.consumer import ConsumerConnectorSyncPostgresMemoryManager
+from typing import Any, Dict
 import logging
 
 logger = logging.getLogger("connector")
@@ -37,23 +40,68 @@ logger.setLevel(logging.INFO)
 
 """
 Currently only one connector is supported from consumer/provider side.
+
+The clients are created in the background by the service container when the application starts,
+the module level names below resolve them when they are used.
 """
-connector_start_up_error:bool = False
-connection_manager:PostgresMemoryRefreshConnectionManager = None
-connector_manager:ConnectorManager = None
-provider_connector_service:BaseConnectorService = None
-consumer_connector_service:BaseConnectorService = None
-connector_provider_manager:ConnectorProviderManager = None
-connector_consumer_manager:ConsumerConnectorSyncPostgresMemoryManager = None
-connector_discovery_service:ConnectorDiscoveryService = None
-discovery_finder_service:DiscoveryFinderService = None
-discovery_oauth:OAuth2Manager = None
-database_error:bool = False
-
-try:
-
-    # If the database is not ready, the backend should wait until the PostgreSQL service is fully available and accepting connections 
-    wait_for_db_connection()
+connection_manager:PostgresMemoryRefreshConnectionManager = ServiceProxy("connector", "connection_manager")
+connector_manager:ConnectorManager = ServiceProxy("connector", "connector_manager")
+provider_connector_service:BaseConnectorService = ServiceProxy("connector", "provider_connector_service")
+consumer_connector_service:BaseConnectorService = ServiceProxy("connector", "consumer_connector_service")
+connector_provider_manager:ConnectorProviderManager = ServiceProxy("connector", "connector_provider_manager")
+connector_consumer_manager:ConsumerConnectorSyncPostgresMemoryManager = ServiceProxy("connector", "connector_consumer_manager")
+connector_discovery_service:ConnectorDiscoveryService = ServiceProxy("discovery", "connector_discovery_service")
+discovery_finder_service:DiscoveryFinderService = ServiceProxy("discovery", "discovery_finder_service")
+discovery_oauth:OAuth2Manager = ServiceProxy("discovery", "discovery_oauth")
+
+
+def init_database() -> bool:
+    # If the database is not ready, the backend should wait until the PostgreSQL service is fully available and accepting connections
+    return wait_for_db_connection()
+
+
+def init_discovery() -> Dict[str, Any]:
+    """
+    Connect to the IAM instance used for the consumer discovery and create the discovery services.
+    """
+    try:
+        discovery_oauth = OAuth2Manager(
+            auth_url=ConfigManager.get_config("consumer.discovery.oauth.url"),
+            realm=ConfigManager.get_config("consumer.discovery.oauth.realm"),
+            clientid=ConfigManager.get_config("consumer.discovery.oauth.client_id"),
+            clientsecret=ConfigManager.get_config("consumer.discovery.oauth.client_secret"),
+        )
+    except ConnectionError as ce:
+        raise ConnectionError(f"Failed to connect to the IAM instance for consumer discovery: {ce}") from ce
+    except Exception as e:
+        raise RuntimeError(f"An unexpected error occurred while setting up OAuth2Manager for consumer discovery: {e}") from e
+
+    if not discovery_oauth.connected:
+        raise ConnectionError("OAuth2Manager is not connected. Cannot initialize ConnectorDiscoveryService.")
+
+    discovery_finder_service = DiscoveryFinderService(
+        url=ConfigManager.get_config("consumer.discovery.discovery_finder.url"),
+        oauth=discovery_oauth
+    )
+
+    return {
+        "discovery_oauth": discovery_oauth,
+        "discovery_finder_service": discovery_finder_service,
+        # Create the connector discovery service for the consumer
+        "connector_discovery_service": ConnectorDiscoveryService(
+            oauth=discovery_oauth,
+            discovery_finder_service=discovery_finder_service
+        )
+    }
+
+
+def init_connector() -> Dict[str, Any]:
+    """
+    Create the provider and consumer connector managers. Runs once the database is available.
+    """
+    database_error:bool = False
+    provider_connector_service:BaseConnectorService = None
+    connector_provider_manager:ConnectorProviderManager = None
 
     # Create the connection manager for the provider
     connection_manager = PostgresMemoryRefreshConnectionManager(engine=engine, logger=logger, verbose=True)
@@ -107,6 +155,16 @@ try:
         "Content-Type": "application/json"
     }
 
+    # Cache of the offers already verified in the EDC, persisted to be shared with the asset sync job
+    known_offers_ttl = ConfigManager.get_config("provider.connector.known_offers.ttl_seconds", default=300)
+    known_offer_cache = KnownOfferCache(enabled=ConfigManager.get_config("provider.connector.known_offers.enabled", default=True), ttl_seconds=known_offers_ttl)
+    if(not database_error and known_offer_cache.enabled and ConfigManager.get_config("provider.connector.known_offers.persist", default=False)):
+        known_offer_cache = KnownOfferPostgresCache(
+            engine=engine,
+            table_name=ConfigManager.get_config("provider.connector.known_offers.table_name", default="known_offers"),
+            ttl_seconds=known_offers_ttl
+        )
+
     if(not database_error):
         # Create the connector provider service
         provider_connector_service:BaseConnectorService = ServiceFactory.get_connector_provider_service(
@@ -130,45 +188,10 @@ try:
             dataspace_version=provider_dataspace_version,
             submodel_mode=submodel_mode,
             submodel_asset_headers=submodel_asset_headers,
+            known_offer_cache=known_offer_cache,
         )
     
     
-    discovery_oauth:OAuth2Manager = None
-
-    try:
-        discovery_oauth = OAuth2Manager(
-            auth_url=ConfigManager.get_config("consumer.discovery.oauth.url"),
-            realm=ConfigManager.get_config("consumer.discovery.oauth.realm"),
-            clientid=ConfigManager.get_config("consumer.discovery.oauth.client_id"),
-            clientsecret=ConfigManager.get_config("consumer.discovery.oauth.client_secret"),
-        )
-    except ConnectionError as ce:
-        logger.critical(f"Failed to connect to the IAM instance for consumer discovery: {ce}")
-        connector_start_up_error = True
-    except Exception as e:
-        logger.critical(f"An unexpected error occurred while setting up OAuth2Manager for consumer discovery: {e}")
-        connector_start_up_error = True
-
-    connector_discovery_service: ConnectorDiscoveryService = None
-    discovery_finder_service: DiscoveryFinderService = None
-
-    
-    if discovery_oauth is not None and discovery_oauth.connected:
-
-        discovery_finder_service = DiscoveryFinderService(
-            url=ConfigManager.get_config("consumer.discovery.discovery_finder.url"),
-            oauth=discovery_oauth
-        )
-
-        # Create the connector discovery service for the consumer
-        connector_discovery_service = ConnectorDiscoveryService(
-            oauth=discovery_oauth,
-            discovery_finder_service=discovery_finder_service
-        )
-    else:
-        logger.critical("OAuth2Manager is not connected. Cannot initialize ConnectorDiscoveryService. The application will not function correctly.")
-        connector_start_up_error = True
-
     consumer_connector_controlplane_hostname = ConfigManager.get_config("consumer.connector.controlplane.hostname")
     consumer_connector_controlplane_management_api = ConfigManager.get_config("consumer.connector.controlplane.managementPath")
     consumer_api_key_header = ConfigManager.get_config("consumer.connector.controlplane.apiKeyHeader")
@@ -195,8 +218,13 @@ try:
     connector_consumer_manager = ConsumerConnectorSyncPostgresMemoryManager(
         connector_consumer_service=consumer_connector_service,
         engine=engine,
-        connector_discovery=connector_discovery_service,
+        connector_discovery=_get_connector_discovery_service(),
         expiration_time=60,  # 60 minutes cache expiration
+        persist_interval=ConfigManager.get_config("consumer.connector.cache.persist_interval", default=5),
+        full_reload_interval=ConfigManager.get_config("consumer.connector.cache.full_reload_interval", default=300),
+        notify_channel=ConfigManager.get_config("consumer.connector.cache.notify.channel", default="ichub_known_connectors") if ConfigManager.get_config("consumer.connector.cache.notify.enabled", default=False) else None,
+        stale_while_revalidate=bool(ConfigManager.get_config("consumer.discovery.single_flight.stale_while_revalidate", default=False)),
+        discovery_timeout=float(ConfigManager.get_config("consumer.discovery.single_flight.timeout", default=60)),
         logger=logger,
         verbose=True
     )
@@ -206,8 +234,26 @@ try:
         connector_consumer_manager=connector_consumer_manager,
         connector_provider_manager=connector_provider_manager
     )
-    
-except Exception as e:
-    logger.critical(f"An unexpected error occurred during connector setup: {e}")
-    connector_start_up_error = True
-    
\ No newline at end of file
+
+    return {
+        "connection_manager": connection_manager,
+        "connector_manager": connector_manager,
+        "provider_connector_service": provider_connector_service,
+        "consumer_connector_service": consumer_connector_service,
+        "connector_provider_manager": connector_provider_manager,
+        "connector_consumer_manager": connector_consumer_manager
+    }
+
+
+def _get_connector_discovery_service() -> ConnectorDiscoveryService:
+    try:
+        return ServiceContainer.get_instance().get("discovery")["connector_discovery_service"]
+    except NotAvailableError as e:
+        logger.critical(f"Cannot initialize ConnectorDiscoveryService, the consumer connector discovery will not work: {e}")
+        return None
+
+
+_container = ServiceContainer.get_instance()
+_container.register("database", init_database)
+_container.register("discovery", init_discovery)
+_container.register("connector", init_connector, depends_on=("database",), wait_for=("discovery",))
@@ -33,11 +33,35 @@ import os
 from tools.exceptions import BaseError
 from tools.constants import API_V1
 from managers.config.config_manager import ConfigManager
+from managers.enablement_services.consumer.connector_delivery import ConnectorDelivery
+from managers.enablement_services.consumer.dtr.shell_descriptor_fetcher import ShellDescriptorFetcher
+from managers.enablement_services.consumer.cache_refresh_scheduler import CacheRefreshScheduler
+from managers.enablement_services.submodel_service_manager import SubmodelServiceManager
+from services.notifications.notification_outbox_dispatcher import NotificationOutboxDispatcher
+from services.provider.aspect_registration_worker import AspectRegistrationWorker
+from utils.async_utils import shutdown_executors
+from utils.service_container import ServiceContainer
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Application lifespan handler. Asset registration is handled by the Kubernetes asset-sync Job."""
+    """
+    Application lifespan handler. The database, connector, DTR and IAM clients are started in the
+    background so the server accepts requests right away, see /ready. Asset registration is handled
+    by the Kubernetes asset-sync Job.
+    """
+    ServiceContainer.get_instance().start()
+    if ConfigManager.get_config("provider.twinManagement.aspectQueue.in_process", default=True):
+        AspectRegistrationWorker.get_instance().start()
+    if ConfigManager.get_config("provider.notificationOutbox.in_process", default=True):
+        NotificationOutboxDispatcher.get_instance().start()
     yield
+    NotificationOutboxDispatcher.shutdown_instance()
+    AspectRegistrationWorker.shutdown_instance()
+    CacheRefreshScheduler.shutdown_instance()
+    ShellDescriptorFetcher.shutdown_instance()
+    ConnectorDelivery.shutdown_instance()
+    SubmodelServiceManager.shutdown_instances()
+    shutdown_executors()
 
 from tractusx_sdk.dataspace.tools import op
 
@@ -197,7 +221,9 @@ app.include_router(v1_router)
 metrics_enabled = ConfigManager.get_config("metrics.enabled", False)
 if metrics_enabled:
     from prometheus_fastapi_instrumentator import Instrumentator
+    from utils.metrics_utils import register_runtime_metrics
 
+    register_runtime_metrics()
     metrics_endpoint = ConfigManager.get_config("metrics.endpoint", "/metrics")
     Instrumentator().instrument(app).expose(
         app,
@@ -292,3 +318,15 @@ def check_health():
         "status": "RUNNING",
         "timestamp": op.timestamp() 
     }
+
+@app.get("/ready")
+def check_readiness():
+    """
+    Retrieves readiness information from the server and each one of the clients it depends on
+
+    Returns:
+        response: :obj:`status, services, timestamp`, with status code 503 until all the critical clients are ready
+    """
+    readiness = ServiceContainer.get_instance().get_status()
+    readiness["timestamp"] = op.timestamp()
+    return JSONResponse(status_code=200 if readiness["status"] == "READY" else 503, content=readiness)
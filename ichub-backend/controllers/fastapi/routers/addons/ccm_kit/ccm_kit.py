@@ -26,11 +26,20 @@ from fastapi import APIRouter, Depends
 from .v1 import certificates, notifications, consumer, provider
 
 from controllers.fastapi.routers.authentication.auth_api import get_authentication_dependency
+from utils.service_container import ServiceContainer, require_service
+
+
+def _init_ccm_kit() -> None:
+    # The certificates are stored in the database and exchanged through the connector, nothing else to set up
+    return None
+
+
+ServiceContainer.get_instance().register("ccm_kit", _init_ccm_kit, depends_on=("database",), wait_for=("connector",), critical=False, lazy=True)
 
 router = APIRouter(
     prefix="/ccm-kit",
     tags=["Company Certificate Management"],
-    dependencies=[Depends(get_authentication_dependency())]
+    dependencies=[Depends(get_authentication_dependency()), Depends(require_service("ccm_kit"))]
 )
 router.include_router(certificates.router)
 router.include_router(notifications.router)
@@ -39,6 +39,7 @@ from models.services.addons.ccm_kit.v1 import (
     UploadCertificateResponse,
 )
 from tools.exceptions import exception_responses
+from utils.async_utils import run_in_executor, DB_EXECUTOR
 
 router = APIRouter(
     prefix="/certificates",
@@ -71,7 +72,7 @@ async def list_certificates(
     offset: int = Query(default=0, ge=0, description="Pagination offset."),
     limit: int = Query(default=100, ge=1, le=1000, description="Maximum records to return."),
 ) -> List[CertificateListItem]:
-    return certificates_manager.list_certificates(
+    return await run_in_executor(DB_EXECUTOR, certificates_manager.list_certificates,
         bpnl=bpnl,
         certificate_type=certificate_type,
         offset=offset,
@@ -89,7 +90,7 @@ async def list_certificates(
     ),
 )
 async def get_certificate(certificate_id: int) -> CertificateDetail:
-    return certificates_manager.get_certificate(certificate_id)
+    return await run_in_executor(DB_EXECUTOR, certificates_manager.get_certificate, certificate_id)
 
 @router.post(
     "/",
@@ -169,7 +170,7 @@ async def upload_certificate(
         )
         raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=detail)
 
-    return certificates_manager.upload_certificate(
+    return await run_in_executor(DB_EXECUTOR, certificates_manager.upload_certificate,
         file_content=file_content,
         file_name=file.filename,
         metadata=metadata,
@@ -221,7 +222,7 @@ async def update_certificate(
         sites=sites,
         description=description,
     )
-    return certificates_manager.update_certificate(certificate_id, update_data)
+    return await run_in_executor(DB_EXECUTOR, certificates_manager.update_certificate, certificate_id, update_data)
 
 @router.delete(
     "/{certificate_id}",
@@ -234,5 +235,5 @@ async def update_certificate(
     ),
 )
 async def delete_certificate(certificate_id: int) -> JSONResponse:
-    certificates_manager.delete_certificate(certificate_id)
+    await run_in_executor(DB_EXECUTOR, certificates_manager.delete_certificate, certificate_id)
     return JSONResponse(status_code=status.HTTP_204_NO_CONTENT, content=None)
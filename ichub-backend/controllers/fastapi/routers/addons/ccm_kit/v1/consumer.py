@@ -36,7 +36,6 @@ Implements the consumer operations for the PULL flow:
 - ``GET  /consumer/requests/{id}``       — detail for one outbound request
 """
 
-import asyncio
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
@@ -59,6 +58,7 @@ from models.services.addons.ccm_kit.v1.notifications import (
 )
 from services.addons.ccm_kit.v1.ccm_consumer_service import ccm_consumer_service
 from tools.exceptions import InvalidError
+from utils.async_utils import run_in_executor, DB_EXECUTOR, IO_EXECUTOR
 
 logger = LoggingManager.get_logger(__name__)
 
@@ -83,7 +83,7 @@ async def catalog_search(request: CcmCatalogSearchRequest) -> CcmCatalogSearchRe
     CCM notification API before attempting to send a request or status.
     """
     try:
-        return await asyncio.to_thread(ccm_consumer_service.search_catalog, request)
+        return await run_in_executor(IO_EXECUTOR, ccm_consumer_service.search_catalog, request)
     except Exception as e:
         logger.exception("Unhandled error in catalog_search endpoint")
         return CcmCatalogSearchResult(
@@ -106,7 +106,7 @@ async def send_certificate_request(payload: CcmSendRequestPayload) -> CcmSendRes
     specific certificate identified by ``certifiedBpn`` and ``certificateType``.
     """
     try:
-        result = await asyncio.to_thread(ccm_consumer_service.send_certificate_request, payload, payload.sender_bpn)
+        result = await run_in_executor(IO_EXECUTOR, ccm_consumer_service.send_certificate_request, payload, payload.sender_bpn)
         return result
     except HTTPException:
         raise
@@ -129,7 +129,7 @@ async def send_certificate_status(payload: CcmSendStatusPayload) -> CcmSendResul
     provider.
     """
     try:
-        result = await asyncio.to_thread(ccm_consumer_service.send_certificate_status, payload, payload.sender_bpn)
+        result = await run_in_executor(IO_EXECUTOR, ccm_consumer_service.send_certificate_status, payload, payload.sender_bpn)
         return result
     except InvalidError as e:
         raise HTTPException(status_code=409, detail=str(e))
@@ -154,7 +154,7 @@ async def pull_certificate(request: CcmPullRequest) -> CcmPullResult:
     embedded BusinessPartnerCertificate payload via the data plane.
     """
     try:
-        return await asyncio.to_thread(ccm_consumer_service.pull_certificate, request)
+        return await run_in_executor(IO_EXECUTOR, ccm_consumer_service.pull_certificate, request)
     except Exception as e:
         logger.exception("Unhandled error in pull_certificate endpoint")
         raise HTTPException(status_code=500, detail=str(e))
@@ -188,7 +188,7 @@ async def list_received(
     to retrieve the full certificate payload including the PDF.
     """
     try:
-        return ccm_consumer_service.list_received(
+        return await run_in_executor(DB_EXECUTOR, ccm_consumer_service.list_received,
             certified_bpn=certified_bpn,
             certificate_type=certificate_type,
             offset=offset,
@@ -220,7 +220,7 @@ async def get_received(
     together with the ``providerBpn`` (which form a unique pair).
     """
     try:
-        result = ccm_consumer_service.get_received_by_document_id(
+        result = await run_in_executor(DB_EXECUTOR, ccm_consumer_service.get_received_by_document_id,
             document_id, provider_bpn,
         )
         if result is None:
@@ -270,7 +270,7 @@ async def list_requests(
     combination.
     """
     try:
-        return ccm_consumer_service.list_requests(
+        return await run_in_executor(DB_EXECUTOR, ccm_consumer_service.list_requests,
             provider_bpn=provider_bpn,
             certified_bpn=certified_bpn,
             certificate_type=certificate_type,
@@ -313,7 +313,7 @@ async def list_request_history(
     to a single certificate of interest.
     """
     try:
-        return ccm_consumer_service.list_request_history(
+        return await run_in_executor(DB_EXECUTOR, ccm_consumer_service.list_request_history,
             provider_bpn=provider_bpn,
             certified_bpn=certified_bpn,
             certificate_type=certificate_type,
@@ -335,7 +335,7 @@ async def get_request(request_id: int) -> OutboundRequestItem:
     Return the detail for a single outbound certificate request.
     """
     try:
-        result = ccm_consumer_service.get_request(request_id)
+        result = await run_in_executor(DB_EXECUTOR, ccm_consumer_service.get_request, request_id)
         if result is None:
             raise HTTPException(status_code=404, detail="Outbound request not found.")
         return result
@@ -34,7 +34,6 @@ Inbound notification endpoints for both PULL-flow and PUSH-flow:
 
 from fastapi import APIRouter, Depends
 from fastapi.responses import JSONResponse
-import asyncio
 
 from controllers.fastapi.routers.authentication.auth_api import (
     get_authentication_dependency,
@@ -50,6 +49,7 @@ from services.addons.ccm_kit.v1.ccm_notification_service import (
     ccm_notification_service,
 )
 from tools.constants import INTERNAL_SERVER_ERROR
+from utils.async_utils import run_in_executor, IO_EXECUTOR
 
 logger = LoggingManager.get_logger(__name__)
 
@@ -71,7 +71,7 @@ async def certificate_request(notification: CcmRequestNotification) -> JSONRespo
     and a push delivery is initiated asynchronously.
     """
     try:
-        status_code, body = await asyncio.to_thread(ccm_notification_service.process_certificate_request, notification)
+        status_code, body = await run_in_executor(IO_EXECUTOR, ccm_notification_service.process_certificate_request, notification)
         return JSONResponse(status_code=status_code, content=body)
     except Exception as e:
         logger.exception("Unhandled error in certificate_request endpoint")
@@ -89,7 +89,7 @@ async def update_certificate_status(notification: CcmStatusNotification) -> JSON
     pushed certificate (RECEIVED, ACCEPTED, or REJECTED).
     """
     try:
-        status_code, body = await asyncio.to_thread(ccm_notification_service.update_certificate_status, notification)
+        status_code, body = await run_in_executor(IO_EXECUTOR, ccm_notification_service.update_certificate_status, notification)
         return JSONResponse(status_code=status_code, content=body)
     except Exception as e:
         logger.exception("Unhandled error in update_certificate_status endpoint")
@@ -107,7 +107,7 @@ async def certificate_push(notification: CcmPushNotification) -> JSONResponse:
     Base64-encoded document) via the CX-0135 PUSH mechanism.
     """
     try:
-        status_code, body = await asyncio.to_thread(ccm_notification_service.process_certificate_push, notification)
+        status_code, body = await run_in_executor(IO_EXECUTOR, ccm_notification_service.process_certificate_push, notification)
         return JSONResponse(status_code=status_code, content=body)
     except Exception as e:
         logger.exception("Unhandled error in certificate_push endpoint")
@@ -125,7 +125,7 @@ async def certificate_available(notification: CcmAvailableNotification) -> JSONR
     retrieval via the EDC catalog.
     """
     try:
-        status_code, body = ccm_notification_service.process_certificate_available(
+        status_code, body = await run_in_executor(IO_EXECUTOR, ccm_notification_service.process_certificate_available,
             notification
         )
         return JSONResponse(status_code=status_code, content=body)
@@ -37,9 +37,8 @@ to initiate outbound operations towards a consumer:
 
 from typing import Dict, List, Optional
 
-import asyncio
-from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 
 from controllers.fastapi.routers.authentication.auth_api import (
     get_authentication_dependency,
@@ -56,6 +55,7 @@ from models.services.addons.ccm_kit.v1.notifications import (
     ShareItem,
 )
 from services.addons.ccm_kit.v1.ccm_provider_service import ccm_provider_service
+from utils.async_utils import run_in_executor, DB_EXECUTOR, IO_EXECUTOR
 
 logger = LoggingManager.get_logger(__name__)
 
@@ -80,7 +80,7 @@ async def push_certificate(request: CcmPushRequest) -> CcmSendResult:
     ``/companycertificate/push`` notification endpoint via the EDC.
     """
     try:
-        return await asyncio.to_thread(ccm_provider_service.push_certificate, request, request.sender_bpn)
+        return await run_in_executor(IO_EXECUTOR, ccm_provider_service.push_certificate, request, request.sender_bpn)
     except Exception as e:
         logger.exception("Unhandled error in push_certificate endpoint")
         return CcmSendResult(success=False, error=str(e))
@@ -101,7 +101,7 @@ async def send_certificate_available(
     in the provider's EDC catalog and can be retrieved via the PULL mechanism.
     """
     try:
-        return await asyncio.to_thread(ccm_provider_service.send_certificate_available, request, request.sender_bpn)
+        return await run_in_executor(IO_EXECUTOR, ccm_provider_service.send_certificate_available, request, request.sender_bpn)
     except Exception as e:
         logger.exception(
             "Unhandled error in send_certificate_available endpoint"
@@ -125,7 +125,7 @@ async def publish_certificate(request: CcmPublishRequest) -> CcmPublishResult:
     CX-0135 PULL mechanism.
     """
     try:
-        result = await asyncio.to_thread(ccm_provider_service.publish_certificate, request.certificate_id)
+        result = await run_in_executor(IO_EXECUTOR, ccm_provider_service.publish_certificate, request.certificate_id)
         return CcmPublishResult(**result)
     except Exception as e:
         logger.exception("Unhandled error in publish_certificate endpoint")
@@ -136,16 +136,24 @@ async def publish_certificate(request: CcmPublishRequest) -> CcmPublishResult:
     "/certificates/{certificate_id}/payload",
     summary="Serve certificate payload for the EDC data plane",
 )
-async def get_certificate_payload(certificate_id: int) -> JSONResponse:
+async def get_certificate_payload(
+    certificate_id: int,
+    if_none_match: Optional[str] = Header(default=None),
+) -> Response:
     """
     Return the full ``BusinessPartnerCertificate`` JSON payload for the given
     certificate.  This endpoint is the ``baseUrl`` embedded in the certificate's
     EDC asset DataAddress; the EDC data plane calls it when a consumer pulls
     the asset via the CX-0135 PULL mechanism.
+
+    The body is streamed and carries an ``ETag``; a request with a matching
+    ``If-None-Match`` header is answered with 304 Not Modified.
     """
     try:
-        payload = ccm_provider_service.get_certificate_payload(certificate_id)
-        return JSONResponse(content=payload)
+        etag, chunks = await run_in_executor(DB_EXECUTOR, ccm_provider_service.stream_certificate_payload, certificate_id)
+        if if_none_match and etag in [tag.strip() for tag in if_none_match.split(",")]:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+        return StreamingResponse(chunks, media_type="application/json", headers={"ETag": etag})
     except Exception as e:
         logger.exception("Unhandled error in get_certificate_payload endpoint")
         raise HTTPException(status_code=500, detail=str(e))
@@ -163,7 +171,7 @@ async def republish_certificate(certificate_id: int) -> CcmPublishResult:
     is updated.  Use this when the BPN allowlist or usage constraints change.
     """
     try:
-        result = await asyncio.to_thread(ccm_provider_service.republish_certificate, certificate_id)
+        result = await run_in_executor(IO_EXECUTOR, ccm_provider_service.republish_certificate, certificate_id)
         return CcmPublishResult(**result)
     except Exception as e:
         logger.exception("Unhandled error in republish_certificate endpoint")
@@ -182,7 +190,7 @@ async def unpublish_certificate(certificate_id: int) -> None:
     discoverable in the provider's catalog.
     """
     try:
-        await asyncio.to_thread(ccm_provider_service.unpublish_certificate, certificate_id)
+        await run_in_executor(IO_EXECUTOR, ccm_provider_service.unpublish_certificate, certificate_id)
     except Exception as e:
         logger.exception("Unhandled error in unpublish_certificate endpoint")
         raise HTTPException(status_code=500, detail=str(e))
@@ -200,7 +208,7 @@ async def get_published_certificate(certificate_id: int) -> Dict[str, bool]:
     Always responds with HTTP 200.
     """
     try:
-        published = ccm_provider_service.get_published_certificate(certificate_id)
+        published = await run_in_executor(DB_EXECUTOR, ccm_provider_service.get_published_certificate, certificate_id)
         return {"published": published}
     except Exception as e:
         logger.exception("Unhandled error in get_published_certificate endpoint")
@@ -221,7 +229,7 @@ async def list_published_certificates() -> List[CcmPublishedItem]:
     in the provider's EDC catalog and for diagnosing DB/EDC sync issues.
     """
     try:
-        items = ccm_provider_service.list_published_certificates()
+        items = await run_in_executor(DB_EXECUTOR, ccm_provider_service.list_published_certificates)
         return [CcmPublishedItem(**item) for item in items]
     except Exception as e:
         logger.exception("Unhandled error in list_published_certificates endpoint")
@@ -246,7 +254,7 @@ async def force_unpublish_by_asset_id(asset_id: str) -> None:
     cleared automatically.
     """
     try:
-        ccm_provider_service.force_unpublish_by_asset_id(asset_id)
+        await run_in_executor(IO_EXECUTOR, ccm_provider_service.force_unpublish_by_asset_id, asset_id)
     except Exception as e:
         logger.exception("Unhandled error in force_unpublish_by_asset_id endpoint")
         raise HTTPException(status_code=500, detail=str(e))
@@ -279,7 +287,7 @@ async def list_shares(
     the complete sharing history from the provider side.
     """
     try:
-        return ccm_provider_service.list_shares(
+        return await run_in_executor(DB_EXECUTOR, ccm_provider_service.list_shares,
             consumer_bpnl=consumer_bpnl,
             status=status,
             offset=offset,
@@ -327,7 +335,7 @@ async def list_inbound_requests(
     specific combination.
     """
     try:
-        return ccm_provider_service.list_inbound_requests(
+        return await run_in_executor(DB_EXECUTOR, ccm_provider_service.list_inbound_requests,
             consumer_bpn=consumer_bpn,
             certified_bpn=certified_bpn,
             certificate_type=certificate_type,
@@ -370,7 +378,7 @@ async def list_inbound_request_history(
     to a single consumer-certificate pair.
     """
     try:
-        return ccm_provider_service.list_inbound_request_history(
+        return await run_in_executor(DB_EXECUTOR, ccm_provider_service.list_inbound_request_history,
             consumer_bpn=consumer_bpn,
             certified_bpn=certified_bpn,
             certificate_type=certificate_type,
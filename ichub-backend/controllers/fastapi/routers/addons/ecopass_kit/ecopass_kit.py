@@ -25,11 +25,30 @@ from fastapi import APIRouter, Depends
 from .v1 import discovery, provision, passports
 
 from controllers.fastapi.routers.authentication.auth_api import get_authentication_dependency
+from managers.config.config_manager import ConfigManager
+from managers.addons_service.ecopass_kit.v1 import discovery_manager
+from managers.addons_service.ecopass_kit.v1.discovery_task_store import DiscoveryTaskPostgresStore
+from utils.service_container import ServiceContainer, require_service
+
+
+def _init_ecopass_kit() -> None:
+    # The passports are discovered through the DTR and the discovery services, only the task store may need the database
+    if ConfigManager.get_config("consumer.ecopass.discovery_tasks.persist", default=False):
+        from database import engine
+        discovery_manager.task_manager.store = DiscoveryTaskPostgresStore(
+            engine=engine,
+            table_name=ConfigManager.get_config("consumer.ecopass.discovery_tasks.table_name", default="discovery_tasks"),
+            ttl_seconds=ConfigManager.get_config("consumer.ecopass.discovery_tasks.ttl_seconds", default=3600)
+        )
+    return None
+
+
+ServiceContainer.get_instance().register("ecopass_kit", _init_ecopass_kit, depends_on=("database",), wait_for=("dtr", "discovery"), critical=False, lazy=True)
 
 router = APIRouter(
     prefix="/ecopass-kit",
     tags=["EcoPass KIT Microservices"],
-    dependencies=[Depends(get_authentication_dependency())]
+    dependencies=[Depends(get_authentication_dependency()), Depends(require_service("ecopass_kit"))]
 )
 router.include_router(passports.router)
 router.include_router(provision.router)
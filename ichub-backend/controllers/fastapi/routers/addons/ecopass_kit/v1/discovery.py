@@ -20,15 +20,22 @@
 # SPDX-License-Identifier: Apache-2.0
 #################################################################################
 
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status, BackgroundTasks
+from fastapi.responses import StreamingResponse
 
 from controllers.fastapi.routers.authentication.auth_api import get_authentication_dependency
+from managers.config.config_manager import ConfigManager
 from managers.config.log_manager import LoggingManager
 from managers.addons_service.ecopass_kit.v1 import discovery_manager
 from models.services.addons.ecopass_kit.v1 import DiscoverDppRequest, DiscoveryStatus, DiscoverDppResponse
+from utils.async_utils import run_in_executor, DB_EXECUTOR
 
 logger = LoggingManager.get_logger(__name__)
 
+MAX_WAIT_SECONDS = ConfigManager.get_config("consumer.ecopass.discovery_tasks.max_wait_seconds", default=30)
+
 router = APIRouter(
     prefix="/discover",
     dependencies=[Depends(get_authentication_dependency())]
@@ -49,6 +56,7 @@ async def discover_dpp(request: DiscoverDppRequest, background_tasks: Background
     
     The operation runs asynchronously with step-by-step status tracking.
     Use the returned taskId to check progress via GET /discover/{taskId}/status
+    or to follow it via GET /discover/{taskId}/events
     
     Args:
         request: DiscoverDppRequest with id and semanticId
@@ -65,7 +73,7 @@ async def discover_dpp(request: DiscoverDppRequest, background_tasks: Background
         task_id = discovery_manager.generate_task_id()
         
         # Initialize task status
-        discovery_manager.task_manager.create_task(task_id)
+        task = await run_in_executor(DB_EXECUTOR, discovery_manager.task_manager.create_task, task_id)
         
         # Validate ID format
         try:
@@ -95,7 +103,8 @@ async def discover_dpp(request: DiscoverDppRequest, background_tasks: Background
                 progress=0
             ),
             digitalTwin=None,
-            data=None
+            data=None,
+            version=task["version"]
         )
         
     except HTTPException:
@@ -109,12 +118,21 @@ async def discover_dpp(request: DiscoverDppRequest, background_tasks: Background
 
 
 @router.get("/{task_id}/status", response_model=DiscoverDppResponse)
-async def get_discovery_status(task_id: str):
+async def get_discovery_status(
+    task_id: str,
+    version: Optional[int] = Query(None, description="Version of the task already known by the client"),
+    wait: float = Query(0, ge=0, description="Maximum seconds to wait for the task to change from the given version (long-poll)")
+):
     """
     Get the current status of a discovery task.
     
+    With a version and a wait time the response is only sent once the task changed from that
+    version, it finished, or the wait time (at most consumer.ecopass.discovery_tasks.max_wait_seconds) passed.
+    
     Args:
         task_id: The unique task identifier from the initial discovery request
+        version: Optional version of the task already known by the client
+        wait: Optional maximum seconds to wait for a change
         
     Returns:
         DiscoverDppResponse with current status and results (if completed)
@@ -122,14 +140,60 @@ async def get_discovery_status(task_id: str):
     Raises:
         HTTPException: If the task ID is not found
     """
-    if not discovery_manager.task_manager.task_exists(task_id):
+    task = await discovery_manager.task_manager.wait_for_update(task_id, version, min(wait, MAX_WAIT_SECONDS))
+    if task is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Discovery task not found: {task_id}"
         )
     
-    task = discovery_manager.task_manager.get_task(task_id)
+    return _to_response(task_id, task)
+
+
+@router.get("/{task_id}/events")
+async def stream_discovery_status(task_id: str):
+    """
+    Stream the status of a discovery task as server-sent events.
+    
+    A "status" event (DiscoverDppResponse) is sent with the current state and on every change,
+    the stream ends once the task completed or failed.
     
+    Args:
+        task_id: The unique task identifier from the initial discovery request
+        
+    Returns:
+        StreamingResponse with the text/event-stream of the task status
+        
+    Raises:
+        HTTPException: If the task ID is not found
+    """
+    task = await discovery_manager.task_manager.wait_for_update(task_id, None, 0)
+    if task is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Discovery task not found: {task_id}"
+        )
+    
+    async def events():
+        current = task
+        while True:
+            yield f"event: status\ndata: {_to_response(task_id, current).model_dump_json(by_alias=True)}\n\n"
+            if current["status"] in discovery_manager.task_manager.FINAL_STATUSES:
+                return
+            version = current["version"]
+            current = await discovery_manager.task_manager.wait_for_update(task_id, version, MAX_WAIT_SECONDS)
+            while current is not None and current["version"] == version:
+                # Keep the connection open through proxies while nothing changes
+                yield ": keep-alive\n\n"
+                current = await discovery_manager.task_manager.wait_for_update(task_id, version, MAX_WAIT_SECONDS)
+            if current is None:
+                yield f"event: error\ndata: Discovery task not found: {task_id}\n\n"
+                return
+    
+    return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+
+def _to_response(task_id: str, task: Dict[str, Any]) -> DiscoverDppResponse:
     return DiscoverDppResponse(
         taskId=task_id,
         status=DiscoveryStatus(
@@ -139,5 +203,6 @@ async def get_discovery_status(task_id: str):
             progress=task["progress"]
         ),
         digitalTwin=task.get("digital_twin"),
-        data=task.get("data")
+        data=task.get("data"),
+        version=task.get("version")
     )
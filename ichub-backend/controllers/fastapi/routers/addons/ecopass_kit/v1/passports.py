@@ -26,6 +26,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from controllers.fastapi.routers.authentication.auth_api import get_authentication_dependency
 from managers.addons_service.ecopass_kit.v1 import passports_manager
 from models.services.addons.ecopass_kit.v1 import DigitalProductPassport
+from utils.async_utils import run_in_executor, DB_EXECUTOR
 
 router = APIRouter(
     prefix="/passports",
@@ -48,7 +49,7 @@ async def get_all_passports():
         HTTPException: If there's an error retrieving the passports
     """
     try:
-        return passports_manager.get_all_passports()
+        return await run_in_executor(DB_EXECUTOR, passports_manager.get_all_passports)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving DPPs: {str(e)}")
 
@@ -27,6 +27,7 @@ from managers.config.log_manager import LoggingManager
 from managers.addons_service.ecopass_kit.v1.provision import provision_manager
 from tools.exceptions import DppNotFoundError, DppShareError
 from models.services.addons.ecopass_kit.v1 import ShareDppRequest, ShareDppResponse
+from utils.async_utils import run_in_executor, IO_EXECUTOR
 
 logger = LoggingManager.get_logger(__name__)
 
@@ -60,7 +61,7 @@ async def share_dpp(request: ShareDppRequest):
     try:
         # Share the DPP using the provision manager
         logger.info(f"[SHARE DEBUG] Step 1: Calling provision_manager.share_dpp()")
-        result = provision_manager.share_dpp(
+        result = await run_in_executor(IO_EXECUTOR, provision_manager.share_dpp,
             dpp_id=request.dpp_id,
             business_partner_number=request.business_partner_number,
         )
@@ -68,7 +69,7 @@ async def share_dpp(request: ShareDppRequest):
 
         # Register in BPN Discovery
         logger.info(f"[SHARE DEBUG] Step 2: Registering in BPN Discovery with manufacturer_part_id: {result['twin_data']['manufacturer_part_id']}")
-        bpn_registered = provision_manager.register_in_bpn_discovery(
+        bpn_registered = await run_in_executor(IO_EXECUTOR, provision_manager.register_in_bpn_discovery,
             result["twin_data"]["manufacturer_part_id"]
         )
         logger.info(f"[SHARE DEBUG] Step 2 DONE: bpn_registered = {bpn_registered}")
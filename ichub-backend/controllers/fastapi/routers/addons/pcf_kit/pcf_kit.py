@@ -26,11 +26,22 @@ from fastapi import APIRouter, Depends
 from .v1 import consumption, exchange, product_ids, provision
 
 from controllers.fastapi.routers.authentication.auth_api import get_authentication_dependency
+from managers.submodels.schema_registry import SchemaRegistry
+from utils.service_container import ServiceContainer, require_service
+
+
+def _init_pcf_kit() -> SchemaRegistry:
+    # Load the aspect model schemas the PCF payloads are validated against
+    return SchemaRegistry.get_instance()
+
+
+# Add-ons are optional: they are initialized on their first request, not when the application starts
+ServiceContainer.get_instance().register("pcf_kit", _init_pcf_kit, depends_on=("database",), wait_for=("connector",), critical=False, lazy=True)
 
 router = APIRouter(
     prefix="/pcf-kit",
     tags=["PCF KIT Microservices"],
-    dependencies=[Depends(get_authentication_dependency())]
+    dependencies=[Depends(get_authentication_dependency()), Depends(require_service("pcf_kit"))]
 )
 
 router.include_router(consumption.router)
@@ -23,7 +23,6 @@
 
 """PCF Consumption API - Data Consumer endpoints for requesting PCF data."""
 
-import asyncio
 from typing import Any, Dict
 
 from fastapi import APIRouter, Depends, HTTPException, Path
@@ -33,8 +32,9 @@ from controllers.fastapi.routers.authentication.auth_api import get_authenticati
 from managers.addons_service.pcf_kit.v1 import consumption_manager
 from managers.config.log_manager import LoggingManager
 from models.services.addons.pcf_kit.v1.management import GovernanceBodyModel
-from models.services.addons.pcf_kit.v1.models import PcfSubPartModel, PcfRelationshipModel, PcfExchangeModel, PcfSpecificStateModel
+from models.services.addons.pcf_kit.v1.models import PcfSubPartModel, PcfRelationshipModel, PcfExchangeModel, PcfRollupModel, PcfSpecificStateModel
 from tools.exceptions import NotFoundError
+from utils.async_utils import run_in_executor, DB_EXECUTOR, IO_EXECUTOR
 from utils.log_utils import sanitize_log_value as _s
 from tools.constants import INTERNAL_SERVER_ERROR
 
@@ -53,7 +53,7 @@ async def search_own_parts_by_manufacturer_part_id(
     manufacturer_part_id: str = Path(..., alias="manufacturerPartId")
 ) -> PcfRelationshipModel:
     try:
-        result = consumption_manager.search_own_parts_by_manufacturer_part_id(manufacturer_part_id)
+        result = await run_in_executor(DB_EXECUTOR, consumption_manager.search_own_parts_by_manufacturer_part_id, manufacturer_part_id)
         return result
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -72,10 +72,11 @@ async def add_subpart_and_create_request(
     if body is None:
         raise HTTPException(status_code=400, detail="Request body is required")
     try:
-        result = consumption_manager.add_subpart_and_create_request(
+        result = await run_in_executor(DB_EXECUTOR, consumption_manager.add_subpart_and_create_request,
             main_manufacturer_part_id=manufacturer_part_id,
             sub_manufacturer_part_id=body.manufacturer_part_id,
-            responding_bpn=body.bpn
+            responding_bpn=body.bpn,
+            quantity=body.quantity
         )
         return result
     except ValueError as e:
@@ -98,7 +99,8 @@ async def send_pcf_request_to_participant(
     manufacturerPartId or customerPartId must be provided.
     """
     try:
-        result = await asyncio.to_thread(
+        result = await run_in_executor(
+            IO_EXECUTOR,
             consumption_manager.send_pcf_request_to_participant,
             request_id=request_id,
             list_policies=body.governance if body else None,
@@ -116,7 +118,7 @@ async def send_pcf_request_to_participant(
 @router.get("/requests/{requestId}/response", response_model=PcfExchangeModel, response_model_by_alias=True)
 async def consult_pcf_response(request_id: str = Path(..., alias="requestId")) -> PcfExchangeModel:
     try:
-        result = consumption_manager.consult_pcf_response(request_id=request_id)
+        result = await run_in_executor(DB_EXECUTOR, consumption_manager.consult_pcf_response, request_id=request_id)
         return result
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -142,7 +144,8 @@ async def retry_pcf_request_sending(
         ValueError: If the request does not exist, is not in a retryable status, or if the retry fails.
     """
     try:
-        result = await asyncio.to_thread(
+        result = await run_in_executor(
+            IO_EXECUTOR,
             consumption_manager.send_pcf_request_to_participant,
             request_id=request_id,
             list_policies=body.governance if body else None,
@@ -162,7 +165,7 @@ async def consult_global_assembly_progress(
     manufacturer_part_id: str = Path(..., alias="manufacturerPartId"),
 ) -> PcfSpecificStateModel:
     try:
-        result = consumption_manager.consult_global_assembly_progress(manufacturer_part_id=manufacturer_part_id)
+        result = await run_in_executor(DB_EXECUTOR, consumption_manager.consult_global_assembly_progress, manufacturer_part_id=manufacturer_part_id)
         return result
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -173,12 +176,28 @@ async def consult_global_assembly_progress(
         raise HTTPException(status_code=500, detail=INTERNAL_SERVER_ERROR)
 
 
+@router.get("/parts/{manufacturerPartId}/pcf-rollup")
+async def rollup_pcf_data(
+    manufacturer_part_id: str = Path(..., alias="manufacturerPartId"),
+) -> PcfRollupModel:
+    try:
+        result = await run_in_executor(DB_EXECUTOR, consumption_manager.rollup_pcf_data, manufacturer_part_id=manufacturer_part_id)
+        return result
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except NotFoundError:
+        raise
+    except Exception as e:
+        logger.error(f"Error rolling up PCF data: {_s(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=INTERNAL_SERVER_ERROR)
+
+
 @router.get("/parts/{manufacturerPartId}/pcf-data/download")
 async def download_consolidated_pcf_data(
     manufacturer_part_id: str = Path(..., alias="manufacturerPartId"),
 ) -> Dict[str, Any]:
     try:
-        result = consumption_manager.download_pcf_data(manufacturer_part_id=manufacturer_part_id)
+        result = await run_in_executor(DB_EXECUTOR, consumption_manager.download_pcf_data, manufacturer_part_id=manufacturer_part_id)
         return JSONResponse(status_code=200, content=[item.model_dump(by_alias=True) for item in result])
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -29,7 +29,6 @@ negotiated — no version query parameter is exposed.
 """
 
 from typing import Optional
-import asyncio
 from fastapi import APIRouter, Depends, Header, Query, HTTPException, Path, Body
 from fastapi.responses import JSONResponse
 
@@ -37,6 +36,7 @@ from controllers.fastapi.routers.authentication.auth_api import get_authenticati
 from managers.addons_service.pcf_kit.v1 import exchange_manager
 from managers.config.log_manager import LoggingManager
 from tools.exceptions import NotFoundError, PcfVersionGateError
+from utils.async_utils import run_in_executor, IO_EXECUTOR
 from utils.log_utils import sanitize_log_value as _s
 from tools.constants import INTERNAL_SERVER_ERROR
 
@@ -100,7 +100,8 @@ async def put_pcf_with_path_id(
     try:
         logger.debug(f"[PCF Exchange PUT] Delegating to exchange_manager.submit_pcf_response()")
         # Delegate to manager to handle PCF response/update
-        result = await asyncio.to_thread(
+        result = await run_in_executor(
+            IO_EXECUTOR,
             exchange_manager.submit_pcf_response,
             request_id=request_id,
             pcf_data=body,
@@ -178,7 +179,8 @@ async def request_pcf(
     try:
         logger.debug(f"[PCF Exchange GET] Delegating to exchange_manager.request_pcf()")
         # Delegate to manager to handle PCF request
-        result = await asyncio.to_thread(
+        result = await run_in_executor(
+            IO_EXECUTOR,
             exchange_manager.request_pcf,
             request_id=request_id,
             edc_bpn=edc_bpn,
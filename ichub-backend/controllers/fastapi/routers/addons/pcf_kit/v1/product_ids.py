@@ -34,7 +34,6 @@ Key differences from the v1.2.0 ``/footprintExchange`` endpoints:
 """
 
 from typing import Optional
-import asyncio
 from fastapi import APIRouter, Depends, Header, Query, HTTPException, Path, Body
 from fastapi.responses import JSONResponse
 
@@ -42,6 +41,7 @@ from controllers.fastapi.routers.authentication.auth_api import get_authenticati
 from managers.addons_service.pcf_kit.v1 import exchange_manager
 from managers.config.log_manager import LoggingManager
 from tools.exceptions import NotFoundError, PcfVersionGateError
+from utils.async_utils import run_in_executor, IO_EXECUTOR
 from utils.log_utils import sanitize_log_value as _s
 from tools.constants import INTERNAL_SERVER_ERROR
 
@@ -107,7 +107,8 @@ async def put_pcf_legacy(
 
     try:
         logger.debug("[PCF ProductIds PUT] Delegating to exchange_manager.submit_pcf_response()")
-        result = await asyncio.to_thread(
+        result = await run_in_executor(
+            IO_EXECUTOR,
             exchange_manager.submit_pcf_response,
             request_id=request_id,
             pcf_data=body,
@@ -171,7 +172,8 @@ async def request_pcf_legacy(
 
     try:
         logger.debug("[PCF ProductIds GET] Delegating to exchange_manager.request_pcf()")
-        result = await asyncio.to_thread(
+        result = await run_in_executor(
+            IO_EXECUTOR,
             exchange_manager.request_pcf,
             request_id=request_id,
             edc_bpn=edc_bpn,
@@ -23,7 +23,6 @@
 
 """PCF Provision API - Data Provider endpoints for responding to PCF requests."""
 
-import asyncio
 from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Path, Query
@@ -36,6 +35,7 @@ from models.metadata_database.pcf import PcfExchangeStatus
 from models.services.addons.pcf_kit.v1.management import GovernanceBodyModel, NotifyUpdateModel
 from models.services.addons.pcf_kit.v1.models import PcfExchangeModel
 from tools.exceptions import NotFoundError, PcfVersionGateError
+from utils.async_utils import run_in_executor, DB_EXECUTOR, IO_EXECUTOR, CPU_EXECUTOR
 from utils.log_utils import sanitize_log_value as _s
 from utils.pcf_utils import DEFAULT_PCF_VERSION, SUPPORTED_PCF_VERSIONS
 from tools.constants import INTERNAL_SERVER_ERROR
@@ -65,7 +65,7 @@ async def upload_new_pcf(
                 f"Unsupported PCF version '{version}'. "
                 f"Supported versions: {sorted(SUPPORTED_PCF_VERSIONS)}"
             )
-        result = provision_manager.upload_new_pcf(manufacturer_part_id, pcf_data, version=version)
+        result = await run_in_executor(CPU_EXECUTOR, provision_manager.upload_new_pcf, manufacturer_part_id, pcf_data, version=version)
         return JSONResponse(status_code=201, content=result)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -90,7 +90,7 @@ async def view_existing_pcf(
                 f"Unsupported PCF version '{version}'. "
                 f"Supported versions: {sorted(SUPPORTED_PCF_VERSIONS)}"
             )
-        result = provision_manager.view_existing_pcf(manufacturer_part_id, version=version)
+        result = await run_in_executor(IO_EXECUTOR, provision_manager.view_existing_pcf, manufacturer_part_id, version=version)
         return JSONResponse(status_code=200, content=result)
     except ValueError as e: 
         raise HTTPException(status_code=400, detail=str(e))
@@ -116,7 +116,7 @@ async def update_pcf_and_get_participants(
                 f"Unsupported PCF version '{version}'. "
                 f"Supported versions: {sorted(SUPPORTED_PCF_VERSIONS)}"
             )
-        result = provision_manager.update_pcf_and_get_participants(manufacturer_part_id, pcf_data, version=version)
+        result = await run_in_executor(CPU_EXECUTOR, provision_manager.update_pcf_and_get_participants, manufacturer_part_id, pcf_data, version=version)
         return JSONResponse(status_code=200, content=result)
     except PcfVersionGateError as e:
         raise HTTPException(status_code=409, detail=str(e))
@@ -135,7 +135,8 @@ async def confirm_and_send_update_to_participants(
     body: NotifyUpdateModel = None
 ) -> Dict[str, Any]:
     try:
-        result = await asyncio.to_thread(
+        result = await run_in_executor(
+            IO_EXECUTOR,
             provision_manager.confirm_and_send_update_to_participants,
             manufacturer_part_id=manufacturer_part_id,
             list_bpns=body.list_bpns if body else [],
@@ -166,7 +167,7 @@ async def list_provider_notifications(
                 f"Unsupported PCF version '{version}'. "
                 f"Supported versions: {sorted(SUPPORTED_PCF_VERSIONS)}"
             )
-        result = provision_manager.list_provider_notifications(status=status, version=version, offset=offset, limit=limit)
+        result = await run_in_executor(DB_EXECUTOR, provision_manager.list_provider_notifications, status=status, version=version, offset=offset, limit=limit)
         return result
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -183,7 +184,8 @@ async def accept_request_and_send_response(
     body: GovernanceBodyModel = None
 ) -> Dict[str, Any]:
     try:
-        result = await asyncio.to_thread(
+        result = await run_in_executor(
+            IO_EXECUTOR,
             provision_manager.accept_request_and_send_response,
             request_id=request_id,
             list_policies=body.governance if body else None
@@ -203,7 +205,7 @@ async def accept_request_and_send_response(
 @router.get("/requests/{requestId}/refresh-pcf", response_model=PcfExchangeModel, response_model_by_alias=True)
 async def refresh_pcf_data_for_request(request_id: str = Path(..., alias="requestId")) -> PcfExchangeModel:
     try:
-        result = provision_manager.refresh_pcf_data_for_request(request_id=request_id)
+        result = await run_in_executor(IO_EXECUTOR, provision_manager.refresh_pcf_data_for_request, request_id=request_id)
         return result
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -219,7 +221,8 @@ async def retry_response_sending(
     body: GovernanceBodyModel = None
 ) -> Dict[str, Any]:
     try:
-        result = await asyncio.to_thread(
+        result = await run_in_executor(
+            IO_EXECUTOR,
             provision_manager.accept_request_and_send_response,
             request_id=request_id,
             list_policies=body.governance if body else None
@@ -26,15 +26,58 @@ from managers.config.config_manager import ConfigManager
 from managers.config.log_manager import LoggingManager
 from fastapi.security import APIKeyHeader, HTTPBearer, HTTPAuthorizationCredentials
 from fastapi import HTTPException, Request, status, Depends
+from utils.service_container import ServiceContainer
 import time
-import threading
 
 logger = LoggingManager.get_logger('staging')
 api_key_manager: AuthManager = None
 oauth2_manager: OAuth2Manager = None
-_keycloak_retry_thread = None
 _keycloak_connected = False
 
+def connect_keycloak() -> OAuth2Manager:
+    """
+    Connect to Keycloak, retrying until it is available. Until then only the API Key authentication is active.
+    """
+    global oauth2_manager, _keycloak_connected
+
+    keycloak_url = ConfigManager.get_config("authorization.keycloak.auth_url")
+    keycloak_realm = ConfigManager.get_config("authorization.keycloak.realm")
+    keycloak_client_id = ConfigManager.get_config("authorization.keycloak.client_id")
+    logger.info(f"[OAuth2 Manager] Attempting to connect to Keycloak OAuth2: {keycloak_url} realm: {keycloak_realm}")
+
+    # Retry logic for Keycloak connection
+    max_retries = ConfigManager.get_config("authorization.keycloak.retry.max_retries", 3)
+    retry_delay = ConfigManager.get_config("authorization.keycloak.retry.retry_delay", 5)
+    background_interval = ConfigManager.get_config("authorization.keycloak.retry.background_retry_interval", retry_delay)
+    logger.info(f"[OAuth2 Manager] Retry configuration: max_retries={max_retries}, retry_delay={retry_delay}s, background_retry_interval={background_interval}s")
+
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            logger.info(f"[OAuth2 Manager] Connection attempt {attempt}...")
+            oauth2_manager = OAuth2Manager(
+                auth_url=keycloak_url,
+                realm=keycloak_realm,
+                clientid=keycloak_client_id,
+                clientsecret=ConfigManager.get_config("authorization.keycloak.client_secret"),
+            )
+            _keycloak_connected = True
+            logger.info("=" * 80)
+            logger.info("[AUTH] Dual authentication active: API Key + OAuth2 (Keycloak)")
+            logger.info("=" * 80)
+            return oauth2_manager
+        except Exception as e:
+            logger.warning(f"[OAuth2 Manager] Connection attempt {attempt} failed: {e}")
+
+        if attempt == max_retries:
+            logger.warning("=" * 80)
+            logger.warning("[AUTH] Keycloak connection failed - API Key authentication active")
+            logger.warning(f"[AUTH] Retrying to connect to Keycloak every {background_interval} seconds")
+            logger.warning("=" * 80)
+        time.sleep(retry_delay if attempt < max_retries else background_interval)
+
+
 if ConfigManager.get_config("authorization.enabled"):
     # Always initialize API Key authentication
     logger.info("[API Key Manager] Initializing API Key authentication")
@@ -45,78 +88,9 @@ if ConfigManager.get_config("authorization.enabled"):
         auth_enabled=ConfigManager.get_config("authorization.enabled")
     )
     
-    # Additionally initialize Keycloak if enabled
+    # Additionally initialize Keycloak if enabled, in the background once the application starts
     if ConfigManager.get_config("authorization.keycloak.enabled"):
-        keycloak_url = ConfigManager.get_config("authorization.keycloak.auth_url")
-        keycloak_realm = ConfigManager.get_config("authorization.keycloak.realm")
-        keycloak_client_id = ConfigManager.get_config("authorization.keycloak.client_id")
-        logger.info(f"[OAuth2 Manager] Attempting to connect to Keycloak OAuth2: {keycloak_url} realm: {keycloak_realm}")
-        
-        # Retry logic for Keycloak connection
-        max_retries = ConfigManager.get_config("authorization.keycloak.retry.max_retries")
-        retry_delay = ConfigManager.get_config("authorization.keycloak.retry.retry_delay")
-
-        _keycloak_connected = False
-        logger.info(f"[OAuth2 Manager] Retry configuration: max_retries={max_retries}, retry_delay={retry_delay}s")
-        
-        for attempt in range(1, max_retries + 1):
-            try:
-                logger.info(f"[OAuth2 Manager] Connection attempt {attempt}/{max_retries}...")
-                oauth2_manager = OAuth2Manager(
-                    auth_url=keycloak_url,
-                    realm=keycloak_realm,
-                    clientid=keycloak_client_id,
-                    clientsecret=ConfigManager.get_config("authorization.keycloak.client_secret"),
-                )
-                _keycloak_connected = True
-                logger.info(f"[OAuth2 Manager] Successfully connected to Keycloak")
-                logger.info("=" * 80)
-                logger.info("[AUTH] Dual authentication active: API Key + OAuth2 (Keycloak)")
-                logger.info("=" * 80)
-                break
-            except Exception as e:
-                logger.warning(f"[OAuth2 Manager] Connection attempt {attempt}/{max_retries} failed: {e}")
-                if attempt < max_retries:
-                    logger.info(f"[OAuth2 Manager] Retrying in {retry_delay} seconds...")
-                    time.sleep(retry_delay)
-                else:
-                    logger.error(f"[OAuth2 Manager] Failed to connect to Keycloak after {max_retries} attempts")
-        
-        # Start background retry if Keycloak connection failed
-        if not _keycloak_connected:
-            logger.warning("=" * 80)
-            logger.warning("[AUTH] Keycloak connection failed - API Key authentication active")
-            logger.warning("[AUTH] Background retry task will continue attempting to connect to Keycloak")
-            logger.warning("=" * 80)
-            
-            # Start background retry thread
-            def retry_keycloak_connection():
-                global oauth2_manager, _keycloak_connected
-                retry_interval = ConfigManager.get_config("authorization.keycloak.retry.background_retry_interval", retry_delay)
-                
-                while not _keycloak_connected:
-                    time.sleep(retry_interval)
-                    try:
-                        logger.info("[OAuth2 Manager] Background retry: Attempting to reconnect to Keycloak...")
-                        temp_manager = OAuth2Manager(
-                            auth_url=keycloak_url,
-                            realm=keycloak_realm,
-                            clientid=keycloak_client_id,
-                            clientsecret=ConfigManager.get_config("authorization.keycloak.client_secret"),
-                        )
-                        # Success - enable OAuth2 alongside API Key
-                        oauth2_manager = temp_manager
-                        _keycloak_connected = True
-                        logger.info("=" * 80)
-                        logger.info("[AUTH] Successfully reconnected to Keycloak - Dual authentication now active: API Key + OAuth2")
-                        logger.info("=" * 80)
-                    except Exception as e:
-                        logger.debug(f"[OAuth2 Manager] Background retry failed: {e}")
-            
-            _keycloak_retry_thread = threading.Thread(target=retry_keycloak_connection, daemon=True)
-            _keycloak_retry_thread.start()
-            background_interval = ConfigManager.get_config("authorization.keycloak.retry.background_retry_interval", retry_delay)
-            logger.info(f"[OAuth2 Manager] Background retry thread started (interval: {background_interval}s)")
+        ServiceContainer.get_instance().register("keycloak", connect_keycloak, critical=False)
     else:
         logger.info("=" * 80)
         logger.info("[AUTH] API Key authentication active (Keycloak disabled)")
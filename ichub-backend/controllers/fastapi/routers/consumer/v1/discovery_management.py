@@ -22,12 +22,12 @@
 
 from fastapi import APIRouter, Depends
 import json
-import asyncio
 
 from fastapi.responses import Response
 #from services.consumer import ConnectionService
 from tools.log_capture import run_with_policy_log_capture
 from tools.exceptions import PolicyMismatchError
+from utils.async_utils import run_in_executor, DB_EXECUTOR, IO_EXECUTOR
 from models.services.consumer.discovery_management import (
     DiscoverRegistriesRequest,
     DiscoverShellsRequest,
@@ -83,8 +83,8 @@ async def _purge_bpn_cache(bpn: str) -> None:
     Args:
         bpn: The Business Partner Number whose cache entries should be removed
     """
-    await asyncio.to_thread(dtr_manager.consumer.purge_bpn, bpn)
-    await asyncio.to_thread(connector_manager.consumer.purge_bpn, bpn)
+    await run_in_executor(DB_EXECUTOR, dtr_manager.consumer.purge_bpn, bpn)
+    await run_in_executor(DB_EXECUTOR, connector_manager.consumer.purge_bpn, bpn)
 
 
 async def _handle_discovery_error(e: Exception, bpn: str, endpoint: str) -> Response:
@@ -139,7 +139,7 @@ async def purge_dtr_cache() -> Response:
 
     Forces re-discovery of Digital Twin Registries on the next request for any BPN.
     """
-    await asyncio.to_thread(dtr_manager.consumer.purge_cache)
+    await run_in_executor(DB_EXECUTOR, dtr_manager.consumer.purge_cache)
     return Response(
         content=json.dumps({"status": "ok", "message": "DTR discovery cache purged"}),
         media_type="application/json",
@@ -157,7 +157,7 @@ async def purge_dtr_cache_for_bpn(bpnl: str) -> Response:
     Args:
         bpnl: The Business Partner Number to purge from DTR cache
     """
-    await asyncio.to_thread(dtr_manager.consumer.purge_bpn, bpnl)
+    await run_in_executor(DB_EXECUTOR, dtr_manager.consumer.purge_bpn, bpnl)
     return Response(
         content=json.dumps({"status": "ok", "message": f"DTR cache purged for BPN {bpnl}"}),
         media_type="application/json",
@@ -174,7 +174,7 @@ async def purge_connector_cache() -> Response:
 
     Forces re-discovery of EDC connectors on the next request for any BPN.
     """
-    await asyncio.to_thread(connector_manager.consumer.purge_cache)
+    await run_in_executor(DB_EXECUTOR, connector_manager.consumer.purge_cache)
     return Response(
         content=json.dumps({"status": "ok", "message": "Connector discovery cache purged"}),
         media_type="application/json",
@@ -192,7 +192,7 @@ async def purge_connector_cache_for_bpn(bpnl: str) -> Response:
     Args:
         bpnl: The Business Partner Number to purge from connector cache
     """
-    await asyncio.to_thread(connector_manager.consumer.purge_bpn, bpnl)
+    await run_in_executor(DB_EXECUTOR, connector_manager.consumer.purge_bpn, bpnl)
     return Response(
         content=json.dumps({"status": "ok", "message": f"Connector cache purged for BPN {bpnl}"}),
         media_type="application/json",
@@ -210,8 +210,8 @@ async def purge_discovery_cache() -> Response:
     Convenience endpoint that clears everything at once.
     Forces re-discovery on the next request for any BPN.
     """
-    await asyncio.to_thread(dtr_manager.consumer.purge_cache)
-    await asyncio.to_thread(connector_manager.consumer.purge_cache)
+    await run_in_executor(DB_EXECUTOR, dtr_manager.consumer.purge_cache)
+    await run_in_executor(DB_EXECUTOR, connector_manager.consumer.purge_cache)
     return Response(
         content=json.dumps({"status": "ok", "message": "DTR and connector discovery cache purged"}),
         media_type="application/json",
@@ -230,8 +230,8 @@ async def purge_discovery_cache_for_bpn(bpnl: str) -> Response:
     Args:
         bpnl: The Business Partner Number to purge from all caches
     """
-    await asyncio.to_thread(dtr_manager.consumer.purge_bpn, bpnl)
-    await asyncio.to_thread(connector_manager.consumer.purge_bpn, bpnl)
+    await run_in_executor(DB_EXECUTOR, dtr_manager.consumer.purge_bpn, bpnl)
+    await run_in_executor(DB_EXECUTOR, connector_manager.consumer.purge_bpn, bpnl)
     return Response(
         content=json.dumps({"status": "ok", "message": f"Cache purged for BPN {bpnl}"}),
         media_type="application/json",
@@ -247,7 +247,8 @@ async def discover_registries(request: DiscoverRegistriesRequest) -> Response:
         # Offload blocking I/O to thread pool to prevent blocking the event loop.
         # run_with_policy_log_capture wraps the call so that SDK policy-diff DEBUG
         # messages are captured in the worker thread and stored in captured_policy_logs.
-        result = await asyncio.to_thread(
+        result = await run_in_executor(
+            IO_EXECUTOR,
             run_with_policy_log_capture(dtr_manager.consumer.get_dtrs, captured_policy_logs),
             request.counter_party_id
         )
@@ -282,7 +283,8 @@ async def discover_shells(search_request: DiscoverShellsRequest) -> Response:
         # Offload blocking I/O to thread pool to prevent blocking the event loop.
         # run_with_policy_log_capture captures SDK policy-diff DEBUG messages in the
         # worker thread so they can be included in the error response.
-        result = await asyncio.to_thread(
+        result = await run_in_executor(
+            IO_EXECUTOR,
             run_with_policy_log_capture(dtr_manager.consumer.discover_shells, captured_policy_logs),
             counter_party_id=search_request.counter_party_id,
             query_spec=query_spec_dict,
@@ -347,7 +349,8 @@ async def discover_shell(search_request: DiscoverShellRequest) -> Response:
     captured_policy_logs: list[str] = []
     try:
         # Offload blocking I/O to thread pool to prevent blocking the event loop.
-        result = await asyncio.to_thread(
+        result = await run_in_executor(
+            IO_EXECUTOR,
             run_with_policy_log_capture(dtr_manager.consumer.discover_shell, captured_policy_logs),
             counter_party_id=search_request.counter_party_id,
             id=search_request.id,
@@ -436,7 +439,8 @@ async def discover_submodels(search_request: DiscoverSubmodelsDataRequest) -> Re
     captured_policy_logs: list[str] = []
     try:
         # Offload blocking I/O to thread pool to prevent blocking the event loop.
-        result = await asyncio.to_thread(
+        result = await run_in_executor(
+            IO_EXECUTOR,
             run_with_policy_log_capture(dtr_manager.consumer.discover_submodels, captured_policy_logs),
             counter_party_id=search_request.counter_party_id,
             id=search_request.id,
@@ -507,7 +511,8 @@ async def discover_submodel(search_request: DiscoverSubmodelDataRequest) -> Resp
     captured_policy_logs: list[str] = []
     try:
         # Offload blocking I/O to thread pool to prevent blocking the event loop.
-        result = await asyncio.to_thread(
+        result = await run_in_executor(
+            IO_EXECUTOR,
             run_with_policy_log_capture(dtr_manager.consumer.discover_submodel, captured_policy_logs),
             counter_party_id=search_request.counter_party_id,
             id=search_request.id,
@@ -617,7 +622,8 @@ async def discover_submodels_by_semantic_id(search_request: DiscoverSubmodelSema
     captured_policy_logs: list[str] = []
     try:
         # Offload blocking I/O to thread pool to prevent blocking the event loop.
-        result = await asyncio.to_thread(
+        result = await run_in_executor(
+            IO_EXECUTOR,
             run_with_policy_log_capture(dtr_manager.consumer.discover_submodel_by_semantic_ids, captured_policy_logs),
             counter_party_id=search_request.counter_party_id,
             id=search_request.id,
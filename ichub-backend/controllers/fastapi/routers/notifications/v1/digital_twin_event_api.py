@@ -35,6 +35,7 @@ from tools.exceptions import NotificationCreationError
 from tools.constants import INTERNAL_SERVER_ERROR
 from models.metadata_database.notification.models import NotificationDirection
 from managers.config.log_manager import LoggingManager
+from utils.async_utils import run_in_executor, DB_EXECUTOR
 
 logger = LoggingManager.get_logger(__name__)
 
@@ -52,7 +53,7 @@ router = APIRouter(
 async def connect_to_parent(notification: Notification) -> Response:
     # TODO: Implement the logic to handle the connection to the parent endpoint and process the received notification
     try:
-        digital_twin_event_api_service.receive_connect_to_parent(notification, direction=NotificationDirection.INCOMING)
+        await run_in_executor(DB_EXECUTOR, digital_twin_event_api_service.receive_connect_to_parent, notification, direction=NotificationDirection.INCOMING)
         return Response(status_code=201)
     except NotificationCreationError as e:
         return JSONResponse(status_code=e.status_code, content={"detail": e.detail.model_dump()})
@@ -64,7 +65,7 @@ async def connect_to_parent(notification: Notification) -> Response:
 async def connect_to_child(notification: Notification) -> Response:
     # TODO: Implement the logic to handle the connection to the child endpoint and process the received notification
     try:
-        digital_twin_event_api_service.receive_connect_to_child(notification, direction=NotificationDirection.INCOMING)
+        await run_in_executor(DB_EXECUTOR, digital_twin_event_api_service.receive_connect_to_child, notification, direction=NotificationDirection.INCOMING)
         return Response(status_code=201)
     except NotificationCreationError as e:
         return JSONResponse(status_code=e.status_code, content={"detail": e.detail.model_dump()})
@@ -76,7 +77,7 @@ async def connect_to_child(notification: Notification) -> Response:
 async def submodel_update(notification: Notification) -> Response:
     # TODO: Implement the logic to handle the submodel update and process the received notification
     try:
-        digital_twin_event_api_service.receive_submodel_update(notification, direction=NotificationDirection.INCOMING)
+        await run_in_executor(DB_EXECUTOR, digital_twin_event_api_service.receive_submodel_update, notification, direction=NotificationDirection.INCOMING)
         return Response(status_code=201)
     except NotificationCreationError as e:
         return JSONResponse(status_code=e.status_code, content={"detail": e.detail.model_dump()})
@@ -88,7 +89,7 @@ async def submodel_update(notification: Notification) -> Response:
 async def feedback(notification: Notification) -> Response:
     # TODO: Implement the logic to handle the feedback and process the received notification
     try:
-        digital_twin_event_api_service.receive_feedback(notification, direction=NotificationDirection.INCOMING)
+        await run_in_executor(DB_EXECUTOR, digital_twin_event_api_service.receive_feedback, notification, direction=NotificationDirection.INCOMING)
         return Response(status_code=201)
     except NotificationCreationError as e:
         return JSONResponse(status_code=e.status_code, content={"detail": e.detail.model_dump()})
@@ -43,6 +43,7 @@ from tools.exceptions import (
 )
 from tools.constants import INTERNAL_SERVER_ERROR
 from managers.config.log_manager import LoggingManager
+from utils.async_utils import run_in_executor, DB_EXECUTOR, IO_EXECUTOR
 
 logger = LoggingManager.get_logger(__name__)
 
@@ -56,9 +57,9 @@ router = APIRouter(
 )
 
 @router.post("/notifications")
-async def get_all_notifications(bpn: str, status: NotificationStatus = None, offset: int = 0, limit: int = 10) -> List[NotificationResponse]:
+async def get_all_notifications(bpn: str, status: NotificationStatus = None, offset: int = 0, limit: int = 10, include_payload: bool = True) -> List[NotificationResponse]:
     try:
-        notifications = notification_management_service.get_all_notifications(bpn=bpn, status=status, offset=offset, limit=limit)
+        notifications = await run_in_executor(DB_EXECUTOR, notification_management_service.get_all_notifications, bpn=bpn, status=status, offset=offset, limit=limit, include_payload=include_payload)
         return notifications
     except NotificationRetrievalError as e:
         return JSONResponse(status_code=e.status_code, content={"detail": e.detail.model_dump()})
@@ -107,7 +108,7 @@ async def create_notification(
     returned in the 201 response body so callers can reference the notification.
     """
     try:
-        entity = notification_management_service.create_notification(notification, direction=NotificationDirection.OUTGOING)
+        entity = await run_in_executor(DB_EXECUTOR, notification_management_service.create_notification, notification, direction=NotificationDirection.OUTGOING)
         return JSONResponse(status_code=201, content={"message_id": str(entity.message_id)})
     except NotificationCreationError as e:
         return JSONResponse(status_code=e.status_code, content={"detail": e.detail.model_dump()})
@@ -126,7 +127,7 @@ async def send_notification(request: SendNotificationRequest) -> Response:
     ``configuration.yml``.
     """
     try:
-        notification_management_service.send_notification(
+        await run_in_executor(IO_EXECUTOR, notification_management_service.send_notification,
             message_id=request.message_id,
             endpoint_url=request.endpoint_path,
             provider_bpn=request.provider_bpn,
@@ -143,7 +144,7 @@ async def send_notification(request: SendNotificationRequest) -> Response:
 @router.put("/notification/status")
 async def update_notification_status(message_id: str, status: NotificationStatus) -> Response:
     try:
-        notification_management_service.update_notification_status(message_id, status)
+        await run_in_executor(DB_EXECUTOR, notification_management_service.update_notification_status, message_id, status)
         return Response(status_code=200)
     except NotificationUpdateStatusError as e:
         return JSONResponse(status_code=e.status_code, content={"detail": e.detail.model_dump()})
@@ -154,7 +155,7 @@ async def update_notification_status(message_id: str, status: NotificationStatus
 @router.delete("/notification")
 async def delete_notification(message_id: str) -> Response:
     try:
-        notification_management_service.delete_notification(message_id)
+        await run_in_executor(DB_EXECUTOR, notification_management_service.delete_notification, message_id)
         return Response(status_code=204)
     except NotificationDeleteError as e:
         return JSONResponse(status_code=e.status_code, content={"detail": e.detail.model_dump()})
@@ -31,6 +31,7 @@ from models.services.notification.unique_id_push import UniqueIdPushConnectToPar
 from services.notifications.notifications_management_service import NotificationsManagementService
 from services.notifications.unique_id_push_service import UniqueIdPushService
 from tools.exceptions import NotificationCreationError
+from utils.async_utils import run_in_executor, DB_EXECUTOR
 
 logger = LoggingManager.get_logger(__name__)
 
@@ -67,7 +68,7 @@ async def connect_to_parent(request: UniqueIdPushConnectToParentRequest) -> Resp
     """
     try:
         # Duplicate check
-        if notification_management_service.notification_exists(request.header.message_id):
+        if await run_in_executor(DB_EXECUTOR, notification_management_service.notification_exists, request.header.message_id):
             return JSONResponse(
                 status_code=409,
                 content={
@@ -75,7 +76,7 @@ async def connect_to_parent(request: UniqueIdPushConnectToParentRequest) -> Resp
                 },
             )
 
-        unique_id_push_service.receive_connect_to_parent(
+        await run_in_executor(DB_EXECUTOR, unique_id_push_service.receive_connect_to_parent,
             request, direction=NotificationDirection.INCOMING
         )
         return Response(status_code=201)
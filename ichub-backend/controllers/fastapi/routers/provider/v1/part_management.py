@@ -20,8 +20,10 @@
 # SPDX-License-Identifier: Apache-2.0
 #################################################################################
 
-from fastapi import APIRouter, Query, Depends
-from typing import List, Optional
+from fastapi import APIRouter, Query, Depends, Response
+from typing import Iterator, List, Optional, Type
+
+from pydantic import BaseModel
 
 from services.provider.part_management_service import PartManagementService
 from models.services.provider.part_management import (
@@ -37,7 +39,9 @@ from models.services.provider.part_management import (
     SerializedPartUpdate,
 )
 from tools.exceptions import exception_responses
-from fastapi.responses import JSONResponse
+from tools.pagination_tools import NEXT_CURSOR_HEADER
+from fastapi.responses import JSONResponse, StreamingResponse
+from utils.async_utils import AsyncManagerWrapper, DB_EXECUTOR, iterate_in_executor
 from controllers.fastapi.routers.authentication.auth_api import get_authentication_dependency
 
 router = APIRouter(
@@ -47,53 +51,105 @@ router = APIRouter(
 )
 part_management_service = PartManagementService()
 
+# Part management only works on the database, run it in the database executor
+async_part_service = AsyncManagerWrapper(part_management_service, "PartManagement", executor=DB_EXECUTOR)
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+STREAM_BATCH_SIZE = 500
+
+LIMIT_DESCRIPTION = "Maximum number of parts to return. The cursor of the next page is returned in the X-Next-Cursor header. All parts are returned if not set."
+CURSOR_DESCRIPTION = "Cursor of the page to return, as returned in the X-Next-Cursor header of the previous page."
+STREAM_DESCRIPTION = "Stream all matching parts as newline delimited JSON (application/x-ndjson) instead of returning a JSON array."
+
+
+def _ndjson_response(items: Iterator[BaseModel], response_model: Type[BaseModel]) -> StreamingResponse:
+    """Stream the items as newline delimited JSON, reading and serializing them in the database executor."""
+    fields = set(response_model.model_fields)
+    lines = (item.model_dump_json(by_alias=True, include=fields) + "\n" for item in items)
+
+    async def content():
+        async for batch in iterate_in_executor(DB_EXECUTOR, lines, batch_size=STREAM_BATCH_SIZE):
+            yield "".join(batch)
+
+    return StreamingResponse(content(), media_type=NDJSON_MEDIA_TYPE)
+
+
+def _set_next_cursor(response: Response, next_cursor: Optional[str]) -> None:
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+
 
 @router.get("/catalog-part/{manufacturer_id}/{manufacturer_part_id}", response_model=CatalogPartDetailsReadWithStatus, responses=exception_responses)
 async def part_management_get_catalog_part_details(manufacturer_id: str, manufacturer_part_id: str) -> Optional[CatalogPartDetailsReadWithStatus]:
-    return part_management_service.get_catalog_part_details(manufacturer_id, manufacturer_part_id)
+    return await async_part_service.get_catalog_part_details(manufacturer_id, manufacturer_part_id)
 
 @router.get("/catalog-part", response_model=List[CatalogPartReadWithStatus], responses=exception_responses)
-async def part_management_get_catalog_parts() -> List[CatalogPartReadWithStatus]:
-    return part_management_service.get_catalog_parts()
+async def part_management_get_catalog_parts(response: Response,
+                                            limit: Optional[int] = Query(None, ge=1, description=LIMIT_DESCRIPTION),
+                                            cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+                                            stream: bool = Query(False, description=STREAM_DESCRIPTION)) -> List[CatalogPartReadWithStatus]:
+    if stream:
+        items = await async_part_service.stream_catalog_parts(yield_per=STREAM_BATCH_SIZE)
+        return _ndjson_response(items, CatalogPartReadWithStatus)
+
+    catalog_parts, next_cursor = await async_part_service.get_catalog_parts_page(cursor=cursor, limit=limit)
+    _set_next_cursor(response, next_cursor)
+    return catalog_parts
 
 @router.post("/catalog-part", response_model=CatalogPartDetailsReadWithStatus, responses=exception_responses)
 async def part_management_create_catalog_part(catalog_part_create: CatalogPartCreate) -> CatalogPartDetailsReadWithStatus:
-    return part_management_service.create_catalog_part(catalog_part_create)
+    return await async_part_service.create_catalog_part(catalog_part_create)
 
 @router.post("/catalog-part/create-partner-mapping", response_model=PartnerCatalogPartRead, responses=exception_responses)
 async def part_management_create_partner_mapping(partner_catalog_part_create: PartnerCatalogPartCreate) -> PartnerCatalogPartRead:
-    return part_management_service.create_partner_catalog_part_mapping(partner_catalog_part_create)
+    return await async_part_service.create_partner_catalog_part_mapping(partner_catalog_part_create)
 
 @router.put("/catalog-part/{manufacturer_id}/{manufacturer_part_id}", response_model=CatalogPartDetailsReadWithStatus, responses=exception_responses)
 async def part_management_update_catalog_part(manufacturer_id: str, manufacturer_part_id: str, catalog_part_update: CatalogPartUpdate) -> CatalogPartDetailsReadWithStatus:
-    return part_management_service.update_catalog_part(manufacturer_id, manufacturer_part_id, catalog_part_update)
+    return await async_part_service.update_catalog_part(manufacturer_id, manufacturer_part_id, catalog_part_update)
 
 @router.delete("/catalog-part/{manufacturer_id}/{manufacturer_part_id}", responses=exception_responses)
 async def part_management_delete_catalog_part(manufacturer_id: str, manufacturer_part_id: str) -> JSONResponse:
-    if part_management_service.delete_catalog_part(manufacturer_id, manufacturer_part_id):
+    if await async_part_service.delete_catalog_part(manufacturer_id, manufacturer_part_id):
         return JSONResponse(status_code=204, content={"description":"Deleted catalog part successfully"})
     else:
         return JSONResponse(status_code=404, content={"description":"Catalog part not found"})
 
 @router.get("/serialized-part", response_model=List[SerializedPartRead], responses=exception_responses)
-async def part_management_get_serialized_parts() -> List[SerializedPartRead]:
-    return part_management_service.get_serialized_parts()
+async def part_management_get_serialized_parts(response: Response,
+                                               limit: Optional[int] = Query(None, ge=1, description=LIMIT_DESCRIPTION),
+                                               cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+                                               stream: bool = Query(False, description=STREAM_DESCRIPTION)) -> List[SerializedPartRead]:
+    return await _get_serialized_parts(response, SerializedPartQuery(), limit, cursor, stream)
 
 @router.post("/serialized-part/query", response_model=List[SerializedPartRead], responses=exception_responses)
-async def part_management_query_serialized_parts(query: SerializedPartQuery) -> List[SerializedPartRead]:
-    return part_management_service.get_serialized_parts(query)
+async def part_management_query_serialized_parts(query: SerializedPartQuery,
+                                                 response: Response,
+                                                 limit: Optional[int] = Query(None, ge=1, description=LIMIT_DESCRIPTION),
+                                                 cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+                                                 stream: bool = Query(False, description=STREAM_DESCRIPTION)) -> List[SerializedPartRead]:
+    return await _get_serialized_parts(response, query, limit, cursor, stream)
+
+async def _get_serialized_parts(response: Response, query: SerializedPartQuery, limit: Optional[int], cursor: Optional[str], stream: bool):
+    if stream:
+        items = await async_part_service.stream_serialized_parts(query, yield_per=STREAM_BATCH_SIZE)
+        return _ndjson_response(items, SerializedPartRead)
+
+    serialized_parts, next_cursor = await async_part_service.get_serialized_parts_page(query, cursor=cursor, limit=limit)
+    _set_next_cursor(response, next_cursor)
+    return serialized_parts
 
 @router.post("/serialized-part", response_model=SerializedPartRead, responses=exception_responses)
 async def part_management_create_serialized_part(serialized_part_create: SerializedPartCreate,  auto_generate_catalog_part: bool = Query(False, alias="autoGenerateCatalogPart", description="Automatically create the catalog part for this serialized part"), auto_generate_partner_part: bool = Query(True, alias="autoGeneratePartnerPart", description="Automatically create a catalog partner part")) -> SerializedPartRead:
-    return part_management_service.create_serialized_part(serialized_part_create, auto_generate_catalog_part=auto_generate_catalog_part, auto_generate_partner_part=auto_generate_partner_part)
+    return await async_part_service.create_serialized_part(serialized_part_create, auto_generate_catalog_part=auto_generate_catalog_part, auto_generate_partner_part=auto_generate_partner_part)
 
 @router.put("/serialized-part/{partner_catalog_part_id}/{part_instance_id}", response_model=SerializedPartRead, responses=exception_responses)
 async def part_management_update_serialized_part(partner_catalog_part_id: int, part_instance_id: str, serialized_part_update: SerializedPartUpdate) -> SerializedPartRead:
-    return part_management_service.update_serialized_part(partner_catalog_part_id, part_instance_id, serialized_part_update)
+    return await async_part_service.update_serialized_part(partner_catalog_part_id, part_instance_id, serialized_part_update)
 
 @router.delete("/serialized-part/{partner_catalog_part_id}/{part_instance_id}", responses=exception_responses)
 async def part_management_delete_serialized_part(partner_catalog_part_id: int, part_instance_id: str) -> JSONResponse:
-    if part_management_service.delete_serialized_part(partner_catalog_part_id, part_instance_id):
+    if await async_part_service.delete_serialized_part(partner_catalog_part_id, part_instance_id):
         return JSONResponse(status_code=204, content={"description":"Deleted serialized part successfully"})
     else:
         return JSONResponse(status_code=404, content={"description":"Serialized part not found"})
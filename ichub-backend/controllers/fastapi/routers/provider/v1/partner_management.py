@@ -26,7 +26,7 @@ from typing import Optional, List
 from services.provider.partner_management_service import PartnerManagementService
 from models.services.provider.partner_management import BusinessPartnerRead, BusinessPartnerCreate, DataExchangeAgreementRead
 from tools.exceptions import exception_responses
-from utils.async_utils import AsyncManagerWrapper
+from utils.async_utils import AsyncManagerWrapper, DB_EXECUTOR
 from controllers.fastapi.routers.authentication.auth_api import get_authentication_dependency
 
 router = APIRouter(
@@ -37,7 +37,7 @@ router = APIRouter(
 partner_management_service = PartnerManagementService()
 
 # Create universal async wrapper - works with any service/manager!
-async_partner_service = AsyncManagerWrapper(partner_management_service, "PartnerManagement")
+async_partner_service = AsyncManagerWrapper(partner_management_service, "PartnerManagement", executor=DB_EXECUTOR)
 
 @router.get("/business-partner", response_model=List[BusinessPartnerRead], responses=exception_responses)
 async def partner_management_get_business_partners() -> List[BusinessPartnerRead]:
@@ -33,10 +33,12 @@ from models.services.provider.twin_management import (
     CatalogPartTwinCreate, CatalogPartTwinShareCreate,
     SerializedPartTwinRead, SerializedPartTwinDetailsRead,
     SerializedPartTwinCreate, SerializedPartTwinShareCreate,
-    SerializedPartTwinUnshareCreate
+    SerializedPartTwinUnshareCreate,
+    TwinBulkCreateRead,
+    TwinAspectRegistrationJobRead
 )
 from tools.exceptions import exception_responses
-from utils.async_utils import AsyncManagerWrapper
+from utils.async_utils import AsyncManagerWrapper, DB_EXECUTOR, IO_EXECUTOR
 from controllers.fastapi.routers.authentication.auth_api import get_authentication_dependency
 
 router = APIRouter(
@@ -47,7 +49,8 @@ router = APIRouter(
 twin_management_service = TwinManagementService()
 
 # Create universal async wrapper - works with any service!
-async_twin_service = AsyncManagerWrapper(twin_management_service, "TwinManagement")
+# Reads only query the database, the writes also call the EDC, DTR and submodel service
+async_twin_service = AsyncManagerWrapper(twin_management_service, "TwinManagement", executor=DB_EXECUTOR)
 
 @router.get("/catalog-part-twin", response_model=List[CatalogPartTwinRead], responses=exception_responses)
 async def twin_management_get_catalog_part_twins(include_data_exchange_agreements: bool = False) -> List[CatalogPartTwinRead]:
@@ -61,25 +64,39 @@ async def twin_management_get_catalog_part_twin(global_id: UUID) -> Optional[Cat
 
 @router.get("/catalog-part-twin/{manufacturer_id}/{manufacturer_part_id}", response_model=Optional[CatalogPartTwinDetailsRead], responses=exception_responses)
 async def twin_management_get_catalog_part_twin_from_manufacturer(manufacturer_id: str, manufacturer_part_id: str) -> Optional[CatalogPartTwinDetailsRead]:
-    return twin_management_service.get_catalog_part_twin_details(manufacturer_id, manufacturer_part_id)
+    return await async_twin_service.get_catalog_part_twin_details(manufacturer_id, manufacturer_part_id)
 
 @router.post("/catalog-part-twin", response_model=TwinRead, responses=exception_responses)
 async def twin_management_create_catalog_part_twin(
     catalog_part_twin_create: CatalogPartTwinCreate,
     auto_create_part_type_information: bool = Query(True, alias="autoCreatePartTypeInformation", description="Automatically create part type information submodel if not present.")
 ) -> TwinRead:
-    return twin_management_service.create_catalog_part_twin(
+    return await async_twin_service.run_in(
+        IO_EXECUTOR,
+        "create_catalog_part_twin",
         catalog_part_twin_create,
         auto_create_part_type_information
     )
 
+@router.post("/catalog-part-twin/bulk", response_model=TwinBulkCreateRead, responses=exception_responses)
+async def twin_management_create_catalog_part_twins_bulk(
+    catalog_part_twin_creates: List[CatalogPartTwinCreate],
+    auto_create_part_type_information: bool = Query(True, alias="autoCreatePartTypeInformation", description="Automatically create part type information submodel if not present.")
+) -> TwinBulkCreateRead:
+    return await async_twin_service.run_in(
+        IO_EXECUTOR,
+        "create_catalog_part_twins_bulk",
+        catalog_part_twin_creates,
+        auto_create_part_type_information
+    )
+
 @router.post("/catalog-part-twin/share", responses={
     201: {"description": "Catalog part twin shared successfully"},
     204: {"description": "Catalog part twin already shared"},
     **exception_responses
 })
 async def twin_management_share_catalog_part_twin(catalog_part_twin_share: CatalogPartTwinShareCreate):
-    if twin_management_service.create_catalog_part_twin_share(catalog_part_twin_share):
+    if await async_twin_service.run_in(IO_EXECUTOR, "create_catalog_part_twin_share", catalog_part_twin_share):
         return JSONResponse(status_code=201, content={"description":"Catalog part twin shared successfully"})
     else:
         return JSONResponse(status_code=204, content={"description":"Catalog part twin already shared"})
@@ -116,24 +133,37 @@ async def twin_management_get_all_serialized_part_twins(
     
     query = SerializedPartQuery(**query_data)
     
-    return twin_management_service.get_serialized_part_twins(
+    return await async_twin_service.get_serialized_part_twins(
         serialized_part_query=query,
         include_data_exchange_agreements=include_data_exchange_agreements
     )
 
 @router.get("/serialized-part-twin/{global_id}", response_model=Optional[SerializedPartTwinDetailsRead], responses=exception_responses)
 async def twin_management_get_serialized_part_twin(global_id: UUID) -> Optional[SerializedPartTwinDetailsRead]:
-    return twin_management_service.get_serialized_part_twin_details(global_id)
+    return await async_twin_service.get_serialized_part_twin_details(global_id)
 
 @router.post("/serialized-part-twin", response_model=TwinRead, responses=exception_responses)
 async def twin_management_create_serialized_part_twin(serialized_part_twin_create: SerializedPartTwinCreate, auto_create_serial_part: bool = Query(True, alias="autoCreatePartTypeInformation", description="Automatically create part type information submodel if not present.")) -> TwinRead:
-    return twin_management_service.create_serialized_part_twin(serialized_part_twin_create, auto_create_serial_part)
+    return await async_twin_service.run_in(IO_EXECUTOR, "create_serialized_part_twin", serialized_part_twin_create, auto_create_serial_part)
+
+@router.post("/serialized-part-twin/bulk", response_model=TwinBulkCreateRead, responses=exception_responses)
+async def twin_management_create_serialized_part_twins_bulk(serialized_part_twin_creates: List[SerializedPartTwinCreate], auto_create_serial_part: bool = Query(True, alias="autoCreatePartTypeInformation", description="Automatically create part type information submodel if not present.")) -> TwinBulkCreateRead:
+    return await async_twin_service.run_in(IO_EXECUTOR, "create_serialized_part_twins_bulk", serialized_part_twin_creates, auto_create_serial_part)
 
 @router.post("/twin-aspect", response_model=TwinAspectRead, responses=exception_responses)
 async def twin_management_create_twin_aspect(twin_aspect_create: TwinAspectCreate, default: bool = True) -> TwinAspectRead:
     if default:
-        return twin_management_service.create_twin_aspect(twin_aspect_create)
-    return twin_management_service.create_or_update_twin_aspect_not_default(twin_aspect_create)
+        return await async_twin_service.run_in(IO_EXECUTOR, "create_twin_aspect", twin_aspect_create)
+    return await async_twin_service.run_in(IO_EXECUTOR, "create_or_update_twin_aspect_not_default", twin_aspect_create)
+
+@router.post("/twin-aspect/job", status_code=202, response_model=TwinAspectRegistrationJobRead, responses=exception_responses)
+async def twin_management_enqueue_twin_aspect(twin_aspect_create: TwinAspectCreate) -> TwinAspectRegistrationJobRead:
+    """Queue the creation of a twin aspect. The aspect is stored and registered in the EDC and the DTR by the aspect registration workers."""
+    return await async_twin_service.enqueue_twin_aspect(twin_aspect_create)
+
+@router.get("/twin-aspect/job/{job_id}", response_model=TwinAspectRegistrationJobRead, responses=exception_responses)
+async def twin_management_get_twin_aspect_registration_job(job_id: UUID) -> TwinAspectRegistrationJobRead:
+    return await async_twin_service.get_twin_aspect_registration_job(job_id)
 
 @router.post("/serialized-part-twin/share", responses={
     201: {"description": "Catalog part twin shared successfully"},
@@ -141,7 +171,7 @@ async def twin_management_create_twin_aspect(twin_aspect_create: TwinAspectCreat
     **exception_responses
 })
 async def twin_management_share_serialized_part_twin(serialized_part_twin_share: SerializedPartTwinShareCreate):
-    if twin_management_service.create_serialized_part_twin_share(serialized_part_twin_share):
+    if await async_twin_service.run_in(IO_EXECUTOR, "create_serialized_part_twin_share", serialized_part_twin_share):
         return JSONResponse(status_code=201, content={"description":"Serialized part twin shared successfully"})
     else:
         return JSONResponse(status_code=204, content=None)
@@ -152,7 +182,7 @@ async def twin_management_share_serialized_part_twin(serialized_part_twin_share:
     **exception_responses
 })
 async def twin_management_unshare_serialized_part_twin(serialized_part_twin_unshare: SerializedPartTwinUnshareCreate):
-    if twin_management_service.part_twin_unshare(serialized_part_twin_unshare):
+    if await async_twin_service.run_in(IO_EXECUTOR, "part_twin_unshare", serialized_part_twin_unshare):
         return JSONResponse(status_code=201, content={"description":"Serialized part twin unshared successfully"})
     else:
         return JSONResponse(status_code=204, content=None)
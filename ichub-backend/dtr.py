@@ -23,6 +23,8 @@
 from managers.enablement_services import DtrManager
 
 from managers.enablement_services.consumer import DtrConsumerSyncPostgresMemoryManager
+from managers.enablement_services.consumer.dtr.shell_descriptor_cache import ShellDescriptorCache
+from managers.enablement_services.consumer.cache_refresh_scheduler import CacheRefreshScheduler
 from managers.enablement_services.provider import DtrProviderManager
 
 import logging
@@ -34,22 +36,36 @@ from connector import connector_manager
 from database import engine
 from managers.config.config_manager import ConfigManager
 from utils.async_utils import AsyncManagerWrapper
-    
-# Get DTR discovery configuration parameter
+from utils.service_container import ServiceContainer, ServiceProxy
+from typing import Any, Dict
 
-dtr_start_up_error:bool = False
-dtr_consumer_manager: DtrConsumerSyncPostgresMemoryManager = None
-dtr_provider_manager: DtrProviderManager = None
-dtr_manager: DtrManager = None
-async_dtr_consumer: AsyncManagerWrapper = None
-async_dtr_provider: AsyncManagerWrapper = None
+# The DTR managers are created in the background by the service container, once the connector is started
+dtr_consumer_manager: DtrConsumerSyncPostgresMemoryManager = ServiceProxy("dtr", "dtr_consumer_manager")
+dtr_provider_manager: DtrProviderManager = ServiceProxy("dtr", "dtr_provider_manager")
+dtr_manager: DtrManager = ServiceProxy("dtr", "dtr_manager")
+async_dtr_consumer: AsyncManagerWrapper = ServiceProxy("dtr", "async_dtr_consumer")
+async_dtr_provider: AsyncManagerWrapper = ServiceProxy("dtr", "async_dtr_provider")
+
+
+def init_dtr() -> Dict[str, Any]:
+    """
+    Create the DTR consumer and provider managers.
+    """
+    # Get DTR discovery configuration parameter
+    dtr_start_up_error:bool = False
+    dtr_consumer_manager: DtrConsumerSyncPostgresMemoryManager = None
 
-try:
     dtr_dct_type_id = ConfigManager.get_config('consumer.discovery.digitalTwinRegistry.dct_type_key')
     dtr_filter_operand_left = ConfigManager.get_config('consumer.discovery.digitalTwinRegistry.dct_type_filter.operandLeft')
     dtr_filter_operator = ConfigManager.get_config('consumer.discovery.digitalTwinRegistry.dct_type_filter.operator')
     dtr_dct_type = ConfigManager.get_config('consumer.discovery.digitalTwinRegistry.dct_type_filter.operandRight')
-    if(engine is None or connector_manager is None or connector_manager.consumer is None):
+    dtr_max_workers_per_partner = ConfigManager.get_config('consumer.discovery.digitalTwinRegistry.concurrency.max_workers_per_partner', default=5)
+    dtr_max_workers_global = ConfigManager.get_config('consumer.discovery.digitalTwinRegistry.concurrency.max_workers_global', default=20)
+    dtr_shell_cache_config = ConfigManager.get_config('consumer.discovery.digitalTwinRegistry.shell_cache', default={}) or {}
+    discovery_timeout = ConfigManager.get_config('consumer.discovery.single_flight.timeout', default=60)
+    stale_while_revalidate = ConfigManager.get_config('consumer.discovery.single_flight.stale_while_revalidate', default=False)
+    if(engine is None or not connector_manager or connector_manager.consumer is None):
+        logger.critical("The connector consumer is not available, the DTR consumer will not be initialized.")
         dtr_start_up_error = True
 
     if(not dtr_start_up_error):
@@ -61,9 +77,25 @@ try:
             dct_type_id=dtr_dct_type_id,
             dct_type_key=dtr_filter_operand_left,
             operator=dtr_filter_operator,
-            dct_type=dtr_dct_type
+            dct_type=dtr_dct_type,
+            max_dtr_workers_per_partner=int(dtr_max_workers_per_partner),
+            max_dtr_workers_global=int(dtr_max_workers_global),
+            shell_descriptor_cache=ShellDescriptorCache(
+                ttl_seconds=int(dtr_shell_cache_config.get("ttl_seconds", 300)),
+                max_entries=int(dtr_shell_cache_config.get("max_entries", 10000)),
+                max_bytes=int(dtr_shell_cache_config.get("max_bytes", 64 * 1024 * 1024))
+            ),
+            stale_while_revalidate=bool(stale_while_revalidate),
+            discovery_timeout=float(discovery_timeout)
         )
 
+        # Refresh the connectors and DTRs of frequently requested partners before they expire
+        if ConfigManager.get_config('consumer.discovery.proactive_refresh.enabled', default=False):
+            cache_refresh_scheduler = CacheRefreshScheduler.get_instance()
+            cache_refresh_scheduler.register("connectors", connector_manager.consumer)
+            cache_refresh_scheduler.register("dtrs", dtr_consumer_manager)
+            cache_refresh_scheduler.start()
+
     """
     Currently only one digital twin registry is supported from the provider side.
     """
@@ -89,11 +121,15 @@ try:
         dtr_provider_manager=dtr_provider_manager
     )
 
-    # Create universal async wrappers - works with any manager!
-    async_dtr_consumer = AsyncManagerWrapper(dtr_manager.consumer, "DTRConsumer")
-    async_dtr_provider = AsyncManagerWrapper(dtr_manager.provider, "DTRProvider")
-except Exception as e:
-    dtr_start_up_error = True
-    logger.critical(f"Failed to initialize DTR managers: {e}")
+    return {
+        "dtr_consumer_manager": dtr_consumer_manager,
+        "dtr_provider_manager": dtr_provider_manager,
+        "dtr_manager": dtr_manager,
+        # Create universal async wrappers - works with any manager!
+        "async_dtr_consumer": AsyncManagerWrapper(dtr_manager.consumer, "DTRConsumer"),
+        "async_dtr_provider": AsyncManagerWrapper(dtr_manager.provider, "DTRProvider")
+    }
 
 
+# The provider side of the DTR works without the connector, so it is waited for but not required
+ServiceContainer.get_instance().register("dtr", init_dtr, wait_for=("connector",))
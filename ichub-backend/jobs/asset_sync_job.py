@@ -61,6 +61,9 @@ class AssetSyncJob:
         
         try:
             logger.info("[AssetSyncJob] Starting asset synchronization...")
+
+            # Verify every offer in the connector again, this re-seeds the known offer cache
+            self.connector_provider_manager.reset_known_offers()
             
             # Step 1: Sync Digital Twin Registry asset
             self._sync_dtr_asset()
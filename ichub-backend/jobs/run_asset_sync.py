@@ -37,9 +37,9 @@ logger = LoggingManager.get_logger(__name__)
 
 ConfigManager.load_config()
 
-from database import wait_for_db_connection
+from database import engine, wait_for_db_connection
 from tractusx_sdk.dataspace.services.connector import ServiceFactory
-from managers.enablement_services.provider import ConnectorProviderManager
+from managers.enablement_services.provider import ConnectorProviderManager, KnownOfferCache, KnownOfferPostgresCache
 from jobs.asset_sync_job import AssetSyncJob
 
 
@@ -134,6 +134,16 @@ def run_asset_sync_job():
                         backend_api_key: backend_api_key_value
                     }
             
+            # Seed the known offer cache shared with the backend replicas
+            known_offers_ttl = ConfigManager.get_config("provider.connector.known_offers.ttl_seconds", default=300)
+            known_offer_cache = KnownOfferCache(enabled=ConfigManager.get_config("provider.connector.known_offers.enabled", default=True), ttl_seconds=known_offers_ttl)
+            if known_offer_cache.enabled and ConfigManager.get_config("provider.connector.known_offers.persist", default=False):
+                known_offer_cache = KnownOfferPostgresCache(
+                    engine=engine,
+                    table_name=ConfigManager.get_config("provider.connector.known_offers.table_name", default="known_offers"),
+                    ttl_seconds=known_offers_ttl
+                )
+
             # Create the provider manager
             connector_provider_manager = ConnectorProviderManager(
                 connector_provider_service=provider_connector_service,
@@ -146,6 +156,7 @@ def run_asset_sync_job():
                 dataspace_version=provider_dataspace_version,
                 submodel_mode=submodel_mode,
                 submodel_asset_headers=submodel_asset_headers,
+                known_offer_cache=known_offer_cache,
             )
             logger.info(f"✓ Connector provider manager initialized: {type(connector_provider_manager).__name__}")
             
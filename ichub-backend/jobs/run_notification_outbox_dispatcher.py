@@ -0,0 +1,80 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import signal
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import modules
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+sys.dont_write_bytecode = True
+
+from managers.config.log_manager import LoggingManager
+from managers.config.config_manager import ConfigManager
+
+LoggingManager.init_logging()
+logger = LoggingManager.get_logger(__name__)
+
+ConfigManager.load_config()
+
+from database import wait_for_db_connection
+
+
+def run_notification_outbox_dispatcher():
+    """
+    Send the notifications queued in the notification outbox until the process is terminated.
+
+    This lets the notification dispatchers scale independently of the backend API
+    (set provider.notificationOutbox.in_process to false in the backend then).
+
+    Returns:
+        int: Exit code - 0 for success, 1 for failure.
+    """
+    try:
+        wait_for_db_connection()
+
+        from services.notifications.notification_outbox_dispatcher import NotificationOutboxDispatcher
+        from utils.service_container import ServiceContainer
+
+        # Create the connector and DTR managers needed to reach the receivers
+        container = ServiceContainer.get_instance()
+        container.start()
+        if not container.wait_until_ready():
+            logger.warning(f"Not all the services started, notifications depending on them will be retried: {container.get_status()}")
+
+        dispatcher = NotificationOutboxDispatcher.get_instance()
+        signal.signal(signal.SIGTERM, lambda *_: NotificationOutboxDispatcher.shutdown_instance())
+        signal.signal(signal.SIGINT, lambda *_: NotificationOutboxDispatcher.shutdown_instance())
+
+        dispatcher.start()
+        dispatcher.wait()
+        logger.info("Notification outbox dispatcher stopped.")
+        return 0
+    except Exception as e:
+        logger.error(f"Notification outbox dispatcher failed with exception: {e}", exc_info=True)
+        return 1
+
+
+if __name__ == "__main__":
+    exit_code = run_notification_outbox_dispatcher()
+    sys.exit(exit_code)
@@ -219,7 +219,7 @@ class CertificatesManager:
             NotFoundError: If no certificate with the given ID exists.
         """
         with RepositoryManagerFactory.create() as repo:
-            ccm = repo.ccm_repository.find_by_id_with_relations(certificate_id)
+            ccm = repo.ccm_repository.find_by_id_with_relations(certificate_id, with_document=True)
             if ccm is None:
                 raise NotFoundError(
                     f"Certificate with ID {certificate_id} not found."
@@ -331,7 +331,7 @@ class CertificatesManager:
             repo.commit()
 
             # Re-fetch to return the refreshed state.
-            ccm = repo.ccm_repository.find_by_id_with_relations(certificate_id)
+            ccm = repo.ccm_repository.find_by_id_with_relations(certificate_id, with_document=True)
 
             sites_read = [SiteRead(siteBpn=s.site_bpn, areaOfApplication=s.area_of_application) for s in ccm.sites]
             shares_read = [self._share_to_read(s) for s in ccm.shares]
@@ -0,0 +1,149 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import base64
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+from managers.config.config_manager import ConfigManager
+from tools.crypt_tools import blake2b_128bit
+from utils.metrics_utils import register_cache
+
+
+@dataclass(frozen=True)
+class CachedDocument:
+    """Base64 form of a certificate PDF together with a digest of the raw bytes."""
+    content_base64: str
+    digest: str
+
+    @classmethod
+    def from_bytes(cls, doc: Optional[bytes]) -> "CachedDocument":
+        if not doc:
+            return cls(content_base64="", digest="")
+        return cls(content_base64=base64.b64encode(doc).decode("ascii"), digest=blake2b_128bit(doc))
+
+
+class CcmDocumentCache:
+    """
+    Size-bounded LRU cache of encoded certificate documents.
+
+    Entries are keyed by ``(certificate_id, version)`` where the version is the
+    ``updated_at`` timestamp of the certificate, so an update never serves a stale
+    document and old versions simply age out of the cache.
+    """
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 256 * 1024 * 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries (int, optional): Maximum number of cached documents. Defaults to 256.
+            max_bytes (int, optional): Memory budget in bytes of the Base64 content. Defaults to 256 MiB.
+        """
+        self.max_entries = max(1, max_entries)
+        self.max_bytes = max(1, max_bytes)
+        self._entries: "OrderedDict[Hashable, CachedDocument]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_load(self, certificate_id: int, version: str, loader: Callable[[], Optional[bytes]]) -> CachedDocument:
+        """
+        Return the cached document for the certificate version, encoding the bytes
+        returned by ``loader`` on a miss.
+        """
+        key: Tuple[int, str] = (certificate_id, version)
+        with self._lock:
+            document = self._entries.get(key)
+            if document is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return document
+            self.misses += 1
+
+        document = CachedDocument.from_bytes(loader())
+        self._put(key, document)
+        return document
+
+    def _put(self, key: Tuple[int, str], document: CachedDocument) -> None:
+        """Store a document, evicting least recently used entries if the cache is over budget."""
+        size = len(document.content_base64)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            existing = self._entries.pop(key, None)
+            if existing is not None:
+                self._total_bytes -= len(existing.content_base64)
+            self._entries[key] = document
+            self._total_bytes += size
+            while len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes:
+                _, oldest = self._entries.popitem(last=False)
+                self._total_bytes -= len(oldest.content_base64)
+                self.evictions += 1
+
+    def invalidate(self, certificate_id: int) -> int:
+        """
+        Remove all cached versions of a certificate.
+
+        Returns:
+            int: Number of removed entries.
+        """
+        with self._lock:
+            keys = [key for key in self._entries if key[0] == certificate_id]
+            for key in keys:
+                self._total_bytes -= len(self._entries.pop(key).content_base64)
+            return len(keys)
+
+    def clear(self) -> None:
+        """Remove all entries. Counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def stats(self) -> Dict[str, float]:
+        """Return the current size and the hit/miss/eviction counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": (self.hits / lookups) if lookups else 0.0,
+            }
+
+
+ccm_document_cache = CcmDocumentCache(
+    max_entries=ConfigManager.get_config("provider.ccm.document_cache.max_entries", default=256),
+    max_bytes=ConfigManager.get_config("provider.ccm.document_cache.max_bytes", default=256 * 1024 * 1024),
+)
+register_cache("ccm_documents", ccm_document_cache.stats)
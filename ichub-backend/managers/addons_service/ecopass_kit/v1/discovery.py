@@ -21,6 +21,8 @@
 #################################################################################
 
 import asyncio
+import json
+import time
 import uuid
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timezone
@@ -32,6 +34,8 @@ from tractusx_sdk.dataspace.services.discovery import DiscoveryFinderService
 from managers.config.config_manager import ConfigManager
 from managers.config.log_manager import LoggingManager
 from dtr import dtr_manager
+from utils.async_utils import run_in_executor, DB_EXECUTOR
+from .discovery_task_store import DiscoveryTaskStore
 
 logger = LoggingManager.get_logger(__name__)
 
@@ -40,14 +44,25 @@ class DiscoveryTaskManager:
     """
     Manages discovery task status and state.
     
-    This class handles the in-memory storage and updates for discovery tasks.
-    In production environments, consider replacing with Redis or similar
-    distributed cache for scalability.
+    The tasks are kept in a DiscoveryTaskStore, in memory by default or in Postgres so that every
+    worker can answer the status requests (consumer.ecopass.discovery_tasks). The size of the
+    discovered twin and passport is limited, a bigger result fails the task instead of being kept.
     """
     
-    def __init__(self) -> None:
-        """Initialize the task manager with empty storage."""
-        self._tasks: Dict[str, Dict[str, Any]] = {}
+    FINAL_STATUSES = ("completed", "failed")
+    
+    def __init__(self, store: Optional[DiscoveryTaskStore] = None, max_result_bytes: int = 5242880, poll_interval: float = 0.5) -> None:
+        """
+        Initialize the task manager.
+        
+        Args:
+            store: Optional task store. If not provided, an in-memory store is created.
+            max_result_bytes: Maximum JSON size of the digital twin and data of a task.
+            poll_interval: Seconds between two reads of a task while waiting for a change.
+        """
+        self.store = store or DiscoveryTaskStore()
+        self.max_result_bytes = max_result_bytes
+        self.poll_interval = poll_interval
     
     def create_task(self, task_id: str) -> Dict[str, Any]:
         """
@@ -59,7 +74,7 @@ class DiscoveryTaskManager:
         Returns:
             The initial task state dictionary
         """
-        self._tasks[task_id] = {
+        return self.store.create(task_id, {
             "status": "in_progress",
             "step": "parsing",
             "message": "Parsing identifier...",
@@ -68,8 +83,7 @@ class DiscoveryTaskManager:
             "data": None,
             "created_at": datetime.now(timezone.utc).isoformat(),
             "error": None
-        }
-        return self._tasks[task_id]
+        })
     
     def get_task(self, task_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -81,7 +95,7 @@ class DiscoveryTaskManager:
         Returns:
             The task state dictionary or None if not found
         """
-        return self._tasks.get(task_id)
+        return self.store.get(task_id)
     
     def task_exists(self, task_id: str) -> bool:
         """
@@ -93,7 +107,7 @@ class DiscoveryTaskManager:
         Returns:
             True if the task exists, False otherwise
         """
-        return task_id in self._tasks
+        return self.store.get(task_id) is not None
     
     def update_task(
         self,
@@ -117,17 +131,25 @@ class DiscoveryTaskManager:
             digital_twin: Optional digital twin data
             data: Optional submodel data
         """
-        if task_id in self._tasks:
-            self._tasks[task_id].update({
-                "status": status,
-                "step": step,
-                "message": message,
-                "progress": progress
-            })
-            if digital_twin is not None:
-                self._tasks[task_id]["digital_twin"] = digital_twin
-            if data is not None:
-                self._tasks[task_id]["data"] = data
+        changes = {
+            "status": status,
+            "step": step,
+            "message": message,
+            "progress": progress
+        }
+        if digital_twin is not None:
+            changes["digital_twin"] = digital_twin
+        if data is not None:
+            changes["data"] = data
+        
+        if digital_twin is not None or data is not None:
+            result_size = len(json.dumps({"digital_twin": digital_twin, "data": data}, default=str))
+            if result_size > self.max_result_bytes:
+                logger.warning(f"[Task {task_id}] Discovery result of {result_size} bytes exceeds the limit of {self.max_result_bytes} bytes")
+                self.mark_failed(task_id, f"The discovered passport is too large ({result_size} bytes, the limit is {self.max_result_bytes} bytes)")
+                return
+        
+        self.store.update(task_id, changes)
     
     def mark_failed(self, task_id: str, error: str) -> None:
         """
@@ -137,15 +159,34 @@ class DiscoveryTaskManager:
             task_id: The unique task identifier
             error: The error message
         """
-        if task_id in self._tasks:
-            current_step = self._tasks[task_id].get("step", "error")
-            self._tasks[task_id].update({
-                "status": "failed",
-                "step": current_step,
-                "message": f"Discovery failed: {error}",
-                "progress": self._tasks[task_id].get("progress", 0),
-                "error": error
-            })
+        self.store.update(task_id, {
+            "status": "failed",
+            "message": f"Discovery failed: {error}",
+            "error": error
+        })
+    
+    async def wait_for_update(self, task_id: str, version: Optional[int], timeout: float) -> Optional[Dict[str, Any]]:
+        """
+        Wait until a task changes from the given version, instead of letting the client poll.
+        
+        Args:
+            task_id: The unique task identifier
+            version: The version already known by the client, None to return the task right away
+            timeout: Maximum seconds to wait
+            
+        Returns:
+            The task state dictionary, unchanged if the timeout was reached or the task already
+            finished, or None if not found
+        """
+        deadline = time.monotonic() + max(0.0, timeout)
+        while True:
+            task = await run_in_executor(DB_EXECUTOR, self.store.get, task_id)
+            if task is None or version is None or task["version"] != version or task["status"] in self.FINAL_STATUSES:
+                return task
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return task
+            await asyncio.sleep(min(self.poll_interval, remaining))
 
 
 class DiscoveryManager:
@@ -253,7 +294,7 @@ class DiscoveryManager:
             
             # Step 1: Parse the ID
             logger.info(f"[Task {task_id}] Step 1: Parsing identifier: {id_str}")
-            self.task_manager.update_task(task_id, "parsing", "Parsing identifier...", 10)
+            await run_in_executor(DB_EXECUTOR, self.task_manager.update_task, task_id, "parsing", "Parsing identifier...", 10)
             
             manufacturer_part_id, part_instance_id = self.parse_id(id_str)
             
@@ -261,7 +302,7 @@ class DiscoveryManager:
             
             # Step 2: Discover BPN using BPN Discovery
             logger.info(f"[Task {task_id}] Step 2: Discovering BPN for manufacturerPartId: {manufacturer_part_id}")
-            self.task_manager.update_task(task_id, "discovering_bpn", f"Looking up BPN owner for {manufacturer_part_id}...", 25)
+            await run_in_executor(DB_EXECUTOR, self.task_manager.update_task, task_id, "discovering_bpn", f"Looking up BPN owner for {manufacturer_part_id}...", 25)
             
             bpn_list = await self.discover_bpn(manufacturer_part_id)
             
@@ -272,7 +313,7 @@ class DiscoveryManager:
             
             # Step 3: Retrieve digital twin shells using DTR (in parallel for multiple BPNs)
             logger.info(f"[Task {task_id}] Step 3: Retrieving digital twin for manufacturerPartId: {manufacturer_part_id}, partInstanceId: {part_instance_id}")
-            self.task_manager.update_task(task_id, "retrieving_twin", f"Retrieving digital twin from DTR across {len(bpn_list)} BPN(s)...", 50)
+            await run_in_executor(DB_EXECUTOR, self.task_manager.update_task, task_id, "retrieving_twin", f"Retrieving digital twin from DTR across {len(bpn_list)} BPN(s)...", 50)
             
             # Build query spec for DTR lookup using specific asset IDs
             query_spec = self._build_query_spec(manufacturer_part_id, part_instance_id)
@@ -291,7 +332,7 @@ class DiscoveryManager:
             
             # Step 4: Look up submodel by semantic ID
             logger.info(f"[Task {task_id}] Step 4: Looking up submodel with semanticId: {semantic_id}")
-            self.task_manager.update_task(task_id, "looking_up_submodel", "Searching for submodel with matching semantic ID...", 70)
+            await run_in_executor(DB_EXECUTOR, self.task_manager.update_task, task_id, "looking_up_submodel", "Searching for submodel with matching semantic ID...", 70)
             
             matching_submodel = self._find_matching_submodel(shell_descriptor, semantic_id)
             
@@ -303,7 +344,7 @@ class DiscoveryManager:
             
             # Step 5: Consume submodel data
             logger.info(f"[Task {task_id}] Step 5: Consuming submodel data for submodel: {submodel_id}")
-            self.task_manager.update_task(task_id, "consuming_data", "Retrieving submodel data...", 85)
+            await run_in_executor(DB_EXECUTOR, self.task_manager.update_task, task_id, "consuming_data", "Retrieving submodel data...", 85)
             
             submodel_data = await self._consume_submodel_data(
                 task_id, matching_bpn, shell_descriptor, submodel_id, odrl_dtr_policies, odrl_governance
@@ -312,7 +353,9 @@ class DiscoveryManager:
             logger.info(f"[Task {task_id}] Successfully consumed submodel data")
             
             # Step 6: Complete
-            self.task_manager.update_task(
+            await run_in_executor(
+                DB_EXECUTOR,
+                self.task_manager.update_task,
                 task_id,
                 "complete",
                 "Discovery completed successfully",
@@ -326,7 +369,7 @@ class DiscoveryManager:
             
         except Exception as e:
             logger.error(f"[Task {task_id}] Discovery task failed: {str(e)}", exc_info=True)
-            self.task_manager.mark_failed(task_id, str(e))
+            await run_in_executor(DB_EXECUTOR, self.task_manager.mark_failed, task_id, str(e))
     
     async def discover_bpn(self, manufacturer_part_id: str) -> List[str]:
         """
@@ -678,4 +721,11 @@ class _PatchedDiscoveryFinderService:
 
 # Module-level singleton for convenience
 # This can be imported and used directly or a new instance can be created
-discovery_manager = DiscoveryManager()
+discovery_manager = DiscoveryManager(task_manager=DiscoveryTaskManager(
+    store=DiscoveryTaskStore(
+        max_entries=ConfigManager.get_config("consumer.ecopass.discovery_tasks.max_entries", default=1000),
+        ttl_seconds=ConfigManager.get_config("consumer.ecopass.discovery_tasks.ttl_seconds", default=3600)
+    ),
+    max_result_bytes=ConfigManager.get_config("consumer.ecopass.discovery_tasks.max_result_bytes", default=5242880),
+    poll_interval=ConfigManager.get_config("consumer.ecopass.discovery_tasks.poll_interval", default=0.5)
+))
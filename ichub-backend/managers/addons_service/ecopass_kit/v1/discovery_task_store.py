@@ -0,0 +1,228 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+
+from sqlmodel import Session, select, delete
+from sqlalchemy import func
+from sqlalchemy.engine import Engine as E
+from sqlalchemy.exc import SQLAlchemyError
+
+from managers.config.log_manager import LoggingManager
+from models.metadata_database.consumer.models import DiscoveryTasks
+
+logger = LoggingManager.get_logger(__name__)
+
+
+class DiscoveryTaskStore:
+    """
+    In-memory LRU+TTL store of the discovery task states.
+
+    The tasks expire a while after their last change and the least recently used tasks are
+    evicted once the store is full, so abandoned tasks do not pile up. Every change increments
+    the version of the task, so that the status requests can wait for a newer one.
+
+    The tasks are only known by the process running them, use the Postgres store when the
+    backend runs with several workers or replicas.
+    """
+
+    def __init__(self, max_entries: int = 1000, ttl_seconds: float = 3600):
+        """
+        Args:
+            max_entries (int, optional): Maximum number of tasks kept. Defaults to 1000.
+            ttl_seconds (float, optional): Seconds a task is kept after its last change. Defaults to 3600.
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._tasks: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self.evictions = 0
+        self.expirations = 0
+
+    def create(self, task_id: str, task: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Store a new task, replacing any task with the same ID.
+
+        Returns:
+            Dict[str, Any]: The stored task, with its version.
+        """
+        task = {**task, "version": 1}
+        with self._lock:
+            self._purge_expired()
+            self._tasks[task_id] = (time.monotonic() + self.ttl_seconds, task)
+            self._tasks.move_to_end(task_id)
+            while len(self._tasks) > self.max_entries:
+                evicted_id, _ = self._tasks.popitem(last=False)
+                self.evictions += 1
+                logger.warning(f"[DiscoveryTaskStore] Evicted discovery task {evicted_id}, the store is full ({self.max_entries} tasks).")
+        return dict(task)
+
+    def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a copy of a task.
+
+        Returns:
+            Optional[Dict[str, Any]]: The task, or None when it does not exist or expired.
+        """
+        with self._lock:
+            entry = self._tasks.get(task_id)
+            if entry is None:
+                return None
+            expires_at, task = entry
+            if expires_at <= time.monotonic():
+                del self._tasks[task_id]
+                self.expirations += 1
+                return None
+            self._tasks.move_to_end(task_id)
+            return dict(task)
+
+    def update(self, task_id: str, changes: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Apply changes to a task and increment its version.
+
+        Returns:
+            Optional[Dict[str, Any]]: The updated task, or None when it does not exist or expired.
+        """
+        with self._lock:
+            if self.get(task_id) is None:
+                return None
+            _, task = self._tasks[task_id]
+            task = {**task, **changes, "version": task["version"] + 1}
+            self._tasks[task_id] = (time.monotonic() + self.ttl_seconds, task)
+        return dict(task)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get the size and eviction statistics of the store.
+        """
+        with self._lock:
+            return {
+                "size": len(self._tasks),
+                "evictions": self.evictions,
+                "expirations": self.expirations
+            }
+
+    def _purge_expired(self) -> None:
+        now = time.monotonic()
+        for task_id in [task_id for task_id, (expires_at, _) in self._tasks.items() if expires_at <= now]:
+            del self._tasks[task_id]
+            self.expirations += 1
+
+
+class DiscoveryTaskPostgresStore(DiscoveryTaskStore):
+    """
+    Discovery task store persisted in a Postgres table, so that any worker or replica can answer
+    the status requests of a discovery running in another process.
+
+    There is no size limit, the expired tasks are deleted when new tasks are created.
+    """
+
+    def __init__(self, engine: E, table_name: str = "discovery_tasks", ttl_seconds: float = 3600):
+        """
+        Args:
+            engine (E): SQLAlchemy engine of the database.
+            table_name (str, optional): Name of the table storing the tasks. Defaults to "discovery_tasks".
+            ttl_seconds (float, optional): Seconds a task is kept after its last change. Defaults to 3600.
+        """
+        super().__init__(ttl_seconds=ttl_seconds)
+        self.engine = engine
+        self.table_name = table_name
+
+        class DynamicDiscoveryTasks(DiscoveryTasks, table=True):
+            __tablename__ = table_name
+            __table_args__ = {"extend_existing": True}
+
+        self.DiscoveryTasksModel = DynamicDiscoveryTasks
+        DynamicDiscoveryTasks.metadata.create_all(engine, tables=[DynamicDiscoveryTasks.__table__])
+
+    def create(self, task_id: str, task: Dict[str, Any]) -> Dict[str, Any]:
+        now = datetime.now()
+        task = {**task, "version": 1}
+        try:
+            with Session(self.engine) as session:
+                result = session.exec(delete(self.DiscoveryTasksModel).where(self.DiscoveryTasksModel.expires_at <= now))
+                self.expirations += result.rowcount or 0
+                session.merge(self.DiscoveryTasksModel(
+                    task_id=task_id,
+                    task=task,
+                    version=1,
+                    expires_at=now + timedelta(seconds=self.ttl_seconds),
+                    updated_at=now
+                ))
+                session.commit()
+        except SQLAlchemyError as e:
+            logger.error(f"[DiscoveryTaskStore] Error saving discovery task {task_id}: {e}")
+            raise
+        return dict(task)
+
+    def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            with Session(self.engine) as session:
+                row = session.get(self.DiscoveryTasksModel, task_id)
+        except SQLAlchemyError as e:
+            logger.error(f"[DiscoveryTaskStore] Error reading discovery task {task_id}: {e}")
+            return None
+        if row is None or row.expires_at <= datetime.now():
+            return None
+        return {**row.task, "version": row.version}
+
+    def update(self, task_id: str, changes: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        now = datetime.now()
+        try:
+            with Session(self.engine) as session:
+                # Lock the row, a concurrent change must not be lost
+                row = session.exec(
+                    select(self.DiscoveryTasksModel)
+                    .where(self.DiscoveryTasksModel.task_id == task_id)
+                    .with_for_update()
+                ).first()
+                if row is None or row.expires_at <= now:
+                    return None
+                row.version += 1
+                row.task = {**row.task, **changes, "version": row.version}
+                row.expires_at = now + timedelta(seconds=self.ttl_seconds)
+                row.updated_at = now
+                session.add(row)
+                session.commit()
+                task = {**row.task}
+        except SQLAlchemyError as e:
+            logger.error(f"[DiscoveryTaskStore] Error updating discovery task {task_id}: {e}")
+            return None
+        return task
+
+    def get_stats(self) -> Dict[str, int]:
+        try:
+            with Session(self.engine) as session:
+                size = session.exec(select(func.count()).select_from(self.DiscoveryTasksModel)).one()
+        except SQLAlchemyError as e:
+            logger.error(f"[DiscoveryTaskStore] Error counting the discovery tasks: {e}")
+            size = 0
+        return {
+            "size": size,
+            "evictions": self.evictions,
+            "expirations": self.expirations
+        }
@@ -52,7 +52,7 @@ class PassportsManager:
 
     def __init__(self) -> None:
         """Initialize the Passports Manager."""
-        self.submodel_service_manager = SubmodelServiceManager()
+        self.submodel_service_manager = SubmodelServiceManager.get_instance()
 
     def get_all_passports(self) -> List[DigitalProductPassport]:
         """
@@ -69,7 +69,7 @@ class ProvisionManager:
     def __init__(self) -> None:
         """Initialize the Provision Manager."""
         self.twin_management_service = TwinManagementService()
-        self.submodel_service_manager = SubmodelServiceManager()
+        self.submodel_service_manager = SubmodelServiceManager.get_instance()
 
     def share_dpp(
         self, dpp_id: str, business_partner_number: str
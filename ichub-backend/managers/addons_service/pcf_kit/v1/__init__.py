@@ -25,3 +25,4 @@ from .exchange import exchange_manager
 from .consumption import consumption_manager
 from .provision import provision_manager
 from .management import management_manager
+from .rollup import rollup_manager
@@ -29,6 +29,7 @@ Reference:
     - CX-0002 Digital Twins in Catena-X
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 from uuid import UUID, uuid4
 from urllib.parse import quote
@@ -38,12 +39,14 @@ from managers.config.config_manager import ConfigManager
 from managers.metadata_database.manager import RepositoryManagerFactory
 from managers.addons_service.pcf_kit.v1.management import management_manager
 from models.metadata_database.pcf import PcfExchangeDirection, PcfExchangeStatus, PcfExchangeType
-from models.services.addons.pcf_kit.v1.models import PcfExchangeModel, PcfRelationshipModel, PcfSpecificStateModel
+from models.services.addons.pcf_kit.v1.models import PcfExchangeModel, PcfRelationshipModel, PcfRollupModel, PcfSpecificStateModel
 from utils.log_utils import sanitize_log_value as _s
-from utils.pcf_utils import PCF_EXCHANGE_ASSET_TYPE
+from utils.pcf_utils import DEFAULT_PCF_VERSION, PCF_EXCHANGE_ASSET_TYPE
 
 logger = LoggingManager.get_logger(__name__)
 
+RESPONDED_STATUSES = [PcfExchangeStatus.DELIVERED, PcfExchangeStatus.UPDATED]
+
 
 class PcfConsumptionManager:
     """
@@ -70,6 +73,7 @@ class PcfConsumptionManager:
     ) -> None:
         """Initialize the consumption manager."""
         self._own_bpn = ConfigManager.get_config("bpn", default=None)
+        self._download_max_workers = ConfigManager.get_config("provider.pcfExchange.download_max_workers", default=10)
         if self._own_bpn is None:
             logger.warning("BPN not configured in configuration.yml. PCF operations requiring BPN will fail at call time.")
 
@@ -166,40 +170,44 @@ class PcfConsumptionManager:
             PcfRelationshipModel with the main part ID and list of sub-parts.
         """
         with RepositoryManagerFactory.create() as repo_manager:
-            own_part = repo_manager.pcf_relationship_repository.find_by_main_manufacturer_part_id(manufacturer_part_id)
-            
-            if not own_part:
-                result = repo_manager.pcf_relationship_repository.create_new(
-                    main_manufacturer_part_id=manufacturer_part_id,
-                    list_sub_manufacturer_part_ids=[]
-                )
-                return PcfRelationshipModel(
-                    main_manufacturer_part_id=result.main_manufacturer_part_id,
-                    list_sub_manufacturer_part_ids=[]
-                )
-            
+            sub_part_ids = self._get_sub_part_ids(repo_manager, manufacturer_part_id)
             result = PcfRelationshipModel(
-                main_manufacturer_part_id=own_part.main_manufacturer_part_id,
+                main_manufacturer_part_id=manufacturer_part_id,
                 list_sub_manufacturer_part_ids=[]
             )
 
-            if own_part.list_sub_manufacturer_part_id == []:
+            if sub_part_ids == []:
                 return result
 
-            for sub_part_id in own_part.list_sub_manufacturer_part_id:
-                sub_part = repo_manager.pcf_repository.find_by_part_id(sub_part_id)
-                if len(sub_part) > 0:
-                    result.list_sub_manufacturer_part_ids.append(PcfExchangeModel.from_entity(sub_part[0]))
+            sub_parts = repo_manager.pcf_repository.find_latest_by_part_ids_with_response(sub_part_ids)
+            for sub_part_id in sub_part_ids:
+                if sub_part_id in sub_parts:
+                    result.list_sub_manufacturer_part_ids.append(PcfExchangeModel.from_entity(sub_parts[sub_part_id][0]))
                 else:
                     logger.warning(f"Sub part with ID {_s(sub_part_id)} not found in PCF repository")
             
             return result
+
+    @staticmethod
+    def _get_sub_part_ids(repo_manager, manufacturer_part_id: str) -> List[str]:
+        """
+        Get the sub-part IDs of a main part, registering the main part when it is not known yet.
+        """
+        own_part = repo_manager.pcf_relationship_repository.find_by_main_manufacturer_part_id(manufacturer_part_id)
+        if not own_part:
+            repo_manager.pcf_relationship_repository.create_new(
+                main_manufacturer_part_id=manufacturer_part_id,
+                list_sub_manufacturer_part_ids=[]
+            )
+            return []
+        return repo_manager.pcf_relationship_repository.find_sub_part_ids(manufacturer_part_id)
         
     def add_subpart_and_create_request(
         self,
         main_manufacturer_part_id: str,
         sub_manufacturer_part_id: str,
-        responding_bpn: str
+        responding_bpn: str,
+        quantity: float = 1.0
     ) -> PcfRelationshipModel:
         """
         Add a sub-part to a main part and create a PCF request for it.
@@ -211,6 +219,7 @@ class PcfConsumptionManager:
             main_manufacturer_part_id: The main part ID to add the sub-part to.
             sub_manufacturer_part_id: The sub-part ID to add.
             responding_bpn: The BPN of the supplier for this sub-part.
+            quantity: Declared units of the sub-part contained in one declared unit of the main part.
 
         Returns:
             The updated PcfRelationshipModel containing all sub-parts.
@@ -243,11 +252,14 @@ class PcfConsumptionManager:
                 # Add the sub-part to the main part's relationship (only if not already present)
                 repo_manager.pcf_relationship_repository.add_sub_manufacturer_part_id(
                     main_manufacturer_part_id=main_manufacturer_part_id,
-                    sub_manufacturer_part_id=sub_manufacturer_part_id
+                    sub_manufacturer_part_id=sub_manufacturer_part_id,
+                    quantity=quantity
                 )
                 
                 # Commit changes to database so they're visible to the next session
                 repo_manager.commit()
+
+            self._refresh_rollup(main_manufacturer_part_id)
                 
             # Now search in a new session - it will see the committed changes
             result = self.search_own_parts_by_manufacturer_part_id(main_manufacturer_part_id)
@@ -355,27 +367,13 @@ class PcfConsumptionManager:
             ValueError: If there is an error retrieving the assembly progress.
         """
         try:
-            part_info = self.search_own_parts_by_manufacturer_part_id(manufacturer_part_id)
-            sub_parts = part_info.list_sub_manufacturer_part_ids
-            total_sub_parts = len(sub_parts)
-            responded_sub_parts = 0
-            responded_statuses = {PcfExchangeStatus.DELIVERED.value, PcfExchangeStatus.UPDATED.value}
-            # Sub-parts are REQUEST records. Check if a RESPONSE record exists for each one.
+            # Sub-parts are REQUEST records. Count those with a RESPONSE record in a single query.
             with RepositoryManagerFactory.create() as repo_manager:
-                for sub_part in sub_parts:
-                    response_entity = repo_manager.pcf_repository.find_by_request_id(
-                        UUID(sub_part.request_id), type=PcfExchangeType.RESPONSE
-                    )
-                    if response_entity and response_entity.status.value in responded_statuses:
-                        responded_sub_parts += 1
-            progress = (responded_sub_parts / total_sub_parts) * 100 if total_sub_parts > 0 else 100
-            return PcfSpecificStateModel(
-                manufacturer_part_id=manufacturer_part_id,
-                total_sub_parts=total_sub_parts,
-                responded_sub_parts=responded_sub_parts,
-                progress_percentage=progress,
-                overall_status="PENDING" if responded_sub_parts < total_sub_parts else "COMPLETED"
-            )
+                sub_part_ids = self._get_sub_part_ids(repo_manager, manufacturer_part_id)
+                total_sub_parts, responded_sub_parts = repo_manager.pcf_repository.count_responses_by_part_ids(
+                    sub_part_ids, RESPONDED_STATUSES
+                )
+            return self._build_progress(manufacturer_part_id, total_sub_parts, responded_sub_parts)
                 
         except ValueError:
             raise
@@ -395,14 +393,36 @@ class PcfConsumptionManager:
             ValueError: If the request does not exist or if there is an error retrieving the data
         """
         try:
-            status = self.consult_global_assembly_progress(manufacturer_part_id)
+            with RepositoryManagerFactory.create() as repo_manager:
+                sub_part_ids = self._get_sub_part_ids(repo_manager, manufacturer_part_id)
+                sub_parts = repo_manager.pcf_repository.find_latest_by_part_ids_with_response(sub_part_ids)
+                # Read everything needed from the entities while the session is open
+                pcf_exchange_collection: List[PcfExchangeModel] = []
+                payload_locations = []
+                responded_sub_parts = 0
+                for sub_part_id in sub_part_ids:
+                    if sub_part_id not in sub_parts:
+                        continue
+                    exchange, response = sub_parts[sub_part_id]
+                    if response is not None and response.status in RESPONDED_STATUSES:
+                        responded_sub_parts += 1
+                    source = response or exchange
+                    pcf_exchange_collection.append(PcfExchangeModel.from_entity(exchange))
+                    payload_locations.append((source.manufacturer_part_id, source.version or DEFAULT_PCF_VERSION))
+
+            status = self._build_progress(manufacturer_part_id, len(pcf_exchange_collection), responded_sub_parts)
             if status.overall_status != "COMPLETED":
                 raise ValueError(f"PCF data for part {manufacturer_part_id} is not yet available for download. Current assembly progress: {status.progress_percentage}%")
-            part_info = self.search_own_parts_by_manufacturer_part_id(manufacturer_part_id)
-            pcf_exchange_collection: List[PcfExchangeModel] = []
-            for sub_part in part_info.list_sub_manufacturer_part_ids:
-                exchange = self.consult_pcf_response(sub_part.request_id)
-                pcf_exchange_collection.append(exchange)
+
+            # The payloads are independent documents of the submodel service, read them concurrently
+            if payload_locations:
+                with ThreadPoolExecutor(max_workers=min(len(payload_locations), self._download_max_workers), thread_name_prefix="pcf-download") as executor:
+                    payloads = list(executor.map(
+                        lambda location: management_manager.get_pcf_data_by_manufacturer_part_id(*location),
+                        payload_locations
+                    ))
+                for exchange_model, pcf_data in zip(pcf_exchange_collection, payloads):
+                    exchange_model.pcf_data = pcf_data
             return pcf_exchange_collection
         except ValueError:
             raise
@@ -410,5 +430,46 @@ class PcfConsumptionManager:
             logger.error(f"Failed to download PCF data for part {_s(manufacturer_part_id)}: {_s(e)}")
             raise ValueError(f"Failed to download PCF data: {str(e)}")
 
+    @staticmethod
+    def _refresh_rollup(manufacturer_part_id: str) -> None:
+        """Recompute the PCF roll-up of a part whose sub-parts changed, and of the assemblies containing it."""
+        # Imported here, the roll-up manager depends on this module
+        from managers.addons_service.pcf_kit.v1.rollup import rollup_manager
+        try:
+            rollup_manager.refresh(manufacturer_part_id)
+        except Exception as e:
+            logger.warning(f"Could not refresh the PCF roll-up of part {_s(manufacturer_part_id)}: {_s(e)}")
+
+    def rollup_pcf_data(self, manufacturer_part_id: str) -> PcfRollupModel:
+        """
+        Roll up the received PCF values of all sub-parts of a part, over all levels, weighted by quantity.
+
+        Args:
+            manufacturer_part_id: The manufacturer part ID to roll up.
+        Returns:
+            A PcfRollupModel with the cradle-to-gate total of the part.
+        Raises:
+            ValueError: If the part relationships are invalid or the roll-up fails.
+        """
+        from managers.addons_service.pcf_kit.v1.rollup import rollup_manager
+        try:
+            return rollup_manager.rollup(manufacturer_part_id)
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to roll up the PCF data of part {_s(manufacturer_part_id)}: {_s(e)}")
+            raise ValueError(f"Failed to roll up PCF data: {str(e)}")
+
+    @staticmethod
+    def _build_progress(manufacturer_part_id: str, total_sub_parts: int, responded_sub_parts: int) -> PcfSpecificStateModel:
+        progress = (responded_sub_parts / total_sub_parts) * 100 if total_sub_parts > 0 else 100
+        return PcfSpecificStateModel(
+            manufacturer_part_id=manufacturer_part_id,
+            total_sub_parts=total_sub_parts,
+            responded_sub_parts=responded_sub_parts,
+            progress_percentage=progress,
+            overall_status="PENDING" if responded_sub_parts < total_sub_parts else "COMPLETED"
+        )
+
 # Module-level singleton for convenience
 consumption_manager = PcfConsumptionManager()
@@ -31,16 +31,16 @@ Reference:
 
 from typing import Dict, Any, Optional
 from uuid import UUID
-from tractusx_sdk.dataspace.tools.validate_submodels import submodel_schema_finder
 
 from managers.addons_service.pcf_kit.v1.notifications import pcf_notification_manager
 from managers.addons_service.pcf_kit.v1.management import management_manager
+from managers.addons_service.pcf_kit.v1.rollup import rollup_manager
 from managers.config.log_manager import LoggingManager
 from managers.config.config_manager import ConfigManager
 from managers.enablement_services.submodel_service_manager import SubmodelServiceManager
 from managers.metadata_database.manager import RepositoryManagerFactory
+from managers.submodels.schema_registry import SchemaRegistry
 from models.metadata_database.pcf import PcfExchangeDirection, PcfExchangeStatus, PcfExchangeType
-from tools.json_validator import json_validator_draft_aware
 from utils.log_utils import sanitize_log_value as _s
 from utils.pcf_utils import DEFAULT_PCF_VERSION, get_pcf_semantic_id
 
@@ -60,7 +60,7 @@ class PcfExchangeManager:
         submodel_service: Optional[SubmodelServiceManager] = None
     ) -> None:
         """Initialize the exchange manager with the submodel service."""
-        self._submodel_service = submodel_service or SubmodelServiceManager()
+        self._submodel_service = submodel_service or SubmodelServiceManager.get_instance()
         self._own_bpn = ConfigManager.get_config("bpn", default=None)
 
 
@@ -247,11 +247,9 @@ class PcfExchangeManager:
             raise ValueError("PCF data cannot be empty")
         
         try:
-            # submodel_schema_finder returns {'status': ..., 'schema': <actual_schema>}
+            # The registry keeps a draft-aware validator per schema (PCF schema uses Draft-04, not Draft-07)
             semantic_id = get_pcf_semantic_id(version)
-            pcf_schema_result = submodel_schema_finder(semantic_id)
-            # Use draft-aware validator (PCF schema uses Draft-04, not Draft-07)
-            json_validator_draft_aware(pcf_schema_result['schema'], pcf_data)
+            SchemaRegistry.get_instance().validate(semantic_id, pcf_data)
             logger.info(f"PCF data for request {_s(request_id)} validated successfully against {_s(version)} schema")
         except Exception as e:
             logger.error(f"PCF data validation failed for request {_s(request_id)}: {_s(e)}")
@@ -402,6 +400,13 @@ class PcfExchangeManager:
                 )
                 logger.info(f"Updated PCF exchange status for request {_s(request_id)}")
 
+        if type == PcfExchangeType.RESPONSE:
+            # The roll-up is derived data, a failure must not reject the response
+            try:
+                rollup_manager.record_response(manufacturer_part_id, pcf_data)
+            except Exception as e:
+                logger.warning(f"Could not update the PCF roll-up for part {_s(manufacturer_part_id)}: {_s(e)}")
+
 
 # Module-level singleton for convenience
 exchange_manager = PcfExchangeManager()
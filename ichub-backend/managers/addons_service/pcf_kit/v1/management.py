@@ -27,15 +27,16 @@ PCF Management Manager - Administrative operations for PCF data.
 
 from typing import Dict, Any, Optional, List
 from uuid import UUID
-import time
+from tractusx_sdk.dataspace.tools import HttpTools
 
 from managers.config.log_manager import LoggingManager
 from managers.config.config_manager import ConfigManager
+from managers.enablement_services.consumer.connector_delivery import ConnectorDelivery
+from managers.enablement_services.consumer.edr_reuse_policy import edr_reuse_policy
 from managers.enablement_services.submodel_service_manager import SubmodelServiceManager
 from managers.metadata_database.manager import RepositoryManagerFactory
+from managers.submodels.schema_registry import SchemaRegistry
 from models.metadata_database.pcf import PcfExchangeEntity, PcfExchangeDirection, PcfExchangeStatus, PcfExchangeType
-from tractusx_sdk.dataspace.tools.validate_submodels import submodel_schema_finder
-from tools.json_validator import json_validator_draft_aware
 from tools.exceptions import NotFoundError
 from utils.log_utils import sanitize_log_value as _s
 from utils.pcf_utils import (
@@ -49,6 +50,10 @@ from utils.pcf_utils import (
 logger = LoggingManager.get_logger(__name__)
 
 
+class _EdcTransferStatusError(ValueError):
+    """The dataplane answered with an unsuccessful status, which is not retried on the same connector."""
+
+
 class PcfManagementManager:
     """
     Manages PCF administrative and retrieval operations.
@@ -59,7 +64,7 @@ class PcfManagementManager:
 
     def __init__(self, submodel_service: Optional[SubmodelServiceManager] = None) -> None:
         """Initialize the management manager with submodel service."""
-        self._submodel_service = submodel_service or SubmodelServiceManager()
+        self._submodel_service = submodel_service or SubmodelServiceManager.get_instance()
         self._own_bpn = ConfigManager.get_config("bpn", default=None)
         if self._own_bpn is None:
             logger.warning("BPN not configured in configuration.yml. PCF operations requiring BPN will fail at call time.")
@@ -502,8 +507,7 @@ class PcfManagementManager:
             ValueError: If the data does not conform to the schema.
         """
         semantic_id = get_pcf_semantic_id(version)
-        pcf_schema_result = submodel_schema_finder(semantic_id)
-        json_validator_draft_aware(pcf_schema_result["schema"], pcf_data)
+        SchemaRegistry.get_instance().validate(semantic_id, pcf_data)
 
     def send_via_edc(
         self,
@@ -518,7 +522,12 @@ class PcfManagementManager:
         asset_version: Optional[str] = None,
     ) -> None:
         """
-        Send PCF data via EDC using either GET or PUT method with single retry on failure.
+        Send PCF data via EDC using either GET or PUT method.
+
+        The partner's connectors are tried from the healthiest to the least healthy,
+        the next one is started while the previous is still running after the
+        configured hedge delay and the first success is returned. A connector that
+        raised an error is retried after a backoff (see ConnectorDelivery).
 
         This is a shared method for both consumption (GET requests) and 
         provision (PUT responses) to avoid code duplication.
@@ -551,100 +560,46 @@ class PcfManagementManager:
 
         logger.info(f"[PCF EDC] Discovering connectors for BPN [{_s(target_bpn)}]")
 
-        # Evict any stale EDR for this counterparty from both the in-memory cache
-        # and the edr_connections DB table before attempting a fresh negotiation.
-        #
-        # In Saturn, the cache is keyed by the counterparty DID
-        # (e.g. "did:web:wallet.example.com:BPNL000000000065"). We resolve the
-        # exact DID first so that clear_connections_by_party can do a precise
-        # match. If discovery fails or the service is Jupiter, we fall back to
-        # the BPN value, which clear_connections_by_party also handles via
-        # substring matching (the DID always contains the BPN).
-        if hasattr(consumer_connector_service, 'connection_manager'):
-            party_key = target_bpn
-            if hasattr(consumer_connector_service, 'get_discovery_info'):
-                try:
-                    _, party_key, _ = consumer_connector_service.get_discovery_info(bpnl=target_bpn)
-                    logger.debug(f"[PCF EDC] Resolved counterparty DID for BPN [{_s(target_bpn)}]: {_s(party_key)}")
-                except Exception as discovery_err:
-                    logger.warning(
-                        f"[PCF EDC] Could not resolve DID for BPN [{_s(target_bpn)}], "
-                        f"falling back to BPN substring clear: {_s(discovery_err)}"
-                    )
-            removed = consumer_connector_service.connection_manager.clear_connections_by_party(party_key)
-            logger.debug(f"[PCF EDC] Cleared EDR cache for [{_s(party_key)}] (removed {removed} entries)")
-
         connectors = connector_consumer_manager.get_connectors(target_bpn)
         if not connectors:
             raise ValueError(f"No connector endpoints found for BPN [{target_bpn}].")
         logger.info(f"[PCF EDC] Found {len(connectors)} connector(s) for BPN [{_s(target_bpn)}]")
 
-        last_error = None
-        for connector_url in connectors:
-            try:
-                response = self._dispatch_edc_request(
-                    consumer_connector_service, http_method, target_bpn,
-                    connector_url, asset_type, list_policies, path, params, json_data,
-                    asset_version=asset_version,
-                )
-
-                if response.status_code in (200, 201, 202, 204):
-                    logger.info(
-                        f"[PCF EDC] {_s(http_method)} successful for request [{_s(request_id)}] "
-                        f"(HTTP {_s(response.status_code)})"
-                    )
-                    return response
-
-                logger.warning(
-                    f"[PCF EDC] {_s(http_method)} returned status {_s(response.status_code)} "
-                    f"on [{_s(connector_url)}]: {_s(response.text)}"
-                )
-                last_error = ValueError(
-                    f"EDC data transfer failed with status {response.status_code}"
-                )
+        def attempt(connector_url: str):
+            response = self._dispatch_edc_request(
+                consumer_connector_service, http_method, target_bpn,
+                connector_url, asset_type, list_policies, path, params, json_data,
+                asset_version=asset_version,
+            )
+            if response.status_code in (200, 201, 202, 204):
+                return response
+            logger.warning(
+                f"[PCF EDC] {_s(http_method)} returned status {_s(response.status_code)} "
+                f"on [{_s(connector_url)}]: {_s(response.text)}"
+            )
+            raise _EdcTransferStatusError(
+                f"EDC data transfer failed with status {response.status_code}"
+            )
 
-            except Exception as e:
-                logger.warning(
-                    f"[PCF EDC] Failed on connector [{_s(connector_url)}]: {_s(e)}. "
-                    f"Retrying in 3 seconds..."
-                )
-                
-                # Wait and retry once more
-                time.sleep(3)
-                
-                try:
-                    logger.info(
-                        f"[PCF EDC] Retry: Attempting {_s(http_method)} on [{_s(connector_url)}] path=[{_s(path)}]"
-                    )
-                    response = self._dispatch_edc_request(
-                        consumer_connector_service, http_method, target_bpn,
-                        connector_url, asset_type, list_policies, path, params, json_data,
-                        asset_version=asset_version,
-                    )
-                    
-                    if response.status_code in (200, 201, 202, 204):
-                        logger.info(
-                            f"[PCF EDC] Retry successful for request [{_s(request_id)}] "
-                            f"(HTTP {response.status_code})"
-                        )
-                        return response
-                    
-                    logger.warning(
-                        f"[PCF EDC] Retry also failed with status {response.status_code}"
-                    )
-                    last_error = ValueError(
-                        f"EDC data transfer failed on retry with status {response.status_code}"
-                    )
-                    
-                except Exception as retry_error:
-                    logger.warning(
-                        f"[PCF EDC] Retry also failed: {_s(retry_error)}"
-                    )
-                    last_error = retry_error
+        # Connectors are tried healthiest first and hedged, so a dead connector of
+        # the partner only delays the delivery by the hedge delay.
+        try:
+            response = ConnectorDelivery.get_instance().deliver(
+                connectors,
+                attempt,
+                retryable=lambda error: not isinstance(error, _EdcTransferStatusError),
+                name=f"PCF EDC {_s(request_id)}",
+            )
+        except Exception as last_error:
+            raise ValueError(
+                f"Failed to send PCF data via EDC to any connector for BPN [{target_bpn}]: {last_error}"
+            )
 
-        raise ValueError(
-            f"Failed to send PCF data via EDC to any connector for BPN [{target_bpn}]: {last_error}"
+        logger.info(
+            f"[PCF EDC] {_s(http_method)} successful for request [{_s(request_id)}] "
+            f"(HTTP {_s(response.status_code)})"
         )
+        return response
 
     def _dispatch_edc_request(
         self,
@@ -683,26 +638,70 @@ class PcfManagementManager:
             )
             filter_expression.append(version_filter)
 
-        if http_method.upper() == "GET":
-            return consumer_connector_service.do_get_with_bpnl(
+        method = http_method.upper()
+        if method not in ("GET", "PUT"):
+            raise ValueError(f"Unsupported HTTP method: {http_method}")
+
+        def negotiate():
+            dataplane_url, access_token = consumer_connector_service.do_dsp_with_bpnl(
                 bpnl=target_bpn,
                 counter_party_address=connector_url,
                 filter_expression=filter_expression,
                 policies=list_policies,
-                path=path,
-                params=params if params else None,
             )
-        elif http_method.upper() == "PUT":
-            return consumer_connector_service.do_put_with_bpnl(
-                bpnl=target_bpn,
-                counter_party_address=connector_url,
-                filter_expression=filter_expression,
-                json=json_data if json_data is not None else {},
-                policies=list_policies,
-                path=path,
+            if dataplane_url is None or access_token is None:
+                raise RuntimeError("No dataplane URL or access token was returned by the EDR negotiation.")
+            return dataplane_url, access_token
+
+        def execute(dataplane_url, access_token):
+            headers = consumer_connector_service.get_data_plane_headers(access_token=access_token)
+            if method == "GET":
+                return HttpTools.do_get(
+                    url=dataplane_url + path, headers=headers, verify=False,
+                    params=params if params else None, allow_redirects=False,
+                )
+            return HttpTools.do_put(
+                url=dataplane_url + path, json=json_data if json_data is not None else {},
+                headers=headers, verify=False, allow_redirects=False,
             )
-        else:
-            raise ValueError(f"Unsupported HTTP method: {http_method}")
+
+        # The EDR of the PCF exchange asset is reused while its token is valid,
+        # the counterparty's cached transfers are only cleared when it refuses it.
+        asset = f"{asset_type}@{asset_version}" if asset_version else asset_type
+        return edr_reuse_policy.call(
+            edr_reuse_policy.key(target_bpn, connector_url, asset, list_policies),
+            negotiate=negotiate,
+            request=execute,
+            on_rejected=lambda: self._evict_edr_cache(consumer_connector_service, target_bpn),
+        )
+
+    def _evict_edr_cache(self, consumer_connector_service, target_bpn: str) -> None:
+        """
+        Evict the EDRs of a counterparty from both the in-memory cache and the
+        edr_connections DB table of the connector SDK, so that the next
+        transfer is negotiated anew.
+
+        In Saturn, the cache is keyed by the counterparty DID
+        (e.g. "did:web:wallet.example.com:BPNL000000000065"). We resolve the
+        exact DID first so that clear_connections_by_party can do a precise
+        match. If discovery fails or the service is Jupiter, we fall back to
+        the BPN value, which clear_connections_by_party also handles via
+        substring matching (the DID always contains the BPN).
+        """
+        if not hasattr(consumer_connector_service, 'connection_manager'):
+            return
+        party_key = target_bpn
+        if hasattr(consumer_connector_service, 'get_discovery_info'):
+            try:
+                _, party_key, _ = consumer_connector_service.get_discovery_info(bpnl=target_bpn)
+                logger.debug(f"[PCF EDC] Resolved counterparty DID for BPN [{_s(target_bpn)}]: {_s(party_key)}")
+            except Exception as discovery_err:
+                logger.warning(
+                    f"[PCF EDC] Could not resolve DID for BPN [{_s(target_bpn)}], "
+                    f"falling back to BPN substring clear: {_s(discovery_err)}"
+                )
+        removed = consumer_connector_service.connection_manager.clear_connections_by_party(party_key)
+        logger.debug(f"[PCF EDC] Cleared EDR cache for [{_s(party_key)}] (removed {removed} entries)")
 
     def _get_connector_services(self):
         """
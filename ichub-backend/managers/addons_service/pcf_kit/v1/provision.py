@@ -80,7 +80,7 @@ class PcfProvisionManager:
         submodel_service: Optional[SubmodelServiceManager] = None,
     ) -> None:
         """Initialize the provision manager with the submodel service."""
-        self._submodel_service = submodel_service or SubmodelServiceManager()
+        self._submodel_service = submodel_service or SubmodelServiceManager.get_instance()
         self._own_bpn = ConfigManager.get_config("bpn", default=None)
         if self._own_bpn is None:
             logger.warning("BPN not configured in configuration.yml. PCF operations requiring BPN will fail at call time.")
@@ -0,0 +1,250 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+"""
+PCF Roll-up Manager - Cradle-to-gate PCF totals over the bill of materials.
+"""
+
+import threading
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from managers.addons_service.pcf_kit.v1.consumption import RESPONDED_STATUSES
+from managers.config.log_manager import LoggingManager
+from managers.metadata_database.manager import RepositoryManagerFactory
+from models.services.addons.pcf_kit.v1.models import PcfRollupModel
+from utils.log_utils import sanitize_log_value as _s
+from utils.pcf_utils import DEFAULT_PCF_VERSION, get_pcf_excluding_biogenic
+
+logger = LoggingManager.get_logger(__name__)
+
+## (parent part ID, child part ID, quantity)
+Edge = Tuple[str, str, float]
+## (total PCF, number of sub-parts without a value)
+Total = Tuple[Optional[float], int]
+
+
+def roll_up(edges: Iterable[Edge], known: Dict[str, Total]) -> Dict[str, Total]:
+    """
+    Aggregate PCF values over a part-relationship graph in one pass.
+
+    The parts are indexed into flat arrays and visited in topological order, from the
+    leaves up, so every part is computed once from the final totals of its sub-parts:
+    the quantity-weighted sum of their totals. Parts in ``known`` keep their value and
+    their own sub-parts are not visited. Leaves without a known value have no total
+    and count as one missing part. The missing parts are carried up as sets, so a
+    sub-part shared by several assemblies of the same part is counted once.
+
+    Args:
+        edges: The edges of the graph.
+        known: Totals of the parts whose value is already known, e.g. a received PCF.
+
+    Returns:
+        Dict[str, Total]: The total and number of missing sub-parts of every part of the graph.
+
+    Raises:
+        ValueError: If the graph contains a cycle.
+    """
+    index: Dict[str, int] = {}
+    parents: List[int] = []
+    children: List[int] = []
+    quantities: List[float] = []
+    for parent_id, child_id, quantity in edges:
+        parent = index.setdefault(parent_id, len(index))
+        child = index.setdefault(child_id, len(index))
+        if parent_id in known:
+            continue
+        parents.append(parent)
+        children.append(child)
+        quantities.append(quantity)
+
+    part_ids = list(index)
+    size = len(part_ids)
+    child_edges: List[List[int]] = [[] for _ in range(size)]
+    parent_edges: List[List[int]] = [[] for _ in range(size)]
+    for edge, (parent, child) in enumerate(zip(parents, children)):
+        child_edges[parent].append(edge)
+        parent_edges[child].append(edge)
+
+    # Topological order from the leaves up (Kahn)
+    pending = [len(edges_of_part) for edges_of_part in child_edges]
+    order = [part for part in range(size) if pending[part] == 0]
+    for part in order:
+        for edge in parent_edges[part]:
+            parent = parents[edge]
+            pending[parent] -= 1
+            if pending[parent] == 0:
+                order.append(parent)
+    if len(order) < size:
+        cyclic = [part_ids[part] for part in range(size) if pending[part] > 0]
+        raise ValueError(f"The part relationships contain a cycle through {cyclic[:5]}")
+
+    totals: List[Optional[float]] = [None] * size
+    missing: List[Set] = [set() for _ in range(size)]
+    for part in order:
+        part_id = part_ids[part]
+        if part_id in known:
+            # Only the number of missing sub-parts of a known total is stored
+            totals[part], missing_count = known[part_id]
+            missing[part] = {(part_id, i) for i in range(missing_count)}
+        elif not child_edges[part]:
+            missing[part] = {part_id}
+        else:
+            total = 0.0
+            for edge in child_edges[part]:
+                child = children[edge]
+                total += quantities[edge] * (totals[child] or 0.0)
+                missing[part] |= missing[child]
+            totals[part] = total
+    return {part_id: (totals[part], len(missing[part])) for part, part_id in enumerate(part_ids)}
+
+
+class PcfRollupManager:
+    """
+    Maintains the cradle-to-gate PCF totals of own parts over all levels of their bill of materials.
+
+    Received PCF values are stored per part. When a sub-part response arrives, or a sub-part
+    is added, only the part and the assemblies above it are recomputed, from the stored totals
+    of their other sub-parts.
+
+    Relationships stored before the part-relationship graph existed are moved to edges in one
+    step, before the first roll-up of the process reads the graph.
+    """
+
+    def __init__(self):
+        self._legacy_migrated = False
+        self._migration_lock = threading.Lock()
+
+    def _migrate_legacy_relationships(self) -> None:
+        """Move all the sub-parts still stored in legacy JSON lists to edges, once per process."""
+        if self._legacy_migrated:
+            return
+        with self._migration_lock:
+            if self._legacy_migrated:
+                return
+            with RepositoryManagerFactory.create() as repo_manager:
+                migrated = repo_manager.pcf_relationship_repository.migrate_legacy_sub_parts()
+                repo_manager.commit()
+            if migrated:
+                logger.info(f"[PCF Roll-up] Moved the sub-parts of {migrated} legacy part relationship(s) to edges")
+            self._legacy_migrated = True
+
+    def record_response(self, manufacturer_part_id: str, pcf_data: Dict) -> None:
+        """
+        Store the PCF value of a received response and recompute the assemblies containing the part.
+
+        Args:
+            manufacturer_part_id: The part the response is for.
+            pcf_data: The received PCF payload.
+        """
+        received_pcf = get_pcf_excluding_biogenic(pcf_data)
+        if received_pcf is None:
+            logger.warning(f"[PCF Roll-up] The PCF response for part {_s(manufacturer_part_id)} carries no pcfExcludingBiogenic value")
+        self._migrate_legacy_relationships()
+        with RepositoryManagerFactory.create() as repo_manager:
+            repository = repo_manager.pcf_relationship_repository
+            repository.save_received_pcf(manufacturer_part_id, received_pcf)
+            self._recompute(repository, [manufacturer_part_id])
+            repo_manager.commit()
+
+    def refresh(self, manufacturer_part_id: str) -> None:
+        """Recompute a part and the assemblies containing it, e.g. after a sub-part was added."""
+        self._migrate_legacy_relationships()
+        with RepositoryManagerFactory.create() as repo_manager:
+            self._recompute(repo_manager.pcf_relationship_repository, [manufacturer_part_id])
+            repo_manager.commit()
+
+    def _recompute(self, repository, manufacturer_part_ids: List[str]) -> Dict[str, Total]:
+        """Recompute the given parts and all their ancestors, reusing the stored totals of the other parts."""
+        affected: Set[str] = set(manufacturer_part_ids) | set(repository.find_ancestor_ids(manufacturer_part_ids))
+        edges: List[Edge] = repository.find_child_edges(list(affected))
+        rollups = repository.find_rollups(list(affected | {child_id for _, child_id, _ in edges}))
+
+        # Sub-parts with children that were never rolled up (e.g. stored before the roll-up existed)
+        for child_id in {child_id for _, child_id, _ in edges} - affected - set(rollups):
+            subtree = repository.find_descendant_edges(child_id)
+            edges.extend(subtree)
+            rollups.update(repository.find_rollups([part_id for _, part_id, _ in subtree]))
+
+        known: Dict[str, Total] = {}
+        for part_id, rollup in rollups.items():
+            if rollup.received_pcf is not None:
+                known[part_id] = (rollup.received_pcf, 0)
+            elif part_id not in affected and (rollup.total_pcf is not None or rollup.missing_parts):
+                known[part_id] = (rollup.total_pcf, rollup.missing_parts)
+
+        totals = roll_up(edges, known)
+        for part_id in affected:
+            totals.setdefault(part_id, known.get(part_id, (None, 1)))
+        repository.save_totals({part_id: totals[part_id] for part_id in affected})
+        return totals
+
+    def rollup(self, manufacturer_part_id: str) -> PcfRollupModel:
+        """
+        Compute the cradle-to-gate PCF of a part over its whole bill of materials.
+
+        The tree is read with one recursive query and aggregated in one pass. Responded
+        sub-parts whose value was never stored are read once from their PCF payload.
+
+        Args:
+            manufacturer_part_id: The own part to roll up.
+
+        Returns:
+            PcfRollupModel with the total, the number of parts and the sub-parts still missing a value.
+        """
+        from managers.addons_service.pcf_kit.v1.management import management_manager
+
+        self._migrate_legacy_relationships()
+        with RepositoryManagerFactory.create() as repo_manager:
+            repository = repo_manager.pcf_relationship_repository
+            edges = repository.find_descendant_edges(manufacturer_part_id)
+            part_ids = {manufacturer_part_id} | {part_id for edge in edges for part_id in edge[:2]}
+            rollups = repository.find_rollups(list(part_ids))
+
+            parents = {parent_id for parent_id, _, _ in edges}
+            unknown_leaves = [part_id for part_id in part_ids - parents if part_id not in rollups]
+            if unknown_leaves:
+                responses = repo_manager.pcf_repository.find_latest_by_part_ids_with_response(unknown_leaves)
+                for part_id, (_, response) in responses.items():
+                    if response is None or response.status not in RESPONDED_STATUSES:
+                        continue
+                    pcf_data = management_manager.get_pcf_data_by_manufacturer_part_id(part_id, response.version or DEFAULT_PCF_VERSION)
+                    rollups[part_id] = repository.save_received_pcf(part_id, get_pcf_excluding_biogenic(pcf_data or {}))
+
+            known = {part_id: (rollup.received_pcf, 0) for part_id, rollup in rollups.items() if rollup.received_pcf is not None}
+            totals = roll_up(edges, known)
+            totals.setdefault(manufacturer_part_id, known.get(manufacturer_part_id, (None, 1)))
+            repository.save_totals(totals)
+            repo_manager.commit()
+
+        total_pcf, missing_parts = totals[manufacturer_part_id]
+        return PcfRollupModel(
+            manufacturer_part_id=manufacturer_part_id,
+            pcf_excluding_biogenic=total_pcf,
+            total_parts=len(part_ids) - 1,
+            missing_parts=missing_parts,
+            complete=missing_parts == 0,
+        )
+
+
+# Module-level singleton for convenience
+rollup_manager = PcfRollupManager()
@@ -56,7 +56,10 @@ class HttpSubmodelAdapter(SubmodelAdapter):
         auth_token: Optional[str] = None,
         auth_key_name: Optional[str] = None,
         timeout: int = 30,
-        verify_ssl: bool = True
+        verify_ssl: bool = True,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30
     ):
         """
         Initialize the HTTP submodel adapter.
@@ -69,6 +72,9 @@ class HttpSubmodelAdapter(SubmodelAdapter):
             auth_key_name: Header name for API key (e.g., "X-Api-Key"), required when auth_type="apikey"
             timeout: Request timeout in seconds (default: 30)
             verify_ssl: Whether to verify SSL certificates (default: True)
+            max_connections: Maximum number of concurrent connections of the pool (default: 20)
+            max_keepalive_connections: Maximum number of idle connections kept alive (default: 10)
+            keepalive_expiry: Seconds an idle connection is kept alive (default: 30)
         """
         self.base_url = base_url.rstrip('/')
         self.api_path = api_path.rstrip('/') if api_path else ""
@@ -90,11 +96,16 @@ class HttpSubmodelAdapter(SubmodelAdapter):
                 "auth_key_name is required when auth_type='apikey'"
             )
         
-        # Initialize HTTP client
+        # Initialize HTTP client, its connection pool is reused by every request of this adapter
         self.client = httpx.Client(
             timeout=timeout,
             verify=verify_ssl,
-            follow_redirects=True
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry
+            )
         )
         
         self.logger.info(f"HttpSubmodelAdapter initialized for {self.base_url}")
@@ -513,11 +524,15 @@ class HttpSubmodelAdapter(SubmodelAdapter):
         self._semantic_id_cache[sha256_hash] = semantic_id
         self.logger.debug(f"Cached semantic_id mapping: {sha256_hash[:16]}... -> {semantic_id}")
     
-    def __del__(self):
-        """Cleanup HTTP client on adapter destruction."""
+    def close(self) -> None:
+        """Close the HTTP client and its connection pool."""
         try:
-            if hasattr(self, 'client'):
+            if hasattr(self, 'client') and not self.client.is_closed:
                 self.client.close()
                 self.logger.debug("HTTP client closed")
         except Exception as e:
             self.logger.warning(f"Error closing HTTP client: {e}")
+
+    def __del__(self):
+        """Cleanup HTTP client on adapter destruction."""
+        self.close()
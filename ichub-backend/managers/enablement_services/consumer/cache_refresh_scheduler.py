@@ -0,0 +1,265 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Hashable, List, Optional, Protocol, Set, Tuple
+
+from managers.config.config_manager import ConfigManager
+
+logger = logging.getLogger(__name__)
+
+
+class CacheAccessTracker:
+    """
+    Tracks how the discovery cache of a manager is used.
+
+    Every lookup is counted as a hit (valid entry), a stale hit (expired entry
+    served while it is refreshed) or a cold miss (the request had to wait for a
+    discovery). Each key also gets an access score that halves every
+    ``half_life_seconds``, so recently and frequently used partners rank first.
+    """
+
+    HIT = "hit"
+    STALE = "stale"
+    COLD = "cold"
+
+    def __init__(self, half_life_seconds: float = 600, max_keys: int = 10000):
+        """
+        Initialize the tracker.
+
+        Args:
+            half_life_seconds (float, optional): Time after which an access counts half. Defaults to 600.
+            max_keys (int, optional): Maximum number of tracked keys, the lowest scores are dropped first. Defaults to 10000.
+        """
+        self.half_life_seconds = max(1.0, half_life_seconds)
+        self.max_keys = max(1, max_keys)
+        # key -> (score, last update)
+        self._scores: Dict[Hashable, Tuple[float, float]] = {}
+        self._counters = {self.HIT: 0, self.STALE: 0, self.COLD: 0, "refreshes": 0, "refresh_errors": 0}
+        self._lock = threading.Lock()
+
+    def _decayed(self, key: Hashable, now: float) -> float:
+        score, updated = self._scores.get(key, (0.0, now))
+        return score * 0.5 ** ((now - updated) / self.half_life_seconds)
+
+    def record(self, key: Hashable, outcome: str) -> None:
+        """Record a lookup of the key with its outcome (``HIT``, ``STALE`` or ``COLD``)."""
+        now = time.monotonic()
+        with self._lock:
+            self._counters[outcome] += 1
+            self._scores[key] = (self._decayed(key, now) + 1.0, now)
+            if len(self._scores) > self.max_keys:
+                coldest = min(self._scores, key=lambda k: self._decayed(k, now))
+                del self._scores[coldest]
+
+    def record_refresh(self, success: bool) -> None:
+        """Record a proactive refresh and whether it succeeded."""
+        with self._lock:
+            self._counters["refreshes" if success else "refresh_errors"] += 1
+
+    def score(self, key: Hashable) -> float:
+        """Return the current access score of the key."""
+        with self._lock:
+            return self._decayed(key, time.monotonic())
+
+    def get_stats(self) -> Dict:
+        """Return the lookup counters and the share of lookups that hit the cold path."""
+        with self._lock:
+            lookups = self._counters[self.HIT] + self._counters[self.STALE] + self._counters[self.COLD]
+            return {
+                "hits": self._counters[self.HIT],
+                "stale_hits": self._counters[self.STALE],
+                "cold_misses": self._counters[self.COLD],
+                "cold_miss_ratio": self._counters[self.COLD] / lookups if lookups else 0.0,
+                "refreshes": self._counters["refreshes"],
+                "refresh_errors": self._counters["refresh_errors"],
+                "tracked_keys": len(self._scores),
+            }
+
+
+class RefreshableCache(Protocol):
+    """Interface of the managers whose entries can be refreshed ahead of expiry."""
+
+    access_tracker: CacheAccessTracker
+
+    def get_expiring_bpns(self, within_seconds: float) -> List[Tuple[str, float]]:
+        ...
+
+    def refresh_bpn(self, bpn: str) -> None:
+        ...
+
+
+class CacheRefreshScheduler:
+    """
+    Refreshes frequently used connector and DTR cache entries shortly before they expire.
+
+    Every cycle the registered managers are asked for the entries expiring within
+    ``refresh_ahead`` seconds. Entries whose access score reaches
+    ``min_access_score`` are refreshed, most used first, in a bounded pool, so
+    user requests for hot partners keep finding a valid cache entry. The cycle
+    interval and the refresh window are jittered to spread the refreshes of
+    entries that were cached at the same time.
+    """
+
+    _instance: Optional['CacheRefreshScheduler'] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, interval: float = 30, refresh_ahead: float = 120, max_workers: int = 4, jitter: float = 0.2,
+                 max_refreshes_per_cycle: int = 50, min_access_score: float = 0.5):
+        """
+        Initialize the scheduler.
+
+        Args:
+            interval (float, optional): Seconds between two refresh cycles. Defaults to 30.
+            refresh_ahead (float, optional): Entries expiring within this many seconds are refreshed. Defaults to 120.
+            max_workers (int, optional): Maximum number of refreshes running at the same time. Defaults to 4.
+            jitter (float, optional): Relative jitter applied to the interval and the refresh window. Defaults to 0.2.
+            max_refreshes_per_cycle (int, optional): Maximum number of refreshes started per cycle. Defaults to 50.
+            min_access_score (float, optional): Minimum access score for an entry to be refreshed. Defaults to 0.5 (one request within the last half-life).
+        """
+        self.interval = max(1.0, interval)
+        self.refresh_ahead = max(0.0, refresh_ahead)
+        self.max_workers = max(1, max_workers)
+        self.jitter = min(max(0.0, jitter), 0.9)
+        self.max_refreshes_per_cycle = max(1, max_refreshes_per_cycle)
+        self.min_access_score = min_access_score
+        self._caches: List[Tuple[str, RefreshableCache]] = []
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="cache-refresh")
+        self._in_progress: Set[Tuple[str, str]] = set()
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.cycles = 0
+
+    @classmethod
+    def get_instance(cls) -> 'CacheRefreshScheduler':
+        """Return the process-wide scheduler, creating it from the configuration on first use."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls(
+                    interval=float(ConfigManager.get_config("consumer.discovery.proactive_refresh.interval", default=30)),
+                    refresh_ahead=float(ConfigManager.get_config("consumer.discovery.proactive_refresh.refresh_ahead", default=120)),
+                    max_workers=int(ConfigManager.get_config("consumer.discovery.proactive_refresh.max_workers", default=4)),
+                    jitter=float(ConfigManager.get_config("consumer.discovery.proactive_refresh.jitter", default=0.2)),
+                    max_refreshes_per_cycle=int(ConfigManager.get_config("consumer.discovery.proactive_refresh.max_refreshes_per_cycle", default=50)),
+                    min_access_score=float(ConfigManager.get_config("consumer.discovery.proactive_refresh.min_access_score", default=0.5)),
+                )
+            return cls._instance
+
+    @classmethod
+    def shutdown_instance(cls) -> None:
+        """Stop the process-wide scheduler, if it was created."""
+        with cls._instance_lock:
+            if cls._instance is not None:
+                cls._instance.stop()
+                cls._instance = None
+
+    def register(self, name: str, cache: RefreshableCache) -> None:
+        """Register a manager whose entries are refreshed ahead of expiry."""
+        with self._lock:
+            self._caches.append((name, cache))
+
+    def start(self) -> None:
+        """Start the background refresh loop."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._loop, name="cache-refresh-scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the refresh loop and wait for the running refreshes."""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=self.interval)
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _loop(self) -> None:
+        while not self._stop_event.wait(self.interval * random.uniform(1 - self.jitter, 1 + self.jitter)):
+            try:
+                self.run_once()
+            except Exception as e:
+                logger.warning(f"[CacheRefreshScheduler] Refresh cycle failed: {e}")
+
+    def _select_candidates(self) -> List[Tuple[float, str, RefreshableCache, str]]:
+        """Collect the expiring entries that are used often enough, most used first."""
+        with self._lock:
+            caches = list(self._caches)
+        candidates = []
+        for name, cache in caches:
+            for bpn, seconds_left in cache.get_expiring_bpns(self.refresh_ahead):
+                # Spread the refreshes of entries expiring at the same time
+                if seconds_left > self.refresh_ahead * (1 - self.jitter * random.random()):
+                    continue
+                score = cache.access_tracker.score(bpn)
+                if score < self.min_access_score:
+                    continue
+                candidates.append((score, name, cache, bpn))
+        candidates.sort(key=lambda candidate: candidate[0], reverse=True)
+        return candidates
+
+    def run_once(self) -> int:
+        """
+        Run one refresh cycle.
+
+        Returns:
+            int: Number of refreshes started.
+        """
+        started = 0
+        for score, name, cache, bpn in self._select_candidates():
+            if started >= self.max_refreshes_per_cycle:
+                break
+            with self._lock:
+                if (name, bpn) in self._in_progress:
+                    continue
+                self._in_progress.add((name, bpn))
+            self._executor.submit(self._refresh, name, cache, bpn)
+            started += 1
+        self.cycles += 1
+        return started
+
+    def _refresh(self, name: str, cache: RefreshableCache, bpn: str) -> None:
+        try:
+            cache.refresh_bpn(bpn)
+            cache.access_tracker.record_refresh(success=True)
+        except Exception as e:
+            cache.access_tracker.record_refresh(success=False)
+            logger.warning(f"[CacheRefreshScheduler] [{name}] [{bpn}] Refresh failed: {e}")
+        finally:
+            with self._lock:
+                self._in_progress.discard((name, bpn))
+
+    def get_stats(self) -> Dict:
+        """Return the cycle count and the access statistics of every registered manager."""
+        with self._lock:
+            caches = list(self._caches)
+            in_progress = len(self._in_progress)
+        return {
+            "cycles": self.cycles,
+            "in_progress": in_progress,
+            "caches": {name: cache.access_tracker.get_stats() for name, cache in caches},
+        }
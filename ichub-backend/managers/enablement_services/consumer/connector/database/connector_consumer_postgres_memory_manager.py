@@ -22,21 +22,20 @@
 ## Code created partially using a LLM (GPT 4o) and reviewed by a human committer
 
 import threading
-import hashlib
-import copy
-from typing import List, Dict, Optional
-import json
+from typing import List, Dict, Optional, Set
 from datetime import datetime
 from sqlmodel import select, delete, Session, SQLModel
+from sqlalchemy import func, inspect, text
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.exc import SQLAlchemyError
 import logging
 from ..memory import ConnectorConsumerMemoryManager
 from tractusx_sdk.dataspace.services.discovery import ConnectorDiscoveryService
 from tractusx_sdk.dataspace.services.connector import BaseConnectorConsumerService
-from tractusx_sdk.dataspace.tools import op
 from sqlalchemy.engine import Engine as E
 from sqlalchemy.orm import Session as S
 from models.metadata_database.consumer.models import KnownConnectors
+from tools.frozen_tools import freeze
 
 class ConsumerConnectorPostgresMemoryManager(ConnectorConsumerMemoryManager):
     """
@@ -52,7 +51,9 @@ class ConsumerConnectorPostgresMemoryManager(ConnectorConsumerMemoryManager):
                  table_name: str = "known_connectors", 
                  connectors_key: str = "connectors", 
                  logger: logging.Logger = None, 
-                 verbose: bool = False):
+                 verbose: bool = False,
+                 stale_while_revalidate: bool = False,
+                 discovery_timeout: float = 60):
         """
         Initialize the Postgres memory-backed connection manager.
 
@@ -65,6 +66,8 @@ class ConsumerConnectorPostgresMemoryManager(ConnectorConsumerMemoryManager):
             connectors_key: Key used to store EDR counts within open_connections.
             logger: Optional logger instance for debug output.
             verbose: Flag for enabling verbose logging.
+            stale_while_revalidate: Serve expired connectors while they are refreshed in the background.
+            discovery_timeout: Seconds a request waits for a discovery of the same BPN already in flight.
         """
         # Initialize base memory connection manager and configure database.
         # Dynamically define the SQLModel table for EDR connections.
@@ -74,7 +77,9 @@ class ConsumerConnectorPostgresMemoryManager(ConnectorConsumerMemoryManager):
             connector_discovery=connector_discovery, 
             expiration_time=expiration_time, 
             logger=logger, 
-            verbose=verbose
+            verbose=verbose,
+            stale_while_revalidate=stale_while_revalidate,
+            discovery_timeout=discovery_timeout
         )
         self.engine = engine
         self.table_name = table_name
@@ -82,7 +87,13 @@ class ConsumerConnectorPostgresMemoryManager(ConnectorConsumerMemoryManager):
         self._stop_event = threading.Event()
         self.connectors_key = connectors_key
         self._save_thread = None
-        self._last_saved_hash = None
+        # Dirty tracking: only the affected rows are written on the next save
+        self._dirty_bpns: Set[str] = set()  # BPNs whose row must be upserted
+        self._purged_bpns: Set[str] = set()  # BPNs whose row must be deleted
+        self._purge_all = False  # Whether the whole table must be cleared
+        self._dirty_lock = threading.Lock()
+        # Newest updated_at seen in the DB, used to only reload changed rows
+        self._high_water_mark: Optional[datetime] = None
         SQLModel.metadata.create_all(engine)
         class DynamicKnownConnectors(KnownConnectors, table=True):
             __tablename__ = table_name
@@ -90,6 +101,7 @@ class ConsumerConnectorPostgresMemoryManager(ConnectorConsumerMemoryManager):
 
         self.KnownConnectorsModel = DynamicKnownConnectors
         DynamicKnownConnectors.metadata.create_all(engine)
+        self._ensure_updated_at_column()
         self._load_from_db()
 
     def add_connectors(self, bpn: str, connectors: List[str]) -> None:
@@ -107,6 +119,7 @@ class ConsumerConnectorPostgresMemoryManager(ConnectorConsumerMemoryManager):
             None
         """
         super().add_connectors(bpn, connectors)  # Call the base class method to handle in-memory caching
+        self._mark_dirty(bpn)
         self._trigger_save()
 
     def delete_connector(self, bpn: str, connector_id: str) -> Dict:
@@ -121,6 +134,7 @@ class ConsumerConnectorPostgresMemoryManager(ConnectorConsumerMemoryManager):
             Dict: Updated cache state after deletion
         """
         super().delete_connector(bpn, connector_id)
+        self._mark_dirty(bpn)
         self._trigger_save()
         return self.known_connectors
 
@@ -136,6 +150,9 @@ class ConsumerConnectorPostgresMemoryManager(ConnectorConsumerMemoryManager):
             None
         """
         super().purge_bpn(bpn)
+        with self._dirty_lock:
+            self._purged_bpns.add(bpn)
+            self._dirty_bpns.discard(bpn)
         self._trigger_save()
 
     
@@ -150,6 +167,10 @@ class ConsumerConnectorPostgresMemoryManager(ConnectorConsumerMemoryManager):
             None
         """
         super().purge_cache()
+        with self._dirty_lock:
+            self._purge_all = True
+            self._dirty_bpns.clear()
+            self._purged_bpns.clear()
         self._trigger_save()
 
 
@@ -160,8 +181,54 @@ class ConsumerConnectorPostgresMemoryManager(ConnectorConsumerMemoryManager):
         """
         if self._save_thread and self._save_thread.is_alive():
             return
-        self._save_thread = threading.Thread(target=self._save_to_db, daemon=True)
+        self._save_thread = threading.Thread(target=self._save_pending_changes, daemon=True)
         self._save_thread.start()
+
+    def _mark_dirty(self, bpn: str):
+        """Mark the row of a BPN to be upserted on the next save."""
+        with self._dirty_lock:
+            self._dirty_bpns.add(bpn)
+            self._purged_bpns.discard(bpn)
+
+    def _is_dirty(self, bpn: str) -> bool:
+        """Check whether a BPN has local changes that were not yet written to the DB."""
+        with self._dirty_lock:
+            return bpn in self._dirty_bpns or bpn in self._purged_bpns
+
+    def _has_pending_changes(self) -> bool:
+        """Check whether there are changes that were not yet written to the DB."""
+        with self._dirty_lock:
+            return bool(self._purge_all or self._purged_bpns or self._dirty_bpns)
+
+    def _save_pending_changes(self):
+        """
+        Save until no pending changes remain, so changes made while a save
+        was running are not left behind.
+        """
+        while self._has_pending_changes():
+            if not self._save_to_db():
+                break
+
+    def _ensure_updated_at_column(self):
+        """
+        Add the updated_at column to tables created before rows were tracked by
+        their last change.
+        """
+        try:
+            bind = self.engine.get_bind() if isinstance(self.engine, S) else self.engine
+            if bind.dialect.name != "postgresql":
+                return
+            columns = [column["name"] for column in inspect(bind).get_columns(self.table_name)]
+            if "updated_at" in columns:
+                return
+            with bind.begin() as connection:
+                connection.execute(text(f'ALTER TABLE "{self.table_name}" ADD COLUMN updated_at timestamp without time zone NOT NULL DEFAULT now()'))
+                connection.execute(text(f'CREATE INDEX IF NOT EXISTS "ix_{self.table_name}_updated_at" ON "{self.table_name}" (updated_at)'))
+            if self.logger:
+                self.logger.info(f"[ConsumerConnectorPostgresMemoryManager] Added column updated_at to [{self.table_name}].")
+        except Exception as e:
+            if self.logger:
+                self.logger.warning(f"[ConsumerConnectorPostgresMemoryManager] Could not verify columns of [{self.table_name}]: {e}")
         
     def _load_from_db(self):
         """
@@ -180,6 +247,7 @@ class ConsumerConnectorPostgresMemoryManager(ConnectorConsumerMemoryManager):
                     
                     # Clear current known_connectors
                     self.known_connectors = {}
+                    high_water_mark = None
                     
                     for row in result:
                         bpn = row.bpnl
@@ -191,86 +259,132 @@ class ConsumerConnectorPostgresMemoryManager(ConnectorConsumerMemoryManager):
 
                         self.known_connectors[bpn] = {
                             self.REFRESH_INTERVAL_KEY: timestamp,
-                            self.CONNECTOR_LIST_KEY: connectors_list
+                            self.CONNECTOR_LIST_KEY: freeze(connectors_list)
                         }
+                        if row.updated_at and (high_water_mark is None or row.updated_at > high_water_mark):
+                            high_water_mark = row.updated_at
                         loaded_bpns += 1
 
-                # Only log if there's a change in the data
-                new_hash = hashlib.sha256(json.dumps(self.known_connectors, sort_keys=True, default=str).encode()).hexdigest()
-                if self.logger and self.verbose and (self._last_saved_hash is None or new_hash != self._last_saved_hash):
+                # Keep local changes that were not yet written to the DB
+                for bpn, bpn_data in old_connectors.items():
+                    if self._is_dirty(bpn):
+                        self.known_connectors[bpn] = bpn_data
+                with self._dirty_lock:
+                    for bpn in self._purged_bpns:
+                        self.known_connectors.pop(bpn, None)
+
+                self._high_water_mark = high_water_mark
+
+                # Only log if there's a change in the number of entries
+                if self.logger and self.verbose and loaded_bpns != len(old_connectors):
                     self.logger.info(f"[ConsumerConnectorPostgresMemoryManager] Loaded {loaded_bpns} BPN connector entries from the database.")
-                    
-                self._last_saved_hash = new_hash
             except SQLAlchemyError as e:
                 if self.logger and self.verbose:
                     self.logger.error(f"[ConsumerConnectorPostgresMemoryManager] Error loading from db: {e}")
         self.logger.debug(f"[ConsumerConnectorPostgresMemoryManager] [{threading.get_ident()}] Released lock (_load_from_db)")
 
-    def _save_to_db(self):
+    def _upsert_statement(self, session: Session, rows: List[Dict]):
+        """
+        Build an ``INSERT ... ON CONFLICT (bpnl) DO UPDATE`` statement for the rows.
+
+        ``updated_at`` is set by the database, so all replicas compare change
+        timestamps from the same clock.
+        """
+        dialect_insert = sqlite.insert if session.get_bind().dialect.name == "sqlite" else postgresql.insert
+        statement = dialect_insert(self.KnownConnectorsModel.__table__).values(rows)
+        return statement.on_conflict_do_update(
+            index_elements=["bpnl"],
+            set_={
+                "connectors": statement.excluded.connectors,
+                "expires_at": statement.excluded.expires_at,
+                "updated_at": func.now()
+            }
+        )
+
+    def _notify_changes(self, session: Session, upserted_bpns: List[str], purged_bpns: List[str], purge_all: bool):
+        """
+        Hook called inside the save transaction to announce the saved changes to other replicas.
+        Does nothing by default.
+        """
+        return
+
+    def _save_to_db(self) -> bool:
         """
-        Persist current in-memory known_connectors to the DB only if changes are detected.
+        Persist the pending changes to the DB, writing only the affected rows.
+
+        Purged BPNs (or the whole table) are deleted first and then the rows of
+        every changed BPN are upserted from the current memory state.
+
+        Returns:
+            bool: True if the pending changes were saved (or nothing was pending), False on a DB error.
         """
-        connectors_to_save = {}
-        current_hash = ""
+        with self._dirty_lock:
+            purge_all = self._purge_all
+            purged_bpns = self._purged_bpns
+            dirty_bpns = self._dirty_bpns
+            self._purge_all = False
+            self._purged_bpns = set()
+            self._dirty_bpns = set()
+
+        if not (purge_all or purged_bpns or dirty_bpns):
+            return True
+
+        rows = []
         self.logger.debug(f"[ConsumerConnectorPostgresMemoryManager] [{threading.get_ident()}] Trying to acquire lock (_save_to_db)")
         with self._lock:
             self.logger.debug(f"[ConsumerConnectorPostgresMemoryManager] [{threading.get_ident()}] Acquired lock (_save_to_db)")
-            current_hash = hashlib.sha256(json.dumps(self.known_connectors, sort_keys=True, default=str).encode()).hexdigest()
-
-            if current_hash == self._last_saved_hash:
-                return
-            
-            connectors_to_save = copy.deepcopy(self.known_connectors)
-
+            for bpn in dirty_bpns:
+                bpn_data = self.known_connectors.get(bpn)
+                if not bpn_data or self.CONNECTOR_LIST_KEY not in bpn_data or self.REFRESH_INTERVAL_KEY not in bpn_data:
+                    continue
+                rows.append({
+                    "bpnl": bpn,
+                    "connectors": list(bpn_data[self.CONNECTOR_LIST_KEY]),
+                    # Convert timestamp to datetime object instead of using the formatted string
+                    "expires_at": datetime.fromtimestamp(bpn_data[self.REFRESH_INTERVAL_KEY]),
+                    "updated_at": func.now()
+                })
         self.logger.debug(f"[ConsumerConnectorPostgresMemoryManager] [{threading.get_ident()}] Released lock (_save_to_db)")
+
         try:
-            saved_connectors = 0
             with Session(self.engine) as session:
-                # Clear existing data
-                session.exec(delete(self.KnownConnectorsModel))
-                
-                # Save each BPN's connector data
-                for bpn, bpn_data in connectors_to_save.items():
-                    if self.CONNECTOR_LIST_KEY in bpn_data and self.REFRESH_INTERVAL_KEY in bpn_data:
-                        # Convert timestamp to datetime object instead of using the formatted string
-                        timestamp = bpn_data[self.REFRESH_INTERVAL_KEY]
-                        expires_at = datetime.fromtimestamp(timestamp)
-                        connectors_list = bpn_data[self.CONNECTOR_LIST_KEY]
-                        
-                        session.add(self.KnownConnectorsModel(
-                            bpnl=bpn,
-                            connectors=connectors_list,
-                            expires_at=expires_at
-                        ))
-                        saved_connectors += 1
-                                
+                if purge_all:
+                    session.exec(delete(self.KnownConnectorsModel))
+                if purged_bpns:
+                    session.exec(delete(self.KnownConnectorsModel).where(self.KnownConnectorsModel.bpnl.in_(purged_bpns)))
+                if rows:
+                    session.exec(self._upsert_statement(session, rows))
+                self._notify_changes(session, upserted_bpns=[row["bpnl"] for row in rows], purged_bpns=list(purged_bpns), purge_all=purge_all)
                 session.commit()
 
-                with self._lock:
-                    self._last_saved_hash = current_hash
-
-                if self.logger and self.verbose:
-                    self.logger.info(f"[ConsumerConnectorPostgresMemoryManager] Saved {saved_connectors} BPN connector entries to the database.")
+            if self.logger and self.verbose:
+                self.logger.info(f"[ConsumerConnectorPostgresMemoryManager] Saved {len(rows)} BPN connector entries to the database.")
+            return True
         except SQLAlchemyError as e:
+            # Restore the pending changes so they are retried on the next save
+            with self._dirty_lock:
+                self._purge_all = self._purge_all or purge_all
+                self._purged_bpns |= purged_bpns
+                self._dirty_bpns |= dirty_bpns
             if self.logger and self.verbose:
                 self.logger.error(f"[ConsumerConnectorPostgresMemoryManager] Error saving to db: {e}")
+            return False
 
-    def get_connectors(self, bpn: str) -> List[str]:
+    def _discover_connectors(self, bpn: str) -> List[str]:
         """
-        Retrieve connectors for a specific BPN, preferring persistent database
+        Discover connectors for a specific BPN, preferring persistent database
         state over an outbound BDRS discovery call.
 
-        The lookup follows three ordered steps so that connectors manually
-        inserted into ``KnownConnectors`` (or surviving from a previous
-        successful discovery) are always honoured before making any external
-        network call:
-
-        1. **In-memory cache (not expired)** – fastest path, no I/O needed.
-        2. **Database** – consulted when the in-memory entry is absent or has
-           passed its expiry timestamp.  If the database holds connectors for
-           the BPN they are restored into memory with a fresh expiry and
-           returned immediately; BDRS discovery is *skipped*.
-        3. **BDRS discovery** – only invoked when the BPN is completely unknown
+        Called by ``get_connectors`` once the in-memory cache is absent or
+        expired, and only by one thread per BPN at a time. The lookup follows
+        two ordered steps so that connectors manually inserted into
+        ``KnownConnectors`` (or surviving from a previous successful discovery)
+        are always honoured before making any external network call:
+
+        1. **Database** – if the database holds connectors for the BPN they
+           are restored into memory with a fresh expiry and returned
+           immediately; BDRS discovery is *skipped*.
+        2. **BDRS discovery** – only invoked when the BPN is completely unknown
            to both the memory cache and the database.
 
         Args:
@@ -280,36 +394,7 @@ class ConsumerConnectorPostgresMemoryManager(ConnectorConsumerMemoryManager):
             List of connector DSP URLs for the given BPN, or an empty list if
             no source can provide them.
         """
-        # --- 1. Fast path: valid in-memory cache ----------------------------
-        self.logger.debug(
-            f"[ConsumerConnectorPostgresMemoryManager] [{threading.get_ident()}] "
-            f"Trying to acquire lock (get_connectors check)"
-        )
-        with self._lock:
-            self.logger.debug(
-                f"[ConsumerConnectorPostgresMemoryManager] [{threading.get_ident()}] "
-                f"Acquired lock (get_connectors check)"
-            )
-            known: Dict = copy.deepcopy(self.known_connectors.get(bpn, {}))
-        self.logger.debug(
-            f"[ConsumerConnectorPostgresMemoryManager] [{threading.get_ident()}] "
-            f"Released lock (get_connectors check)"
-        )
-
-        if (
-            known
-            and self.REFRESH_INTERVAL_KEY in known
-            and self.CONNECTOR_LIST_KEY in known
-            and not op.is_interval_reached(end_timestamp=known[self.REFRESH_INTERVAL_KEY])
-        ):
-            if self.logger and self.verbose:
-                self.logger.debug(
-                    f"[ConsumerConnectorPostgresMemoryManager] [{bpn}] Returning "
-                    f"[{len(known[self.CONNECTOR_LIST_KEY])}] connector(s) from memory cache."
-                )
-            return known[self.CONNECTOR_LIST_KEY]
-
-        # --- 2. DB fallback: cache absent or expired ------------------------
+        # --- 1. DB fallback: cache absent or expired ------------------------
         # Prioritise existing database entries over BDRS re-discovery so that
         # manually populated or previously discovered connector URLs are reused
         # instead of being silently replaced by a potentially stale BDRS result.
@@ -337,11 +422,11 @@ class ConsumerConnectorPostgresMemoryManager(ConnectorConsumerMemoryManager):
                     f"[{len(row.connectors)}] connector(s) from DB; BDRS discovery skipped."
                 )
             # Restore to in-memory cache with a fresh expiry so that subsequent
-            # calls use the fast path (step 1) until the next expiration cycle.
+            # calls use the in-memory cache until the next expiration cycle.
             self.add_connectors(bpn=bpn, connectors=row.connectors)
-            return row.connectors
+            return freeze(row.connectors)
 
-        # --- 3. Last resort: BDRS discovery ---------------------------------
+        # --- 2. Last resort: BDRS discovery ---------------------------------
         if self.logger and self.verbose:
             self.logger.info(
                 f"[ConsumerConnectorPostgresMemoryManager] [{bpn}] No database entry "
@@ -351,7 +436,7 @@ class ConsumerConnectorPostgresMemoryManager(ConnectorConsumerMemoryManager):
         if not connectors:
             return []
         self.add_connectors(bpn=bpn, connectors=connectors)
-        return connectors
+        return freeze(connectors)
 
     def stop(self):
         """
@@ -359,4 +444,4 @@ class ConsumerConnectorPostgresMemoryManager(ConnectorConsumerMemoryManager):
         """
         if self._save_thread:
             self._save_thread.join()
-        self._save_to_db()
\ No newline at end of file
+        self._save_pending_changes()
\ No newline at end of file
@@ -24,17 +24,34 @@
 from .connector_consumer_postgres_memory_manager import ConsumerConnectorPostgresMemoryManager
 from sqlalchemy.engine import Engine as E
 from sqlalchemy.orm import Session as S
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import select, Session
+from datetime import timedelta
+from typing import List, Optional
 import threading
+import select as io_select
+import json
 import time
+import uuid
 import logging
 from tractusx_sdk.dataspace.services.discovery import ConnectorDiscoveryService
 from tractusx_sdk.dataspace.services.connector import BaseConnectorConsumerService
+from tools.frozen_tools import freeze
 
 class ConsumerConnectorSyncPostgresMemoryManager(ConsumerConnectorPostgresMemoryManager):
     """
     Manages EDR connections using an in-memory cache synchronized with a Postgres database.
-    Periodically persists changes and reloads updates from the database to ensure consistency.
+    Periodically persists changes and pulls the rows changed by other replicas from the database.
+    Changes can optionally be pushed between replicas with Postgres LISTEN/NOTIFY.
     """
+
+    ## Rows changed shortly before the high-water mark are read again, so rows
+    ## committed late by a concurrent transaction are not missed
+    CHANGE_FEED_OVERLAP = timedelta(seconds=5)
+    ## Postgres rejects NOTIFY payloads of 8000 bytes or more
+    MAX_NOTIFY_PAYLOAD = 7500
+
     def __init__(self, 
                  connector_consumer_service: BaseConnectorConsumerService,
                  engine: E | S, 
@@ -44,8 +61,21 @@ class ConsumerConnectorSyncPostgresMemoryManager(ConsumerConnectorPostgresMemory
                  table_name: str = "known_connectors", 
                  connectors_key: str = "connectors", 
                  logger: logging.Logger = None, 
-                 verbose: bool = False):
+                 verbose: bool = False,
+                 full_reload_interval: int = 300,
+                 notify_channel: Optional[str] = None,
+                 stale_while_revalidate: bool = False,
+                 discovery_timeout: float = 60):
+        """
+        Initialize the synchronized Postgres memory-backed connection manager.
 
+        Args:
+            persist_interval (int, optional): Interval (seconds) for persisting changes and pulling changed rows. Defaults to 5.
+            full_reload_interval (int, optional): Interval (seconds) for a full reload, which also drops rows deleted by other replicas. Defaults to 300.
+            notify_channel (str, optional): Postgres channel used to push changes between replicas. Defaults to None (disabled).
+            stale_while_revalidate (bool, optional): Serve expired connectors while they are refreshed in the background. Defaults to False.
+            discovery_timeout (float, optional): Seconds a request waits for a discovery of the same BPN already in flight. Defaults to 60.
+        """
         super().__init__(
             connector_consumer_service=connector_consumer_service,
             connector_discovery=connector_discovery, 
@@ -54,32 +84,173 @@ class ConsumerConnectorSyncPostgresMemoryManager(ConsumerConnectorPostgresMemory
             verbose=verbose, 
             table_name=table_name, 
             connectors_key=connectors_key, 
-            engine=engine
+            engine=engine,
+            stale_while_revalidate=stale_while_revalidate,
+            discovery_timeout=discovery_timeout
         )
         self.persist_interval = persist_interval
+        self.full_reload_interval = full_reload_interval
+        self.notify_channel = notify_channel if self._supports_notify() else None
+        self._instance_id = str(uuid.uuid4())
         self._stop_event = threading.Event()
         self._start_background_tasks()
 
+    def _supports_notify(self) -> bool:
+        """Check whether the engine is a Postgres engine able to LISTEN for notifications."""
+        return isinstance(self.engine, E) and self.engine.dialect.name == "postgresql"
+
     def _start_background_tasks(self):
         """
-        Start the background thread for periodic persistence and reloading from DB.
+        Start the background threads for periodic persistence and change notifications.
         """
         threading.Thread(target=self._persistence_loop, daemon=True).start()
+        if self.notify_channel:
+            threading.Thread(target=self._listen_loop, daemon=True).start()
 
     def _persistence_loop(self):
         """
-        Periodically save current in-memory connections to DB and reload any changes.
+        Periodically save the changed connections to the DB and pull the rows changed by other replicas.
+
+        When notifications are enabled the changed rows are pulled on notification instead.
+        A full reload still runs every ``full_reload_interval`` to drop rows deleted elsewhere.
         """
+        last_full_reload = time.monotonic()
         while not self._stop_event.is_set():
             time.sleep(self.persist_interval)
             self._save_to_db()
+            if time.monotonic() - last_full_reload >= self.full_reload_interval:
+                self._load_from_db()
+                last_full_reload = time.monotonic()
+            elif not self.notify_channel:
+                self._load_changes_from_db()
+
+    def _load_changes_from_db(self) -> int:
+        """
+        Pull the rows changed since the high-water mark into memory.
+
+        BPNs with local changes that were not yet saved keep their local state.
+
+        Returns:
+            int: Number of BPN entries updated in memory.
+        """
+        if self._high_water_mark is None:
             self._load_from_db()
+            return len(self.known_connectors)
+
+        try:
+            with Session(self.engine) as session:
+                rows = session.exec(
+                    select(self.KnownConnectorsModel).where(self.KnownConnectorsModel.updated_at > self._high_water_mark - self.CHANGE_FEED_OVERLAP)
+                ).all()
+        except SQLAlchemyError as e:
+            if self.logger and self.verbose:
+                self.logger.error(f"[ConsumerConnectorSyncPostgresMemoryManager] Error loading changes from db: {e}")
+            return 0
+
+        updated_bpns = 0
+        self.logger.debug(f"[ConsumerConnectorSyncPostgresMemoryManager] [{threading.get_ident()}] Trying to acquire lock (_load_changes_from_db)")
+        with self._lock:
+            self.logger.debug(f"[ConsumerConnectorSyncPostgresMemoryManager] [{threading.get_ident()}] Acquired lock (_load_changes_from_db)")
+            for row in rows:
+                if row.updated_at > self._high_water_mark:
+                    self._high_water_mark = row.updated_at
+                if self._is_dirty(row.bpnl):
+                    continue
+                entry = {
+                    self.REFRESH_INTERVAL_KEY: row.expires_at.timestamp(),
+                    self.CONNECTOR_LIST_KEY: freeze(row.connectors)
+                }
+                if self.known_connectors.get(row.bpnl) != entry:
+                    self.known_connectors[row.bpnl] = entry
+                    updated_bpns += 1
+        self.logger.debug(f"[ConsumerConnectorSyncPostgresMemoryManager] [{threading.get_ident()}] Released lock (_load_changes_from_db)")
+
+        if self.logger and self.verbose and updated_bpns > 0:
+            self.logger.info(f"[ConsumerConnectorSyncPostgresMemoryManager] Loaded {updated_bpns} changed BPN connector entries from the database.")
+        return updated_bpns
+
+    def _notify_changes(self, session: Session, upserted_bpns: List[str], purged_bpns: List[str], purge_all: bool):
+        """
+        Announce the saved changes to the other replicas with ``pg_notify``.
+
+        The notification is sent inside the save transaction, so it is only delivered if the changes are committed.
+        """
+        if not self.notify_channel:
+            return
+        payload = json.dumps({"origin": self._instance_id, "upserted": upserted_bpns, "purged": purged_bpns, "purge_all": purge_all})
+        if len(payload.encode()) > self.MAX_NOTIFY_PAYLOAD:
+            # Too many BPNs for one notification, the replicas reload the whole table instead
+            payload = json.dumps({"origin": self._instance_id, "full_reload": True})
+        session.exec(text("SELECT pg_notify(:channel, :payload)").bindparams(channel=self.notify_channel, payload=payload))
+
+    def _handle_notification(self, payload: str):
+        """
+        Apply a change notification sent by another replica.
+
+        Args:
+            payload (str): JSON payload written by ``_notify_changes``.
+        """
+        try:
+            message = json.loads(payload)
+        except ValueError:
+            if self.logger:
+                self.logger.warning(f"[ConsumerConnectorSyncPostgresMemoryManager] Ignoring invalid notification payload: {payload}")
+            return
+        if message.get("origin") == self._instance_id:
+            return
+        if message.get("full_reload"):
+            self._load_from_db()
+            return
+
+        self.logger.debug(f"[ConsumerConnectorSyncPostgresMemoryManager] [{threading.get_ident()}] Trying to acquire lock (_handle_notification)")
+        with self._lock:
+            self.logger.debug(f"[ConsumerConnectorSyncPostgresMemoryManager] [{threading.get_ident()}] Acquired lock (_handle_notification)")
+            if message.get("purge_all"):
+                self.known_connectors = {bpn: bpn_data for bpn, bpn_data in self.known_connectors.items() if self._is_dirty(bpn)}
+            for bpn in message.get("purged", []):
+                if not self._is_dirty(bpn):
+                    self.known_connectors.pop(bpn, None)
+        self.logger.debug(f"[ConsumerConnectorSyncPostgresMemoryManager] [{threading.get_ident()}] Released lock (_handle_notification)")
+
+        if message.get("upserted"):
+            self._load_changes_from_db()
+
+    def _listen_loop(self):
+        """
+        Listen for change notifications of other replicas and reconnect on connection errors.
+        """
+        while not self._stop_event.is_set():
+            connection = None
+            try:
+                connection = self.engine.raw_connection()
+                dbapi_connection = connection.driver_connection
+                dbapi_connection.autocommit = True
+                with dbapi_connection.cursor() as cursor:
+                    cursor.execute(f'LISTEN "{self.notify_channel}"')
+                if self.logger and self.verbose:
+                    self.logger.info(f"[ConsumerConnectorSyncPostgresMemoryManager] Listening for connector changes on channel [{self.notify_channel}].")
+                # Catch up with the changes made while no listener was connected
+                self._load_changes_from_db()
+                while not self._stop_event.is_set():
+                    if io_select.select([dbapi_connection], [], [], 1.0) == ([], [], []):
+                        continue
+                    dbapi_connection.poll()
+                    while dbapi_connection.notifies:
+                        self._handle_notification(dbapi_connection.notifies.pop(0).payload)
+            except Exception as e:
+                if self.logger:
+                    self.logger.warning(f"[ConsumerConnectorSyncPostgresMemoryManager] Notification listener failed, reconnecting: {e}")
+                self._stop_event.wait(self.persist_interval)
+            finally:
+                if connection is not None:
+                    # Never return a listening connection to the pool
+                    connection.invalidate()
 
     def stop(self):
         """
-        Stop the background thread and perform a final save to the DB.
+        Stop the background threads and perform a final save to the DB.
         """
         if self._save_thread:
             self._save_thread.join()
         self._stop_event.set()
-        self._save_to_db()
\ No newline at end of file
+        self._save_pending_changes()
@@ -31,8 +31,12 @@ from tractusx_sdk.dataspace.services.discovery import ConnectorDiscoveryService
 from tractusx_sdk.dataspace.services.connector import BaseConnectorConsumerService
 from tractusx_sdk.dataspace.tools import op
 from managers.enablement_services.consumer.base_connector_consumer_manager import BaseConnectorConsumerManager
-from typing import List, Dict, Optional
-import copy
+from managers.enablement_services.consumer.single_flight import SingleFlight
+from managers.enablement_services.consumer.cache_refresh_scheduler import CacheAccessTracker
+from tools.frozen_tools import freeze
+from utils.metrics_utils import EDC, timed_stage
+from typing import List, Dict, Optional, Tuple
+import time
 import logging
 
 class ConnectorConsumerMemoryManager(BaseConnectorConsumerManager):
@@ -55,7 +59,9 @@ class ConnectorConsumerMemoryManager(BaseConnectorConsumerManager):
                  connector_discovery: ConnectorDiscoveryService, 
                  expiration_time: int = 60, 
                  logger: logging.Logger = None, 
-                 verbose: bool = False):
+                 verbose: bool = False,
+                 stale_while_revalidate: bool = False,
+                 discovery_timeout: float = 60):
         """
         Initialize the memory-based connector consumer manager.
         
@@ -65,12 +71,19 @@ class ConnectorConsumerMemoryManager(BaseConnectorConsumerManager):
             expiration_time (int, optional): Cache expiration time in minutes. Defaults to 60.
             logger (logging.Logger, optional): Logger instance
             verbose (bool, optional): Verbose flag
+            stale_while_revalidate (bool, optional): Serve expired connectors while they are refreshed in the background. Defaults to False.
+            discovery_timeout (float, optional): Seconds a request waits for a discovery of the same BPN already in flight. Defaults to 60.
         """
         super().__init__(connector_consumer_service, connector_discovery, expiration_time)
         self.known_connectors = {}
         self.logger = logger if logger else None
         self.verbose = verbose
         self._lock = threading.RLock()
+        self.stale_while_revalidate = stale_while_revalidate
+        # Concurrent cache misses for the same BPN share one discovery
+        self._discovery_flight = SingleFlight(timeout=discovery_timeout, name="CONNECTOR Manager", logger=logger)
+        # Cache usage, used to refresh the most requested BPNs ahead of expiry
+        self.access_tracker = CacheAccessTracker()
         
     def add_connectors(self, bpn: str, connectors: List[str]) -> None:
         """
@@ -98,8 +111,8 @@ class ConnectorConsumerMemoryManager(BaseConnectorConsumerManager):
                     self.logger.debug(f"[CONNECTOR Manager] [{bpn}] CONNECTORs already cached, skipping update")
                 return
             
-            # Store the connectors under the specific key
-            self.known_connectors[bpn][self.CONNECTOR_LIST_KEY] = connectors
+            # Store the connectors under the specific key (frozen, shared with the callers without copying)
+            self.known_connectors[bpn][self.CONNECTOR_LIST_KEY] = freeze(connectors)
             
             if(self.logger and self.verbose):
                 self.logger.info(f"[CONNECTOR Manager] [{bpn}] Added [{len(self.known_connectors[bpn][self.CONNECTOR_LIST_KEY])}] CONNECTORs to the cache! Next refresh at [{op.timestamp_to_datetime(self.known_connectors[bpn][self.REFRESH_INTERVAL_KEY])}] UTC")
@@ -187,7 +200,8 @@ class ConnectorConsumerMemoryManager(BaseConnectorConsumerManager):
             self.logger.debug(f"[CONNECTOR Manager] [{threading.get_ident()}] Acquired lock (delete_connector)")
             if bpn in self.known_connectors and self.CONNECTOR_LIST_KEY in self.known_connectors[bpn]:
                 if connector_id in self.known_connectors[bpn][self.CONNECTOR_LIST_KEY]:
-                    self.known_connectors[bpn][self.CONNECTOR_LIST_KEY].remove(connector_id)
+                    # Copy-on-write, the previous list may still be used by callers
+                    self.known_connectors[bpn][self.CONNECTOR_LIST_KEY] = freeze([connector for connector in self.known_connectors[bpn][self.CONNECTOR_LIST_KEY] if connector != connector_id])
                     if(self.logger and self.verbose):
                         self.logger.debug(f"[CONNECTOR Manager] [{bpn}] Removed connector [{connector_id}] from cache")
         self.logger.debug(f"[CONNECTOR Manager] [{threading.get_ident()}] Released lock (delete_connector)")
@@ -225,7 +239,9 @@ class ConnectorConsumerMemoryManager(BaseConnectorConsumerManager):
         
         First checks the in-memory cache for existing connectors. If cache is empty
         or expired, uses the connector discovery service to find and cache new
-        connectors for the given BPN.
+        connectors for the given BPN. Concurrent requests for the same BPN share
+        a single discovery. With ``stale_while_revalidate`` enabled, expired
+        connectors are returned right away and refreshed in the background.
         
         Args:
             bpn (str): The Business Partner Number to get connectors for
@@ -238,17 +254,75 @@ class ConnectorConsumerMemoryManager(BaseConnectorConsumerManager):
             self.logger.debug(f"[CONNECTOR Manager] [{threading.get_ident()}] Acquired lock (get_connectors check)")
             known_connectors: Dict = {}
             
-            ## If the connectors are known then the cache is loaded
+            ## If the connectors are known then the cache is loaded (the connector list is frozen, only the entry is copied)
             if(bpn in self.known_connectors):
-                known_connectors = copy.deepcopy(self.known_connectors[bpn])
+                known_connectors = dict(self.known_connectors[bpn])
         self.logger.debug(f"[CONNECTOR Manager] [{threading.get_ident()}] Released lock (get_connectors check)")
             
+        has_connectors = (known_connectors != {}) and (self.REFRESH_INTERVAL_KEY in known_connectors) and (self.CONNECTOR_LIST_KEY in known_connectors)
         ## In case there is connectors, and the interval has not yet been reached
-        if(known_connectors != {}) and (self.REFRESH_INTERVAL_KEY in known_connectors) and (self.CONNECTOR_LIST_KEY in known_connectors) and (not op.is_interval_reached(end_timestamp=known_connectors[self.REFRESH_INTERVAL_KEY])):
+        if has_connectors and (not op.is_interval_reached(end_timestamp=known_connectors[self.REFRESH_INTERVAL_KEY])):
+            self.access_tracker.record(bpn, CacheAccessTracker.HIT)
             if(self.logger and self.verbose):
-                self.logger.debug(f"[CONNECTOR Manager] [{bpn}] Returning [{len(self.known_connectors[bpn][self.CONNECTOR_LIST_KEY])}] CONNECTORs from cache. Next refresh at [{op.timestamp_to_datetime(self.known_connectors[bpn][self.REFRESH_INTERVAL_KEY])}] UTC")
-            return self.known_connectors[bpn][self.CONNECTOR_LIST_KEY] ## Return the urls from the connectors
-            
+                self.logger.debug(f"[CONNECTOR Manager] [{bpn}] Returning [{len(known_connectors[self.CONNECTOR_LIST_KEY])}] CONNECTORs from cache. Next refresh at [{op.timestamp_to_datetime(known_connectors[self.REFRESH_INTERVAL_KEY])}] UTC")
+            return known_connectors[self.CONNECTOR_LIST_KEY] ## Return the urls from the connectors
+
+        ## Serve the expired connectors and refresh them in the background
+        if has_connectors and self.stale_while_revalidate and len(known_connectors[self.CONNECTOR_LIST_KEY]) > 0:
+            self.access_tracker.record(bpn, CacheAccessTracker.STALE)
+            if self._discovery_flight.do_async(bpn, self._discover_connectors, bpn) and self.logger and self.verbose:
+                self.logger.info(f"[CONNECTOR Manager] [{bpn}] Returning expired CONNECTORs from cache, refreshing them in the background")
+            return known_connectors[self.CONNECTOR_LIST_KEY]
+
+        self.access_tracker.record(bpn, CacheAccessTracker.COLD)
+        try:
+            return self._discovery_flight.do(bpn, self._discover_connectors, bpn)
+        except TimeoutError as e:
+            if(self.logger and self.verbose):
+                self.logger.error(f"[CONNECTOR Manager] [{bpn}] Error discovering CONNECTORs: {e}")
+            return known_connectors.get(self.CONNECTOR_LIST_KEY, [])
+
+    def get_expiring_bpns(self, within_seconds: float) -> List[Tuple[str, float]]:
+        """
+        List the cached BPNs whose connectors expire within the given time.
+
+        Args:
+            within_seconds (float): Time window in seconds
+
+        Returns:
+            List[Tuple[str, float]]: BPN and seconds left until expiry (negative if already expired)
+        """
+        now = time.time()
+        with self._lock:
+            return [
+                (bpn, bpn_data[self.REFRESH_INTERVAL_KEY] - now)
+                for bpn, bpn_data in self.known_connectors.items()
+                if self.REFRESH_INTERVAL_KEY in bpn_data and bpn_data.get(self.CONNECTOR_LIST_KEY)
+                and bpn_data[self.REFRESH_INTERVAL_KEY] - now <= within_seconds
+            ]
+
+    def refresh_bpn(self, bpn: str) -> None:
+        """
+        Rediscover the connectors of a BPN ahead of expiry, sharing a discovery already in flight.
+
+        Args:
+            bpn (str): The Business Partner Number to refresh
+        """
+        self._discovery_flight.do(bpn, self._discover_connectors, bpn)
+
+    @timed_stage(EDC, "discover_connectors", counter_party_arg="bpn")
+    def _discover_connectors(self, bpn: str) -> List[str]:
+        """
+        Discover the connectors of a BPN and add them to the cache.
+
+        Only called by one thread per BPN at a time, see ``get_connectors``.
+
+        Args:
+            bpn (str): The Business Partner Number to discover connectors for
+
+        Returns:
+            List[str]: List of connector URLs/endpoints for the BPN
+        """
         if(self.logger and self.verbose):
             self.logger.info(f"[CONNECTOR Manager] No cached CONNECTOR were found, discoverying CONNECTORs for bpn [{bpn}]...")
 
@@ -258,7 +332,7 @@ class ConnectorConsumerMemoryManager(BaseConnectorConsumerManager):
         
         self.add_connectors(bpn=bpn, connectors=connectors)
 
-        return connectors
+        return freeze(connectors)
 
     def _is_cache_expired(self, bpn: str) -> bool:
         """
@@ -0,0 +1,274 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import contextvars
+import heapq
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional
+
+from managers.config.config_manager import ConfigManager
+from utils.log_utils import sanitize_log_value as _s
+
+logger = logging.getLogger(__name__)
+
+
+class _ConnectorStats:
+    """Latency and recent failures observed for one connector."""
+
+    __slots__ = ("latency", "failures", "updated")
+
+    def __init__(self):
+        self.latency: Optional[float] = None
+        self.failures = 0.0
+        self.updated = time.monotonic()
+
+
+class ConnectorHealth:
+    """
+    Health score of partner connectors, lower is better.
+
+    The score is the average latency of the connector (exponentially weighted) plus
+    ``failure_penalty`` seconds for every recent failure. Failures count half after
+    ``failure_half_life`` seconds, so a connector that recovered is preferred again.
+    Connectors never used before score 0 and are tried in the order they were discovered.
+    """
+
+    def __init__(self, failure_half_life: float = 300, failure_penalty: float = 30, latency_weight: float = 0.3):
+        """
+        Initialize the health tracker.
+
+        Args:
+            failure_half_life (float, optional): Seconds after which a failure counts half. Defaults to 300.
+            failure_penalty (float, optional): Seconds of latency a failure weighs. Defaults to 30.
+            latency_weight (float, optional): Weight of the last latency in the average. Defaults to 0.3.
+        """
+        self.failure_half_life = max(1.0, failure_half_life)
+        self.failure_penalty = failure_penalty
+        self.latency_weight = min(1.0, max(0.0, latency_weight))
+        self._stats: Dict[str, _ConnectorStats] = {}
+        self._lock = threading.Lock()
+
+    def _decay(self, stats: _ConnectorStats, now: float) -> None:
+        stats.failures *= 0.5 ** ((now - stats.updated) / self.failure_half_life)
+        stats.updated = now
+
+    def record_success(self, connector_url: str, latency: float) -> None:
+        """Record a successful call to the connector and its latency in seconds."""
+        with self._lock:
+            stats = self._stats.setdefault(connector_url, _ConnectorStats())
+            self._decay(stats, time.monotonic())
+            stats.latency = latency if stats.latency is None else (
+                self.latency_weight * latency + (1 - self.latency_weight) * stats.latency
+            )
+
+    def record_failure(self, connector_url: str) -> None:
+        """Record a failed call to the connector."""
+        with self._lock:
+            stats = self._stats.setdefault(connector_url, _ConnectorStats())
+            self._decay(stats, time.monotonic())
+            stats.failures += 1
+
+    def _score(self, stats: Optional[_ConnectorStats]) -> float:
+        if stats is None:
+            return 0.0
+        self._decay(stats, time.monotonic())
+        return (stats.latency or 0.0) + self.failure_penalty * stats.failures
+
+    def score(self, connector_url: str) -> float:
+        """Return the health score of the connector."""
+        with self._lock:
+            return self._score(self._stats.get(connector_url))
+
+    def order(self, connector_urls: List[str]) -> List[str]:
+        """Return the connectors sorted from the healthiest to the least healthy."""
+        with self._lock:
+            scores = {connector_url: self._score(self._stats.get(connector_url)) for connector_url in connector_urls}
+        return sorted(connector_urls, key=scores.__getitem__)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Return the score, average latency and recent failures of every known connector."""
+        with self._lock:
+            return {
+                connector_url: {"score": self._score(stats), "latency": stats.latency or 0.0, "failures": stats.failures}
+                for connector_url, stats in self._stats.items()
+            }
+
+
+class ConnectorDelivery:
+    """
+    Delivers a request to the first of several connectors of a partner that accepts it.
+
+    The connectors are tried from the healthiest to the least healthy. While an attempt is
+    running, the next connector is started after ``hedge_delay`` seconds, or right away when
+    an attempt fails, and the first successful attempt wins. Attempts still running at that
+    point are left to finish; their outcome only updates the health of their connector.
+    A connector whose attempt raised a retryable error is tried again after an exponential
+    backoff, while the other connectors keep going, up to ``max_attempts`` times.
+    """
+
+    _instance: Optional['ConnectorDelivery'] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, max_workers: int = 16, hedge_delay: Optional[float] = 2.0, max_attempts: int = 2,
+                 retry_backoff: float = 3.0, max_retry_backoff: float = 30.0, health: Optional[ConnectorHealth] = None):
+        """
+        Initialize the delivery.
+
+        Args:
+            max_workers (int, optional): Size of the pool running the attempts. Defaults to 16.
+            hedge_delay (float, optional): Seconds after which the next connector is started while an attempt is
+                still running. None starts it only when the attempt failed. Defaults to 2.0.
+            max_attempts (int, optional): Attempts per connector. Defaults to 2.
+            retry_backoff (float, optional): Seconds before the first retry of a connector, doubled on every further retry. Defaults to 3.0.
+            max_retry_backoff (float, optional): Upper bound of the retry backoff in seconds. Defaults to 30.0.
+            health (ConnectorHealth, optional): Health tracker ordering the connectors. Defaults to a new tracker.
+        """
+        self.max_workers = max(1, max_workers)
+        self.hedge_delay = hedge_delay if hedge_delay is None or hedge_delay >= 0 else None
+        self.max_attempts = max(1, max_attempts)
+        self.retry_backoff = max(0.0, retry_backoff)
+        self.max_retry_backoff = max(self.retry_backoff, max_retry_backoff)
+        self.health = health or ConnectorHealth()
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="connector-delivery")
+
+    @classmethod
+    def get_instance(cls) -> 'ConnectorDelivery':
+        """Return the process-wide delivery, creating it from the configuration on first use."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                hedge_delay = ConfigManager.get_config("consumer.connector.delivery.hedge_delay", default=2.0)
+                cls._instance = cls(
+                    max_workers=int(ConfigManager.get_config("consumer.connector.delivery.max_workers", default=16)),
+                    hedge_delay=float(hedge_delay) if hedge_delay is not None else None,
+                    max_attempts=int(ConfigManager.get_config("consumer.connector.delivery.max_attempts", default=2)),
+                    retry_backoff=float(ConfigManager.get_config("consumer.connector.delivery.retry_backoff", default=3)),
+                    max_retry_backoff=float(ConfigManager.get_config("consumer.connector.delivery.max_retry_backoff", default=30)),
+                    health=ConnectorHealth(
+                        failure_half_life=float(ConfigManager.get_config("consumer.connector.delivery.failure_half_life", default=300)),
+                        failure_penalty=float(ConfigManager.get_config("consumer.connector.delivery.failure_penalty", default=30)),
+                    ),
+                )
+            return cls._instance
+
+    @classmethod
+    def shutdown_instance(cls) -> None:
+        """Shut down the process-wide delivery, if it was ever created."""
+        with cls._instance_lock:
+            if cls._instance is not None:
+                cls._instance.shutdown()
+                cls._instance = None
+
+    def shutdown(self) -> None:
+        """Stop the pool without waiting for the attempts still running."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _backoff(self, attempt: int) -> float:
+        return min(self.retry_backoff * (2 ** (attempt - 1)), self.max_retry_backoff)
+
+    def _submit(self, connector_url: str, attempt: Callable[[str], Any]) -> Future:
+        def run() -> Any:
+            # The health is recorded before the future completes, so the next ordering already sees it
+            started = time.monotonic()
+            try:
+                result = attempt(connector_url)
+            except Exception:
+                self.health.record_failure(connector_url)
+                raise
+            self.health.record_success(connector_url, time.monotonic() - started)
+            return result
+
+        return self._executor.submit(contextvars.copy_context().run, run)
+
+    def deliver(self, connector_urls: List[str], attempt: Callable[[str], Any],
+                retryable: Callable[[Exception], bool] = lambda error: True, name: str = "ConnectorDelivery") -> Any:
+        """
+        Run ``attempt(connector_url)`` on the connectors until one of them succeeds.
+
+        Args:
+            connector_urls (List[str]): DSP URLs of the partner's connectors.
+            attempt (Callable): Sends the request to one connector. It returns the result on success and raises otherwise.
+            retryable (Callable, optional): Tells whether a connector that raised the given error is tried again. Defaults to always.
+            name (str, optional): Name used in log messages. Defaults to "ConnectorDelivery".
+
+        Returns:
+            Any: The result of the first successful attempt.
+
+        Raises:
+            ValueError: If no connector was given.
+            Exception: The error of the last failed attempt, if all of them failed.
+        """
+        if not connector_urls:
+            raise ValueError("No connector to deliver to.")
+
+        waiting = self.health.order(list(dict.fromkeys(connector_urls)))
+        next_start: Optional[float] = time.monotonic()
+        sequence = itertools.count()
+        # Retries waiting for their backoff: (start not before, sequence, connector url, attempt number)
+        retries: List[tuple] = []
+        in_flight: Dict[Future, tuple] = {}
+        last_error: Optional[Exception] = None
+
+        def start(connector_url: str, attempt_number: int) -> None:
+            logger.debug(f"[{_s(name)}] Attempt {attempt_number} on [{_s(connector_url)}]")
+            in_flight[self._submit(connector_url, attempt)] = (connector_url, attempt_number)
+
+        while waiting or retries or in_flight:
+            now = time.monotonic()
+            while retries and retries[0][0] <= now:
+                _, _, connector_url, attempt_number = heapq.heappop(retries)
+                start(connector_url, attempt_number)
+            if waiting and (not in_flight or (next_start is not None and next_start <= now)):
+                start(waiting.pop(0), 1)
+                next_start = (now + self.hedge_delay) if self.hedge_delay is not None else None
+
+            deadlines = [retries[0][0]] if retries else []
+            if waiting and next_start is not None:
+                deadlines.append(next_start)
+            timeout = max(0.0, min(deadlines) - now) if deadlines else None
+            if not in_flight:
+                # Only retries waiting for their backoff are left
+                time.sleep(timeout)
+                continue
+
+            done, _ = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                connector_url, attempt_number = in_flight.pop(future)
+                error = future.exception()
+                if error is None:
+                    for running in in_flight:
+                        running.cancel()
+                    logger.info(f"[{_s(name)}] Delivered via [{_s(connector_url)}] on attempt {attempt_number}")
+                    return future.result()
+
+                last_error = error
+                logger.warning(f"[{_s(name)}] Attempt {attempt_number} on [{_s(connector_url)}] failed: {_s(error)}")
+                # A failed attempt frees its place for the next connector right away
+                next_start = time.monotonic()
+                if attempt_number < self.max_attempts and retryable(error):
+                    heapq.heappush(retries, (time.monotonic() + self._backoff(attempt_number), next(sequence), connector_url, attempt_number + 1))
+
+        raise last_error
@@ -22,14 +22,15 @@
 ## Code created partially using a LLM (GPT 4o) and reviewed by a human committer
 
 import threading
-import hashlib
-from typing import List, Dict, TYPE_CHECKING
-import json
+from typing import List, Dict, Optional, Set, Tuple, TYPE_CHECKING
 from datetime import datetime
 from sqlmodel import select, delete, Session, SQLModel
+from sqlalchemy import inspect, text
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.exc import SQLAlchemyError
 import logging
 from ..memory import DtrConsumerMemoryManager
+from ..shell_descriptor_cache import ShellDescriptorCache
 from sqlalchemy.engine import Engine as E
 from sqlalchemy.orm import Session as S
 from models.metadata_database.consumer.models import KnownDtrs
@@ -43,7 +44,7 @@ class DtrConsumerPostgresMemoryManager(DtrConsumerMemoryManager):
     Inherits from DtrConsumerMemoryManager to maintain an in-memory cache and extends it with persistent storage functionality.
     """
 
-    def __init__(self, engine: E | S, connector_consumer_manager: 'BaseConnectorConsumerManager', expiration_time:int=3600, table_name="known_dtrs", dtrs_key="dtrs", logger:logging.Logger=None, verbose:bool=False, dct_type_id="dct:type", dct_type_key:str="'http://purl.org/dc/terms/type'.'@id'", operator:str="=", dct_type:str="https://w3id.org/catenax/taxonomy#DigitalTwinRegistry"):
+    def __init__(self, engine: E | S, connector_consumer_manager: 'BaseConnectorConsumerManager', expiration_time:int=3600, table_name="known_dtrs", dtrs_key="dtrs", logger:logging.Logger=None, verbose:bool=False, dct_type_id="dct:type", dct_type_key:str="'http://purl.org/dc/terms/type'.'@id'", operator:str="=", dct_type:str="https://w3id.org/catenax/taxonomy#DigitalTwinRegistry", max_dtr_workers_per_partner:int=5, max_dtr_workers_global:int=20, shell_descriptor_cache:Optional[ShellDescriptorCache]=None, stale_while_revalidate:bool=False, discovery_timeout:float=60):
         """
         Initialize the Postgres memory-backed DTR manager.
 
@@ -54,16 +55,26 @@ class DtrConsumerPostgresMemoryManager(DtrConsumerMemoryManager):
             dtrs_key: Key used to store DTR data within known_dtrs.
             logger: Optional logger instance for debug output.
             verbose: Flag for enabling verbose logging.
+            max_dtr_workers_per_partner: Maximum number of DTRs of a single partner queried at the same time.
+            max_dtr_workers_global: Maximum number of DTR lookups running at the same time across all partners.
+            shell_descriptor_cache: Optional LRU+TTL cache for shell descriptors.
+            stale_while_revalidate: Serve expired DTRs while they are refreshed in the background.
+            discovery_timeout: Seconds a request waits for a DTR discovery of the same BPN already in flight.
         """
         # Initialize base memory DTR manager and configure database.
         # Dynamically define the SQLModel table for DTR data.
         # Load existing data from the database into memory.
-        super().__init__(connector_consumer_manager=connector_consumer_manager, expiration_time=expiration_time, logger=logger, verbose=verbose, dct_type_id=dct_type_id, dct_type_key=dct_type_key, operator=operator, dct_type=dct_type)
+        super().__init__(connector_consumer_manager=connector_consumer_manager, expiration_time=expiration_time, logger=logger, verbose=verbose, dct_type_id=dct_type_id, dct_type_key=dct_type_key, operator=operator, dct_type=dct_type, max_dtr_workers_per_partner=max_dtr_workers_per_partner, max_dtr_workers_global=max_dtr_workers_global, shell_descriptor_cache=shell_descriptor_cache, stale_while_revalidate=stale_while_revalidate, discovery_timeout=discovery_timeout)
         self.engine = engine
         self.table_name = table_name
         self.dtrs_key = dtrs_key
         self._save_thread = None
-        self._last_saved_hash = None
+        # Dirty tracking: only the affected rows are written on the next save
+        self._dirty_bpns: Set[str] = set()  # BPNs whose rows must be upserted
+        self._deleted_dtrs: Set[Tuple[str, str]] = set()  # (bpn, asset_id) rows to delete
+        self._purged_bpns: Set[str] = set()  # BPNs whose rows must all be deleted
+        self._purge_all = False  # Whether the whole table must be cleared
+        self._dirty_lock = threading.Lock()
         SQLModel.metadata.create_all(engine)
         class DynamicKnownDtrs(KnownDtrs, table=True):
             __tablename__ = table_name
@@ -71,6 +82,7 @@ class DtrConsumerPostgresMemoryManager(DtrConsumerMemoryManager):
 
         self.KnownDtrsModel = DynamicKnownDtrs
         DynamicKnownDtrs.metadata.create_all(engine)
+        self._ensure_composite_primary_key()
         self._load_from_db()
 
     def add_dtr(self, bpn: str, connector_url: str, asset_id: str, policies: List[str]) -> None:
@@ -90,6 +102,9 @@ class DtrConsumerPostgresMemoryManager(DtrConsumerMemoryManager):
             None
         """
         super().add_dtr(bpn, connector_url, asset_id, policies)  # Call the base class method to handle in-memory caching
+        # The refresh interval is stored per row, so every row of the BPN is upserted
+        with self._dirty_lock:
+            self._dirty_bpns.add(bpn)
         self._trigger_save()
 
     def delete_dtr(self, bpn: str, asset_id: str) -> Dict:
@@ -104,6 +119,8 @@ class DtrConsumerPostgresMemoryManager(DtrConsumerMemoryManager):
             Dict: Updated cache state after deletion
         """
         super().delete_dtr(bpn, asset_id)
+        with self._dirty_lock:
+            self._deleted_dtrs.add((bpn, asset_id))
         self._trigger_save()
         return self.known_dtrs
 
@@ -119,6 +136,10 @@ class DtrConsumerPostgresMemoryManager(DtrConsumerMemoryManager):
             None
         """
         super().purge_bpn(bpn)
+        with self._dirty_lock:
+            self._purged_bpns.add(bpn)
+            self._dirty_bpns.discard(bpn)
+            self._deleted_dtrs = {key for key in self._deleted_dtrs if key[0] != bpn}
         self._trigger_save()
 
     
@@ -133,6 +154,11 @@ class DtrConsumerPostgresMemoryManager(DtrConsumerMemoryManager):
             None
         """
         super().purge_cache()
+        with self._dirty_lock:
+            self._purge_all = True
+            self._dirty_bpns.clear()
+            self._deleted_dtrs.clear()
+            self._purged_bpns.clear()
         self._trigger_save()
 
 
@@ -143,8 +169,44 @@ class DtrConsumerPostgresMemoryManager(DtrConsumerMemoryManager):
         """
         if self._save_thread and self._save_thread.is_alive():
             return
-        self._save_thread = threading.Thread(target=self._save_to_db, daemon=True)
+        self._save_thread = threading.Thread(target=self._save_pending_changes, daemon=True)
         self._save_thread.start()
+
+    def _has_pending_changes(self) -> bool:
+        """Check whether there are changes that were not yet written to the DB."""
+        with self._dirty_lock:
+            return bool(self._purge_all or self._purged_bpns or self._deleted_dtrs or self._dirty_bpns)
+
+    def _save_pending_changes(self):
+        """
+        Save until no pending changes remain, so changes made while a save
+        was running are not left behind.
+        """
+        while self._has_pending_changes():
+            if not self._save_to_db():
+                break
+
+    def _ensure_composite_primary_key(self):
+        """
+        Upgrade tables created with the former single-column primary key (bpnl)
+        to the (bpnl, asset_id) key required by the row-level upserts.
+        """
+        try:
+            bind = self.engine.get_bind() if isinstance(self.engine, S) else self.engine
+            if bind.dialect.name != "postgresql":
+                return
+            pk = inspect(bind).get_pk_constraint(self.table_name)
+            if pk.get("constrained_columns") != ["bpnl"]:
+                return
+            constraint_name = pk.get("name") or f"pk_{self.table_name}"
+            with bind.begin() as connection:
+                connection.execute(text(f'ALTER TABLE "{self.table_name}" DROP CONSTRAINT "{constraint_name}"'))
+                connection.execute(text(f'ALTER TABLE "{self.table_name}" ADD CONSTRAINT "{constraint_name}" PRIMARY KEY (bpnl, asset_id)'))
+            if self.logger:
+                self.logger.info(f"[DtrConsumerPostgresMemoryManager] Upgraded primary key of [{self.table_name}] to (bpnl, asset_id).")
+        except Exception as e:
+            if self.logger:
+                self.logger.warning(f"[DtrConsumerPostgresMemoryManager] Could not verify primary key of [{self.table_name}]: {e}")
         
     def _load_from_db(self):
         """
@@ -186,74 +248,124 @@ class DtrConsumerPostgresMemoryManager(DtrConsumerMemoryManager):
                             self.known_dtrs[bpn][self.REFRESH_INTERVAL_KEY] = timestamp
                         
                         # Add DTR using asset_id as key
-                        self.known_dtrs[bpn][self.DTR_DATA_KEY][asset_id] = {
-                            self.DTR_CONNECTOR_URL_KEY: edc_url,
-                            self.DTR_ASSET_ID_KEY: asset_id,
-                            self.DTR_POLICIES_KEY: policies
-                        }
+                        self.known_dtrs[bpn][self.DTR_DATA_KEY][asset_id] = self._create_dtr_cache_entry(
+                            connector_url=edc_url,
+                            asset_id=asset_id,
+                            policies=policies
+                        )
                         loaded_dtrs += 1
 
-                # Only log if there's a change in the data
-                new_hash = hashlib.sha256(json.dumps(self.known_dtrs, sort_keys=True, default=str).encode()).hexdigest()
-                if self.logger and self.verbose and (self._last_saved_hash is None or new_hash != self._last_saved_hash):
+                # Only log if there's a change in the number of entries
+                if self.logger and self.verbose and loaded_dtrs != self._count_dtrs(old_dtrs):
                     self.logger.info(f"[DtrConsumerPostgresMemoryManager] Loaded {loaded_dtrs} DTR entries from the database.")
-                    
-                self._last_saved_hash = new_hash
             except SQLAlchemyError as e:
                 if self.logger and self.verbose:
                     self.logger.error(f"[DtrConsumerPostgresMemoryManager] Error loading from db: {e}")
         self.logger.debug(f"[DtrConsumerPostgresMemoryManager] [{threading.get_ident()}] Released lock (load_from_db)")
           
-    def _save_to_db(self):
+    def _count_dtrs(self, dtrs: Dict) -> int:
+        """Count the DTR entries of a known_dtrs structure."""
+        return sum(len(bpn_data.get(self.DTR_DATA_KEY, {})) for bpn_data in dtrs.values() if isinstance(bpn_data, dict))
+
+    def _build_rows(self, bpn: str) -> List[Dict]:
+        """
+        Build the DB rows for all DTRs of a BPN from memory. Caller must hold ``_dtrs_lock``.
+        """
+        bpn_data = self.known_dtrs.get(bpn)
+        if not bpn_data or self.DTR_DATA_KEY not in bpn_data or self.REFRESH_INTERVAL_KEY not in bpn_data:
+            return []
+        expires_at = datetime.fromtimestamp(bpn_data[self.REFRESH_INTERVAL_KEY])
+        dtr_dict = bpn_data[self.DTR_DATA_KEY]
+        if not isinstance(dtr_dict, dict):
+            return []
+        return [
+            {
+                "bpnl": bpn,
+                "edc_url": dtr_data[self.DTR_CONNECTOR_URL_KEY],
+                "asset_id": dtr_data[self.DTR_ASSET_ID_KEY],
+                "policies": dtr_data[self.DTR_POLICIES_KEY],
+                "expires_at": expires_at
+            }
+            for dtr_data in dtr_dict.values() if dtr_data is not None
+        ]
+
+    def _upsert_statement(self, session: Session, rows: List[Dict]):
+        """
+        Build an ``INSERT ... ON CONFLICT (bpnl, asset_id) DO UPDATE`` statement for the rows.
         """
-        Persist current in-memory known_dtrs to the DB only if changes are detected.
+        dialect_insert = sqlite.insert if session.get_bind().dialect.name == "sqlite" else postgresql.insert
+        statement = dialect_insert(self.KnownDtrsModel.__table__).values(rows)
+        return statement.on_conflict_do_update(
+            index_elements=["bpnl", "asset_id"],
+            set_={
+                "edc_url": statement.excluded.edc_url,
+                "policies": statement.excluded.policies,
+                "expires_at": statement.excluded.expires_at
+            }
+        )
+
+    def _save_to_db(self) -> bool:
+        """
+        Persist the pending changes to the DB, writing only the affected rows.
+
+        Deletions (whole table, whole BPNs or single DTRs) are applied first and
+        then the rows of every changed BPN are upserted from the current memory
+        state. The DTR lock is only held while the rows are collected, not while
+        the DB is written.
+
+        Returns:
+            bool: True if the pending changes were saved (or nothing was pending), False on a DB error.
         """
+        with self._dirty_lock:
+            purge_all = self._purge_all
+            purged_bpns = self._purged_bpns
+            deleted_dtrs = self._deleted_dtrs
+            dirty_bpns = self._dirty_bpns
+            self._purge_all = False
+            self._purged_bpns = set()
+            self._deleted_dtrs = set()
+            self._dirty_bpns = set()
+
+        if not (purge_all or purged_bpns or deleted_dtrs or dirty_bpns):
+            return True
+
         self.logger.debug(f"[DtrConsumerPostgresMemoryManager] [{threading.get_ident()}] Trying to acquire lock (save_to_db)")
         with self._dtrs_lock:
             self.logger.debug(f"[DtrConsumerPostgresMemoryManager] [{threading.get_ident()}] Acquired lock (save_to_db)")
-            current_hash = hashlib.sha256(json.dumps(self.known_dtrs, sort_keys=True, default=str).encode()).hexdigest()
-            if current_hash == self._last_saved_hash:
-                return
-            try:
-                saved_dtrs = 0
-                with Session(self.engine) as session:
-                    # Clear existing data
-                    session.exec(delete(self.KnownDtrsModel))
-                    
-                    # Save each BPN's DTR data
-                    for bpn, bpn_data in self.known_dtrs.items():
-                        if self.DTR_DATA_KEY in bpn_data and self.REFRESH_INTERVAL_KEY in bpn_data:
-                            # Convert timestamp to datetime object instead of using the formatted string
-                            timestamp = bpn_data[self.REFRESH_INTERVAL_KEY]
-                            expires_at = datetime.fromtimestamp(timestamp)
-                            dtr_dict = bpn_data[self.DTR_DATA_KEY]
-                            
-                            # Iterate through all DTRs for this BPN (now a dictionary keyed by asset_id)
-                            if isinstance(dtr_dict, dict):
-                                for asset_id, dtr_data in dtr_dict.items():
-                                    if dtr_data is not None:
-                                        session.add(self.KnownDtrsModel(
-                                            bpnl=bpn,
-                                            edc_url=dtr_data[self.DTR_CONNECTOR_URL_KEY],
-                                            asset_id=dtr_data[self.DTR_ASSET_ID_KEY],
-                                            policies=dtr_data[self.DTR_POLICIES_KEY],
-                                            expires_at=expires_at
-                                        ))
-                                        saved_dtrs += 1
-                                    
-                    session.commit()
-                    self._last_saved_hash = current_hash
-                    if self.logger and self.verbose:
-                        self.logger.info(f"[DtrConsumerPostgresMemoryManager] Saved {saved_dtrs} DTR entries to the database.")
-            except SQLAlchemyError as e:
-                if self.logger and self.verbose:
-                    self.logger.error(f"[DtrConsumerPostgresMemoryManager] Error saving to db: {e}")
+            rows = [row for bpn in dirty_bpns for row in self._build_rows(bpn)]
         self.logger.debug(f"[DtrConsumerPostgresMemoryManager] [{threading.get_ident()}] Released lock (save_to_db)")
 
+        try:
+            with Session(self.engine) as session:
+                model = self.KnownDtrsModel
+                if purge_all:
+                    session.exec(delete(model))
+                if purged_bpns:
+                    session.exec(delete(model).where(model.bpnl.in_(purged_bpns)))
+                for bpn, asset_id in deleted_dtrs:
+                    session.exec(delete(model).where(model.bpnl == bpn, model.asset_id == asset_id))
+                if rows:
+                    session.exec(self._upsert_statement(session, rows))
+                session.commit()
+
+            if self.logger and self.verbose:
+                self.logger.info(f"[DtrConsumerPostgresMemoryManager] Saved {len(rows)} DTR entries and {len(deleted_dtrs)} deletions to the database.")
+            return True
+        except SQLAlchemyError as e:
+            # Restore the pending changes so they are retried on the next save
+            with self._dirty_lock:
+                self._purge_all = self._purge_all or purge_all
+                self._purged_bpns |= purged_bpns
+                self._deleted_dtrs |= deleted_dtrs
+                self._dirty_bpns |= dirty_bpns
+            if self.logger and self.verbose:
+                self.logger.error(f"[DtrConsumerPostgresMemoryManager] Error saving to db: {e}")
+            return False
+
     def stop(self):
         """
         Stop the background thread and perform a final save to the database.
         """
         if self._save_thread:
             self._save_thread.join()
-        self._save_to_db()
+        self._save_pending_changes()
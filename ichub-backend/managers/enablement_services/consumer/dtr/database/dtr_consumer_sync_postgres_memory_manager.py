@@ -22,12 +22,13 @@
 ## Code created partially using a LLM (GPT 4o) and reviewed by a human committer
 
 from .dtr_consumer_postgres_memory_manager import DtrConsumerPostgresMemoryManager
+from ..shell_descriptor_cache import ShellDescriptorCache
 from sqlalchemy.engine import Engine as E
 from sqlalchemy.orm import Session as S
 import threading
 import time
 import logging
-from typing import TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from managers.enablement_services.connector_manager import BaseConnectorConsumerManager
@@ -37,7 +38,7 @@ class DtrConsumerSyncPostgresMemoryManager(DtrConsumerPostgresMemoryManager):
     Manages DTR data using an in-memory cache synchronized with a Postgres database.
     Periodically persists changes and reloads updates from the database to ensure consistency.
     """
-    def __init__(self, engine: E | S, connector_consumer_manager: 'BaseConnectorConsumerManager', persist_interval:int = 5, expiration_time:int=3600, table_name="known_dtrs", dtrs_key="dtrs", logger:logging.Logger=None, verbose:bool=False, dct_type_id="dct:type",dct_type_key:str="'http://purl.org/dc/terms/type'.'@id'", operator:str="=", dct_type:str="https://w3id.org/catenax/taxonomy#DigitalTwinRegistry"):
+    def __init__(self, engine: E | S, connector_consumer_manager: 'BaseConnectorConsumerManager', persist_interval:int = 5, expiration_time:int=3600, table_name="known_dtrs", dtrs_key="dtrs", logger:logging.Logger=None, verbose:bool=False, dct_type_id="dct:type",dct_type_key:str="'http://purl.org/dc/terms/type'.'@id'", operator:str="=", dct_type:str="https://w3id.org/catenax/taxonomy#DigitalTwinRegistry", max_dtr_workers_per_partner:int=5, max_dtr_workers_global:int=20, shell_descriptor_cache:Optional[ShellDescriptorCache]=None, stale_while_revalidate:bool=False, discovery_timeout:float=60):
         """Initialize the DTR consumer synchronization manager.
 
         Args:
@@ -49,8 +50,13 @@ class DtrConsumerSyncPostgresMemoryManager(DtrConsumerPostgresMemoryManager):
             dtrs_key (str, optional): Key used to store DTR data within known_dtrs. Defaults to "dtrs".
             logger (logging.Logger, optional): Logger instance for debug output. Defaults to None.
             verbose (bool, optional): Flag for enabling verbose logging. Defaults to False.
+            max_dtr_workers_per_partner (int, optional): Maximum number of DTRs of a single partner queried at the same time. Defaults to 5.
+            max_dtr_workers_global (int, optional): Maximum number of DTR lookups running at the same time across all partners. Defaults to 20.
+            shell_descriptor_cache (ShellDescriptorCache, optional): LRU+TTL cache for shell descriptors. Defaults to None (default cache).
+            stale_while_revalidate (bool, optional): Serve expired DTRs while they are refreshed in the background. Defaults to False.
+            discovery_timeout (float, optional): Seconds a request waits for a DTR discovery of the same BPN already in flight. Defaults to 60.
         """
-        super().__init__(connector_consumer_manager=connector_consumer_manager, expiration_time=expiration_time, logger=logger, verbose=verbose, table_name=table_name, dtrs_key=dtrs_key, engine=engine, dct_type_id=dct_type_id, dct_type_key=dct_type_key, operator=operator, dct_type=dct_type)
+        super().__init__(connector_consumer_manager=connector_consumer_manager, expiration_time=expiration_time, logger=logger, verbose=verbose, table_name=table_name, dtrs_key=dtrs_key, engine=engine, dct_type_id=dct_type_id, dct_type_key=dct_type_key, operator=operator, dct_type=dct_type, max_dtr_workers_per_partner=max_dtr_workers_per_partner, max_dtr_workers_global=max_dtr_workers_global, shell_descriptor_cache=shell_descriptor_cache, stale_while_revalidate=stale_while_revalidate, discovery_timeout=discovery_timeout)
         self.persist_interval = persist_interval
         self._stop_event = threading.Event()
         self._start_background_tasks()
@@ -77,4 +83,4 @@ class DtrConsumerSyncPostgresMemoryManager(DtrConsumerPostgresMemoryManager):
         if self._save_thread:
             self._save_thread.join()
         self._stop_event.set()
-        self._save_to_db()
+        self._save_pending_changes()
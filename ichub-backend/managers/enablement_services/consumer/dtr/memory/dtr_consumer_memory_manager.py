@@ -31,12 +31,18 @@ import time
 import json
 import base64
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import TYPE_CHECKING, Dict, List, Optional, Union, Any
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union, Any
 from tractusx_sdk.dataspace.tools import op
 from sqlmodel import Session
 from tractusx_sdk.dataspace.services.connector import BaseConnectorConsumerService
 from managers.enablement_services.consumer.base_dtr_consumer_manager import BaseDtrConsumerManager
 from managers.enablement_services.consumer.dtr.pagination_manager import PaginationManager, DtrPaginationState, PageState
+from managers.enablement_services.consumer.dtr.shell_descriptor_fetcher import ShellDescriptorFetcher
+from managers.enablement_services.consumer.dtr.shell_descriptor_cache import ShellDescriptorCache
+from managers.enablement_services.consumer.single_flight import SingleFlight
+from managers.enablement_services.consumer.cache_refresh_scheduler import CacheAccessTracker
+from tools.frozen_tools import freeze
+from utils.metrics_utils import DTR, EDC, register_cache, track_stage
 if TYPE_CHECKING:
     from managers.enablement_services.connector_manager import BaseConnectorConsumerManager
 from tractusx_sdk.dataspace.tools import HttpTools
@@ -55,23 +61,39 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
     logger: logging.Logger
     verbose: bool
 
-    def __init__(self, connector_consumer_manager: 'BaseConnectorConsumerManager', expiration_time: int = 60, logger:logging.Logger=None, verbose:bool=False, dct_type_id="dct:type", dct_type_key:str="'http://purl.org/dc/terms/type'.'@id'", operator:str="=", dct_type:str="https://w3id.org/catenax/taxonomy#DigitalTwinRegistry"):
+    def __init__(self, connector_consumer_manager: 'BaseConnectorConsumerManager', expiration_time: int = 60, logger:logging.Logger=None, verbose:bool=False, dct_type_id="dct:type", dct_type_key:str="'http://purl.org/dc/terms/type'.'@id'", operator:str="=", dct_type:str="https://w3id.org/catenax/taxonomy#DigitalTwinRegistry", max_dtr_workers_per_partner:int=5, max_dtr_workers_global:int=20, shell_descriptor_cache:Optional[ShellDescriptorCache]=None, stale_while_revalidate:bool=False, discovery_timeout:float=60):
         """
         Initialize the memory-based DTR consumer manager.
         
         Args:
             connector_consumer_manager (BaseConnectorConsumerManager): Connector manager with consumer capabilities
             expiration_time (int, optional): Cache expiration time in minutes. Defaults to 60.
+            max_dtr_workers_per_partner (int, optional): Maximum number of DTRs of a single partner queried at the same time. Defaults to 5.
+            max_dtr_workers_global (int, optional): Maximum number of DTR lookups running at the same time across all partners. Defaults to 20.
+            shell_descriptor_cache (ShellDescriptorCache, optional): LRU+TTL cache for shell descriptors. A default cache is created if not provided.
+            stale_while_revalidate (bool, optional): Serve expired DTRs while they are refreshed in the background. Defaults to False.
+            discovery_timeout (float, optional): Seconds a request waits for a DTR discovery of the same BPN already in flight. Defaults to 60.
         """
         super().__init__(connector_consumer_manager, expiration_time, dct_type_id=dct_type_id, dct_type_key=dct_type_key, operator=operator, dct_type=dct_type)
         self.known_dtrs = {}
-        self.shell_descriptors = {}  # Central storage for shell descriptors by shell ID
+        # Central storage for shell descriptors keyed by (counter party, DTR asset, shell ID)
+        self.shell_descriptors = shell_descriptor_cache if shell_descriptor_cache is not None else ShellDescriptorCache()
+        register_cache("shell_descriptors", self.shell_descriptors.stats)
         self.logger = logger if logger else None
         self.verbose = verbose
         # Use separate locks for different data structures to reduce contention
         self._dtrs_lock = threading.RLock()  # Only for known_dtrs modifications
         self._shells_lock = threading.RLock()  # Only for shell_descriptors modifications
-        self._list_lock = threading.RLock()  # Only for thread-safe list operations
+        # Concurrency limits for the DTR fan-out in discover_shells
+        self.max_dtr_workers_per_partner = max(1, max_dtr_workers_per_partner)
+        self._global_dtr_semaphore = threading.BoundedSemaphore(max(1, max_dtr_workers_global))
+        # Shared, bounded pool for shell descriptor GETs (process-wide)
+        self.shell_descriptor_fetcher = ShellDescriptorFetcher.get_instance()
+        self.stale_while_revalidate = stale_while_revalidate
+        # Concurrent cache misses for the same BPN share one catalog discovery
+        self._discovery_flight = SingleFlight(timeout=discovery_timeout, name="DTR Manager", logger=logger)
+        # Cache usage, used to refresh the most requested BPNs ahead of expiry
+        self.access_tracker = CacheAccessTracker()
         
     def add_dtr(self, bpn: str, connector_url: str, asset_id: str, policies: List[str]) -> None:
         """
@@ -117,6 +139,9 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
     def _create_dtr_cache_entry(self, connector_url: str, asset_id: str, policies: List[Union[str, Dict[str, Any]]]) -> dict:
         """
         Create a new DTR cache entry for a specific BPN.
+
+        The entry is frozen, so it can be handed out to callers without copying.
+        Changes replace the whole entry instead of modifying it.
         
         Args:
             bpn (str): The Business Partner Number to associate DTR with
@@ -125,11 +150,11 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
             policies (List[Union[str, Dict[str, Any]]]): List of policies for this DTR (cleaned of @id and @type)
         """
 
-        return {
+        return freeze({
                     self.DTR_CONNECTOR_URL_KEY: connector_url,
                     self.DTR_ASSET_ID_KEY: asset_id,
                     self.DTR_POLICIES_KEY: policies
-                }
+                })
 
     def is_dtr_known(self, bpn: str, asset_id: str) -> bool:
         """
@@ -178,7 +203,7 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
             return None
             
         if asset_id in dtr_dict:
-            return copy.deepcopy(dtr_dict[asset_id])
+            return dtr_dict[asset_id]
         
         return None
 
@@ -189,7 +214,7 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         Returns:
             Dict: Complete cache dictionary containing all BPNs and their associated DTRs
         """
-        # Read operation - return a deep copy of the current state
+        # Read operation - return a copy of the current state, the frozen DTR entries are shared
         return copy.deepcopy(self.known_dtrs)
 
     def delete_dtr(self, bpn: str, asset_id: str) -> Dict:
@@ -231,6 +256,7 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
                 del self.known_dtrs[bpn]
                 if(self.logger and self.verbose):
                     self.logger.info(f"[DTR Manager] [{bpn}] Purged all DTRs from cache")
+            self.shell_descriptors.invalidate_counter_party(bpn)
         self.logger.debug(f"[DTR Manager] [{threading.get_ident()}] Released lock (purge_bpn)")
 
     def purge_cache(self) -> None:
@@ -254,6 +280,15 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
             self.logger.debug(f"[DTR Manager] [{threading.get_ident()}] Released lock (purge_cache - shells)")        
         self.logger.debug(f"[DTR Manager] [{threading.get_ident()}] Released locks (purge_cache)")
 
+    def get_shell_cache_stats(self) -> Dict:
+        """
+        Get the size and hit/miss/eviction counters of the shell descriptor cache.
+        
+        Returns:
+            Dict: Cache statistics
+        """
+        return self.shell_descriptors.stats()
+
     def get_dtrs_by_connector(self, bpn: str, connector_url: str) -> List[Dict]:
         """
         Retrieve DTRs for a specific BPN from a specific connector.
@@ -275,7 +310,7 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
             
         # Filter DTRs by connector URL
         filtered_dtrs = [
-            copy.deepcopy(dtr) for dtr in dtr_dict.values()
+            dtr for dtr in dtr_dict.values()
             if dtr.get(self.DTR_CONNECTOR_URL_KEY) == connector_url
         ]
         
@@ -354,7 +389,10 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         
         This method first checks the cache for existing DTRs. If cache is empty
         or expired, it uses the connector manager to get connectors for the BPN,
-        then queries each connector's catalog to find DTR assets.
+        then queries each connector's catalog to find DTR assets. Concurrent
+        requests for the same BPN share a single discovery. With
+        ``stale_while_revalidate`` enabled, expired DTRs are returned right away
+        and refreshed in the background.
         
         Args:
             bpn (str): The Business Partner Number to get DTRs for
@@ -363,17 +401,73 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         Returns:
             List[Dict]: List of DTR data for the BPN, each containing connector_url, asset_id, and policies
         """
-        # Check if we have cached data that hasn't expired (read operation - no lock needed)
-        if bpn in self.known_dtrs and not self._is_cache_expired(bpn):
-            if self.DTR_DATA_KEY in self.known_dtrs[bpn] and isinstance(self.known_dtrs[bpn][self.DTR_DATA_KEY], dict):
-                cached_dtrs_dict = self.known_dtrs[bpn][self.DTR_DATA_KEY]
-                if len(cached_dtrs_dict) > 0:
+        # Check if we have cached data (read operation - no lock needed)
+        if bpn in self.known_dtrs:
+            cached_dtrs_dict = self.known_dtrs[bpn].get(self.DTR_DATA_KEY)
+            if isinstance(cached_dtrs_dict, dict) and len(cached_dtrs_dict) > 0:
+                if not self._is_cache_expired(bpn):
+                    self.access_tracker.record(bpn, CacheAccessTracker.HIT)
                     if(self.logger and self.verbose):
                         self.logger.debug(f"[DTR Manager] [{bpn}] Returning {len(cached_dtrs_dict)} DTRs from cache. Next refresh at [{op.timestamp_to_datetime(self.known_dtrs[bpn][self.REFRESH_INTERVAL_KEY])}] UTC")
-                    # Return list of DTR values
-                    return [copy.deepcopy(dtr) for dtr in cached_dtrs_dict.values()]
-        
-        
+                    # Return list of DTR values (frozen, shared without copying)
+                    return list(cached_dtrs_dict.values())
+                if self.stale_while_revalidate:
+                    # Serve the expired DTRs and refresh them in the background
+                    self.access_tracker.record(bpn, CacheAccessTracker.STALE)
+                    if self._discovery_flight.do_async(bpn, self._discover_dtrs, bpn, timeout) and self.logger and self.verbose:
+                        self.logger.info(f"[DTR Manager] [{bpn}] Returning expired DTRs from cache, refreshing them in the background")
+                    return list(cached_dtrs_dict.values())
+
+        self.access_tracker.record(bpn, CacheAccessTracker.COLD)
+        try:
+            dtrs = self._discovery_flight.do(bpn, self._discover_dtrs, bpn, timeout)
+        except TimeoutError as e:
+            if(self.logger and self.verbose):
+                self.logger.error(f"[DTR Manager] [{bpn}] Error discovering DTRs: {e}")
+            return []
+        return list(dtrs)
+
+    def get_expiring_bpns(self, within_seconds: float) -> List[Tuple[str, float]]:
+        """
+        List the cached BPNs whose DTRs expire within the given time.
+
+        Args:
+            within_seconds (float): Time window in seconds
+
+        Returns:
+            List[Tuple[str, float]]: BPN and seconds left until expiry (negative if already expired)
+        """
+        now = time.time()
+        with self._dtrs_lock:
+            return [
+                (bpn, bpn_data[self.REFRESH_INTERVAL_KEY] - now)
+                for bpn, bpn_data in self.known_dtrs.items()
+                if self.REFRESH_INTERVAL_KEY in bpn_data and bpn_data.get(self.DTR_DATA_KEY)
+                and bpn_data[self.REFRESH_INTERVAL_KEY] - now <= within_seconds
+            ]
+
+    def refresh_bpn(self, bpn: str) -> None:
+        """
+        Rediscover the DTRs of a BPN ahead of expiry, sharing a discovery already in flight.
+
+        Args:
+            bpn (str): The Business Partner Number to refresh
+        """
+        self._discovery_flight.do(bpn, self._discover_dtrs, bpn)
+
+    def _discover_dtrs(self, bpn: str, timeout: int = 30) -> List[Dict]:
+        """
+        Discover the DTRs of a BPN from the catalogs of its connectors and add them to the cache.
+
+        Only called by one thread per BPN at a time, see ``get_dtrs``.
+
+        Args:
+            bpn (str): The Business Partner Number to discover DTRs for
+            timeout (int): Timeout for catalog requests
+
+        Returns:
+            List[Dict]: The frozen DTR entries of the BPN
+        """
         # Cache is expired or doesn't exist, discover DTRs
         if(self.logger and self.verbose):
             self.logger.info(f"[DTR Manager] No cached DTRs were found, discovering DTRs for bpn [{bpn}]...")
@@ -436,7 +530,7 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
                     cached_dtrs_list = list(cached_dtrs_dict.values())
                     if(self.logger and self.verbose):
                         self.logger.info(f"[DTR Manager] [{bpn}] Discovery complete. Found {len(cached_dtrs_list)} DTR(s) total")
-                    return [copy.deepcopy(dtr) for dtr in cached_dtrs_list]
+                    return cached_dtrs_list
                 else:
                     return []
             else:
@@ -494,8 +588,10 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         active_dtrs = len([dtr for dtr in dtrs if not current_page.dtr_states.get(dtr.get(self.DTR_ASSET_ID_KEY), DtrPaginationState("")).exhausted])
         per_dtr_limit = PaginationManager.distribute_limit(limit or 50, active_dtrs) if limit else None
         
-        # Process DTRs
+        # Split DTRs into exhausted ones (state carried over) and ones to query
         new_dtr_states = {}
+        fetched_descriptors = {}
+        dtrs_to_query = []
         for dtr in dtrs:
             asset_id = dtr.get(self.DTR_ASSET_ID_KEY)
             dtr_state = current_page.dtr_states.get(asset_id, DtrPaginationState(asset_id))
@@ -504,17 +600,24 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
                 new_dtr_states[asset_id] = dtr_state
                 continue
             
-            dtr = self._process_dtr_with_retry(
-                connector_service, counter_party_id, dtr, query_spec, dtr_policies,
-                limit=per_dtr_limit, cursor=dtr_state.cursor
-            )
+            dtrs_to_query.append((dtr, dtr_state))
+        
+        # Query all active DTRs concurrently, results come back in DTR order
+        processed_dtrs = self._process_dtrs_concurrently(
+            connector_service, counter_party_id, dtrs_to_query, query_spec, dtr_policies, limit=per_dtr_limit
+        )
+        
+        # Merge shell IDs in the stable DTR order
+        for (dtr, dtr_state), processed_dtr in zip(dtrs_to_query, processed_dtrs):
+            asset_id = dtr.get(self.DTR_ASSET_ID_KEY)
             
-            dtr_results.append(dtr)
-            shells = dtr.get("shells", [])
+            fetched_descriptors.update(processed_dtr.pop("_shell_descriptors", {}))
+            dtr_results.append(processed_dtr)
+            shells = processed_dtr.get("shells", [])
             all_shells.extend(shells)
             
             # Update DTR state
-            paging_metadata = dtr.get("paging_metadata", {})
+            paging_metadata = processed_dtr.get("paging_metadata", {})
             new_cursor = paging_metadata.get("cursor")
             new_dtr_states[asset_id] = DtrPaginationState(
                 asset_id=asset_id,
@@ -536,7 +639,7 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         )
         
         # Get shell descriptors
-        shell_descriptors = [self.shell_descriptors.get(shell_id) for shell_id in all_shells if shell_id in self.shell_descriptors]
+        shell_descriptors = [fetched_descriptors[shell_id] for shell_id in all_shells if shell_id in fetched_descriptors]
         
         # Generate pagination tokens - only include pagination if limit or cursor was provided
         pagination_enabled = limit is not None or cursor is not None
@@ -579,14 +682,53 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         
         return response
 
-    def _process_dtr_parallel(self, connector_service, counter_party_id: str, dtr: Dict, query_spec: List[Dict], dtr_policies: Optional[List[Dict]] = None, dtr_results: List = None, limit: Optional[int] = None, cursor: Optional[str] = None) -> None:
-        """Process a single DTR in parallel and append result to shared list."""
-        dtr = self._process_dtr_with_retry(connector_service, counter_party_id, dtr, query_spec, dtr_policies, limit=limit, cursor=cursor)
-        self.logger.debug(f"[DTR Manager] [{threading.get_ident()}] Trying to acquire lock (_process_dtr_parallel)")
-        with self._list_lock:  # Thread-safe append to shared list
-            self.logger.debug(f"[DTR Manager] [{threading.get_ident()}] Acquired lock (_process_dtr_parallel)")
-            dtr_results.append(dtr)
-        self.logger.debug(f"[DTR Manager] [{threading.get_ident()}] Released lock (_process_dtr_parallel)")
+    def _process_dtrs_concurrently(self, connector_service, counter_party_id: str, dtrs_to_query: List[tuple], query_spec: List[Dict], dtr_policies: Optional[List[Dict]] = None, limit: Optional[int] = None) -> List[Dict]:
+        """Process several DTRs of one partner in parallel.
+        
+        At most ``max_dtr_workers_per_partner`` DTRs of the partner are queried at
+        the same time, and every lookup additionally holds a slot of the global
+        semaphore so concurrent requests cannot exceed ``max_dtr_workers_global``.
+        
+        Args:
+            dtrs_to_query: List of (dtr, DtrPaginationState) tuples to process
+            
+        Returns:
+            List[Dict]: Processed DTR results in the same order as ``dtrs_to_query``
+        """
+        if not dtrs_to_query:
+            return []
+        
+        if len(dtrs_to_query) == 1:
+            dtr, dtr_state = dtrs_to_query[0]
+            return [self._process_dtr_bounded(connector_service, counter_party_id, dtr, query_spec, dtr_policies, limit=limit, cursor=dtr_state.cursor)]
+        
+        with ThreadPoolExecutor(max_workers=min(len(dtrs_to_query), self.max_dtr_workers_per_partner)) as executor:
+            futures = [
+                executor.submit(
+                    self._process_dtr_bounded,
+                    connector_service, counter_party_id, dtr, query_spec, dtr_policies,
+                    limit=limit, cursor=dtr_state.cursor
+                )
+                for dtr, dtr_state in dtrs_to_query
+            ]
+            return [future.result() for future in futures]
+    
+    def _process_dtr_bounded(self, connector_service, counter_party_id: str, dtr: Dict, query_spec: List[Dict], dtr_policies: Optional[List[Dict]] = None, limit: Optional[int] = None, cursor: Optional[str] = None) -> Dict:
+        """Process a single DTR while holding a slot of the global DTR semaphore."""
+        with self._global_dtr_semaphore:
+            try:
+                return self._process_dtr_with_retry(connector_service, counter_party_id, dtr, query_spec, dtr_policies, limit=limit, cursor=cursor)
+            except Exception as e:
+                if self.logger:
+                    self.logger.error(f"[DTR Manager] [{counter_party_id}] Unexpected error processing DTR [{dtr.get(self.DTR_ASSET_ID_KEY)}]: {e}")
+                return {
+                    "connectorUrl": dtr.get(self.DTR_CONNECTOR_URL_KEY),
+                    "assetId": dtr.get(self.DTR_ASSET_ID_KEY),
+                    "status": "failed",
+                    "shellsFound": 0,
+                    "shells": [],
+                    "error": str(e)
+                }
 
     def _process_dtr_with_retry(self, connector_service, counter_party_id: str, dtr: Dict, query_spec: List[Dict], dtr_policies: Optional[List[Dict]] = None, max_retries: int = 2, limit: Optional[int] = None, cursor: Optional[str] = None) -> Dict:
         """Process a single DTR with retry mechanism."""
@@ -617,12 +759,13 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
                 self.logger.info(f"[DTR Manager] [{counter_party_id}] Retrying DTR [{asset_id}] at [{connector_url}] (attempt {attempt + 1}/{max_retries + 1})...")
             try:
                 # Establish connection
-                dataplane_url, access_token = connector_service.do_dsp_with_bpnl(
-                    bpnl=counter_party_id,
-                    counter_party_address=connector_url,
-                    policies=policies_to_use,
-                    filter_expression=filter_expression
-                )
+                with track_stage(EDC, "dsp", counter_party_id):
+                    dataplane_url, access_token = connector_service.do_dsp_with_bpnl(
+                        bpnl=counter_party_id,
+                        counter_party_address=connector_url,
+                        policies=policies_to_use,
+                        filter_expression=filter_expression
+                    )
                 
                 # Search for shells
                 url = f"{dataplane_url}/lookup/shellsByAssetLink"
@@ -634,29 +777,35 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
                         query_params.append(f"cursor={cursor}")
                     url += "?" + "&".join(query_params)
                 
-                response = HttpTools.do_post(
-                    url=url,
-                    headers={"Authorization": f"{access_token}"},
-                    json=query_spec
-                )
+                with track_stage(DTR, "lookup_shells", counter_party_id):
+                    response = HttpTools.do_post(
+                        url=url,
+                        headers={"Authorization": f"{access_token}"},
+                        json=query_spec
+                    )
                 
                 if response.status_code == 200:
                     response_data = response.json()
                     shell_ids = self._extract_shell_ids(response_data)
-                    shells = self._fetch_shell_descriptors(response_data, dataplane_url, access_token)
+                    shells, shell_errors = self._fetch_shell_descriptors(response_data, dataplane_url, access_token)
                     
-                    # Store shell descriptors in central memory
+                    # Store shell descriptors in the central cache
+                    descriptors_by_id = {}
                     for shell in shells:
                         shell_id = shell.get("id")
                         if shell_id:
-                            self.shell_descriptors[shell_id] = shell
+                            descriptors_by_id[shell_id] = shell
+                            self.shell_descriptors.put((counter_party_id, asset_id, shell_id), shell)
                     
                     dtr.update({
                         "status": "connected",
                         "shellsFound": len(shell_ids),
                         "shells": shell_ids,  # Store just IDs in DTR info
-                        "paging_metadata": response_data.get("paging_metadata", {})
+                        "paging_metadata": response_data.get("paging_metadata", {}),
+                        "_shell_descriptors": descriptors_by_id  # Removed by discover_shells before responding
                     })
+                    if shell_errors:
+                        dtr["shellErrors"] = shell_errors
                     return dtr
                 else:
                     # Delete failed connection for retry
@@ -680,14 +829,7 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
     
     def _fetch_shell_descriptor(self, shell_uuid: str, dataplane_url: str, access_token: str) -> Dict:
         """Fetch single shell descriptor by UUID."""
-        encoded_uuid = base64.b64encode(shell_uuid.encode('utf-8')).decode('utf-8')
-        response = HttpTools.do_get(
-            url=f"{dataplane_url}/shell-descriptors/{encoded_uuid}",
-            headers={"Authorization": f"{access_token}"}
-        )
-        if response.status_code == 200:
-            return response.json()
-        return None
+        return self.shell_descriptor_fetcher.fetch_one(shell_uuid, dataplane_url, access_token)
     
     def _fetch_submodel_descriptor(self, shell_id: str, submodel_id: str, dataplane_url: str, access_token: str) -> Optional[Dict]:
         """Fetch single submodel descriptor by shell ID and submodel ID.
@@ -770,40 +912,18 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         
         return response
     
-    def _fetch_shell_descriptors(self, shells_response: Dict, dataplane_url: str, access_token: str) -> List[Dict]:
-        """Fetch shell descriptors from shell UUIDs in parallel."""
-        shell_uuids = shells_response.get('result', []) if isinstance(shells_response, dict) else shells_response
+    def _fetch_shell_descriptors(self, shells_response: Dict, dataplane_url: str, access_token: str) -> tuple[List[Dict], Dict[str, str]]:
+        """Fetch shell descriptors from shell UUIDs through the shared descriptor pool.
+        
+        Returns:
+            tuple[List[Dict], Dict[str, str]]: The descriptors found (in lookup order) and
+                an error message per shell UUID that could not be fetched.
+        """
+        shell_uuids = self._extract_shell_ids(shells_response)
         if not shell_uuids:
-            return []
+            return [], {}
         
-        shells = []
-        threads = []
-        
-        # Use a thread-safe list to collect results
-        def fetch_single_shell(shell_uuid: str, results_list: List[Dict]):
-            try:
-                shell = self._fetch_shell_descriptor(shell_uuid, dataplane_url, access_token)
-                if shell:
-                    self.logger.debug(f"[DTR Manager] [{threading.get_ident()}] Trying to acquire lock (fetch_single_shell)")
-                    with self._list_lock:  # Thread-safe append
-                        self.logger.debug(f"[DTR Manager] [{threading.get_ident()}] Acquired lock (fetch_single_shell)")
-                        results_list.append(shell)
-                    self.logger.debug(f"[DTR Manager] [{threading.get_ident()}] Released lock (fetch_single_shell)")
-            except Exception:
-                # Silently continue on error
-                pass
-        
-        # Start threads for parallel fetching
-        for shell_uuid in shell_uuids:
-            thread = threading.Thread(target=fetch_single_shell, args=(shell_uuid, shells))
-            thread.start()
-            threads.append(thread)
-        
-        # Wait for all threads to complete
-        for thread in threads:
-            thread.join()
-        
-        return shells
+        return self.shell_descriptor_fetcher.fetch_many(shell_uuids, dataplane_url, access_token)
         
     def _extract_shell_ids(self, shells_response: Dict) -> List[str]:
         """Extract shell IDs from the lookup response."""
@@ -855,6 +975,21 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         if not id:
             return {"status": 400, "error": "No shell ID provided"}
         
+        # Serve the shell from the descriptor cache when possible
+        for dtr in dtrs:
+            asset_id = dtr.get(self.DTR_ASSET_ID_KEY)
+            cached_shell = self.shell_descriptors.get((counter_party_id, asset_id, id))
+            if cached_shell:
+                if self.logger and self.verbose:
+                    self.logger.debug(f"[DTR Manager] [{counter_party_id}] Shell {id} served from descriptor cache")
+                return {
+                    "shell_descriptor": cached_shell,
+                    "dtr": {
+                        "connectorUrl": dtr.get(self.DTR_CONNECTOR_URL_KEY),
+                        "assetId": asset_id,
+                    }
+                }
+        
         connector_service = self.connector_consumer_manager.connector_service
         
         # Try each DTR to find the shell
@@ -871,16 +1006,18 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
             
             try:
                 # Establish connection
-                dataplane_url, access_token = connector_service.do_dsp_with_bpnl(
-                    bpnl=counter_party_id,
-                    counter_party_address=connector_url,
-                    policies=policies_to_use,
-                    filter_expression=filter_expression
-                )
+                with track_stage(EDC, "dsp", counter_party_id):
+                    dataplane_url, access_token = connector_service.do_dsp_with_bpnl(
+                        bpnl=counter_party_id,
+                        counter_party_address=connector_url,
+                        policies=policies_to_use,
+                        filter_expression=filter_expression
+                    )
                 
                 # Fetch specific shell descriptor
                 shell = self._fetch_shell_descriptor(id, dataplane_url, access_token)
                 if shell:
+                    self.shell_descriptors.put((counter_party_id, asset_id, id), shell)
                     return {
                         "shell_descriptor": shell,
                         "dtr": {
@@ -1037,12 +1174,13 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
             
             try:
                 # Establish connection
-                dataplane_url, access_token = connector_service.do_dsp_with_bpnl(
-                    bpnl=counter_party_id,
-                    counter_party_address=connector_url,
-                    policies=policies_to_use,
-                    filter_expression=filter_expression
-                )
+                with track_stage(EDC, "dsp", counter_party_id):
+                    dataplane_url, access_token = connector_service.do_dsp_with_bpnl(
+                        bpnl=counter_party_id,
+                        counter_party_address=connector_url,
+                        policies=policies_to_use,
+                        filter_expression=filter_expression
+                    )
                 self.logger.debug(f"[DTR Manager] [{counter_party_id}] Connected to DTR at {connector_url} for submodel discovery")
                 self.logger.debug(f"[DTR Manager] [{counter_party_id}] Using policies: {policies_to_use}")
                 self.logger.debug(f"[DTR Manager] [{counter_party_id}] Dataplane URL: {dataplane_url}")
@@ -1216,13 +1354,15 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         assets_to_negotiate = self._group_submodels_by_asset(submodels_to_fetch)
         
         # Negotiate assets in parallel
-        asset_tokens, asset_errors = self._negotiate_assets_parallel(counter_party_id, assets_to_negotiate)
+        with track_stage(EDC, "negotiate_assets", counter_party_id):
+            asset_tokens, asset_errors = self._negotiate_assets_parallel(counter_party_id, assets_to_negotiate)
         
         # Mark failed negotiations with specific error messages
         self._mark_failed_negotiations(assets_to_negotiate, asset_tokens, asset_errors, response)
         
         # Fetch data in parallel
-        self._fetch_data_parallel(submodels_to_fetch, asset_tokens, response)
+        with track_stage(EDC, "fetch_data", counter_party_id):
+            self._fetch_data_parallel(submodels_to_fetch, asset_tokens, response)
         
         # Mark any remaining pending items as failed
         self._mark_remaining_pending_as_failed(submodels_to_fetch, response)
@@ -1844,12 +1984,13 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         filter_expression = connector_service.get_filter_expression(
             key="https://w3id.org/edc/v0.0.1/ns/id", value=asset_id
         )
-        dataplane_url, access_token = connector_service.do_dsp_with_bpnl(
-            bpnl=counter_party_id,
-            counter_party_address=dsp_endpoint_url,
-            policies=policies,
-            filter_expression=filter_expression
-        )
+        with track_stage(EDC, "dsp", counter_party_id):
+            dataplane_url, access_token = connector_service.do_dsp_with_bpnl(
+                bpnl=counter_party_id,
+                counter_party_address=dsp_endpoint_url,
+                policies=policies,
+                filter_expression=filter_expression
+            )
         return access_token
 
     def _purge_asset_cache(self, counter_party_id: str, asset_id: str, dsp_endpoint_url: str, policies: List[Dict]) -> bool:
@@ -0,0 +1,154 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+
+ShellCacheKey = Tuple[str, str, str]
+
+
+class ShellDescriptorCache:
+    """
+    Size-bounded LRU cache with a time-to-live for shell descriptors.
+
+    Entries are keyed by ``(counter_party_id, dtr_asset_id, shell_id)``. The cache
+    evicts the least recently used entries once either the entry limit or the
+    approximate memory budget is exceeded, and treats entries older than the TTL
+    as misses. Hit, miss and eviction counters are kept for monitoring.
+    """
+
+    def __init__(self, ttl_seconds: int = 300, max_entries: int = 10000, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl_seconds (int, optional): Time in seconds an entry stays valid. Defaults to 300.
+            max_entries (int, optional): Maximum number of cached descriptors. Defaults to 10000.
+            max_bytes (int, optional): Approximate memory budget in bytes (JSON size). Defaults to 64 MiB.
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self.max_bytes = max(1, max_bytes)
+        # key -> (expires_at, size, descriptor)
+        self._entries: "OrderedDict[Hashable, Tuple[float, int, Dict]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @staticmethod
+    def _estimate_size(descriptor: Dict) -> int:
+        """Approximate the memory footprint of a descriptor by its JSON size."""
+        try:
+            return len(json.dumps(descriptor, default=str))
+        except (TypeError, ValueError):
+            return 1024
+
+    def get(self, key: ShellCacheKey) -> Optional[Dict]:
+        """
+        Return the cached descriptor for the key, or None on a miss or an expired entry.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, size, descriptor = entry
+            if time.monotonic() >= expires_at:
+                self._remove(key, size)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return descriptor
+
+    def put(self, key: ShellCacheKey, descriptor: Dict) -> None:
+        """
+        Store a descriptor, evicting least recently used entries if the cache is over budget.
+        """
+        size = self._estimate_size(descriptor)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            existing = self._entries.pop(key, None)
+            if existing is not None:
+                self._total_bytes -= existing[1]
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, size, descriptor)
+            self._total_bytes += size
+            while len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes:
+                oldest_key, (_, oldest_size, _) = next(iter(self._entries.items()))
+                self._remove(oldest_key, oldest_size)
+                self.evictions += 1
+
+    def _remove(self, key: ShellCacheKey, size: int) -> None:
+        """Remove an entry and update the memory accounting. Caller must hold the lock."""
+        del self._entries[key]
+        self._total_bytes -= size
+
+    def invalidate_counter_party(self, counter_party_id: str) -> int:
+        """
+        Remove all descriptors cached for a counter party.
+
+        Returns:
+            int: Number of removed entries.
+        """
+        with self._lock:
+            keys = [key for key in self._entries if key[0] == counter_party_id]
+            for key in keys:
+                self._remove(key, self._entries[key][1])
+            return len(keys)
+
+    def clear(self) -> None:
+        """Remove all entries. Counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, key: ShellCacheKey) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and time.monotonic() < entry[0]
+
+    def stats(self) -> Dict[str, float]:
+        """Return the current size and the hit/miss/eviction counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_ratio": (self.hits / lookups) if lookups else 0.0,
+            }
@@ -0,0 +1,232 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import base64
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from tractusx_sdk.dataspace.tools import HttpTools
+
+from managers.config.config_manager import ConfigManager
+from utils.metrics_utils import DTR, timed_stage
+
+logger = logging.getLogger(__name__)
+
+
+class ShellDescriptorFetcher:
+    """
+    Process-wide, bounded fetcher for shell descriptors of partner DTRs.
+
+    All descriptor GETs share one thread pool, so a lookup returning hundreds
+    of shell IDs no longer spawns one OS thread per shell. HTTP connections are
+    kept alive in one ``requests.Session`` per dataplane host.
+
+    When ``batch_lookup`` is enabled, descriptors are first requested in one
+    round trip via ``GET /shell-descriptors`` with an ID filter. Registries that
+    reject the filter are remembered and only get single-descriptor GETs.
+    """
+
+    _instance: Optional['ShellDescriptorFetcher'] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, max_workers: int = 32, timeout: int = 60, batch_lookup: bool = False, batch_size: int = 100):
+        """
+        Initialize the fetcher.
+
+        Args:
+            max_workers (int, optional): Size of the shared descriptor pool. Defaults to 32.
+            timeout (int, optional): Timeout in seconds for each descriptor request. Defaults to 60.
+            batch_lookup (bool, optional): Try the batch endpoint before single GETs. Defaults to False.
+            batch_size (int, optional): Maximum number of IDs requested per batch call. Defaults to 100.
+        """
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+        self.batch_lookup = batch_lookup
+        self.batch_size = max(1, batch_size)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="dtr-descriptor")
+        self._sessions: Dict[str, requests.Session] = {}
+        self._sessions_lock = threading.Lock()
+        self._batch_unsupported: set = set()
+
+    @classmethod
+    def get_instance(cls) -> 'ShellDescriptorFetcher':
+        """Return the process-wide fetcher, creating it from the configuration on first use."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls(
+                    max_workers=int(ConfigManager.get_config("consumer.discovery.digitalTwinRegistry.descriptors.max_workers", default=32)),
+                    timeout=int(ConfigManager.get_config("consumer.discovery.digitalTwinRegistry.descriptors.timeout", default=60)),
+                    batch_lookup=bool(ConfigManager.get_config("consumer.discovery.digitalTwinRegistry.descriptors.batch_lookup", default=False)),
+                    batch_size=int(ConfigManager.get_config("consumer.discovery.digitalTwinRegistry.descriptors.batch_size", default=100)),
+                )
+            return cls._instance
+
+    @staticmethod
+    def encode_id(shell_id: str) -> str:
+        """Base64-encode an identifier as required by the AAS registry API."""
+        return base64.b64encode(shell_id.encode('utf-8')).decode('utf-8')
+
+    def _get_session(self, dataplane_url: str) -> requests.Session:
+        """Return the keep-alive session for the host of the given dataplane."""
+        parsed = urlparse(dataplane_url)
+        host_key = f"{parsed.scheme}://{parsed.netloc}"
+        with self._sessions_lock:
+            session = self._sessions.get(host_key)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_workers)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._sessions[host_key] = session
+            return session
+
+    @timed_stage(DTR, "fetch_shell")
+    def fetch_one(self, shell_id: str, dataplane_url: str, access_token: str) -> Optional[Dict]:
+        """
+        Fetch a single shell descriptor.
+
+        Returns:
+            Optional[Dict]: The shell descriptor, or None if the registry did not return HTTP 200.
+        """
+        descriptor, _ = self._fetch_one_with_error(shell_id, dataplane_url, access_token)
+        return descriptor
+
+    def _fetch_one_with_error(self, shell_id: str, dataplane_url: str, access_token: str) -> Tuple[Optional[Dict], Optional[str]]:
+        """Fetch a single shell descriptor and return it together with an error message, if any."""
+        try:
+            response = HttpTools.do_get_with_session(
+                url=f"{dataplane_url}/shell-descriptors/{self.encode_id(shell_id)}",
+                session=self._get_session(dataplane_url),
+                headers={"Authorization": f"{access_token}"},
+                timeout=self.timeout
+            )
+            if response.status_code == 200:
+                return response.json(), None
+            return None, f"HTTP {response.status_code}"
+        except Exception as e:
+            return None, str(e)
+
+    def _fetch_batch(self, shell_ids: List[str], dataplane_url: str, access_token: str) -> Optional[Dict[str, Dict]]:
+        """
+        Fetch a chunk of shell descriptors in one round trip.
+
+        Returns:
+            Optional[Dict[str, Dict]]: Descriptors found by shell ID, or None if the registry
+                does not support the ID filter.
+        """
+        params = [("id", self.encode_id(shell_id)) for shell_id in shell_ids]
+        params.append(("limit", str(len(shell_ids))))
+        response = HttpTools.do_get_with_session(
+            url=f"{dataplane_url}/shell-descriptors",
+            session=self._get_session(dataplane_url),
+            headers={"Authorization": f"{access_token}"},
+            params=params,
+            timeout=self.timeout
+        )
+        if response.status_code != 200:
+            return None
+
+        body = response.json()
+        descriptors = body.get("result", []) if isinstance(body, dict) else body
+        if not isinstance(descriptors, list):
+            return None
+
+        # Registries ignoring the filter return unrelated shells; only keep the requested ones
+        requested = set(shell_ids)
+        matched = {d.get("id"): d for d in descriptors if isinstance(d, dict) and d.get("id") in requested}
+        if descriptors and not matched:
+            # A page of shells without a single requested ID means the filter was ignored
+            return None
+        return matched
+
+    @timed_stage(DTR, "fetch_shells")
+    def fetch_many(self, shell_ids: List[str], dataplane_url: str, access_token: str) -> Tuple[List[Dict], Dict[str, str]]:
+        """
+        Fetch many shell descriptors from one dataplane.
+
+        Args:
+            shell_ids (List[str]): Shell IDs to fetch
+            dataplane_url (str): The dataplane URL of the DTR
+            access_token (str): The EDR access token for the dataplane
+
+        Returns:
+            Tuple[List[Dict], Dict[str, str]]: The descriptors found, in the order of
+                ``shell_ids``, and an error message per shell ID that could not be fetched.
+        """
+        if not shell_ids:
+            return [], {}
+
+        found: Dict[str, Dict] = {}
+        errors: Dict[str, str] = {}
+
+        if self.batch_lookup and dataplane_url not in self._batch_unsupported:
+            for start in range(0, len(shell_ids), self.batch_size):
+                chunk = shell_ids[start:start + self.batch_size]
+                try:
+                    batch = self._fetch_batch(chunk, dataplane_url, access_token)
+                except Exception as e:
+                    logger.debug(f"[ShellDescriptorFetcher] Batch lookup failed at [{dataplane_url}]: {e}")
+                    batch = None
+                if batch is None:
+                    self._batch_unsupported.add(dataplane_url)
+                    break
+                found.update(batch)
+
+        missing = [shell_id for shell_id in shell_ids if shell_id not in found]
+        if missing:
+            futures = {
+                shell_id: self._executor.submit(self._fetch_one_with_error, shell_id, dataplane_url, access_token)
+                for shell_id in missing
+            }
+            for shell_id, future in futures.items():
+                descriptor, error = future.result()
+                if descriptor:
+                    found[shell_id] = descriptor
+                else:
+                    errors[shell_id] = error or "Empty response"
+
+        if errors:
+            logger.warning(f"[ShellDescriptorFetcher] Failed to fetch {len(errors)}/{len(shell_ids)} shell descriptors from [{dataplane_url}]")
+
+        return [found[shell_id] for shell_id in shell_ids if shell_id in found], errors
+
+    def shutdown(self) -> None:
+        """Stop the shared pool and close all keep-alive sessions."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        with self._sessions_lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+    @classmethod
+    def shutdown_instance(cls) -> None:
+        """Shut down the process-wide fetcher, if it was ever created."""
+        with cls._instance_lock:
+            if cls._instance is not None:
+                cls._instance.shutdown()
+                cls._instance = None
@@ -0,0 +1,271 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import base64
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from managers.config.config_manager import ConfigManager
+from managers.config.log_manager import LoggingManager
+from managers.enablement_services.consumer.single_flight import SingleFlight
+from utils.metrics_utils import register_cache
+
+logger = LoggingManager.get_logger(__name__)
+
+## (counter_party_id, counter_party_address, asset, policy hash)
+EdrCacheKey = Tuple[str, str, str, str]
+
+_REJECTED_STATUS_CODES = (401, 403)
+_STATUS_CODE_PATTERN = re.compile(r"\b(?:status code|status)[:= ]+(\d{3})\b", re.IGNORECASE)
+
+
+def is_rejected(result: Any) -> bool:
+    """
+    Tell whether a dataplane response, or the error raised for it, means the EDR token was refused (HTTP 401/403).
+
+    Besides responses and ``requests`` errors this recognizes the SDK errors, which only carry the status
+    code in their message (e.g. ``NotificationError("... Status code: 403")``).
+    """
+    status_code = getattr(result, "status_code", None)
+    if status_code is None:
+        status_code = getattr(getattr(result, "response", None), "status_code", None)
+    if status_code is None and isinstance(result, Exception):
+        match = _STATUS_CODE_PATTERN.search(str(result))
+        status_code = int(match.group(1)) if match else None
+    return status_code in _REJECTED_STATUS_CODES
+
+
+def _token_expiry(token: str) -> Optional[float]:
+    """Return the ``exp`` claim of a JWT access token as a unix timestamp, None if the token carries none."""
+    try:
+        payload = token.split(" ")[-1].split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+class EdrReusePolicy:
+    """
+    Reuses the negotiated EDRs (dataplane endpoint and access token) of a counter party asset until the token expires.
+
+    Entries are keyed by ``(counter_party_id, counter_party_address, asset, policy hash)``, the asset being the
+    dct:type or asset id the transfer was negotiated for. The expiry is read from the ``exp`` claim of the token,
+    shortened by ``expiry_margin``; tokens without one are kept for ``default_ttl`` seconds. When the dataplane
+    refuses a token (HTTP 401/403) the entry is evicted and the transfer is negotiated again, once.
+    Concurrent negotiations for the same key are coalesced.
+    """
+
+    def __init__(self, enabled: bool = True, max_entries: int = 1024, default_ttl: float = 300, expiry_margin: float = 30):
+        """
+        Initialize the policy.
+
+        Args:
+            enabled (bool, optional): Reuse EDRs. When disabled every call negotiates. Defaults to True.
+            max_entries (int, optional): Maximum number of cached EDRs. Defaults to 1024.
+            default_ttl (float, optional): Seconds an EDR whose token carries no expiry is reused. Defaults to 300.
+            expiry_margin (float, optional): Seconds before the token expiry at which the EDR is no longer reused. Defaults to 30.
+        """
+        self.enabled = enabled
+        self.max_entries = max(1, max_entries)
+        self.default_ttl = max(0.0, default_ttl)
+        self.expiry_margin = max(0.0, expiry_margin)
+        # key -> (expires_at, endpoint, token)
+        self._entries: "OrderedDict[Hashable, Tuple[float, str, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # The negotiation is bounded by its own max_wait, waiters wait for it to finish
+        self._negotiations = SingleFlight(timeout=None, name="EdrReusePolicy", logger=logger)
+        self.reused = 0
+        self.negotiated = 0
+        self.rejected = 0
+
+    @staticmethod
+    def key(counter_party_id: str, counter_party_address: Optional[str], asset: str, policies: Optional[List[Dict]]) -> EdrCacheKey:
+        """Build the cache key; the policies are hashed like the connector SDK does for its EDR cache."""
+        policy_hash = hashlib.sha3_256(str(policies).encode("utf-8")).hexdigest()
+        return (counter_party_id, counter_party_address or "", asset, policy_hash)
+
+    def _get(self, key: EdrCacheKey) -> Optional[Tuple[str, str]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, endpoint, token = entry
+            if time.time() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            self.reused += 1
+            return endpoint, token
+
+    def _put(self, key: EdrCacheKey, endpoint: str, token: str) -> None:
+        expires_at = _token_expiry(token)
+        expires_at = (expires_at - self.expiry_margin) if expires_at is not None else (time.time() + self.default_ttl)
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (expires_at, endpoint, token)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _negotiate(self, key: EdrCacheKey, negotiate: Callable[[], Tuple[str, str]]) -> Tuple[str, str]:
+        def run() -> Tuple[str, str]:
+            endpoint, token = negotiate()
+            if not endpoint or not token:
+                raise RuntimeError("The negotiation did not return a dataplane endpoint and access token.")
+            with self._lock:
+                self.negotiated += 1
+            if self.enabled:
+                self._put(key, endpoint, token)
+            return endpoint, token
+        return self._negotiations.do(key, run)
+
+    def acquire(self, key: EdrCacheKey, negotiate: Callable[[], Tuple[str, str]]) -> Tuple[str, str]:
+        """
+        Return the cached EDR for the key, or negotiate one with ``negotiate``.
+
+        Args:
+            key (EdrCacheKey): The key built with ``key()``.
+            negotiate (Callable): Returns ``(dataplane_endpoint, access_token)`` of a new transfer.
+
+        Returns:
+            Tuple[str, str]: The dataplane endpoint and access token.
+        """
+        if self.enabled:
+            cached = self._get(key)
+            if cached is not None:
+                return cached
+        return self._negotiate(key, negotiate)
+
+    def call(self, key: EdrCacheKey, negotiate: Callable[[], Tuple[str, str]], request: Callable[[str, str], Any],
+             on_rejected: Optional[Callable[[], Any]] = None) -> Any:
+        """
+        Run a dataplane request with a reused EDR. If the token is refused, negotiate again once and repeat the request.
+
+        Args:
+            key (EdrCacheKey): The key built with ``key()``.
+            negotiate (Callable): Returns ``(dataplane_endpoint, access_token)`` of a new transfer.
+            request (Callable): Runs the request with ``(dataplane_endpoint, access_token)`` and returns its result.
+            on_rejected (Callable, optional): Called after a refused token, e.g. to drop the transfer cached by the connector SDK.
+
+        Returns:
+            Any: The result of the request.
+        """
+        return self.session(key, negotiate, on_rejected).call(request)
+
+    def session(self, key: EdrCacheKey, negotiate: Callable[[], Tuple[str, str]],
+                on_rejected: Optional[Callable[[], Any]] = None) -> "EdrSession":
+        """
+        Acquire one EDR for a batch of dataplane requests, also when the reuse across calls is disabled.
+
+        Args:
+            key (EdrCacheKey): The key built with ``key()``.
+            negotiate (Callable): Returns ``(dataplane_endpoint, access_token)`` of a new transfer.
+            on_rejected (Callable, optional): Called after a refused token, e.g. to drop the transfer cached by the connector SDK.
+
+        Returns:
+            EdrSession: The session holding the acquired EDR.
+        """
+        return EdrSession(self, key, negotiate, on_rejected)
+
+    def _renegotiate(self, key: EdrCacheKey, negotiate: Callable[[], Tuple[str, str]],
+                     on_rejected: Optional[Callable[[], Any]] = None) -> Tuple[str, str]:
+        logger.info(f"[EdrReusePolicy] [{key[0]}] The dataplane refused the EDR for [{key[2]}], negotiating again")
+        self.evict(key)
+        with self._lock:
+            self.rejected += 1
+        if on_rejected is not None:
+            on_rejected()
+        return self._negotiate(key, negotiate)
+
+    def evict(self, key: EdrCacheKey) -> bool:
+        """Remove the EDR of the key. Returns True if one was cached."""
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def clear(self) -> None:
+        """Remove all entries. Counters are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def stats(self) -> Dict[str, float]:
+        """Return the number of cached EDRs and how often one was reused, negotiated or refused by the dataplane."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.reused,
+                "misses": self.negotiated,
+                "invalidations": self.rejected,
+            }
+
+
+class EdrSession:
+    """
+    Runs several dataplane requests with one EDR. The EDR is acquired once and negotiated again only when the dataplane refuses it.
+    """
+
+    def __init__(self, policy: EdrReusePolicy, key: EdrCacheKey, negotiate: Callable[[], Tuple[str, str]],
+                 on_rejected: Optional[Callable[[], Any]] = None):
+        self.policy = policy
+        self.key = key
+        self.negotiate = negotiate
+        self.on_rejected = on_rejected
+        self.edr = policy.acquire(key, negotiate)
+
+    def call(self, request: Callable[[str, str], Any]) -> Any:
+        """
+        Run a dataplane request with the session EDR. If the token is refused, negotiate again once and repeat the request.
+
+        Args:
+            request (Callable): Runs the request with ``(dataplane_endpoint, access_token)`` and returns its result.
+
+        Returns:
+            Any: The result of the request.
+        """
+        try:
+            result = request(*self.edr)
+            if not is_rejected(result):
+                return result
+        except Exception as e:
+            if not is_rejected(e):
+                raise
+
+        self.edr = self.policy._renegotiate(self.key, self.negotiate, self.on_rejected)
+        return request(*self.edr)
+
+
+edr_reuse_policy = EdrReusePolicy(
+    enabled=bool(ConfigManager.get_config("consumer.connector.edr_reuse.enabled", default=True)),
+    max_entries=int(ConfigManager.get_config("consumer.connector.edr_reuse.max_entries", default=1024)),
+    default_ttl=float(ConfigManager.get_config("consumer.connector.edr_reuse.default_ttl_seconds", default=300)),
+    expiry_margin=float(ConfigManager.get_config("consumer.connector.edr_reuse.expiry_margin_seconds", default=30)),
+)
+register_cache("edrs", edr_reuse_policy.stats)
@@ -0,0 +1,147 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import logging
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class _Call:
+    """State of one in-flight call shared by the caller running it and its waiters."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls for the same key into a single execution.
+
+    The first caller for a key runs the function, every other caller asking for
+    the same key while it runs waits for that result instead of starting its own
+    call. Exceptions raised by the function are re-raised in every waiter.
+    """
+
+    def __init__(self, timeout: Optional[float] = 60, name: str = "SingleFlight", logger: logging.Logger = None):
+        """
+        Initialize the single-flight group.
+
+        Args:
+            timeout (float, optional): Seconds a waiter waits for the in-flight call before giving up. None waits forever. Defaults to 60.
+            name (str, optional): Name used in log messages. Defaults to "SingleFlight".
+            logger (logging.Logger, optional): Logger instance. Defaults to None.
+        """
+        self.timeout = timeout
+        self.name = name
+        self.logger = logger
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.executions = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run ``fn(*args, **kwargs)`` once for all concurrent callers of the same key.
+
+        Args:
+            key (Hashable): Key identifying the call, e.g. the BPN.
+            fn (Callable): Function to run when no call for the key is in flight.
+
+        Returns:
+            Any: The result of the (shared) call.
+
+        Raises:
+            TimeoutError: If a waiter did not get the result within ``timeout`` seconds.
+            Exception: Any exception raised by ``fn``.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+                self.executions += 1
+            else:
+                self.coalesced += 1
+
+        if leader:
+            return self._run(key, call, fn, *args, **kwargs)
+
+        if self.logger:
+            self.logger.debug(f"[{self.name}] [{key}] Waiting for the call already in flight")
+        if not call.done.wait(self.timeout):
+            raise TimeoutError(f"[{self.name}] [{key}] Timed out after {self.timeout}s waiting for the call in flight")
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def do_async(self, key: Hashable, fn: Callable[..., Any], *args, **kwargs) -> bool:
+        """
+        Run the call in a background thread unless a call for the key is already in flight.
+
+        Errors are logged and not raised, as there is no caller to receive them.
+
+        Returns:
+            bool: True if a background call was started, False if one was already in flight.
+        """
+        with self._lock:
+            if key in self._calls:
+                return False
+            call = _Call()
+            self._calls[key] = call
+            self.executions += 1
+
+        def run():
+            try:
+                self._run(key, call, fn, *args, **kwargs)
+            except Exception as e:
+                if self.logger:
+                    self.logger.warning(f"[{self.name}] [{key}] Background refresh failed: {e}")
+
+        threading.Thread(target=run, daemon=True).start()
+        return True
+
+    def in_flight(self, key: Hashable) -> bool:
+        """Check whether a call for the key is currently running."""
+        with self._lock:
+            return key in self._calls
+
+    def get_stats(self) -> Dict[str, int]:
+        """Return the number of executed and coalesced calls."""
+        with self._lock:
+            return {"executions": self.executions, "coalesced": self.coalesced, "in_flight": len(self._calls)}
+
+    def _run(self, key: Hashable, call: _Call, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run the function as the leader of the call and publish its outcome to the waiters."""
+        try:
+            call.result = fn(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
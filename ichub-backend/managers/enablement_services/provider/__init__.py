@@ -27,4 +27,5 @@ __license__ = "Apache License, Version 2.0"
 
 
 from .connector_provider_manager import ConnectorProviderManager
-from .dtr_provider_manager import DtrProviderManager
\ No newline at end of file
+from .dtr_provider_manager import DtrProviderManager
+from .known_offer_cache import KnownOfferCache, KnownOfferPostgresCache
\ No newline at end of file
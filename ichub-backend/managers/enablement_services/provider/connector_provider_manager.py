@@ -37,9 +37,11 @@ from tools.constants import (
 import json
 
 from .dtr_provider_manager import DtrProviderManager
+from .known_offer_cache import KnownOfferCache
 
 logger = LoggingManager.get_logger(__name__)
 from tools.crypt_tools import blake2b_128bit
+from utils.metrics_utils import EDC, register_cache, timed_stage
 class ConnectorProviderManager:
     """Manager for handling EDC (Eclipse Data Space Components Connector) related operations."""
 
@@ -55,7 +57,8 @@ class ConnectorProviderManager:
                  backend_api_key_value: str = "",
                  dataspace_version: str = DATASPACE_VERSION_JUPITER,
                  submodel_mode: str = "filesystem",
-                 submodel_asset_headers: dict = None):
+                 submodel_asset_headers: dict = None,
+                 known_offer_cache: KnownOfferCache = None):
 
         self.ichub_url = ichub_url  # base URL of the submodel service (local or external)
         self.path_submodel_dispatcher = path_submodel_dispatcher
@@ -84,6 +87,11 @@ class ConnectorProviderManager:
         self.connector_service = connector_provider_service
         self.notification_service = NotificationService(connector_provider_service)
 
+        # Assets, policies and contracts already verified in the EDC. Their IDs are
+        # deterministic, so known ones are not looked up again on every registration.
+        self.known_offer_cache = known_offer_cache if known_offer_cache is not None else KnownOfferCache()
+        register_cache("known_offers", self.known_offer_cache.get_stats)
+
     @staticmethod
     def _mask_credential(value: str) -> str:
         """Mask a credential value for safe logging (show only last 4 chars)."""
@@ -105,6 +113,7 @@ class ConnectorProviderManager:
                 headers[header_name] = value
         return headers
 
+    @timed_stage(EDC, "update_asset_headers")
     def update_asset_headers(self, asset_id: str, desired_headers: dict | None) -> bool:
         """Compare and update the header:* properties in an existing asset's data-address.
 
@@ -117,7 +126,7 @@ class ConnectorProviderManager:
         if desired_headers is None:
             desired_headers = {}
 
-        response = self.connector_service.assets.get_by_id(oid=asset_id)
+        response = self._lookup_asset(asset_id)
         if response.status_code != 200:
             logger.warning(f"Cannot update headers for asset {asset_id}: asset not found.")
             return False
@@ -267,6 +276,29 @@ class ConnectorProviderManager:
         
         return usage_policy_id, access_policy_id
         
+    def invalidate_known_offer(self, asset_id: str = None, *offer_ids: str) -> None:
+        """
+        Forget a registered offer (its asset, contracts and the given policy or contract IDs), e.g. after a
+        downstream call answered 404 for it, so that it is verified again in the EDC on the next registration.
+        """
+        if asset_id:
+            self.known_offer_cache.invalidate_asset(asset_id)
+        if offer_ids:
+            self.known_offer_cache.invalidate(*offer_ids)
+
+    def _lookup_asset(self, asset_id: str):
+        """Get an asset from the EDC, forgetting it and its contracts if it does not exist (anymore)."""
+        response = self.connector_service.assets.get_by_id(oid=asset_id)
+        if response.status_code == 404:
+            self.invalidate_known_offer(asset_id)
+        return response
+
+    def reset_known_offers(self) -> None:
+        """
+        Forget all the known offer components, so that the next registrations verify them again in the EDC.
+        """
+        self.known_offer_cache.clear()
+
     def register_submodel_bundle_circular_offer(self, semantic_id: str, headers: dict = None) -> tuple[str, str, str, str]:
         # Use the pre-configured submodel auth headers when the caller does not
         # supply explicit ones (covers the normal startup/sync code paths).
@@ -294,11 +326,21 @@ class ConnectorProviderManager:
             asset_id + usage_policy_id + access_policy_id
         )
 
+    @timed_stage(EDC, "get_or_create_contract")
     def get_or_create_contract(self, asset_id:str, usage_policy_id:str, access_policy_id:str) -> str:
         contract_id:str = self.generate_contract_id(asset_id=asset_id, usage_policy_id=usage_policy_id, access_policy_id=access_policy_id)
+        # Contracts are cached with the fingerprint of their asset, so they can be invalidated with it
+        asset_fingerprint = KnownOfferCache.fingerprint(asset_id)
+        if self.known_offer_cache.is_known(KnownOfferCache.CONTRACT, contract_id, asset_fingerprint):
+            logger.debug(f"Contract with ID {contract_id} is already known.")
+            return contract_id
+
         existing_contract = self.connector_service.contract_definitions.get_by_id(oid=contract_id)
-        if existing_contract.status_code == 200:
+        if existing_contract.status_code == 404:
+            self.invalidate_known_offer(None, contract_id)
+        elif existing_contract.status_code == 200:
             logger.debug(f"Contract with ID {contract_id} already exists.")
+            self.known_offer_cache.add(KnownOfferCache.CONTRACT, contract_id, asset_fingerprint)
             return contract_id
 
         try:
@@ -314,9 +356,13 @@ class ConnectorProviderManager:
                 f"(usage_policy='{usage_policy_id}', access_policy='{access_policy_id}'). "
                 f"Error: {e}"
             )
+            # The referenced components may be gone from the EDC, verify them again on the next call
+            self.known_offer_cache.invalidate(asset_id, usage_policy_id, access_policy_id)
             raise
         logger.info(f"Successfully registered contract with ID {contract_id} for asset '{asset_id}'.")
-        return contract_response.get("@id", contract_id)
+        contract_id = contract_response.get("@id", contract_id)
+        self.known_offer_cache.add(KnownOfferCache.CONTRACT, contract_id, asset_fingerprint)
+        return contract_id
 
 
     def generate_policy_id(self, context: dict | list[dict] = {}, permissions: dict | list[dict] = [], prohibitions: dict | list[dict] = [], obligations: dict | list[dict] = [], qualifier: str = "") -> str:
@@ -339,6 +385,7 @@ class ConnectorProviderManager:
             context_str + permissions_str + prohibitions_str + obligations_str
         )
     
+    @timed_stage(EDC, "get_or_create_policy")
     def get_or_create_policy(self, context: dict | list[dict] = {}, permissions: dict | list[dict] = [], prohibitions: dict | list[dict] = [], obligations: dict | list[dict] = [], qualifier: str = "") -> str:
         
         policy_id = self.generate_policy_id(
@@ -350,10 +397,17 @@ class ConnectorProviderManager:
         )
         
         """Get or create a policy in the EDC, returning the policy ID."""
+        if self.known_offer_cache.is_known(KnownOfferCache.POLICY, policy_id):
+            logger.debug(f"Policy with ID {policy_id} is already known.")
+            return policy_id
+
         # Check if the policy already exists
         existing_policy = self.connector_service.policies.get_by_id(oid=policy_id)
-        if existing_policy.status_code == 200:
+        if existing_policy.status_code == 404:
+            self.invalidate_known_offer(None, policy_id)
+        elif existing_policy.status_code == 200:
             logger.debug(f"Policy with ID {policy_id} already exists.")
+            self.known_offer_cache.add(KnownOfferCache.POLICY, policy_id)
             return policy_id
 
         try:
@@ -372,21 +426,31 @@ class ConnectorProviderManager:
             )
             raise
         logger.info(f"Successfully registered policy with ID {policy_id}.")
-        return policy_response.get("@id", policy_id)
+        policy_id = policy_response.get("@id", policy_id)
+        self.known_offer_cache.add(KnownOfferCache.POLICY, policy_id)
+        return policy_id
     
     
+    @timed_stage(EDC, "get_or_create_dtr_asset")
     def get_or_create_dtr_asset(self, dtr_url:str, dct_type:str, existing_asset_id:str=None, headers:dict=None, version:str="3.0") -> str:
         """Get or create a DTR asset, updating headers if they changed."""
         if(not existing_asset_id):
             existing_asset_id = self.generate_dtr_asset_id(dtr_url=dtr_url)
 
+        # Known with the same headers: nothing to check or update in the EDC
+        headers_fingerprint = KnownOfferCache.fingerprint(headers or {})
+        if self.known_offer_cache.is_known(KnownOfferCache.ASSET, existing_asset_id, headers_fingerprint):
+            logger.debug(f"[DTR] Asset with ID {existing_asset_id} is already known.")
+            return existing_asset_id
+
         # Check if the asset already exists
-        existing_asset = self.connector_service.assets.get_by_id(oid=existing_asset_id)
+        existing_asset = self._lookup_asset(existing_asset_id)
         
         if existing_asset.status_code == 200:
             logger.debug(f"[DTR] Asset with ID {existing_asset_id} already exists.")
             # Ensure credentials in the data-address are up to date
             self.update_asset_headers(asset_id=existing_asset_id, desired_headers=headers)
+            self.known_offer_cache.add(KnownOfferCache.ASSET, existing_asset_id, headers_fingerprint)
             return existing_asset_id
         
         # If it doesn't exist, create it
@@ -397,18 +461,28 @@ class ConnectorProviderManager:
             logger.error(f"[DTR] Failed to register asset with ID {existing_asset_id} for URL '{dtr_url}'. Error: {e}")
             raise
         logger.info(f"[DTR] Successfully registered asset with ID {existing_asset_id}.")
-        return asset.get("@id", existing_asset_id)
+        asset_id = asset.get("@id", existing_asset_id)
+        self.known_offer_cache.add(KnownOfferCache.ASSET, asset_id, headers_fingerprint)
+        return asset_id
     
+    @timed_stage(EDC, "get_or_create_submodel_asset")
     def get_or_create_circular_submodel_asset(self, semantic_id: str, headers: dict = None) -> str:
         """Get or create a circular submodel asset, updating headers if they changed."""
         standard_asset_id = self.generate_asset_id(semantic_id=semantic_id)
 
+        # Known with the same headers: nothing to check or update in the EDC
+        headers_fingerprint = KnownOfferCache.fingerprint(headers or {})
+        if self.known_offer_cache.is_known(KnownOfferCache.ASSET, standard_asset_id, headers_fingerprint):
+            logger.debug(f"Asset with ID {standard_asset_id} is already known.")
+            return standard_asset_id
+
         # Check if the asset already exists
-        existing_asset = self.connector_service.assets.get_by_id(oid=standard_asset_id)
+        existing_asset = self._lookup_asset(standard_asset_id)
         if existing_asset.status_code == 200:
             logger.debug(f"Asset with ID {standard_asset_id} already exists.")
             # Ensure credentials in the data-address are up to date
             self.update_asset_headers(asset_id=standard_asset_id, desired_headers=headers)
+            self.known_offer_cache.add(KnownOfferCache.ASSET, standard_asset_id, headers_fingerprint)
             return standard_asset_id
 
         # If it doesn't exist, create it
@@ -419,7 +493,9 @@ class ConnectorProviderManager:
             logger.error(f"Failed to register submodel bundle asset with ID {standard_asset_id} for semantic ID '{semantic_id}'. Error: {e}")
             raise
         logger.info(f"Successfully registered submodel bundle asset with ID {standard_asset_id}.")
-        return asset.get("@id", standard_asset_id)
+        asset_id = asset.get("@id", standard_asset_id)
+        self.known_offer_cache.add(KnownOfferCache.ASSET, asset_id, headers_fingerprint)
+        return asset_id
     
     def build_dispatcher_url(self, semantic_id: str):
         return self.backend_submodel_dispatcher + "/" + quote(semantic_id, safe="")
@@ -526,7 +602,7 @@ class ConnectorProviderManager:
         if not existing_asset_id:
             existing_asset_id = self.generate_digital_twin_event_asset_id(digital_twin_event_url=digital_twin_event_url)
         # Check if the asset already exists
-        existing_asset = self.connector_service.assets.get_by_id(oid=existing_asset_id)
+        existing_asset = self._lookup_asset(existing_asset_id)
         if existing_asset.status_code == 200:
             logger.debug(f"[DigitalTwinEvent] Asset with ID {existing_asset_id} already exists.")
             # Ensure credentials in the data-address are up to date
@@ -625,7 +701,7 @@ class ConnectorProviderManager:
             existing_asset_id = self.generate_unique_id_push_asset_id(unique_id_push_url)
 
         # Check if the asset already exists
-        existing_asset = self.connector_service.assets.get_by_id(oid=existing_asset_id)
+        existing_asset = self._lookup_asset(existing_asset_id)
         if existing_asset.status_code == 200:
             logger.debug(f"[UniqueIdPush] Asset with ID {existing_asset_id} already exists.")
             return existing_asset_id
@@ -775,7 +851,7 @@ class ConnectorProviderManager:
             # Non-fatal: stale cleanup is best-effort
             logger.warning(f"[CCM] Stale asset cleanup query failed: {query_exc}")
 
-        existing_asset = self.connector_service.assets.get_by_id(oid=asset_id)
+        existing_asset = self._lookup_asset(asset_id)
         if existing_asset.status_code == 200:
             logger.debug(f"[CCM] Asset with ID {asset_id} already exists.")
             return asset_id
@@ -883,7 +959,7 @@ class ConnectorProviderManager:
             existing_asset_id = self.generate_pcf_exchange_asset_id(pcf_exchange_url=pcf_exchange_url)
 
         # Check if the asset already exists
-        existing_asset = self.connector_service.assets.get_by_id(oid=existing_asset_id)
+        existing_asset = self._lookup_asset(existing_asset_id)
         
         if existing_asset.status_code == 200:
             logger.debug(f"[PCF Exchange] Asset with ID {existing_asset_id} already exists.")
@@ -1033,6 +1109,9 @@ class ConnectorProviderManager:
         Args:
             asset_id: The EDC asset ID of the certificate to unpublish.
         """
+        # The asset and its contracts must be verified again if the certificate is published again
+        self.known_offer_cache.invalidate_asset(asset_id)
+
         # Delete the contract definition first (requires the asset to exist)
         contract_id = f"ichub:contract:ccm-cert:{blake2b_128bit(asset_id)}"
         try:
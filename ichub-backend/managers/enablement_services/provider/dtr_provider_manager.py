@@ -44,6 +44,7 @@ from urllib import parse
 
 from tools.aspect_id_tools import extract_aspect_id_name_from_urn_camelcase
 from tools.exceptions import ExternalAPIError, InvalidError
+from utils.metrics_utils import DTR, timed_stage
 from urllib.parse import urljoin
 
 import logging
@@ -216,6 +217,7 @@ class DtrProviderManager:
                     ReferenceKey(type=ReferenceKeyTypes.GLOBAL_REFERENCE, value=bpn)
                 )
 
+    @timed_stage(DTR, "create_or_update_shell_descriptor")
     def create_or_update_shell_descriptor(self,
         aas_id: UUID,
         global_id: UUID,
@@ -380,6 +382,7 @@ class DtrProviderManager:
 
         return res
         
+    @timed_stage(DTR, "create_submodel_descriptor")
     def create_submodel_descriptor(
         self,
         aas_id: UUID|str,
@@ -467,6 +470,7 @@ class DtrProviderManager:
             raise ExternalAPIError("Error creating submodels descriptor: " + "\n" +res.to_json_string())
         return res
 
+    @timed_stage(DTR, "get_shell_descriptor")
     def get_shell_descriptor_by_id(self, aas_id: UUID) -> ShellDescriptor:
         """
         Retrieves a shell descriptor from the DTR.
@@ -478,6 +482,7 @@ class DtrProviderManager:
             raise ExternalAPIError("Error retrieving shell descriptor: " + "\n" + res.to_json_string())
         return res
 
+    @timed_stage(DTR, "get_submodel_descriptor")
     def get_submodel_descriptor_by_id(
         self, aas_id: UUID, submodel_id: UUID
     ) -> SubModelDescriptor:
@@ -493,6 +498,7 @@ class DtrProviderManager:
             )
         return res
 
+    @timed_stage(DTR, "delete_shell_descriptor")
     def delete_shell_descriptor(self, aas_id: UUID) -> None:
         """
         Deletes a shell descriptor in the DTR.
@@ -501,6 +507,7 @@ class DtrProviderManager:
         if isinstance(res, Result):
             raise ExternalAPIError("Error deleting shell descriptor: " + "\n" + res.to_json_string())
 
+    @timed_stage(DTR, "delete_submodel_descriptor")
     def delete_submodel_descriptor(self, aas_id: UUID, submodel_id: UUID) -> None:
         """
         Deletes a submodel descriptor in the DTR.
@@ -0,0 +1,275 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import json
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from sqlmodel import Session, select, delete
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Engine as E
+from sqlalchemy.exc import SQLAlchemyError
+
+from managers.config.log_manager import LoggingManager
+from models.metadata_database.provider.models import KnownOffers
+from tools.crypt_tools import blake2b_128bit
+
+logger = LoggingManager.get_logger(__name__)
+
+
+class KnownOfferCache:
+    """
+    In-memory cache of the EDC offer components (assets, policies and contract definitions)
+    that are known to exist in the provider connector.
+
+    The IDs of these components are deterministic hashes, so once a component was verified
+    or created it does not need to be looked up again in the EDC. An optional fingerprint
+    (e.g. of the asset data-address headers) is stored with each ID, a lookup with a
+    different fingerprint is a miss so that the component is verified again.
+
+    Entries older than the optional TTL are misses too, so that components deleted in the EDC
+    (or reset by another process) are eventually verified again.
+    """
+
+    ASSET = "asset"
+    POLICY = "policy"
+    CONTRACT = "contract"
+
+    def __init__(self, enabled: bool = True, ttl_seconds: Optional[float] = None):
+        """
+        Args:
+            enabled (bool, optional): When disabled nothing is known, so every registration is verified in the EDC. Defaults to True.
+            ttl_seconds (Optional[float], optional): Seconds a component stays known in memory, None or 0 keeps it until invalidated. Defaults to None.
+        """
+        self.enabled = enabled
+        self.ttl_seconds = ttl_seconds
+        self._offers: Dict[str, Tuple[str, Optional[str]]] = {}
+        self._verified_at: Dict[str, float] = {}
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def fingerprint(value) -> Optional[str]:
+        """
+        Build a fingerprint of a JSON serializable value, without keeping the value itself (e.g. credentials).
+
+        Returns:
+            Optional[str]: The fingerprint, or None when there is no value.
+        """
+        if value is None:
+            return None
+        return blake2b_128bit(json.dumps(value, sort_keys=True, default=str))
+
+    def is_known(self, offer_type: str, offer_id: str, fingerprint: Optional[str] = None) -> bool:
+        """
+        Check if an offer component is known to exist in the EDC with the given fingerprint.
+        """
+        if not self.enabled:
+            return False
+        with self._lock:
+            if self._is_expired(offer_id):
+                self._offers.pop(offer_id, None)
+                self._verified_at.pop(offer_id, None)
+            known = self._offers.get(offer_id) == (offer_type, fingerprint)
+            if known:
+                self.hits += 1
+            else:
+                self.misses += 1
+            return known
+
+    def add(self, offer_type: str, offer_id: str, fingerprint: Optional[str] = None) -> None:
+        """
+        Mark an offer component as existing in the EDC.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._offers[offer_id] = (offer_type, fingerprint)
+            self._verified_at[offer_id] = time.monotonic()
+
+    def _is_expired(self, offer_id: str) -> bool:
+        """Check if a component was verified longer than the TTL ago (the lock must be held)."""
+        if not self.ttl_seconds or offer_id not in self._verified_at:
+            return False
+        return time.monotonic() - self._verified_at[offer_id] > self.ttl_seconds
+
+    def invalidate(self, *offer_ids: str) -> None:
+        """
+        Forget the given offer components, e.g. after the EDC answered that they do not exist.
+        """
+        with self._lock:
+            for offer_id in offer_ids:
+                self._verified_at.pop(offer_id, None)
+                if self._offers.pop(offer_id, None) is not None:
+                    logger.info(f"[KnownOfferCache] Invalidated known offer component {offer_id}.")
+
+    def invalidate_asset(self, asset_id: str) -> None:
+        """
+        Forget an asset and the contract definitions offering it (added with the asset fingerprint).
+        """
+        asset_fingerprint = self.fingerprint(asset_id)
+        with self._lock:
+            contract_ids = [
+                offer_id for offer_id, (offer_type, fingerprint) in self._offers.items()
+                if offer_type == self.CONTRACT and fingerprint == asset_fingerprint
+            ]
+        self.invalidate(asset_id, *contract_ids)
+
+    def clear(self) -> None:
+        """
+        Forget all the offer components.
+        """
+        with self._lock:
+            self._offers.clear()
+            self._verified_at.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get the size and hit statistics of the cache.
+        """
+        with self._lock:
+            return {
+                "size": len(self._offers),
+                "hits": self.hits,
+                "misses": self.misses
+            }
+
+
+class KnownOfferPostgresCache(KnownOfferCache):
+    """
+    Known offer cache persisted in a Postgres table, so that the components verified by the asset
+    synchronization job or by another replica are also known by this process.
+
+    Memory misses (including expired entries) are looked up in the table, the writes go directly
+    to the table. With a TTL, a reset or invalidation done by another process reaches this one
+    once its memory entries expire.
+    """
+
+    def __init__(self, engine: E, table_name: str = "known_offers", ttl_seconds: Optional[float] = None):
+        """
+        Args:
+            engine (E): SQLAlchemy engine of the database.
+            table_name (str, optional): Name of the table storing the known offer components. Defaults to "known_offers".
+            ttl_seconds (Optional[float], optional): Seconds a component stays known in memory before it is looked up in the table again. Defaults to None.
+        """
+        super().__init__(ttl_seconds=ttl_seconds)
+        self.engine = engine
+        self.table_name = table_name
+
+        class DynamicKnownOffers(KnownOffers, table=True):
+            __tablename__ = table_name
+            __table_args__ = {"extend_existing": True}
+
+        self.KnownOffersModel = DynamicKnownOffers
+        DynamicKnownOffers.metadata.create_all(engine, tables=[DynamicKnownOffers.__table__])
+        self._load_from_db()
+
+    def _load_from_db(self) -> None:
+        """
+        Load all the known offer components from the DB into memory.
+        """
+        try:
+            with Session(self.engine) as session:
+                rows = session.exec(select(self.KnownOffersModel)).all()
+            now = time.monotonic()
+            with self._lock:
+                self._offers = {row.offer_id: (row.offer_type, row.fingerprint) for row in rows}
+                self._verified_at = {row.offer_id: now for row in rows}
+            logger.info(f"[KnownOfferCache] Loaded {len(rows)} known offer components from the database.")
+        except SQLAlchemyError as e:
+            logger.error(f"[KnownOfferCache] Error loading known offer components from the database: {e}")
+
+    def is_known(self, offer_type: str, offer_id: str, fingerprint: Optional[str] = None) -> bool:
+        if super().is_known(offer_type, offer_id, fingerprint):
+            return True
+
+        # It may have been verified by the asset synchronization job or by another replica
+        try:
+            with Session(self.engine) as session:
+                row = session.get(self.KnownOffersModel, offer_id)
+        except SQLAlchemyError as e:
+            logger.error(f"[KnownOfferCache] Error looking up known offer component {offer_id}: {e}")
+            return False
+
+        if row is None or (row.offer_type, row.fingerprint) != (offer_type, fingerprint):
+            return False
+        super().add(offer_type, offer_id, fingerprint)
+        return True
+
+    def add(self, offer_type: str, offer_id: str, fingerprint: Optional[str] = None) -> None:
+        super().add(offer_type, offer_id, fingerprint)
+        try:
+            with Session(self.engine) as session:
+                dialect_insert = sqlite.insert if session.get_bind().dialect.name == "sqlite" else postgresql.insert
+                statement = dialect_insert(self.KnownOffersModel.__table__).values(
+                    offer_id=offer_id,
+                    offer_type=offer_type,
+                    fingerprint=fingerprint,
+                    verified_at=datetime.now()
+                )
+                session.exec(statement.on_conflict_do_update(
+                    index_elements=["offer_id"],
+                    set_={
+                        "offer_type": statement.excluded.offer_type,
+                        "fingerprint": statement.excluded.fingerprint,
+                        "verified_at": statement.excluded.verified_at
+                    }
+                ))
+                session.commit()
+        except SQLAlchemyError as e:
+            logger.error(f"[KnownOfferCache] Error saving known offer component {offer_id}: {e}")
+
+    def invalidate(self, *offer_ids: str) -> None:
+        super().invalidate(*offer_ids)
+        if not offer_ids:
+            return
+        try:
+            with Session(self.engine) as session:
+                session.exec(delete(self.KnownOffersModel).where(self.KnownOffersModel.offer_id.in_(offer_ids)))
+                session.commit()
+        except SQLAlchemyError as e:
+            logger.error(f"[KnownOfferCache] Error invalidating known offer components {offer_ids}: {e}")
+
+    def invalidate_asset(self, asset_id: str) -> None:
+        super().invalidate_asset(asset_id)
+        try:
+            with Session(self.engine) as session:
+                session.exec(delete(self.KnownOffersModel).where(
+                    self.KnownOffersModel.offer_type == self.CONTRACT,
+                    self.KnownOffersModel.fingerprint == self.fingerprint(asset_id)
+                ))
+                session.commit()
+        except SQLAlchemyError as e:
+            logger.error(f"[KnownOfferCache] Error invalidating the contracts of asset {asset_id}: {e}")
+
+    def clear(self) -> None:
+        super().clear()
+        try:
+            with Session(self.engine) as session:
+                session.exec(delete(self.KnownOffersModel))
+                session.commit()
+        except SQLAlchemyError as e:
+            logger.error(f"[KnownOfferCache] Error clearing known offer components: {e}")
@@ -22,8 +22,11 @@
 #################################################################################
 
 import os
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, Optional
 from uuid import UUID
 from hashlib import sha256
 from enum import Enum
@@ -31,6 +34,7 @@ from enum import Enum
 from managers.config.config_manager import ConfigManager
 from managers.config.log_manager import LoggingManager
 from tools.exceptions import InvalidError, NotFoundError
+from utils.metrics_utils import SUBMODEL_SERVICE, timed_stage
 
 from tractusx_sdk.industry.adapters import SubmodelAdapter
 from tractusx_sdk.industry.adapters.submodel_adapter_factory import SubmodelAdapterFactory
@@ -45,17 +49,33 @@ class OperationType(Enum):
     DELETE = "delete"
 
 class SubmodelServiceManager:
-    """Manager for handling submodel service."""
+    """Manager for handling submodel service.
+
+    Instances are meant to be shared: use ``get_instance()`` to obtain the manager of a
+    given enablement service stack, so that all aspects stored in the same backend reuse
+    one adapter (and, in HTTP mode, one keep-alive connection pool).
+    """
     adapter: SubmodelAdapter
     adapter_mode: str
     logger = LoggingManager.get_logger(__name__)
 
-    def __init__(self):
+    ## Process-wide registry of managers, keyed by their submodel service settings
+    _instances: Dict[str, "SubmodelServiceManager"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, connection_settings: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the submodel service manager.
+
+        Args:
+            connection_settings: Connection settings of the enablement service stack. The optional
+                ``submodel_service`` entry overrides the ``provider.submodel_dispatcher`` configuration
+                (e.g. ``mode``, ``path`` or ``http``) for this stack.
+        """
+        self.settings = self._resolve_settings(connection_settings)
+
         # Get adapter mode from configuration (default: filesystem)
-        self.adapter_mode = ConfigManager.get_config(
-            "provider.submodel_dispatcher.mode",
-            default="filesystem"
-        )
+        self.adapter_mode = self._get_setting("mode", default="filesystem")
         
         if not isinstance(self.adapter_mode, str):
             raise ValueError(
@@ -79,12 +99,103 @@ class SubmodelServiceManager:
         else:
             raise ValueError(f"Unsupported adapter mode: {self.adapter_mode}")
         
+        # Threads of the bulk reads, started on first use
+        self.max_read_workers = max(1, int(self._get_setting("max_read_workers", default=10)))
+        self._read_executor: Optional[ThreadPoolExecutor] = None
+        self._read_executor_lock = threading.Lock()
+
         self.logger.info(f"SubmodelServiceManager initialized with mode: {self.adapter_mode}")
+
+    @classmethod
+    def get_instance(cls, connection_settings: Optional[Dict[str, Any]] = None) -> "SubmodelServiceManager":
+        """
+        Get the shared manager for the given enablement service stack connection settings.
+
+        Stacks without submodel service overrides share the default manager built from the
+        configuration. The manager is created on first use and reused afterwards.
+
+        Args:
+            connection_settings: Connection settings of the enablement service stack.
+
+        Returns:
+            SubmodelServiceManager: The shared manager for these settings.
+        """
+        key = cls._registry_key(connection_settings)
+        with cls._instances_lock:
+            instance = cls._instances.get(key)
+            if instance is None:
+                instance = cls(connection_settings)
+                cls._instances[key] = instance
+            return instance
+
+    @classmethod
+    def shutdown_instances(cls) -> None:
+        """
+        Close all shared managers and clear the registry.
+        """
+        with cls._instances_lock:
+            instances = list(cls._instances.values())
+            cls._instances.clear()
+        for instance in instances:
+            instance.close()
+
+    def close(self) -> None:
+        """
+        Release the resources held by the adapter (e.g. the HTTP connection pool).
+        """
+        with self._read_executor_lock:
+            executor, self._read_executor = self._read_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+        close = getattr(self.adapter, "close", None)
+        if callable(close):
+            close()
+
+    @staticmethod
+    def _get_overrides(connection_settings: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Get the submodel service overrides from the stack connection settings."""
+        if not isinstance(connection_settings, dict):
+            return {}
+        overrides = connection_settings.get("submodel_service")
+        return overrides if isinstance(overrides, dict) else {}
+
+    @classmethod
+    def _registry_key(cls, connection_settings: Optional[Dict[str, Any]]) -> str:
+        """Build a stable registry key from the submodel service overrides."""
+        return json.dumps(cls._get_overrides(connection_settings), sort_keys=True, default=str)
+
+    @classmethod
+    def _resolve_settings(cls, connection_settings: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Merge the stack overrides on top of the ``provider.submodel_dispatcher`` configuration."""
+        configured = ConfigManager.get_config("provider.submodel_dispatcher", default={})
+        if not isinstance(configured, dict):
+            configured = {}
+        return cls._merge_settings(configured, cls._get_overrides(connection_settings))
+
+    @classmethod
+    def _merge_settings(cls, base: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
+        """Recursively merge two settings dictionaries, values of ``overrides`` taking precedence."""
+        merged = dict(base)
+        for key, value in overrides.items():
+            if isinstance(value, dict) and isinstance(merged.get(key), dict):
+                merged[key] = cls._merge_settings(merged[key], value)
+            else:
+                merged[key] = value
+        return merged
+
+    def _get_setting(self, key: str, default: Any = None) -> Any:
+        """Get a (dot-notation) key from the resolved submodel service settings."""
+        value = self.settings
+        for k in key.split("."):
+            if not isinstance(value, dict) or k not in value:
+                return default
+            value = value[k]
+        return value
     
     def _initialize_filesystem_adapter(self) -> FileSystemAdapter:
         """Initialize filesystem adapter for local storage."""
-        submodel_service_path = ConfigManager.get_config(
-            "provider.submodel_dispatcher.path",
+        submodel_service_path = self._get_setting(
+            "path",
             default="/industry-core-hub/data/submodels"
         )
         
@@ -127,7 +238,7 @@ class SubmodelServiceManager:
     
     def _initialize_http_adapter(self) -> HttpSubmodelAdapter:
         """Initialize HTTP adapter for external submodel service."""
-        http_config = ConfigManager.get_config("provider.submodel_dispatcher.http", default={})
+        http_config = self._get_setting("http", default={})
         
         if not isinstance(http_config, dict):
             raise ValueError(
@@ -146,6 +257,7 @@ class SubmodelServiceManager:
         api_path = http_config.get("api_path", "")
         timeout = http_config.get("timeout", 30)
         verify_ssl = http_config.get("verify_ssl", True)
+        pool_config = http_config.get("pool", {}) or {}
         
         # Extract authentication configuration
         auth_config = http_config.get("auth", {})
@@ -197,7 +309,10 @@ class SubmodelServiceManager:
             auth_token=auth_token if auth_enabled else None,
             auth_key_name=auth_key_name,
             timeout=timeout,
-            verify_ssl=verify_ssl
+            verify_ssl=verify_ssl,
+            max_connections=pool_config.get("max_connections", 20),
+            max_keepalive_connections=pool_config.get("max_keepalive_connections", 10),
+            keepalive_expiry=pool_config.get("keepalive_expiry", 30)
         )
 
     def _validate_uuid(self, value: Any) -> UUID:
@@ -304,6 +419,7 @@ class SubmodelServiceManager:
             self.logger.info("Submodel deleted successfully.")
             return None
 
+    @timed_stage(SUBMODEL_SERVICE, "write")
     def upload_twin_aspect_document(
         self,
         submodel_id: UUID,
@@ -318,6 +434,7 @@ class SubmodelServiceManager:
             payload
         )
 
+    @timed_stage(SUBMODEL_SERVICE, "read")
     def get_twin_aspect_document(
         self,
         submodel_id: UUID,
@@ -330,6 +447,49 @@ class SubmodelServiceManager:
             semantic_id
         )
 
+    def _get_read_executor(self) -> ThreadPoolExecutor:
+        """Get the executor of the bulk reads, creating it on first use."""
+        with self._read_executor_lock:
+            if self._read_executor is None:
+                self._read_executor = ThreadPoolExecutor(
+                    max_workers=self.max_read_workers,
+                    thread_name_prefix="ichub-submodel-read"
+                )
+            return self._read_executor
+
+    def _get_or_none(self, submodel_id: UUID, semantic_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            return self.get_twin_aspect_document(submodel_id, semantic_id)
+        except NotFoundError:
+            self.logger.warning(f"Submodel with id=[{submodel_id}] not found, semanticId=[{semantic_id}]")
+            return None
+
+    @timed_stage(SUBMODEL_SERVICE, "read_many")
+    def get_twin_aspect_documents(
+        self,
+        submodel_ids: Iterable[UUID],
+        semantic_id: str
+    ) -> Dict[UUID, Optional[Dict[str, Any]]]:
+        """Get many submodels of the same semantic ID from the service.
+
+        The submodels are read concurrently (``max_read_workers``), so the
+        time of a page does not grow with the number of submodels on it.
+
+        Args:
+            submodel_ids: UUIDs of the submodels.
+            semantic_id: Semantic ID of the submodels.
+
+        Returns:
+            The submodels by UUID, None for the submodels that were not found.
+        """
+        ids = list(dict.fromkeys(self._validate_uuid(submodel_id) for submodel_id in submodel_ids))
+        if len(ids) <= 1:
+            return {submodel_id: self._get_or_none(submodel_id, semantic_id) for submodel_id in ids}
+
+        documents = self._get_read_executor().map(lambda submodel_id: self._get_or_none(submodel_id, semantic_id), ids)
+        return dict(zip(ids, documents))
+
+    @timed_stage(SUBMODEL_SERVICE, "delete")
     def delete_twin_aspect_document(
         self,
         submodel_id: UUID,
@@ -25,6 +25,7 @@
 
 from sqlmodel import Session
 from database import engine
+from utils.metrics_utils import DB, track_stage
 
 class RepositoryManager:
     """Repository manager for managing repositories and handling the session."""
@@ -41,9 +42,11 @@ class RepositoryManager:
         self._twin_repository = None
         self._twin_aspect_repository = None
         self._twin_aspect_registration_repository = None
+        self._twin_aspect_registration_job_repository = None
         self._twin_exchange_repository = None
         self._twin_registration_repository = None
         self._notification_repository = None
+        self._notification_outbox_repository = None
         self._ccm_repository = None
         self._ccm_site_repository = None
         self._certificate_share_repository = None
@@ -52,21 +55,30 @@ class RepositoryManager:
         self._ccm_inbound_request_repository = None
         self._pcf_repository = None
         self._pcf_relationship_repository = None
+        self._transaction_stage = None
 
     # Context Manager Methods
     def __enter__(self):
         """Enter the context, ensuring the session is active."""
+        self._transaction_stage = track_stage(DB, "transaction")
+        self._transaction_stage.__enter__()
         if not self._session.is_active:
             self._session.begin()
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
         """Exit the context, committing or rolling back the session."""
-        if exc_type is None:
-            self._session.commit()
-        else:
-            self._session.rollback()
-        self._session.close()
+        try:
+            if exc_type is None:
+                with track_stage(DB, "commit"):
+                    self._session.commit()
+            else:
+                self._session.rollback()
+            self._session.close()
+        finally:
+            stage, self._transaction_stage = self._transaction_stage, None
+            if stage is not None:
+                stage.__exit__(exc_type, exc_value, traceback)
 
     # Manual Session Control
     def flush(self):
@@ -175,6 +187,14 @@ class RepositoryManager:
             self._twin_aspect_registration_repository = TwinAspectRegistrationRepository(self._session)
         return self._twin_aspect_registration_repository
 
+    @property
+    def twin_aspect_registration_job_repository(self):
+        """Lazy initialization of the twin aspect registration job repository."""
+        if self._twin_aspect_registration_job_repository is None:
+            from managers.metadata_database.repositories import TwinAspectRegistrationJobRepository
+            self._twin_aspect_registration_job_repository = TwinAspectRegistrationJobRepository(self._session)
+        return self._twin_aspect_registration_job_repository
+
     @property
     def twin_exchange_repository(self):
         """Lazy initialization of the twin exchange repository."""
@@ -199,6 +219,14 @@ class RepositoryManager:
             self._notification_repository = NotificationRepository(self._session)
         return self._notification_repository
 
+    @property
+    def notification_outbox_repository(self):
+        """Lazy initialization of the notification outbox repository."""
+        if self._notification_outbox_repository is None:
+            from managers.metadata_database.repositories import NotificationOutboxRepository
+            self._notification_outbox_repository = NotificationOutboxRepository(self._session)
+        return self._notification_outbox_repository
+
     @property
     def ccm_repository(self):
         """Lazy initialization of the CCM (Company Certificate Management) repository."""
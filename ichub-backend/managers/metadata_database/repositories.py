@@ -23,13 +23,13 @@
 # SPDX-License-Identifier: Apache-2.0
 #################################################################################
 
-from sqlalchemy import case, and_, or_, func, update, literal
+from sqlalchemy import case, and_, or_, func, update, literal, tuple_
 from sqlmodel import SQLModel, Session, select, desc
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, selectinload, undefer
 from sqlalchemy.orm.attributes import flag_modified
-from typing import TypeVar, Type, List, Optional, Generic
+from typing import TypeVar, Type, List, Optional, Generic, Iterator, Dict, Tuple
 from uuid import UUID, uuid4
-from datetime import date, datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 
 from models.metadata_database.provider.models import (
     BusinessPartner,
@@ -38,6 +38,8 @@ from models.metadata_database.provider.models import (
     Twin,
     TwinAspect,
     TwinAspectRegistration,
+    TwinAspectRegistrationJob,
+    TwinAspectRegistrationJobStatus,
     TwinExchange,
     TwinRegistration,
     CatalogPart,
@@ -48,6 +50,8 @@ from models.metadata_database.provider.models import (
 from models.metadata_database.notification.models import (
     NotificationEntity,
     NotificationDirection,
+    NotificationOutboxEntry,
+    NotificationOutboxStatus,
     NotificationStatus
 )
 from models.metadata_database.pcf.models import (
@@ -55,7 +59,9 @@ from models.metadata_database.pcf.models import (
     PcfExchangeDirection,
     PcfExchangeStatus,
     PcfExchangeType,
-    PcfRelationshipEntity
+    PcfPartEdgeEntity,
+    PcfRelationshipEntity,
+    PcfRollupEntity
 )
 from models.metadata_database.addons.ccm_kit.v1.models import (
     Ccm,
@@ -71,6 +77,7 @@ from models.metadata_database.addons.ccm_kit.v1.models import (
     TrustLevel,
 )
 from tractusx_sdk.industry.models.notifications import Notification
+from tools.datetime_tools import utc_now_naive
 
 ModelType = TypeVar("ModelType", bound=SQLModel)
 
@@ -168,14 +175,48 @@ class CatalogPartRepository(BaseRepository[CatalogPart]):
             CatalogPart.manufacturer_part_id == manufacturer_part_id)
         return self._session.scalars(stmt).first()
 
-    def find_by_manufacturer_id_manufacturer_part_id(self, manufacturer_id: Optional[str], manufacturer_part_id: Optional[str], join_partner_catalog_parts : bool = False) -> List[tuple[CatalogPart, int]]:
+    def find_by_manufacturer_id_manufacturer_part_id(self, manufacturer_id: Optional[str], manufacturer_part_id: Optional[str], join_partner_catalog_parts : bool = False, after_id: Optional[int] = None, limit: Optional[int] = None) -> List[tuple[CatalogPart, int]]:
         """
         Find catalog parts by manufacturer ID and manufacturer part ID.
         If manufacturer ID is not provided, all catalog parts are returned.
         If manufacturer part ID is not provided, all catalog parts with the given manufacturer ID are returned.
         
         The result is a list of tuples, where each tuple contains the CatalogPart object and its status.
+        The rows are ordered by the catalog part ID, so a page can be continued with the ID of its last
+        catalog part as after_id (keyset pagination).
         """
+        stmt = self._find_with_status_stmt(manufacturer_id, manufacturer_part_id, join_partner_catalog_parts, after_id)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        return self._session.exec(stmt).all()
+
+    def iter_by_manufacturer_id_manufacturer_part_id(self, manufacturer_id: Optional[str] = None, manufacturer_part_id: Optional[str] = None, join_partner_catalog_parts : bool = False, yield_per: int = 500) -> Iterator[tuple[CatalogPart, int]]:
+        """
+        Iterate over the same rows as find_by_manufacturer_id_manufacturer_part_id, fetching them in batches
+        of yield_per rows from a server-side cursor instead of loading the whole result at once.
+        """
+        stmt = self._find_with_status_stmt(manufacturer_id, manufacturer_part_id, join_partner_catalog_parts)
+        yield from self._session.exec(stmt.execution_options(yield_per=yield_per))
+
+    def find_by_manufacturer_keys(self, keys: List[tuple[str, str]]) -> List[CatalogPart]:
+        """
+        Find the catalog parts for a set of (manufacturer ID, manufacturer part ID) keys with a single query.
+        The legal entity, the twin and the partner catalog parts (with their business partners) are loaded eagerly.
+        """
+        if not keys:
+            return []
+
+        stmt = select(CatalogPart).join(
+            LegalEntity, LegalEntity.id == CatalogPart.legal_entity_id).where(
+            tuple_(LegalEntity.bpnl, CatalogPart.manufacturer_part_id).in_(keys)).options(
+            selectinload(CatalogPart.legal_entity),
+            selectinload(CatalogPart.twin),
+            selectinload(CatalogPart.partner_catalog_parts).selectinload(PartnerCatalogPart.business_partner))
+        return self._session.scalars(stmt).all()
+
+    def _find_with_status_stmt(self, manufacturer_id: Optional[str], manufacturer_part_id: Optional[str], join_partner_catalog_parts: bool, after_id: Optional[int] = None):
+        """Build the query for catalog parts with their status, ordered by the catalog part ID."""
 
         # Case to determine the status of the catalog part
         status_expr = case(
@@ -205,7 +246,10 @@ class CatalogPartRepository(BaseRepository[CatalogPart]):
             subquery = select(PartnerCatalogPart).join(BusinessPartner, BusinessPartner.id == PartnerCatalogPart.business_partner_id).where(PartnerCatalogPart.catalog_part_id == CatalogPart.id).subquery()
             stmt = stmt.join(subquery, subquery.c.catalog_part_id == CatalogPart.id, isouter=True)
 
-        return self._session.exec(stmt).all()
+        if after_id is not None:
+            stmt = stmt.where(CatalogPart.id > after_id)
+
+        return stmt.order_by(CatalogPart.id)
 
 class DataExchangeAgreementRepository(BaseRepository[DataExchangeAgreement]):
     def get_by_business_partner_id(self, business_partner_id: int) -> List[DataExchangeAgreement]:
@@ -356,17 +400,69 @@ class SerializedPartRepository(BaseRepository[SerializedPart]):
 
         return self._session.scalars(stmt).all()
 
+    def find_by_keys(self, keys: List[tuple[str, str, str]]) -> List[SerializedPart]:
+        """
+        Find the serialized parts for a set of (manufacturer ID, manufacturer part ID, part instance ID) keys with a single query.
+        The twin, the partner catalog part and its catalog part (with legal entity) and business partner are loaded eagerly.
+        """
+        if not keys:
+            return []
+
+        stmt = select(SerializedPart).join(
+            PartnerCatalogPart, PartnerCatalogPart.id == SerializedPart.partner_catalog_part_id).join(
+            CatalogPart, CatalogPart.id == PartnerCatalogPart.catalog_part_id).join(
+            LegalEntity, LegalEntity.id == CatalogPart.legal_entity_id).where(
+            tuple_(LegalEntity.bpnl, CatalogPart.manufacturer_part_id, SerializedPart.part_instance_id).in_(keys)).options(
+            selectinload(SerializedPart.twin),
+            selectinload(SerializedPart.partner_catalog_part).selectinload(PartnerCatalogPart.business_partner),
+            selectinload(SerializedPart.partner_catalog_part).selectinload(PartnerCatalogPart.catalog_part).selectinload(CatalogPart.legal_entity))
+        return self._session.scalars(stmt).all()
+
     def find_with_status(self,
         manufacturer_id: Optional[str] = None,
         manufacturer_part_id: Optional[str] = None,
         business_partner_number: Optional[str] = None,
         customer_part_id: Optional[str] = None,
         part_instance_id: Optional[str] = None,
-        van: Optional[str] = None) -> List[tuple[SerializedPart, int]]:
+        van: Optional[str] = None,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None) -> List[tuple[SerializedPart, int]]:
         """
         Find serialized parts with status information.
         The result is a list of tuples, where each tuple contains the SerializedPart object and its status.
+        The rows are ordered by the serialized part ID, so a page can be continued with the ID of its last
+        serialized part as after_id (keyset pagination).
         """
+        stmt = self._find_with_status_stmt(manufacturer_id, manufacturer_part_id, business_partner_number, customer_part_id, part_instance_id, van, after_id)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        return self._session.exec(stmt).all()
+
+    def iter_with_status(self,
+        manufacturer_id: Optional[str] = None,
+        manufacturer_part_id: Optional[str] = None,
+        business_partner_number: Optional[str] = None,
+        customer_part_id: Optional[str] = None,
+        part_instance_id: Optional[str] = None,
+        van: Optional[str] = None,
+        yield_per: int = 500) -> Iterator[tuple[SerializedPart, int]]:
+        """
+        Iterate over the same rows as find_with_status, fetching them in batches of yield_per rows
+        from a server-side cursor instead of loading the whole result at once.
+        """
+        stmt = self._find_with_status_stmt(manufacturer_id, manufacturer_part_id, business_partner_number, customer_part_id, part_instance_id, van)
+        yield from self._session.exec(stmt.execution_options(yield_per=yield_per))
+
+    def _find_with_status_stmt(self,
+        manufacturer_id: Optional[str],
+        manufacturer_part_id: Optional[str],
+        business_partner_number: Optional[str],
+        customer_part_id: Optional[str],
+        part_instance_id: Optional[str],
+        van: Optional[str],
+        after_id: Optional[int] = None):
+        """Build the query for serialized parts with their status, ordered by the serialized part ID."""
         
         # Case to determine the status of the serialized part
         status_expr = case(
@@ -409,7 +505,10 @@ class SerializedPartRepository(BaseRepository[SerializedPart]):
         if customer_part_id:
             stmt = stmt.where(PartnerCatalogPart.customer_part_id == customer_part_id)
 
-        return self._session.exec(stmt).all()
+        if after_id is not None:
+            stmt = stmt.where(SerializedPart.id > after_id)
+
+        return stmt.order_by(SerializedPart.id)
 
     def create_new(self, partner_catalog_part_id: int, part_instance_id: str, van: Optional[str]) -> SerializedPart:
         """Create a new SerializedPart instance."""
@@ -644,6 +743,104 @@ class TwinAspectRegistrationRepository(BaseRepository[TwinAspectRegistration]):
         self.create(twin_aspect_registration)
         return twin_aspect_registration
 
+class TwinAspectRegistrationJobRepository(BaseRepository[TwinAspectRegistrationJob]):
+    def create_new(self, twin_aspect_id: int, enablement_service_stack_id: int, payload: Optional[dict] = None) -> TwinAspectRegistrationJob:
+        """Create a new queued TwinAspectRegistrationJob instance."""
+        job = TwinAspectRegistrationJob(
+            twin_aspect_id=twin_aspect_id,
+            enablement_service_stack_id=enablement_service_stack_id,
+            payload=payload
+        )
+        self.create(job)
+        return job
+
+    def find_by_job_id(self, job_id: UUID) -> Optional[TwinAspectRegistrationJob]:
+        stmt = select(TwinAspectRegistrationJob).where(
+            TwinAspectRegistrationJob.job_id == job_id).options(
+            selectinload(TwinAspectRegistrationJob.twin_aspect).selectinload(TwinAspect.twin))
+        return self._session.scalars(stmt).first()
+
+    def find_queued_by_twin_aspect_id_enablement_service_stack_id(self, twin_aspect_id: int, enablement_service_stack_id: int) -> Optional[TwinAspectRegistrationJob]:
+        """Retrieve a job for the twin aspect and enablement service stack that was not picked up by a worker yet."""
+        stmt = select(TwinAspectRegistrationJob).where(
+            TwinAspectRegistrationJob.twin_aspect_id == twin_aspect_id).where(
+            TwinAspectRegistrationJob.enablement_service_stack_id == enablement_service_stack_id).where(
+            TwinAspectRegistrationJob.status == TwinAspectRegistrationJobStatus.QUEUED.value).with_for_update(skip_locked=True)
+        return self._session.scalars(stmt).first()
+
+    def claim_next(self, worker_id: str, limit: int = 1, lease_seconds: float = 300) -> List[TwinAspectRegistrationJob]:
+        """
+        Claim up to limit jobs that are due, or whose worker lease expired, for the given worker.
+
+        The rows are selected with FOR UPDATE SKIP LOCKED, so concurrent workers (threads, processes or replicas)
+        never claim the same job. The claim is only visible to the other workers once the caller commits.
+        """
+        now = utc_now_naive()
+        stmt = select(TwinAspectRegistrationJob).where(
+            or_(
+                and_(
+                    TwinAspectRegistrationJob.status == TwinAspectRegistrationJobStatus.QUEUED.value,
+                    TwinAspectRegistrationJob.next_attempt_date <= now),
+                and_(
+                    TwinAspectRegistrationJob.status == TwinAspectRegistrationJobStatus.RUNNING.value,
+                    TwinAspectRegistrationJob.locked_until < now))).order_by(
+            TwinAspectRegistrationJob.id).limit(limit).with_for_update(skip_locked=True)
+
+        jobs = self._session.scalars(stmt).all()
+        for job in jobs:
+            job.status = TwinAspectRegistrationJobStatus.RUNNING.value
+            job.locked_by = worker_id
+            job.locked_until = now + timedelta(seconds=lease_seconds)
+            job.attempts += 1
+            job.modified_date = now
+        return jobs
+
+    def renew_leases(self, ids: List[int], worker_id: str, lease_seconds: float = 300) -> List[int]:
+        """
+        Extend the lease of the running jobs still held by the given worker.
+
+        Returns:
+            List[int]: The IDs whose lease was extended; the others were taken over by another worker.
+        """
+        if not ids:
+            return []
+
+        now = utc_now_naive()
+        stmt = update(TwinAspectRegistrationJob).where(
+            TwinAspectRegistrationJob.id.in_(ids),
+            TwinAspectRegistrationJob.locked_by == worker_id,
+            TwinAspectRegistrationJob.status == TwinAspectRegistrationJobStatus.RUNNING.value).values(
+            locked_until=now + timedelta(seconds=lease_seconds),
+            modified_date=now).returning(TwinAspectRegistrationJob.id).execution_options(synchronize_session=False)
+        return list(self._session.scalars(stmt).all())
+
+    def release(self, id: int, worker_id: str, status: str, last_error: Optional[str] = None,
+                next_attempt_date: Optional[datetime] = None, clear_payload: bool = False) -> bool:
+        """
+        Set the outcome of a job and release its lease, only if the given worker still holds it.
+
+        Returns:
+            bool: False if the job was taken over by another worker, whose outcome is then kept.
+        """
+        now = utc_now_naive()
+        values = {
+            "status": status,
+            "locked_by": None,
+            "locked_until": None,
+            "last_error": last_error,
+            "modified_date": now
+        }
+        if next_attempt_date is not None:
+            values["next_attempt_date"] = next_attempt_date
+        if clear_payload:
+            values["payload"] = None
+
+        stmt = update(TwinAspectRegistrationJob).where(
+            TwinAspectRegistrationJob.id == id,
+            TwinAspectRegistrationJob.locked_by == worker_id).values(
+            **values).execution_options(synchronize_session=False)
+        return self._session.execute(stmt).rowcount > 0
+
 class TwinExchangeRepository(BaseRepository[TwinExchange]):
     def get_by_twin_id_data_exchange_agreement_id(self, twin_id: int, data_exchange_agreement_id: int) -> Optional[Twin]:
         stmt = select(TwinExchange).where(
@@ -689,6 +886,35 @@ class TwinRegistrationRepository(BaseRepository[TwinRegistration]):
         self.create(twin_registration)
         return twin_registration
 
+    def create_new_for_twin(self, twin: Twin, enablement_service_stack_id: int, dtr_registered: bool = False) -> TwinRegistration:
+        """Create a new TwinRegistration for a twin that may not have been flushed yet (and therefore has no ID)."""
+        twin_registration = TwinRegistration(
+            twin=twin,
+            enablement_service_stack_id=enablement_service_stack_id,
+            dtr_registered=dtr_registered
+        )
+        self.create(twin_registration)
+        return twin_registration
+
+    def find_by_twin_ids(self, twin_ids: List[int]) -> List[TwinRegistration]:
+        """Find the twin registrations of all enablement service stacks for a set of twins with a single query."""
+        if not twin_ids:
+            return []
+
+        stmt = select(TwinRegistration).where(
+            TwinRegistration.twin_id.in_(twin_ids))  # type: ignore
+        return self._session.scalars(stmt).all()
+
+    def set_dtr_registered(self, keys: List[tuple[int, int]], dtr_registered: bool = True) -> None:
+        """Set the dtr_registered flag for a set of (twin ID, enablement service stack ID) keys with a single UPDATE."""
+        if not keys:
+            return
+
+        stmt = update(TwinRegistration).where(
+            tuple_(TwinRegistration.twin_id, TwinRegistration.enablement_service_stack_id).in_(keys)).values(
+            dtr_registered=dtr_registered).execution_options(synchronize_session=False)
+        self._session.execute(stmt)
+
 class NotificationRepository(BaseRepository[NotificationEntity]):
     """
     Repository for managing Industry Core Notifications.
@@ -734,6 +960,14 @@ class NotificationRepository(BaseRepository[NotificationEntity]):
         )
         return self._session.scalars(stmt).first()
 
+    def find_by_message_ids(self, message_ids: List[UUID]) -> List[NotificationEntity]:
+        """Find the notifications with the given messageIds."""
+        if not message_ids:
+            return []
+
+        stmt = select(NotificationEntity).where(NotificationEntity.message_id.in_(message_ids))
+        return list(self._session.scalars(stmt).all())
+
     def find_by_bpn(
         self, 
         bpn: str, 
@@ -783,6 +1017,16 @@ class NotificationRepository(BaseRepository[NotificationEntity]):
         self._session.add(db_obj)
         return db_obj
 
+    def update_status_by_message_ids(self, message_ids: List[UUID], new_status: NotificationStatus) -> None:
+        """Update the lifecycle status of several notifications with one statement."""
+        if not message_ids:
+            return
+
+        stmt = update(NotificationEntity).where(
+            NotificationEntity.message_id.in_(message_ids)).values(
+            status=new_status).execution_options(synchronize_session=False)
+        self._session.execute(stmt)
+
     def delete_by_message_id(self, message_id: UUID) -> bool:
         """Delete a notification by its messageId. Returns True if deleted, False if not found."""
         db_obj = self.find_by_message_id(message_id)
@@ -792,6 +1036,128 @@ class NotificationRepository(BaseRepository[NotificationEntity]):
         self.delete_obj(db_obj)
         return True
     
+class NotificationOutboxRepository(BaseRepository[NotificationOutboxEntry]):
+    """
+    Repository for the outgoing notifications waiting to be sent (see NotificationOutboxDispatcher).
+    """
+
+    def create_new(
+        self,
+        message_id: UUID,
+        receiver_bpn: str,
+        provider_dsp_url: Optional[str] = None,
+        endpoint_path: Optional[str] = None,
+        policies: Optional[List[dict]] = None,
+        dct_type: Optional[str] = None
+    ) -> NotificationOutboxEntry:
+        """Create a new queued NotificationOutboxEntry instance."""
+        entry = NotificationOutboxEntry(
+            message_id=message_id,
+            receiver_bpn=receiver_bpn,
+            provider_dsp_url=provider_dsp_url,
+            endpoint_path=endpoint_path,
+            policies=policies,
+            dct_type=dct_type
+        )
+        self.create(entry)
+        return entry
+
+    def find_by_message_id(self, message_id: UUID) -> Optional[NotificationOutboxEntry]:
+        stmt = select(NotificationOutboxEntry).where(NotificationOutboxEntry.message_id == message_id)
+        return self._session.scalars(stmt).first()
+
+    def find_by_ids(self, ids: List[int], locked_by: Optional[str] = None) -> List[NotificationOutboxEntry]:
+        """
+        Find outbox entries by ID. With locked_by, only the entries still leased to that dispatcher are returned,
+        locked FOR UPDATE so that no other dispatcher claims them before the caller commits.
+        """
+        if not ids:
+            return []
+
+        stmt = select(NotificationOutboxEntry).where(NotificationOutboxEntry.id.in_(ids))
+        if locked_by is not None:
+            stmt = stmt.where(NotificationOutboxEntry.locked_by == locked_by).with_for_update()
+        return list(self._session.scalars(stmt).all())
+
+    @staticmethod
+    def _is_due(now: datetime):
+        return or_(
+            and_(
+                NotificationOutboxEntry.status == NotificationOutboxStatus.QUEUED.value,
+                NotificationOutboxEntry.next_attempt_date <= now),
+            and_(
+                NotificationOutboxEntry.status == NotificationOutboxStatus.RUNNING.value,
+                NotificationOutboxEntry.locked_until < now))
+
+    def claim_next_group(self, worker_id: str, limit: int = 50, lease_seconds: float = 120) -> List[NotificationOutboxEntry]:
+        """
+        Claim up to limit due entries for the receiver of the oldest due entry, so they can be sent
+        over a single negotiated transfer.
+
+        Like TwinAspectRegistrationJobRepository.claim_next, the rows are selected with FOR UPDATE SKIP LOCKED
+        and the claim is only visible to the other dispatchers once the caller commits.
+        """
+        now = utc_now_naive()
+        oldest = self._session.scalars(
+            select(NotificationOutboxEntry).where(self._is_due(now)).order_by(
+                NotificationOutboxEntry.id).limit(1).with_for_update(skip_locked=True)).first()
+        if not oldest:
+            return []
+
+        stmt = select(NotificationOutboxEntry).where(
+            NotificationOutboxEntry.receiver_bpn == oldest.receiver_bpn).where(
+            self._is_due(now)).order_by(
+            NotificationOutboxEntry.id).limit(limit).with_for_update(skip_locked=True)
+
+        entries = self._session.scalars(stmt).all()
+        for entry in entries:
+            entry.status = NotificationOutboxStatus.RUNNING.value
+            entry.locked_by = worker_id
+            entry.locked_until = now + timedelta(seconds=lease_seconds)
+            entry.attempts += 1
+            entry.modified_date = now
+        return entries
+
+    def renew_leases(self, ids: List[int], worker_id: str, lease_seconds: float = 120) -> List[int]:
+        """
+        Extend the lease of the running entries still held by the given dispatcher.
+
+        Returns:
+            List[int]: The IDs whose lease was extended; the others were taken over by another dispatcher.
+        """
+        if not ids:
+            return []
+
+        now = utc_now_naive()
+        stmt = update(NotificationOutboxEntry).where(
+            NotificationOutboxEntry.id.in_(ids),
+            NotificationOutboxEntry.locked_by == worker_id,
+            NotificationOutboxEntry.status == NotificationOutboxStatus.RUNNING.value).values(
+            locked_until=now + timedelta(seconds=lease_seconds),
+            modified_date=now).returning(NotificationOutboxEntry.id).execution_options(synchronize_session=False)
+        return list(self._session.scalars(stmt).all())
+
+    def mark_sent(self, ids: List[int], worker_id: str) -> List[int]:
+        """
+        Mark the given entries as sent and release their lease with one statement, only where the
+        given dispatcher still holds the lease.
+
+        Returns:
+            List[int]: The IDs marked as sent.
+        """
+        if not ids:
+            return []
+
+        stmt = update(NotificationOutboxEntry).where(
+            NotificationOutboxEntry.id.in_(ids),
+            NotificationOutboxEntry.locked_by == worker_id).values(
+            status=NotificationOutboxStatus.SENT.value,
+            locked_by=None,
+            locked_until=None,
+            last_error=None,
+            modified_date=utc_now_naive()).returning(NotificationOutboxEntry.id).execution_options(synchronize_session=False)
+        return list(self._session.scalars(stmt).all())
+
 class PCFRepository(BaseRepository[PcfExchangeEntity]):
     """
     Repository for managing PCF (Product Carbon Footprint) exchange records.
@@ -977,6 +1343,83 @@ class PCFRepository(BaseRepository[PcfExchangeEntity]):
 
         return list(self._session.scalars(stmt).all())
 
+    @staticmethod
+    def _join_latest_with_response(stmt, response, manufacturer_part_ids: List[str]):
+        """
+        Restrict a statement to the newest exchange of each part, outer joined with the
+        response (an alias of PcfExchangeEntity) to its request.
+        """
+        ranked = select(
+            PcfExchangeEntity.id,
+            func.row_number().over(
+                partition_by=PcfExchangeEntity.manufacturer_part_id,
+                order_by=(desc(PcfExchangeEntity.created_at), desc(PcfExchangeEntity.id))
+            ).label("position")
+        ).where(PcfExchangeEntity.manufacturer_part_id.in_(manufacturer_part_ids)).subquery()
+
+        return (
+            stmt.select_from(PcfExchangeEntity)
+            .join(ranked, and_(ranked.c.id == PcfExchangeEntity.id, ranked.c.position == 1))
+            .outerjoin(response, and_(
+                response.request_id == PcfExchangeEntity.request_id,
+                response.type == PcfExchangeType.RESPONSE
+            ))
+        )
+
+    def find_latest_by_part_ids_with_response(
+        self,
+        manufacturer_part_ids: List[str],
+    ) -> Dict[str, Tuple[PcfExchangeEntity, Optional[PcfExchangeEntity]]]:
+        """
+        Find the newest exchange of each part together with the response to its request, in one statement.
+
+        Args:
+            manufacturer_part_ids: The manufacturer part IDs to look up.
+
+        Returns:
+            Dictionary of manufacturer part ID -> (newest exchange, response or None). Parts
+            without any exchange are not included.
+        """
+        if not manufacturer_part_ids:
+            return {}
+        response = aliased(PcfExchangeEntity)
+        stmt = self._join_latest_with_response(
+            select(PcfExchangeEntity, response), response, manufacturer_part_ids
+        ).order_by(desc(response.updated_at))
+        result: Dict[str, Tuple[PcfExchangeEntity, Optional[PcfExchangeEntity]]] = {}
+        for exchange, response in self._session.execute(stmt).all():
+            result.setdefault(exchange.manufacturer_part_id, (exchange, response))
+        return result
+
+    def count_responses_by_part_ids(
+        self,
+        manufacturer_part_ids: List[str],
+        statuses: List[PcfExchangeStatus],
+    ) -> Tuple[int, int]:
+        """
+        Count the parts with an exchange, and those whose request got a response in one of the given statuses.
+
+        Args:
+            manufacturer_part_ids: The manufacturer part IDs to look up.
+            statuses: The response statuses counted as responded.
+
+        Returns:
+            Tuple of (parts with an exchange, parts with a response in the given statuses).
+        """
+        if not manufacturer_part_ids:
+            return 0, 0
+        response = aliased(PcfExchangeEntity)
+        stmt = self._join_latest_with_response(
+            select(
+                func.count(func.distinct(PcfExchangeEntity.manufacturer_part_id)),
+                func.count(func.distinct(case((response.status.in_(statuses), PcfExchangeEntity.manufacturer_part_id))))
+            ),
+            response,
+            manufacturer_part_ids
+        )
+        total, responded = self._session.execute(stmt).one()
+        return total, responded
+
     def find_by_correlation_id(self, correlation_id: str) -> Optional[PcfExchangeEntity]:
         """Find a PCF exchange by its external correlation ID."""
         stmt = select(PcfExchangeEntity).where(
@@ -1060,6 +1503,11 @@ class PCFRepository(BaseRepository[PcfExchangeEntity]):
 class PCFRelationshipRepository(BaseRepository[PcfRelationshipEntity]):
     """
     Repository for managing relationships between our PCF and other entities.
+
+    The sub-parts of a part are edges of the part-relationship graph (``pcf_part_edges``);
+    the whole bill of materials below a part, or the assemblies above it, are read with
+    one recursive CTE each. The recursive queries only see edges, so the legacy JSON lists
+    must be migrated first (see ``migrate_legacy_sub_parts``).
     """
 
     def create_new(
@@ -1069,9 +1517,14 @@ class PCFRelationshipRepository(BaseRepository[PcfRelationshipEntity]):
     ) -> PcfRelationshipEntity:
         pcf_relationship = PcfRelationshipEntity(
             main_manufacturer_part_id=main_manufacturer_part_id,
-            list_sub_manufacturer_part_id=list_sub_manufacturer_part_ids
+            list_sub_manufacturer_part_id=[]
         )
         self.create(pcf_relationship)
+        for sub_manufacturer_part_id in dict.fromkeys(list_sub_manufacturer_part_ids):
+            self._session.add(PcfPartEdgeEntity(
+                parent_manufacturer_part_id=main_manufacturer_part_id,
+                child_manufacturer_part_id=sub_manufacturer_part_id
+            ))
         return pcf_relationship
     
     def find_by_main_manufacturer_part_id(self, main_manufacturer_part_id: str) -> Optional[PcfRelationshipEntity]:
@@ -1080,16 +1533,141 @@ class PCFRelationshipRepository(BaseRepository[PcfRelationshipEntity]):
         )
         return self._session.scalars(stmt).first()
     
-    def add_sub_manufacturer_part_id(self, main_manufacturer_part_id: str, sub_manufacturer_part_id: str) -> Optional[PcfRelationshipEntity]:
-        """Add a sub manufacturer part ID to the list for a given main manufacturer part ID."""
+    def add_sub_manufacturer_part_id(self, main_manufacturer_part_id: str, sub_manufacturer_part_id: str, quantity: float = 1.0) -> Optional[PcfRelationshipEntity]:
+        """
+        Add a sub manufacturer part ID to a given main manufacturer part ID.
+
+        Returns:
+            The relationship of the main part, or None if it is unknown or already has the sub-part.
+        """
         relationship = self.find_by_main_manufacturer_part_id(main_manufacturer_part_id)
-        if relationship and sub_manufacturer_part_id not in relationship.list_sub_manufacturer_part_id:
-            relationship.list_sub_manufacturer_part_id.append(sub_manufacturer_part_id)
-            # Flag the list as modified so SQLAlchemy tracks the change to the JSON column
-            flag_modified(relationship, "list_sub_manufacturer_part_id")
-            self._session.add(relationship)
-            return relationship
-        return None
+        if relationship is None or sub_manufacturer_part_id in self.find_sub_part_ids(main_manufacturer_part_id):
+            return None
+        self._session.add(PcfPartEdgeEntity(
+            parent_manufacturer_part_id=main_manufacturer_part_id,
+            child_manufacturer_part_id=sub_manufacturer_part_id,
+            quantity=quantity
+        ))
+        return relationship
+
+    def find_sub_part_ids(self, main_manufacturer_part_id: str) -> List[str]:
+        """
+        Get the direct sub-part IDs of a part, in the order they were added.
+
+        Sub-parts still stored in the legacy JSON list of the relationship are moved to edges first.
+        """
+        relationship = self.find_by_main_manufacturer_part_id(main_manufacturer_part_id)
+        if relationship is not None and relationship.list_sub_manufacturer_part_id:
+            self._migrate_legacy_sub_parts(relationship)
+        stmt = select(PcfPartEdgeEntity.child_manufacturer_part_id).where(
+            PcfPartEdgeEntity.parent_manufacturer_part_id == main_manufacturer_part_id
+        ).order_by(PcfPartEdgeEntity.id)
+        return list(self._session.scalars(stmt).all())
+
+    def migrate_legacy_sub_parts(self) -> int:
+        """
+        Move the sub-parts of every relationship still stored in the legacy JSON list to edges.
+
+        Idempotent: migrated relationships keep an empty list and are not selected again.
+
+        Returns:
+            int: The number of migrated relationships.
+        """
+        stmt = select(PcfRelationshipEntity).where(
+            func.json_array_length(PcfRelationshipEntity.list_sub_manufacturer_part_id) > 0
+        )
+        relationships = self._session.scalars(stmt).all()
+        for relationship in relationships:
+            self._migrate_legacy_sub_parts(relationship)
+        return len(relationships)
+
+    def _migrate_legacy_sub_parts(self, relationship: PcfRelationshipEntity) -> None:
+        stmt = select(PcfPartEdgeEntity.child_manufacturer_part_id).where(
+            PcfPartEdgeEntity.parent_manufacturer_part_id == relationship.main_manufacturer_part_id
+        )
+        existing = set(self._session.scalars(stmt).all())
+        for sub_manufacturer_part_id in dict.fromkeys(relationship.list_sub_manufacturer_part_id):
+            if sub_manufacturer_part_id not in existing:
+                self._session.add(PcfPartEdgeEntity(
+                    parent_manufacturer_part_id=relationship.main_manufacturer_part_id,
+                    child_manufacturer_part_id=sub_manufacturer_part_id
+                ))
+        relationship.list_sub_manufacturer_part_id = []
+        flag_modified(relationship, "list_sub_manufacturer_part_id")
+        self._session.add(relationship)
+
+    def find_descendant_edges(self, manufacturer_part_id: str) -> List[Tuple[str, str, float]]:
+        """
+        Get all edges of the bill of materials below a part, over all levels, in one recursive query.
+
+        Returns:
+            List of (parent part ID, child part ID, quantity). An edge reached over several paths is returned once.
+        """
+        tree = select(
+            PcfPartEdgeEntity.parent_manufacturer_part_id.label("parent_id"),
+            PcfPartEdgeEntity.child_manufacturer_part_id.label("child_id"),
+            PcfPartEdgeEntity.quantity.label("quantity"),
+        ).where(
+            PcfPartEdgeEntity.parent_manufacturer_part_id == manufacturer_part_id
+        ).cte("bom_tree", recursive=True)
+        edge = aliased(PcfPartEdgeEntity)
+        # UNION (not UNION ALL) drops edges already visited, which also stops on cycles
+        tree = tree.union(
+            select(edge.parent_manufacturer_part_id, edge.child_manufacturer_part_id, edge.quantity)
+            .where(edge.parent_manufacturer_part_id == tree.c.child_id)
+        )
+        stmt = select(tree.c.parent_id, tree.c.child_id, tree.c.quantity)
+        return [tuple(row) for row in self._session.execute(stmt).all()]
+
+    def find_ancestor_ids(self, manufacturer_part_ids: List[str]) -> List[str]:
+        """Get the IDs of all assemblies containing one of the parts, directly or over several levels."""
+        if not manufacturer_part_ids:
+            return []
+        ancestors = select(PcfPartEdgeEntity.parent_manufacturer_part_id.label("part_id")).where(
+            PcfPartEdgeEntity.child_manufacturer_part_id.in_(manufacturer_part_ids)
+        ).cte("bom_ancestors", recursive=True)
+        edge = aliased(PcfPartEdgeEntity)
+        ancestors = ancestors.union(
+            select(edge.parent_manufacturer_part_id).where(edge.child_manufacturer_part_id == ancestors.c.part_id)
+        )
+        return list(self._session.scalars(select(ancestors.c.part_id)).all())
+
+    def find_child_edges(self, manufacturer_part_ids: List[str]) -> List[Tuple[str, str, float]]:
+        """Get the direct edges below the given parts as (parent part ID, child part ID, quantity)."""
+        if not manufacturer_part_ids:
+            return []
+        stmt = select(
+            PcfPartEdgeEntity.parent_manufacturer_part_id,
+            PcfPartEdgeEntity.child_manufacturer_part_id,
+            PcfPartEdgeEntity.quantity,
+        ).where(PcfPartEdgeEntity.parent_manufacturer_part_id.in_(manufacturer_part_ids))
+        return [tuple(row) for row in self._session.execute(stmt).all()]
+
+    def find_rollups(self, manufacturer_part_ids: List[str]) -> Dict[str, PcfRollupEntity]:
+        """Get the stored PCF values of the given parts, by part ID."""
+        if not manufacturer_part_ids:
+            return {}
+        stmt = select(PcfRollupEntity).where(PcfRollupEntity.manufacturer_part_id.in_(manufacturer_part_ids))
+        return {rollup.manufacturer_part_id: rollup for rollup in self._session.scalars(stmt).all()}
+
+    def save_received_pcf(self, manufacturer_part_id: str, received_pcf: Optional[float]) -> PcfRollupEntity:
+        """Store the PCF value received for a part."""
+        rollup = self._session.get(PcfRollupEntity, manufacturer_part_id) or PcfRollupEntity(manufacturer_part_id=manufacturer_part_id)
+        rollup.received_pcf = received_pcf
+        rollup.updated_at = datetime.now(timezone.utc)
+        self._session.add(rollup)
+        return rollup
+
+    def save_totals(self, totals: Dict[str, Tuple[Optional[float], int]]) -> None:
+        """Store the rolled-up total and number of missing sub-parts of every given part."""
+        existing = self.find_rollups(list(totals))
+        now = datetime.now(timezone.utc)
+        for manufacturer_part_id, (total_pcf, missing_parts) in totals.items():
+            rollup = existing.get(manufacturer_part_id) or PcfRollupEntity(manufacturer_part_id=manufacturer_part_id)
+            rollup.total_pcf = total_pcf
+            rollup.missing_parts = missing_parts
+            rollup.updated_at = now
+            self._session.add(rollup)
 
 
 class CcmRepository(BaseRepository[Ccm]):
@@ -1164,10 +1742,13 @@ class CcmRepository(BaseRepository[Ccm]):
         self.create(ccm)
         return ccm
 
-    def find_by_id_with_relations(self, ccm_id: int) -> Optional[Ccm]:
+    def find_by_id_with_relations(self, ccm_id: int, with_document: bool = False) -> Optional[Ccm]:
         """
         Fetch a single Ccm record with its ``sites`` and ``shares`` eagerly
         loaded in one query, avoiding N+1 issues.
+
+        The ``doc`` column is deferred; pass ``with_document=True`` to load it
+        in the same query when the PDF is going to be used.
         """
         stmt = (
             select(Ccm)
@@ -1177,6 +1758,8 @@ class CcmRepository(BaseRepository[Ccm]):
                 selectinload(Ccm.shares),
             )
         )
+        if with_document:
+            stmt = stmt.options(undefer(Ccm.doc))
         return self._session.scalars(stmt).first()
 
     _LEGACY_ASSET_PREFIX = "ichub:asset:ccm-cert:"
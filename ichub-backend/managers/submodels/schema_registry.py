@@ -0,0 +1,176 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+"""
+Local registry of the JSON schemas of the Catena-X aspect models.
+
+The schemas are read once from the bundled ``resources/schemas`` directory and
+the configured ``schema_registry.directories`` (e.g. a mounted checkout of
+https://github.com/eclipse-tractusx/sldt-semantic-models). Every ``*-schema.json``
+file generated from a SAMM model declares its semantic ID in the
+``x-samm-aspect-model-urn`` property, which is used as the registry key, so the
+directory layout does not matter.
+
+One validator is kept per semantic ID, so validating a payload does not fetch
+or rebuild the schema anymore. Schemas that are not available locally are only
+downloaded (once) when ``schema_registry.allow_download`` is enabled.
+"""
+
+import json
+import os
+import threading
+from typing import Any, Dict, List, Optional
+
+import jsonschema
+from requests import HTTPError
+from tractusx_sdk.dataspace.tools.validate_submodels import submodel_schema_finder
+
+from managers.config.config_manager import ConfigManager
+from managers.config.log_manager import LoggingManager
+from tools.json_validator import get_validator_class, collect_validation_errors, raise_validation_errors
+
+logger = LoggingManager.get_logger(__name__)
+
+BUNDLED_SCHEMAS_DIRECTORY = os.path.join(os.path.dirname(__file__), "..", "..", "resources", "schemas")
+SCHEMA_FILE_SUFFIX = "-schema.json"
+SEMANTIC_ID_KEY = "x-samm-aspect-model-urn"
+
+
+class SchemaRegistry:
+    """
+    Registry of aspect model JSON schemas and their validators, indexed by semantic ID.
+    """
+
+    _instance: Optional['SchemaRegistry'] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, directories: Optional[List[str]] = None, allow_download: bool = True):
+        """
+        Args:
+            directories: Directories to load the schemas from, searched recursively. The first
+                directory containing a schema for a semantic ID wins. Defaults to the bundled schemas.
+            allow_download: Download schemas missing locally from the Tractus-X semantic models repository.
+        """
+        self.allow_download = allow_download
+        self._schemas: Dict[str, Dict[str, Any]] = {}
+        self._validators: Dict[str, jsonschema.protocols.Validator] = {}
+        self._lock = threading.Lock()
+
+        for directory in directories if directories is not None else [BUNDLED_SCHEMAS_DIRECTORY]:
+            self._load_directory(directory)
+        logger.info(f"[SchemaRegistry] Loaded {len(self._schemas)} aspect model schemas.")
+
+    @classmethod
+    def get_instance(cls) -> 'SchemaRegistry':
+        """Return the process-wide registry, creating it from the configuration on first use."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                directories = ConfigManager.get_config("schema_registry.directories", default=None) or []
+                cls._instance = cls(
+                    directories=[*directories, BUNDLED_SCHEMAS_DIRECTORY],
+                    allow_download=bool(ConfigManager.get_config("schema_registry.allow_download", default=True)),
+                )
+            return cls._instance
+
+    def _load_directory(self, directory: str) -> None:
+        if not os.path.isdir(directory):
+            logger.warning(f"[SchemaRegistry] Schema directory [{directory}] does not exist, skipping it.")
+            return
+
+        for root, _, files in os.walk(directory):
+            for file_name in sorted(files):
+                if not file_name.endswith(SCHEMA_FILE_SUFFIX):
+                    continue
+                path = os.path.join(root, file_name)
+                try:
+                    with open(path, "r", encoding="utf-8") as file:
+                        schema = json.load(file)
+                except (OSError, ValueError) as e:
+                    logger.warning(f"[SchemaRegistry] Could not read the schema [{path}]: {e}")
+                    continue
+
+                semantic_id = schema.get(SEMANTIC_ID_KEY) if isinstance(schema, dict) else None
+                if not semantic_id:
+                    logger.debug(f"[SchemaRegistry] Schema [{path}] has no {SEMANTIC_ID_KEY}, skipping it.")
+                    continue
+                self._schemas.setdefault(semantic_id, schema)
+
+    def register(self, semantic_id: str, schema: Dict[str, Any]) -> None:
+        """Register (or replace) the schema of a semantic ID."""
+        with self._lock:
+            self._schemas[semantic_id] = schema
+            self._validators.pop(semantic_id, None)
+
+    def has_schema(self, semantic_id: str) -> bool:
+        """Check whether the schema of a semantic ID is available without downloading it."""
+        return semantic_id in self._schemas
+
+    def get_schema(self, semantic_id: str) -> Dict[str, Any]:
+        """
+        Get the schema of a semantic ID.
+
+        Raises:
+            HTTPError: If the schema is not available locally and cannot be downloaded.
+        """
+        schema = self._schemas.get(semantic_id)
+        if schema is not None:
+            return schema
+
+        if not self.allow_download:
+            raise HTTPError(f"422 Client Error: No schema available for the semantic ID {semantic_id}")
+
+        logger.info(f"[SchemaRegistry] Schema for [{semantic_id}] not available locally, downloading it.")
+        schema = submodel_schema_finder(semantic_id)["schema"]
+        with self._lock:
+            return self._schemas.setdefault(semantic_id, schema)
+
+    def get_validator(self, semantic_id: str) -> jsonschema.protocols.Validator:
+        """Get the validator of a semantic ID, building it from its schema on first use."""
+        validator = self._validators.get(semantic_id)
+        if validator is not None:
+            return validator
+
+        schema = self.get_schema(semantic_id)
+        validator_cls = get_validator_class(schema)
+        validator_cls.check_schema(schema)
+        with self._lock:
+            return self._validators.setdefault(semantic_id, validator_cls(schema))
+
+    def is_valid(self, semantic_id: str, json_to_validate: Dict[str, Any]) -> bool:
+        """Check whether a JSON object conforms to the schema of a semantic ID, without collecting the errors."""
+        return self.get_validator(semantic_id).is_valid(json_to_validate)
+
+    def validate(self, semantic_id: str, json_to_validate: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Validate a JSON object against the schema of a semantic ID.
+
+        The detailed errors are only collected when the object is invalid.
+
+        Raises:
+            HTTPError: If the schema is not available or validation errors are found.
+        """
+        validator = self.get_validator(semantic_id)
+        if not validator.is_valid(json_to_validate):
+            raise_validation_errors(collect_validation_errors(validator, json_to_validate))
+
+        return {"status": "ok", "message": "JSON validation passed"}
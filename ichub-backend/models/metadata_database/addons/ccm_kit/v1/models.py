@@ -42,6 +42,7 @@ from enum import Enum
 from typing import List, Optional
 
 from sqlalchemy import Column, Enum as SAEnum, Index, LargeBinary, Text, UniqueConstraint
+from sqlalchemy.orm import deferred
 from sqlmodel import Field, Relationship, SQLModel
 
 
@@ -107,6 +108,16 @@ class OutboundRequestStatus(str, Enum):
     Failed   = "Failed"
 
 
+# ---------------------------------------------------------------------------
+# Document columns
+# ---------------------------------------------------------------------------
+
+# The PDF columns are mapped as deferred so listing and metadata queries do not
+# read the document bytes. Use ``undefer(Ccm.doc)`` when the document is needed.
+_ccm_doc_column = Column("doc", LargeBinary)
+_ccm_received_doc_column = Column("doc", LargeBinary)
+
+
 # ---------------------------------------------------------------------------
 # Core certificate entity
 # ---------------------------------------------------------------------------
@@ -210,10 +221,10 @@ class Ccm(SQLModel, table=True):
 
     # --- Document storage ---
     # The raw PDF bytes are stored here.  Base64 conversion happens at the
-    # service/controller layer when building JSON responses.
+    # service/controller layer when building JSON responses.  Loaded lazily.
     doc: Optional[bytes] = Field(
         default=None,
-        sa_column=Column(LargeBinary),
+        sa_column=_ccm_doc_column,
         description="Binary PDF document content (BYTEA in PostgreSQL)."
     )
 
@@ -241,6 +252,7 @@ class Ccm(SQLModel, table=True):
     __table_args__ = (
         Index("ix_ccm_bpnl_certificate_type", "bpnl", "certificate_type"),
     )
+    __mapper_args__ = {"properties": {"doc": deferred(_ccm_doc_column)}}
 
 
 # ---------------------------------------------------------------------------
@@ -425,7 +437,7 @@ class CcmReceived(SQLModel, table=True):
     # --- Document binary ---
     doc: Optional[bytes] = Field(
         default=None,
-        sa_column=Column(LargeBinary),
+        sa_column=_ccm_received_doc_column,
         description="Binary PDF content (BYTEA in PostgreSQL).",
     )
 
@@ -486,6 +498,7 @@ class CcmReceived(SQLModel, table=True):
             name="uq_ccm_received_doc_provider",
         ),
     )
+    __mapper_args__ = {"properties": {"doc": deferred(_ccm_received_doc_column)}}
 
 
 # ---------------------------------------------------------------------------
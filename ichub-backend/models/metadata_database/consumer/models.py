@@ -24,7 +24,7 @@ from sqlmodel import SQLModel, Field
 from sqlalchemy import JSON
 from sqlmodel import Column
 from datetime import datetime
-from typing import List
+from typing import Any, Dict, List
 
 class KnownConnectors(SQLModel):
     """
@@ -37,6 +37,7 @@ class KnownConnectors(SQLModel):
     bpnl: str = Field(primary_key=True, index=True, description="Business Partner Number Legal Entity")
     connectors: List[str] = Field(sa_column=Column(JSON), description="List of connector URLs for this BPNL")
     expires_at: datetime = Field(index=True, description="When this cache entry expires")
+    updated_at: datetime = Field(default_factory=datetime.now, index=True, description="When this cache entry was last written")
 
 
 class KnownDtrs(SQLModel):
@@ -49,7 +50,21 @@ class KnownDtrs(SQLModel):
 
     bpnl: str = Field(primary_key=True, index=True, description="Business Partner Number Legal Entity")
     edc_url: str = Field(description="URL of the EDC where the DTR is stored")
-    asset_id: str = Field(description="Asset ID of the DTR")
+    asset_id: str = Field(primary_key=True, description="Asset ID of the DTR")
     policies: List[str] = Field(sa_column=Column(JSON), description="List of policies for this DTR")
     expires_at: datetime = Field(index=True, description="When this cache entry expires")
 
+
+class DiscoveryTasks(SQLModel):
+    """
+    Represents the state of an EcoPass KIT passport discovery task.
+
+    This table lets every backend worker and replica answer the status requests of a discovery
+    running in another process. The rows are removed once they expire.
+    """
+
+    task_id: str = Field(primary_key=True, description="Unique identifier of the discovery task")
+    task: Dict[str, Any] = Field(sa_column=Column(JSON), description="Status, progress and result of the task")
+    version: int = Field(default=1, description="Incremented on every change, used to wait for the next update")
+    expires_at: datetime = Field(index=True, description="When this task is removed")
+    updated_at: datetime = Field(default_factory=datetime.now, description="When this task was last written")
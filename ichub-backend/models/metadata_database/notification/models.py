@@ -22,12 +22,13 @@
 #################################################################################
 
 from sqlmodel import SQLModel, Field, Column
-from sqlalchemy import Enum as SAEnum
+from sqlalchemy import Enum as SAEnum, JSON
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from uuid import UUID
 from enum import Enum
 from tractusx_sdk.industry.models.notifications import Notification
+from tools.datetime_tools import utc_now_naive
 
 class NotificationDirection(str, Enum):
     INCOMING = "incoming"
@@ -108,3 +109,56 @@ class NotificationEntity(SQLModel, table=True):
         Reconstructs the original SDK Notification object from the database record.
         """
         return Notification.model_validate(payload)
+
+
+class NotificationOutboxStatus(str, Enum):
+    """The dispatch status of an outgoing notification in the outbox."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    SENT = "sent"
+    FAILED = "failed"
+
+
+class NotificationOutboxEntry(SQLModel, table=True):
+    """
+    Represents an outgoing notification waiting to be sent by the notification outbox dispatcher.
+    The entry is written in the same transaction as the notification itself, so a stored outgoing
+    notification is never lost when the connector of the receiver is not reachable.
+
+    Attributes:
+        id (int): The unique identifier of the entry.
+        message_id (UUID): The messageId of the notification to send.
+        receiver_bpn (str): The BPNL of the receiver. Entries are sent in groups per receiver.
+        provider_dsp_url (Optional[str]): The DSP URL of the receiver's connector. Resolved via connector discovery when empty.
+        endpoint_path (Optional[str]): The path appended to the notification endpoint. Derived from the notification context when empty.
+        policies (Optional[List[Dict[str, Any]]]): The accepted usage policies of the notification offer. Any policy is accepted when empty.
+        dct_type (Optional[str]): The dct:type of the notification asset in the receiver's catalog.
+        status (str): The dispatch status of the entry (queued, running, sent or failed).
+        attempts (int): How many times a dispatcher picked up the entry.
+        next_attempt_date (datetime): The entry is not picked up before this date (retry backoff).
+        locked_by (Optional[str]): The dispatcher currently sending the entry.
+        locked_until (Optional[datetime]): The end of the lease of the dispatcher. A running entry with an expired lease is picked up again.
+        last_error (Optional[str]): The error of the last failed attempt.
+        created_date (datetime): The creation date of the entry.
+        modified_date (datetime): The last modification date of the entry.
+
+    Table Name:
+        notification_outbox
+    """
+    id: Optional[int] = Field(default=None, primary_key=True)
+    message_id: UUID = Field(unique=True, description="The messageId of the notification to send.")
+    receiver_bpn: str = Field(index=True, description="The BPNL of the receiver.")
+    provider_dsp_url: Optional[str] = Field(default=None, description="The DSP URL of the receiver's connector.")
+    endpoint_path: Optional[str] = Field(default=None, description="The path appended to the notification endpoint.")
+    policies: Optional[List[Dict[str, Any]]] = Field(default=None, sa_column=Column(JSON), description="The accepted usage policies of the notification offer.")
+    dct_type: Optional[str] = Field(default=None, description="The dct:type of the notification asset.")
+    status: str = Field(index=True, default=NotificationOutboxStatus.QUEUED.value, description="The dispatch status of the entry.")
+    attempts: int = Field(default=0, description="How many times a dispatcher picked up the entry.")
+    next_attempt_date: datetime = Field(index=True, default_factory=utc_now_naive, description="The entry is not picked up before this date.")
+    locked_by: Optional[str] = Field(default=None, description="The dispatcher currently sending the entry.")
+    locked_until: Optional[datetime] = Field(default=None, description="The end of the lease of the dispatcher sending the entry.")
+    last_error: Optional[str] = Field(default=None, description="The error of the last failed attempt.")
+    created_date: datetime = Field(default_factory=utc_now_naive, description="The creation date of the entry.")
+    modified_date: datetime = Field(default_factory=utc_now_naive, description="The last modification date of the entry.")
+
+    __tablename__ = "notification_outbox"
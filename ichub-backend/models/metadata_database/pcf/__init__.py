@@ -26,5 +26,7 @@ from .models import (
     PcfExchangeDirection,
     PcfExchangeStatus,
     PcfExchangeType,
-    PcfRelationshipEntity
+    PcfRelationshipEntity,
+    PcfPartEdgeEntity,
+    PcfRollupEntity
 )
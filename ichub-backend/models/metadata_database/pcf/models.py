@@ -33,7 +33,7 @@ from enum import Enum
 from typing import List, Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import Column, JSON
+from sqlalchemy import Column, JSON, UniqueConstraint
 from sqlalchemy import Enum as SAEnum
 from sqlmodel import SQLModel, Field
 
@@ -191,6 +191,13 @@ class PcfExchangeEntity(SQLModel, table=True):
     )
 
 class PcfRelationshipEntity(SQLModel, table=True):
+    """
+    Registers an own (main) part whose sub-parts are tracked for PCF exchanges.
+
+    The sub-parts are stored as edges in ``pcf_part_edges``. ``list_sub_manufacturer_part_id``
+    only holds sub-parts added before the edge table existed; they are moved to edges
+    the first time the part is read.
+    """
 
     __tablename__ = "pcf_relationships"
     __table_args__ = {"schema": "public"}
@@ -205,3 +212,81 @@ class PcfRelationshipEntity(SQLModel, table=True):
         sa_column=Column(JSON),
         description="List of manufacturer part identifiers for subparts related to the main part"
     )
+
+
+class PcfPartEdgeEntity(SQLModel, table=True):
+    """
+    An edge of the bill of materials: the parent part contains ``quantity`` units of the child part.
+
+    Together the edges form the part-relationship graph over all levels, queried with recursive CTEs.
+
+    Attributes:
+        id: Primary key.
+        parent_manufacturer_part_id: Manufacturer part ID of the assembly.
+        child_manufacturer_part_id: Manufacturer part ID of the sub-part.
+        quantity: Declared units of the sub-part contained in one declared unit of the assembly.
+        created_at: Timestamp when the sub-part was added.
+    """
+    __tablename__ = "pcf_part_edges"
+    __table_args__ = (
+        UniqueConstraint("parent_manufacturer_part_id", "child_manufacturer_part_id", name="uk_pcf_part_edges_parent_child"),
+        {"schema": "public"},
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    parent_manufacturer_part_id: str = Field(
+        index=True,
+        description="Manufacturer's part identifier of the assembly"
+    )
+    child_manufacturer_part_id: str = Field(
+        index=True,
+        description="Manufacturer's part identifier of the sub-part"
+    )
+    quantity: float = Field(
+        default=1.0,
+        description="Declared units of the sub-part contained in one declared unit of the assembly"
+    )
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        description="Timestamp when the sub-part was added"
+    )
+
+
+class PcfRollupEntity(SQLModel, table=True):
+    """
+    Received and rolled-up PCF values of a part, in kg CO2e per declared unit.
+
+    ``received_pcf`` is the cradle-to-gate ``pcfExcludingBiogenic`` value of a supplier response.
+    ``total_pcf`` is the value used by the assemblies containing the part: the received value if
+    there is one, otherwise the quantity-weighted sum of the totals of its sub-parts.
+
+    Attributes:
+        manufacturer_part_id: Primary key, the manufacturer part identifier.
+        received_pcf: Value taken from the latest PCF response for the part, if any.
+        total_pcf: Rolled-up cradle-to-gate value of the part.
+        missing_parts: Number of sub-parts (over all levels) without any value, 0 when the total is complete.
+        updated_at: Timestamp of the last roll-up.
+    """
+    __tablename__ = "pcf_rollups"
+    __table_args__ = {"schema": "public"}
+
+    manufacturer_part_id: str = Field(
+        primary_key=True,
+        description="Manufacturer's part identifier"
+    )
+    received_pcf: Optional[float] = Field(
+        default=None,
+        description="pcfExcludingBiogenic value of the latest PCF response for the part"
+    )
+    total_pcf: Optional[float] = Field(
+        default=None,
+        description="Rolled-up cradle-to-gate PCF value of the part"
+    )
+    missing_parts: int = Field(
+        default=0,
+        description="Number of sub-parts over all levels without a PCF value"
+    )
+    updated_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        description="Timestamp of the last roll-up"
+    )
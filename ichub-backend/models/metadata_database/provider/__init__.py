@@ -24,8 +24,8 @@
 
 from .models import (
     LegalEntity, BusinessPartner, EnablementServiceStack,
-    Twin, TwinAspect, TwinAspectRegistration, TwinExchange, TwinRegistration,
+    Twin, TwinAspect, TwinAspectRegistration, TwinAspectRegistrationJob, TwinAspectRegistrationJobStatus, TwinExchange, TwinRegistration,
     CatalogPart, PartnerCatalogPart, SerializedPart, JISPart, Batch, BatchBusinessPartner,
-    DataExchangeAgreement, DataExchangeContract
+    DataExchangeAgreement, DataExchangeContract, KnownOffers
 )
 
@@ -36,6 +36,7 @@ from pydantic import BaseModel, Field as PydField
 from sqlmodel import Field, SQLModel, Relationship
 from sqlalchemy import Column, JSON, UniqueConstraint, SmallInteger
 from tools.constants import TWIN_ID_DESCRIPTION, BUSINESS_PARTNER_ID_DESCRIPTION
+from tools.datetime_tools import utc_now_naive
 
 class Unit(str, Enum):
     mm = "mm"
@@ -618,6 +619,62 @@ class TwinAspectRegistration(SQLModel, table=True):
 
     __tablename__ = "twin_aspect_registration"
 
+class TwinAspectRegistrationJobStatus(str, Enum):
+    """The processing status of a queued twin aspect registration."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class TwinAspectRegistrationJob(SQLModel, table=True):
+    """
+    Represents a queued registration of a twin aspect within an enablement service stack.
+    The registration steps (submodel service upload, EDC offer and DTR submodel descriptor) are executed
+    by the aspect registration workers, which continue from the status reached in the twin aspect registration.
+
+    Attributes:
+        id (int): The unique identifier of the job.
+        job_id (UUID): The public ID of the job, returned to the API caller.
+        twin_aspect_id (int): The ID of the twin aspect to register (foreign key to twin_aspect).
+        enablement_service_stack_id (int): The ID of the enablement service stack to register the aspect in (foreign key).
+        payload (Optional[Dict[str, Any]]): The aspect document to store in the submodel service. Cleared once the job is completed.
+        status (str): The processing status of the job (queued, running, completed or failed).
+        attempts (int): How many times a worker picked up the job.
+        next_attempt_date (datetime): The job is not picked up before this date (retry backoff).
+        locked_by (Optional[str]): The worker currently processing the job.
+        locked_until (Optional[datetime]): The end of the lease of the worker. A running job with an expired lease is picked up again.
+        last_error (Optional[str]): The error of the last failed attempt.
+        created_date (datetime): The creation date of the job.
+        modified_date (datetime): The last modification date of the job.
+
+    Relationships:
+        twin_aspect (TwinAspect): The twin aspect to register.
+        enablement_service_stack (EnablementServiceStack): The enablement service stack to register the aspect in.
+
+    Table Name:
+        twin_aspect_registration_job
+    """
+    id: Optional[int] = Field(default=None, primary_key=True)
+    job_id: UUID = Field(default_factory=uuid4, unique=True, description="The public ID of the job.")
+    twin_aspect_id: int = Field(index=True, foreign_key="twin_aspect.id", description="The ID of the twin aspect to register.")
+    enablement_service_stack_id: int = Field(foreign_key="enablement_service_stack.id", description="The ID of the enablement service stack to register the aspect in.")
+    payload: Optional[Dict[str, Any]] = Field(default=None, sa_column=Column(JSON), description="The aspect document to store in the submodel service.")
+    status: str = Field(index=True, default=TwinAspectRegistrationJobStatus.QUEUED.value, description="The processing status of the job.")
+    attempts: int = Field(default=0, description="How many times a worker picked up the job.")
+    next_attempt_date: datetime = Field(index=True, default_factory=utc_now_naive, description="The job is not picked up before this date.")
+    locked_by: Optional[str] = Field(default=None, description="The worker currently processing the job.")
+    locked_until: Optional[datetime] = Field(default=None, description="The end of the lease of the worker processing the job.")
+    last_error: Optional[str] = Field(default=None, description="The error of the last failed attempt.")
+    created_date: datetime = Field(default_factory=utc_now_naive, description="The creation date of the job.")
+    modified_date: datetime = Field(default_factory=utc_now_naive, description="The last modification date of the job.")
+
+    # Relationships
+    twin_aspect: TwinAspect = Relationship()
+    enablement_service_stack: EnablementServiceStack = Relationship()
+
+    __tablename__ = "twin_aspect_registration_job"
+
 
 class TwinExchange(SQLModel, table=True):
     """
@@ -679,4 +736,22 @@ class TwinRegistration(SQLModel, table=True):
     twin: Twin = Relationship(back_populates="twin_registrations")
     enablement_service_stack: EnablementServiceStack = Relationship(back_populates="twin_registrations")
 
-    __tablename__ = "twin_registration"
\ No newline at end of file
+    __tablename__ = "twin_registration"
+
+class KnownOffers(SQLModel):
+    """
+    Represents an EDC offer component (asset, policy or contract definition) that is known to exist in the provider connector.
+
+    This table lets the asset synchronization job and every backend replica share which deterministic
+    offer IDs were already verified or created, so that they are not looked up again in the EDC.
+
+    Attributes:
+        offer_id (str): The ID of the asset, policy or contract definition in the EDC.
+        offer_type (str): The type of the offer component ("asset", "policy" or "contract").
+        fingerprint (Optional[str]): Hash of the state the component was verified with (e.g. the asset data-address headers).
+        verified_at (datetime): When the component was last verified or created in the EDC.
+    """
+    offer_id: str = Field(primary_key=True, description="The ID of the asset, policy or contract definition in the EDC.")
+    offer_type: str = Field(index=True, description="The type of the offer component (asset, policy or contract).")
+    fingerprint: Optional[str] = Field(default=None, description="Hash of the state the component was verified with.")
+    verified_at: datetime = Field(default_factory=datetime.now, description="When the component was last verified in the EDC.")
@@ -84,6 +84,10 @@ class DiscoverDppResponse(BaseModel):
         None,
         description="The consumed DPP data"
     )
+    version: Optional[int] = Field(
+        None,
+        description="Version of the task state, incremented on every change. Pass it back to wait for the next change"
+    )
 
     class Config:
         populate_by_name = True
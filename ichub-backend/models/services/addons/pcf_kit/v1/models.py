@@ -128,6 +128,12 @@ class PcfSubPartModel(BaseModel):
         alias="bpn",
         description="The Business Partner Number (BPN) associated with the sub-part."
     )
+    quantity: float = Field(
+        default=1.0,
+        gt=0,
+        alias="quantity",
+        description="Declared units of the sub-part contained in one declared unit of the main part, used to roll up the PCF."
+    )
 
 class PcfSpecificStateModel(BaseModel):
     """Model for representing the global state of PCF exchanges."""
@@ -151,4 +157,28 @@ class PcfSpecificStateModel(BaseModel):
     overall_status: str = Field(
         alias="overallStatus",
         description="Overall status of the PCF exchange for the main part (e.g., pending, in progress, completed)."
-    )
\ No newline at end of file
+    )
+
+class PcfRollupModel(BaseModel):
+    """Model for the cradle-to-gate PCF of a part rolled up over its bill of materials."""
+    model_config = ConfigDict(populate_by_name=True)
+
+    manufacturer_part_id: str = Field(
+        alias="manufacturerPartId"
+    )
+    pcf_excluding_biogenic: Optional[float] = Field(
+        default=None,
+        alias="pcfExcludingBiogenic",
+        description="Quantity-weighted sum of the received PCF values (kg CO2e per declared unit) over all levels of the bill of materials."
+    )
+    total_parts: int = Field(
+        alias="totalParts",
+        description="Number of sub-parts over all levels of the bill of materials."
+    )
+    missing_parts: int = Field(
+        alias="missingParts",
+        description="Number of sub-parts without a PCF value, not included in the total."
+    )
+    complete: bool = Field(
+        description="Whether every sub-part has a PCF value."
+    )
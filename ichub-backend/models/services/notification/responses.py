@@ -43,7 +43,7 @@ class NotificationResponse(BaseModel):
     direction: str
     status: str
     use_case: Optional[str] = None
-    full_notification: Dict[str, Any]
+    full_notification: Optional[Dict[str, Any]] = None
 
     model_config = ConfigDict(
         from_attributes=True,
@@ -38,6 +38,7 @@ from models.services.provider.part_management import (
     SerializedPartDetailsRead,
 )
 from models.services.provider.partner_management import DataExchangeAgreementRead
+from models.metadata_database.provider.models import TwinAspectRegistrationJobStatus
 
 class TwinAspectRegistrationStatus(enum.Enum):
     """An enumeration of potential status values when a twin aspect is registered within the system"""
@@ -149,3 +150,36 @@ class SerializedPartTwinUnshareCreate(BaseModel):
     business_partner_number_to_unshare: list[str] = Field(alias="businessPartnerNumberToUnshare", description="The business partner number of the business partner with which the serialized part twin should be unshared.")
     manufacturer_id: str = Field(alias="manufacturerId", description="The manufacturer ID of the serialized part twin to unshare.")
     asset_id_names_filter: Optional[List[str]] = Field(alias="assetIdNamesFilter", description="An optional list of asset ID names to filter the serialized part twin unshare operation. If provided, only asset IDs with names in this list will be considered for unsharing.", default=None)
+
+class TwinBulkCreateItemResult(BaseModel):
+    """Represents the outcome of a single item of a bulk twin creation."""
+
+    index: int = Field(description="The position of the item within the bulk request.")
+    manufacturer_id: str = Field(alias="manufacturerId", description="The BPNL (manufactuer ID) of the part of the item.")
+    manufacturer_part_id: str = Field(alias="manufacturerPartId", description="The manufacturer part ID of the part of the item.")
+    part_instance_id: Optional[str] = Field(alias="partInstanceId", description="The part instance ID of the item (only for serialized parts).", default=None)
+    success: bool = Field(description="Whether the twin of the item was created and registered in the Digital Twin Registry.")
+    twin: Optional[TwinRead] = Field(description="The twin of the item, if it exists in the database.", default=None)
+    error: Optional[str] = Field(description="The reason why the item failed.", default=None)
+
+class TwinBulkCreateRead(BaseModel):
+    """Represents the outcome of a bulk twin creation."""
+
+    total: int = Field(description="The number of items in the bulk request.")
+    succeeded: int = Field(description="The number of items that were processed successfully.")
+    failed: int = Field(description="The number of items that failed.")
+    results: List[TwinBulkCreateItemResult] = Field(description="The outcome of every item, in the order of the bulk request.")
+
+class TwinAspectRegistrationJobRead(BaseModel):
+    """Represents a queued registration of a twin aspect, processed in the background by the aspect registration workers."""
+
+    job_id: UUID = Field(alias="jobId", description="The ID of the registration job.")
+    global_id: UUID = Field(alias="globalId", description="The Catena-X ID / global ID of the digital twin the aspect belongs to.")
+    semantic_id: str = Field(alias="semanticId", description="The semantic ID of the aspect.")
+    submodel_id: UUID = Field(alias="submodelId", description="The ID of the submodel descriptor within the DTR shell descriptor for the associated twin.")
+    status: TwinAspectRegistrationJobStatus = Field(description="The processing status of the job.")
+    registration_status: TwinAspectRegistrationStatus = Field(alias="registrationStatus", description="The registration status reached so far.")
+    attempts: int = Field(description="How many times a worker picked up the job.")
+    last_error: Optional[str] = Field(alias="lastError", description="The error of the last failed attempt.", default=None)
+    created_date: datetime = Field(alias="createdDate", description="The date when the job was queued.")
+    modified_date: datetime = Field(alias="modifiedDate", description="The date when the job last changed.")
@@ -44,6 +44,7 @@ from tractusx_sdk.industry.services.notifications.exceptions import Notification
 from connector import connector_manager, consumer_connector_service
 from managers.config.config_manager import ConfigManager
 from managers.config.log_manager import LoggingManager
+from managers.enablement_services.consumer.edr_reuse_policy import edr_reuse_policy
 from utils.log_utils import sanitize_log_value as _s
 from models.services.addons.ccm_kit.v1.notifications import CcmSendResult
 from tools.constants import CCM_DCT_TYPE
@@ -88,8 +89,9 @@ class CcmBaseService:
 
     def _evict_edr_cache(self, bpnl: str) -> None:
         """
-        Clear any stale EDR cache entries for the given counterparty before
-        starting a fresh DSP negotiation.
+        Clear the EDR cache entries of the connector SDK for the given
+        counterparty, once it refused a token, so that the next DSP
+        negotiation starts fresh.
 
         In Saturn the cache is keyed by the counterparty DID.  We resolve the
         DID first for a precise eviction; if discovery fails we fall back to
@@ -193,9 +195,6 @@ class CcmBaseService:
 
         policies = policies if policies is not None else self._resolve_policies()
 
-        # Evict any stale EDR for this counterparty before negotiating.
-        self._evict_edr_cache(target_bpn)
-
         notification_service = NotificationConsumerService(
             consumer_connector_service,
             verbose=bool(
@@ -206,18 +205,22 @@ class CcmBaseService:
         )
 
         try:
-            endpoint, token = notification_service.get_notification_endpoint_with_bpnl(
-                bpnl=target_bpn,
-                counter_party_address=dsp_url,
-                policies=policies,
-                dct_type=CCM_DCT_TYPE,
-            )
-
-            provider_body = notification_service.send_notification_to_endpoint(
-                endpoint_url=endpoint,
-                access_token=token,
-                notification=notification,
-                endpoint_path=endpoint_path,
+            # Reuse the EDR of the target's CCM endpoint while its token is valid.
+            provider_body = edr_reuse_policy.call(
+                edr_reuse_policy.key(target_bpn, dsp_url, CCM_DCT_TYPE, policies),
+                negotiate=lambda: notification_service.get_notification_endpoint_with_bpnl(
+                    bpnl=target_bpn,
+                    counter_party_address=dsp_url,
+                    policies=policies,
+                    dct_type=CCM_DCT_TYPE,
+                ),
+                request=lambda endpoint, token: notification_service.send_notification_to_endpoint(
+                    endpoint_url=endpoint,
+                    access_token=token,
+                    notification=notification,
+                    endpoint_path=endpoint_path,
+                ),
+                on_rejected=lambda: self._evict_edr_cache(target_bpn),
             )
 
             message_id = str(notification.header.message_id)
@@ -43,6 +43,7 @@ import requests as http_requests
 from connector import consumer_connector_service
 from managers.config.config_manager import ConfigManager
 from managers.config.log_manager import LoggingManager
+from managers.enablement_services.consumer.edr_reuse_policy import edr_reuse_policy
 from managers.metadata_database.manager import RepositoryManagerFactory
 from models.metadata_database.addons.ccm_kit.v1.models import (
     CcmReceived,
@@ -406,6 +407,7 @@ class CcmConsumerService(CcmBaseService):
         2. Perform the full DSP exchange (catalog → contract negotiation → EDR)
            via ``do_dsp_with_bpnl``, which handles Saturn BPN→DID resolution
            internally and polls for the EDR with configurable ``max_wait``.
+           The EDR of the document is reused while its token is valid.
         3. Retrieve the certificate data via the data plane.
         4. Store the certificate in the local ``ccm_received`` table.
 
@@ -455,33 +457,42 @@ class CcmConsumerService(CcmBaseService):
                     operator="=",
                 )
             ]
-            # Evict any stale EDR for this counterparty before negotiating.
-            self._evict_edr_cache(provider_bpn)
+            timeout_sec = int(
+                ConfigManager.get_config(
+                    "consumer.ccm.data_plane_timeout_sec", default=60
+                )
+            )
 
             # Performs catalog lookup → contract negotiation → EDR polling.
             # do_dsp_with_bpnl handles Saturn BPN→DID resolution internally;
             # for Jupiter it passes the BPN directly as counter_party_id.
-            endpoint, token = consumer_connector_service.do_dsp_with_bpnl(
-                bpnl=provider_bpn,
-                counter_party_address=dsp_url,
-                filter_expression=filter_expression,
-                policies=policies,
-                max_wait=max_wait,
-                poll_interval=1,
-            )
-            if not endpoint or not token:
-                raise RuntimeError("DSP exchange did not return endpoint or token.")
+            def negotiate():
+                endpoint, token = consumer_connector_service.do_dsp_with_bpnl(
+                    bpnl=provider_bpn,
+                    counter_party_address=dsp_url,
+                    filter_expression=filter_expression,
+                    policies=policies,
+                    max_wait=max_wait,
+                    poll_interval=1,
+                )
+                if not endpoint or not token:
+                    raise RuntimeError("DSP exchange did not return endpoint or token.")
+                return endpoint, token
 
-            headers = consumer_connector_service.get_data_plane_headers(
-                access_token=token
-            )
-            timeout_sec = int(
-                ConfigManager.get_config(
-                    "consumer.ccm.data_plane_timeout_sec", default=60
+            def fetch(endpoint, token):
+                headers = consumer_connector_service.get_data_plane_headers(
+                    access_token=token
                 )
+                response = http_requests.get(endpoint, headers=headers, timeout=timeout_sec)
+                response.raise_for_status()
+                return response
+
+            response = edr_reuse_policy.call(
+                edr_reuse_policy.key(provider_bpn, dsp_url, document_id, policies),
+                negotiate=negotiate,
+                request=fetch,
+                on_rejected=lambda: self._evict_edr_cache(provider_bpn),
             )
-            response = http_requests.get(endpoint, headers=headers, timeout=timeout_sec)
-            response.raise_for_status()
             certificate_data = response.json()
         except ValueError as json_err:
             logger.error(
@@ -40,13 +40,16 @@ data-plane proxy — exactly mirroring the consumer-side send pattern.
 """
 
 import base64
+import json
 import uuid
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from managers.config.config_manager import ConfigManager
 from managers.config.log_manager import LoggingManager
+from managers.addons_service.ccm_kit.v1.document_cache import CachedDocument, ccm_document_cache
 from managers.metadata_database.manager import RepositoryManagerFactory
 from utils.log_utils import sanitize_log_value as _s
+from tools.crypt_tools import blake2b_128bit
 from tools.exceptions import AlreadyExistsError, InvalidError, NotFoundError
 from models.services.addons.ccm_kit.v1.notifications import (
     CcmAvailableRequest,
@@ -72,6 +75,9 @@ from tools.constants import (
 
 logger = LoggingManager.get_logger(__name__)
 
+# Size of the Base64 slices written by the streamed payload endpoint.
+PAYLOAD_CHUNK_SIZE = 64 * 1024
+
 
 def _safe_parse_rejection_reason(raw: Optional[str]) -> Optional[RejectionReasonPayload]:
     """
@@ -144,7 +150,9 @@ class CcmProviderService(CcmBaseService):
                 return CcmSendResult(success=False, error=msg)
 
             # --- 2. Build push payload ---
-            content_fields = self._build_push_content(ccm)
+            content_fields = self._build_push_content(
+                ccm, self._get_document(ccm).content_base64
+            )
             certified_bpn = ccm.bpnl
             certificate_type_val = ccm.certificate_type
             cert_canonical_sites = self._canonicalize_location_bpns(
@@ -619,14 +627,62 @@ class CcmProviderService(CcmBaseService):
             ccm = repo.ccm_repository.find_by_id_with_relations(certificate_id)
             if ccm is None:
                 raise NotFoundError(f"Certificate with ID {certificate_id} not found.")
-            return self._build_push_content(ccm)
+            return self._build_push_content(ccm, self._get_document(ccm).content_base64)
+
+    def stream_certificate_payload(self, certificate_id: int) -> Tuple[str, Iterator[bytes]]:
+        """
+        Return the ETag and a chunked serialisation of the certificate payload.
+
+        The metadata is serialised once and the cached Base64 document is
+        written in ``PAYLOAD_CHUNK_SIZE`` slices, so a pull never builds a
+        second copy of the whole document in memory.  The ETag is derived from
+        the metadata and the digest of the PDF bytes.
+
+        Args:
+            certificate_id: Primary key of the certificate in the local DB.
+
+        Returns:
+            Tuple of the quoted ETag and an iterator over the JSON body.
+
+        Raises:
+            NotFoundError: If the certificate is not found.
+        """
+        with RepositoryManagerFactory.create() as repo:
+            ccm = repo.ccm_repository.find_by_id_with_relations(certificate_id)
+            if ccm is None:
+                raise NotFoundError(f"Certificate with ID {certificate_id} not found.")
+            document = self._get_document(ccm)
+            placeholder = uuid.uuid4().hex
+            content = self._build_push_content(ccm, placeholder)
+
+        prefix, _, suffix = json.dumps(content).partition(placeholder)
+        etag = f'"{blake2b_128bit(prefix + document.digest + suffix)}"'
+
+        def chunks() -> Iterator[bytes]:
+            yield prefix.encode("utf-8")
+            encoded = document.content_base64
+            for start in range(0, len(encoded), PAYLOAD_CHUNK_SIZE):
+                yield encoded[start:start + PAYLOAD_CHUNK_SIZE].encode("ascii")
+            yield suffix.encode("utf-8")
+
+        return etag, chunks()
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _build_push_content(ccm) -> Dict:
+    def _get_document(ccm) -> CachedDocument:
+        """
+        Return the encoded document of a certificate from the document cache.
+        The deferred ``doc`` column is only read on a cache miss, so the
+        session the certificate was loaded with must still be open.
+        """
+        version = ccm.updated_at.isoformat() if ccm.updated_at else ""
+        return ccm_document_cache.get_or_load(ccm.id, version, lambda: ccm.doc)
+
+    @staticmethod
+    def _build_push_content(ccm, content_base64: Optional[str] = None) -> Dict:
         """
         Serialise a ``Ccm`` database entity into the CX-0135 push content
         dictionary.
@@ -634,10 +690,13 @@ class CcmProviderService(CcmBaseService):
         The structure mirrors the CX-0135 §2.1.1 push payload exactly:
         ``businessPartnerNumber``, ``type``, ``enclosedSites``, ``document``,
         ``issuer``, ``validator``, etc.
+
+        ``content_base64`` is the already encoded document; when omitted the
+        ``doc`` bytes of the entity are encoded.
         """
         # Base64-encode the binary document
-        doc_b64 = ""
-        if ccm.doc:
+        doc_b64 = content_base64 if content_base64 is not None else ""
+        if content_base64 is None and ccm.doc:
             doc_b64 = base64.b64encode(ccm.doc).decode("ascii")
 
         # --- type block (required + optional certificateVersion) ---
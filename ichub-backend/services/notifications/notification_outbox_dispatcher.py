@@ -0,0 +1,318 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import json
+import os
+import socket
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Dict, List, Optional, Set
+from uuid import UUID
+
+from managers.config.config_manager import ConfigManager
+from managers.config.log_manager import LoggingManager
+from managers.metadata_database.manager import RepositoryManagerFactory
+from models.metadata_database.notification.models import NotificationOutboxStatus, NotificationStatus
+from services.notifications.notifications_management_service import NotificationsManagementService
+from tools.datetime_tools import utc_now_naive
+
+logger = LoggingManager.get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class _OutboxItem:
+    """The claimed outbox entry, detached from the session that claimed it."""
+    id: int
+    message_id: UUID
+    receiver_bpn: str
+    provider_dsp_url: Optional[str]
+    endpoint_path: Optional[str]
+    policies: Optional[list]
+    dct_type: Optional[str]
+
+    def transfer_key(self) -> tuple:
+        """Entries with the same key are sent over the same negotiated transfer."""
+        return (self.provider_dsp_url, self.endpoint_path, self.dct_type, json.dumps(self.policies, sort_keys=True))
+
+
+class NotificationOutboxDispatcher:
+    """
+    Sends the outgoing notifications queued in the notification outbox (see NotificationsManagementService.enqueue_notification).
+
+    A polling thread claims the due entries of one receiver at a time from the notification_outbox table with
+    SELECT ... FOR UPDATE SKIP LOCKED, so every receiver only costs one catalog request, contract negotiation and
+    transfer per batch instead of one per notification. Any number of backend replicas and separate dispatcher
+    processes can share the outbox. Notifications that could not be sent are retried with exponential backoff;
+    after ``max_attempts`` they are marked as failed.
+
+    Like the AspectRegistrationWorker, the polling thread renews the lease of the entries being sent, as a batch
+    may take longer than ``lease_seconds``. Entries whose lease was lost are neither sent nor recorded anymore.
+    """
+
+    _instance: Optional['NotificationOutboxDispatcher'] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, notifications_service: Optional[NotificationsManagementService] = None, workers: int = 2, batch_size: int = 50, poll_interval: float = 2,
+                 lease_seconds: float = 120, max_attempts: int = 8, retry_backoff: float = 15, max_retry_backoff: float = 900):
+        """
+        Initialize the dispatcher.
+
+        Args:
+            notifications_service (NotificationsManagementService, optional): Service sending the notifications. Defaults to a new service.
+            workers (int, optional): Maximum number of receivers served at the same time. Defaults to 2.
+            batch_size (int, optional): Maximum number of notifications sent to one receiver over a single transfer. Defaults to 50.
+            poll_interval (float, optional): Seconds to wait before polling again when no entry was due. Defaults to 2.
+            lease_seconds (float, optional): Seconds a claimed batch stays with this dispatcher before another one may take it over. Defaults to 120.
+            max_attempts (int, optional): Attempts after which a notification is marked as failed. Defaults to 8.
+            retry_backoff (float, optional): Seconds before the first retry, doubled with every further attempt. Defaults to 15.
+            max_retry_backoff (float, optional): Upper bound of the retry delay in seconds. Defaults to 900.
+        """
+        self.notifications_service = notifications_service or NotificationsManagementService()
+        self.workers = max(1, workers)
+        self.batch_size = max(1, batch_size)
+        self.poll_interval = max(0.1, poll_interval)
+        self.lease_seconds = max(1.0, lease_seconds)
+        self.max_attempts = max(1, max_attempts)
+        self.retry_backoff = max(0.0, retry_backoff)
+        self.max_retry_backoff = max(self.retry_backoff, max_retry_backoff)
+        self.worker_id = f"{socket.gethostname()}-{os.getpid()}"
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="notification-outbox")
+        self._slots = threading.Semaphore(self.workers)
+        self._running: Set[int] = set()
+        self._running_lock = threading.Lock()
+        self._heartbeat_interval = self.lease_seconds / 3
+        self._last_heartbeat = time.monotonic()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def get_instance(cls) -> 'NotificationOutboxDispatcher':
+        """Return the process-wide dispatcher, creating it from the configuration on first use."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls(
+                    workers=int(ConfigManager.get_config("provider.notificationOutbox.workers", default=2)),
+                    batch_size=int(ConfigManager.get_config("provider.notificationOutbox.batch_size", default=50)),
+                    poll_interval=float(ConfigManager.get_config("provider.notificationOutbox.poll_interval", default=2)),
+                    lease_seconds=float(ConfigManager.get_config("provider.notificationOutbox.lease_seconds", default=120)),
+                    max_attempts=int(ConfigManager.get_config("provider.notificationOutbox.max_attempts", default=8)),
+                    retry_backoff=float(ConfigManager.get_config("provider.notificationOutbox.retry_backoff", default=15)),
+                    max_retry_backoff=float(ConfigManager.get_config("provider.notificationOutbox.max_retry_backoff", default=900)),
+                )
+            return cls._instance
+
+    @classmethod
+    def shutdown_instance(cls) -> None:
+        """Stop the process-wide dispatcher, if it was created."""
+        with cls._instance_lock:
+            if cls._instance is not None:
+                cls._instance.stop()
+                cls._instance = None
+
+    def start(self) -> None:
+        """Start polling the outbox in the background."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._loop, name="notification-outbox-poller", daemon=True)
+        self._thread.start()
+        logger.info(f"[NotificationOutboxDispatcher] Started dispatcher [{self.worker_id}] with {self.workers} slot(s).")
+
+    def stop(self) -> None:
+        """Stop polling and wait for the running batches. Entries still queued stay in the table."""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=self.poll_interval + 5)
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def wait(self) -> None:
+        """Block until the dispatcher is stopped (used by the standalone dispatcher process)."""
+        while self._thread and self._thread.is_alive():
+            self._thread.join(timeout=1)
+
+    def _loop(self) -> None:
+        while not self._stop_event.is_set():
+            claimed = 0
+            try:
+                claimed = self.run_once()
+            except Exception as e:
+                logger.warning(f"[NotificationOutboxDispatcher] Polling the notification outbox failed: {e}")
+            try:
+                self.renew_leases()
+            except Exception as e:
+                logger.warning(f"[NotificationOutboxDispatcher] Renewing the leases of the claimed entries failed: {e}")
+            if not claimed:
+                self._stop_event.wait(min(self.poll_interval, self._heartbeat_interval))
+
+    def renew_leases(self, force: bool = False) -> None:
+        """
+        Extend the lease of the entries being sent, so that no other dispatcher claims them meanwhile.
+
+        Args:
+            force (bool, optional): Renew even if the heartbeat interval did not pass yet. Defaults to False.
+        """
+        now = time.monotonic()
+        if not force and now - self._last_heartbeat < self._heartbeat_interval:
+            return
+        self._last_heartbeat = now
+        with self._running_lock:
+            entry_ids = list(self._running)
+        if not entry_ids:
+            return
+
+        with RepositoryManagerFactory.create() as repo:
+            renewed = repo.notification_outbox_repository.renew_leases(
+                entry_ids,
+                worker_id=self.worker_id,
+                lease_seconds=self.lease_seconds
+            )
+            repo.commit()
+
+        lost = set(entry_ids) - set(renewed)
+        if lost:
+            logger.warning(f"[NotificationOutboxDispatcher] Lost the lease of {len(lost)} outbox entry(ies) to another dispatcher.")
+            with self._running_lock:
+                self._running -= lost
+
+    def _owned(self, items: List[_OutboxItem]) -> List[_OutboxItem]:
+        """Keep the items whose lease this dispatcher still holds."""
+        with self._running_lock:
+            return [item for item in items if item.id in self._running]
+
+    def run_once(self) -> int:
+        """
+        Claim one batch of due entries per idle slot, each batch addressed to a single receiver, and hand them to the pool.
+
+        Returns:
+            int: The number of claimed entries.
+        """
+        claimed = 0
+        while self._slots.acquire(blocking=False):
+            items = []
+            try:
+                with RepositoryManagerFactory.create() as repo:
+                    entries = repo.notification_outbox_repository.claim_next_group(
+                        worker_id=self.worker_id,
+                        limit=self.batch_size,
+                        lease_seconds=self.lease_seconds
+                    )
+                    items = [
+                        _OutboxItem(
+                            id=entry.id,
+                            message_id=entry.message_id,
+                            receiver_bpn=entry.receiver_bpn,
+                            provider_dsp_url=entry.provider_dsp_url,
+                            endpoint_path=entry.endpoint_path,
+                            policies=entry.policies,
+                            dct_type=entry.dct_type
+                        ) for entry in entries
+                    ]
+                    repo.commit()
+            finally:
+                if not items:
+                    self._slots.release()
+
+            if not items:
+                break
+            with self._running_lock:
+                self._running.update(item.id for item in items)
+            self._executor.submit(self._process, items)
+            claimed += len(items)
+        return claimed
+
+    def _process(self, items: List[_OutboxItem]) -> None:
+        try:
+            transfers: Dict[tuple, List[_OutboxItem]] = defaultdict(list)
+            for item in items:
+                transfers[item.transfer_key()].append(item)
+
+            errors: Dict[UUID, Optional[str]] = {}
+            for group in transfers.values():
+                group = self._owned(group)
+                if not group:
+                    continue
+                first = group[0]
+                message_ids = [item.message_id for item in group]
+                try:
+                    errors.update(self.notifications_service.send_notifications(
+                        message_ids=message_ids,
+                        provider_bpn=first.receiver_bpn,
+                        provider_dsp_url=first.provider_dsp_url,
+                        list_policies=first.policies,
+                        dct_type=first.dct_type,
+                        endpoint_url=first.endpoint_path
+                    ))
+                except Exception as e:
+                    errors.update((message_id, str(e)) for message_id in message_ids)
+            self._record_results(self._owned(items), errors)
+        finally:
+            with self._running_lock:
+                self._running.difference_update(item.id for item in items)
+            self._slots.release()
+
+    def _record_results(self, items: List[_OutboxItem], errors: Dict[UUID, Optional[str]]) -> None:
+        """
+        Mark the sent entries and queue the failed ones again with backoff, in one transaction.
+
+        Only the entries still leased to this dispatcher are updated, the ones taken over meanwhile are left to their new owner.
+        """
+        sent = [item for item in items if item.message_id in errors and errors[item.message_id] is None]
+        sent_ids = {item.id for item in sent}
+        failed = {item.id: errors.get(item.message_id) or "Not sent" for item in items if item.id not in sent_ids}
+        try:
+            with RepositoryManagerFactory.create() as repo:
+                marked = set(repo.notification_outbox_repository.mark_sent([item.id for item in sent], worker_id=self.worker_id))
+                repo.notification_repository.update_status_by_message_ids([item.message_id for item in sent if item.id in marked], NotificationStatus.SENT)
+
+                given_up = []
+                now = utc_now_naive()
+                db_entries = repo.notification_outbox_repository.find_by_ids(list(failed), locked_by=self.worker_id)
+                for db_entry in db_entries:
+                    error = failed[db_entry.id]
+                    if db_entry.attempts >= self.max_attempts:
+                        db_entry.status = NotificationOutboxStatus.FAILED.value
+                        given_up.append(db_entry.message_id)
+                        logger.error(f"[NotificationOutboxDispatcher] Notification [{db_entry.message_id}] to [{db_entry.receiver_bpn}] failed after {db_entry.attempts} attempt(s): {error}")
+                    else:
+                        delay = min(self.retry_backoff * 2 ** (db_entry.attempts - 1), self.max_retry_backoff)
+                        db_entry.status = NotificationOutboxStatus.QUEUED.value
+                        db_entry.next_attempt_date = now + timedelta(seconds=delay)
+                        logger.warning(f"[NotificationOutboxDispatcher] Notification [{db_entry.message_id}] to [{db_entry.receiver_bpn}] failed (attempt {db_entry.attempts}), retrying in {delay:.0f}s: {error}")
+                    db_entry.locked_by = None
+                    db_entry.locked_until = None
+                    db_entry.last_error = error
+                    db_entry.modified_date = now
+                repo.notification_repository.update_status_by_message_ids(given_up, NotificationStatus.FAILED)
+                repo.commit()
+
+            dropped = len(items) - len(marked) - len(db_entries)
+            if dropped:
+                logger.warning(f"[NotificationOutboxDispatcher] {dropped} notification result(s) dropped, their entries were taken over by another dispatcher.")
+        except Exception as e:
+            # The lease expires and another dispatcher picks the entries up again; the receivers
+            # deduplicate the notifications sent twice by their messageId
+            logger.error(f"[NotificationOutboxDispatcher] Could not record the result of {len(items)} notification(s): {e}")
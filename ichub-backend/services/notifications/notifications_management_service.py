@@ -24,7 +24,7 @@
 import re
 from datetime import datetime, timezone
 from uuid import UUID
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 
 from tractusx_sdk.industry.models.notifications import Notification
 from tractusx_sdk.industry.services.notifications import NotificationConsumerService
@@ -36,6 +36,7 @@ from managers.config.config_manager import ConfigManager
 from managers.config.log_manager import LoggingManager
 from managers.metadata_database.manager import RepositoryManagerFactory
 from managers.enablement_services.submodel_service_manager import SubmodelServiceManager
+from managers.enablement_services.consumer.edr_reuse_policy import edr_reuse_policy
 from models.metadata_database.notification.models import NotificationStatus, NotificationDirection, NotificationEntity
 from models.services.notification.responses import NotificationResponse
 from tools.exceptions import NotificationCreationError, NotificationUpdateStatusError, NotificationRetrievalError, NotificationDeleteError, NotificationSendingError
@@ -54,8 +55,19 @@ class NotificationsManagementService():
     """
 
     def __init__(self):
-        self.connector_consumer_service: BaseConnectorConsumerService = connector_manager.consumer.connector_service
-        self.submodel_service_manager = SubmodelServiceManager()
+        self._connector_consumer_service: Optional[BaseConnectorConsumerService] = None
+        self.submodel_service_manager = SubmodelServiceManager.get_instance()
+
+    @property
+    def connector_consumer_service(self) -> BaseConnectorConsumerService:
+        # Resolved on first use, the connector is started in the background after the service is created
+        if self._connector_consumer_service is None:
+            self._connector_consumer_service = connector_manager.consumer.connector_service
+        return self._connector_consumer_service
+
+    @connector_consumer_service.setter
+    def connector_consumer_service(self, connector_consumer_service: BaseConnectorConsumerService) -> None:
+        self._connector_consumer_service = connector_consumer_service
 
     @staticmethod
     def _derive_endpoint_path(context: str) -> str:
@@ -91,8 +103,8 @@ class NotificationsManagementService():
 
     def _purge_edrs_for_notification(self, provider_bpn: str) -> None:
         """
-        Before sending a notification, remove any cached EDR for this provider's
-        notification assets so we never reuse a stale token.
+        Remove the EDRs cached for this provider's notification assets, called
+        when the provider refused a token so the next transfer is negotiated anew.
         """
         rows = dtr_manager.purge_edrs_matching(
             counter_party_id=provider_bpn,
@@ -102,6 +114,56 @@ class NotificationsManagementService():
             f"[Notifications] Purged {rows} stale EDR(s) for provider [{provider_bpn}]"
         )
 
+    @staticmethod
+    def _negotiate_notification_endpoint(notification_service: NotificationConsumerService, provider_bpn: str, provider_dsp_url: str, policies: List[Dict], dct_type: str) -> Tuple[str, str]:
+        """
+        Negotiate a transfer for the provider's notification endpoint and return its dataplane URL and access token.
+
+        get_notification_endpoint_with_bpnl is used so that Saturn connectors resolve the
+        BPN to its DID (counterPartyId) via connector discovery before the catalog request.
+        """
+        return notification_service.get_notification_endpoint_with_bpnl(
+            bpnl=provider_bpn,
+            counter_party_address=provider_dsp_url,
+            policies=policies,
+            dct_type=dct_type,
+        )
+
+    @staticmethod
+    def _resolve_dsp_url(provider_bpn: str, provider_dsp_url: Optional[str]) -> str:
+        """
+        Return the given DSP URL, or the first connector discovered for the provider BPN.
+        """
+        if provider_dsp_url:
+            return provider_dsp_url
+
+        connectors = connector_manager.consumer.get_connectors(provider_bpn)
+        if not connectors:
+            raise NotificationSendingError(
+                f"No connector DSP URL found for provider BPN [{provider_bpn}]. "
+                "Please provide provider_dsp_url explicitly."
+            )
+        logger.debug(
+            f"[Notifications] No provider_dsp_url provided; using discovered "
+            f"DSP URL [{connectors[0]}] for BPN [{provider_bpn}]"
+        )
+        return connectors[0]
+
+    @staticmethod
+    def _resolve_policies(list_policies=_USE_CONFIG_POLICIES) -> Optional[List]:
+        """
+        Resolve the accepted policies: explicit None means accept any policy from the provider,
+        the sentinel (default) means use the configured fallback, an explicit list is used as-is.
+        """
+        if list_policies is _USE_CONFIG_POLICIES:
+            dte_policy = ConfigManager.get_config("provider.digitalTwinEventAPI.policy.consumption")
+            if dte_policy:
+                logger.debug("[Notifications] Using provider.digitalTwinEventAPI.policy.consumption from configuration")
+                return [dte_policy]
+            logger.warning("[Notifications] No consumption policy configured; will reject all offers")
+            return []
+        return list_policies
+
     def notification_exists(self, message_id: UUID) -> bool:
         """Check whether a notification with the given messageId already exists."""
         with RepositoryManagerFactory().create() as repos:
@@ -148,6 +210,45 @@ class NotificationsManagementService():
             logger.error(f"Error creating notification: {e}")
             raise NotificationCreationError(f"Failed to create notification: {e}")
 
+    def enqueue_notification(self, notification: Notification, use_case: str = None, endpoint_url: Optional[str] = None, provider_dsp_url: Optional[str] = None, list_policies=_USE_CONFIG_POLICIES, dct_type: Optional[str] = None) -> NotificationEntity:
+        """
+        Create an outgoing notification and queue it in the notification outbox.
+
+        The notification and its outbox entry are stored in the same transaction, the
+        NotificationOutboxDispatcher sends it afterwards to ``header.receiver_bpn``.
+        The arguments have the same meaning as in ``send_notification``; the policies
+        are resolved now, the DSP URL and endpoint path when the notification is sent.
+        """
+        try:
+            logger.info(f"Queueing outgoing notification with ID: {notification.header.message_id}")
+            payload = notification.model_dump(mode="json", by_alias=True)
+            self.submodel_service_manager.upload_twin_aspect_document(
+                submodel_id=notification.header.message_id,
+                semantic_id=SEM_ID_NOTIFICATION,
+                payload=payload
+            )
+            location = self._build_location(notification.header.message_id)
+            with RepositoryManagerFactory().create() as repos:
+                notification_data = repos.notification_repository.create_new(
+                    notification=notification,
+                    direction=NotificationDirection.OUTGOING,
+                    status=NotificationStatus.PENDING,
+                    use_case=use_case,
+                    location=location
+                )
+                repos.notification_outbox_repository.create_new(
+                    message_id=notification.header.message_id,
+                    receiver_bpn=notification.header.receiver_bpn,
+                    provider_dsp_url=provider_dsp_url,
+                    endpoint_path=endpoint_url,
+                    policies=self._resolve_policies(list_policies),
+                    dct_type=dct_type
+                )
+                return notification_data
+        except Exception as e:
+            logger.error(f"Error queueing notification: {e}")
+            raise NotificationCreationError(f"Failed to queue notification: {e}")
+
     def update_notification_status(self, message_id: UUID, new_status: NotificationStatus) -> Optional[NotificationEntity]:
         """
         Update the status of an existing notification identified by its message_id.
@@ -160,19 +261,25 @@ class NotificationsManagementService():
             logger.error(f"Error updating notification status: {e}")
             raise NotificationUpdateStatusError(f"Failed to update notification status: {e}")
         
-    def get_all_notifications(self, bpn: str, status: Optional[NotificationStatus] = None, use_case: Optional[str] = None, offset: int = 0, limit: int = 100) -> List[NotificationResponse]:
+    def get_all_notifications(self, bpn: str, status: Optional[NotificationStatus] = None, use_case: Optional[str] = None, offset: int = 0, limit: int = 100, include_payload: bool = True) -> List[NotificationResponse]:
         """
         Retrieve all notifications from the database, optionally filtered by BPN, status, and use_case, with pagination support.
+
+        The payloads of the page are read from the submodel service in one bulk call. With
+        ``include_payload=False`` only the notification headers are returned, e.g. for list views.
         """
         try:
             with RepositoryManagerFactory().create() as repos:
                 notifications = repos.notification_repository.find_by_bpn(bpn=bpn, status=status, use_case=use_case, offset=offset, limit=limit)
-                responses: List[NotificationResponse] = []
-                for notification in notifications:
-                    payload = self.submodel_service_manager.get_twin_aspect_document(
-                        submodel_id=notification.message_id,
+                payloads: Dict[UUID, Optional[Dict]] = {}
+                if include_payload and notifications:
+                    payloads = self.submodel_service_manager.get_twin_aspect_documents(
+                        submodel_ids=[notification.message_id for notification in notifications],
                         semantic_id=SEM_ID_NOTIFICATION
                     )
+                responses: List[NotificationResponse] = []
+                for notification in notifications:
+                    payload = payloads.get(notification.message_id)
                     responses.append(NotificationResponse(
                         id=notification.id,
                         created_at=notification.created_at,
@@ -233,36 +340,10 @@ class NotificationsManagementService():
         filter for catalog negotiation.  Defaults to
         ``DIGITAL_TWIN_EVENT_API_TYPE`` when not supplied.
         """
+        resolved_dsp_url = provider_dsp_url
         try:
-            # Resolve DSP URL: use provided value or fall back to connector discovery
-            resolved_dsp_url = provider_dsp_url
-            if not resolved_dsp_url:
-                connectors = connector_manager.consumer.get_connectors(provider_bpn)
-                if not connectors:
-                    raise NotificationSendingError(
-                        f"No connector DSP URL found for provider BPN [{provider_bpn}]. "
-                        "Please provide provider_dsp_url explicitly."
-                    )
-                resolved_dsp_url = connectors[0]
-                logger.debug(
-                    f"[Notifications] No provider_dsp_url provided; using discovered "
-                    f"DSP URL [{resolved_dsp_url}] for BPN [{provider_bpn}]"
-                )
-
-            # Resolve policies: explicit None means accept any policy from provider;
-            # sentinel (default) means use config fallback; explicit list is used as-is.
-            if list_policies is _USE_CONFIG_POLICIES:
-                dte_policy = ConfigManager.get_config("provider.digitalTwinEventAPI.policy.consumption")
-                if dte_policy:
-                    resolved_policies = [dte_policy]
-                    logger.debug("[Notifications] Using provider.digitalTwinEventAPI.policy.consumption from configuration")
-                else:
-                    resolved_policies = []
-                    logger.warning("[Notifications] No consumption policy configured; will reject all offers")
-            elif list_policies is None:
-                resolved_policies = None
-            else:
-                resolved_policies = list_policies
+            resolved_dsp_url = self._resolve_dsp_url(provider_bpn, provider_dsp_url)
+            resolved_policies = self._resolve_policies(list_policies)
 
             with RepositoryManagerFactory().create() as repos:
                 db_notification = repos.notification_repository.find_by_message_id(
@@ -278,7 +359,6 @@ class NotificationsManagementService():
             notification = db_notification.to_sdk(payload)
 
             resolved_dct_type = dct_type or DIGITAL_TWIN_EVENT_API_TYPE
-            self._purge_edrs_for_notification(provider_bpn)
 
             # Stamp the actual dispatch time so sentDateTime in the payload reflects
             # when the message left this system, not when it was pre-created.
@@ -299,20 +379,18 @@ class NotificationsManagementService():
                 verbose=True
             )
 
-            # Use get_notification_endpoint_with_bpnl so that Saturn connectors
-            # resolve the BPN to its DID (counterPartyId) via connector discovery
-            # before performing the DSP catalog request.
-            edc_endpoint, access_token = notification_service.get_notification_endpoint_with_bpnl(
-                bpnl=provider_bpn,
-                counter_party_address=resolved_dsp_url,
-                policies=resolved_policies,
-                dct_type=resolved_dct_type,
-            )
-            result = notification_service.send_notification_to_endpoint(
-                endpoint_url=edc_endpoint,
-                access_token=access_token,
-                notification=notification,
-                endpoint_path=resolved_endpoint,
+            # The EDR of the provider's notification endpoint is reused until its
+            # token expires; a refused token is purged and negotiated again once.
+            result = edr_reuse_policy.call(
+                edr_reuse_policy.key(provider_bpn, resolved_dsp_url, resolved_dct_type, resolved_policies),
+                negotiate=lambda: self._negotiate_notification_endpoint(notification_service, provider_bpn, resolved_dsp_url, resolved_policies, resolved_dct_type),
+                request=lambda edc_endpoint, access_token: notification_service.send_notification_to_endpoint(
+                    endpoint_url=edc_endpoint,
+                    access_token=access_token,
+                    notification=notification,
+                    endpoint_path=resolved_endpoint,
+                ),
+                on_rejected=lambda: self._purge_edrs_for_notification(provider_bpn),
             )
             self.update_notification_status(
                 message_id=message_id,
@@ -334,3 +412,87 @@ class NotificationsManagementService():
         except Exception as e:
             logger.error(f"Error sending notification: {e}")
             raise NotificationSendingError(f"Failed to send notification: {e}")
+
+    def send_notifications(self, message_ids: List[UUID], provider_bpn: str, provider_dsp_url: Optional[str] = None, list_policies=_USE_CONFIG_POLICIES, dct_type: Optional[str] = None, endpoint_url: Optional[str] = None) -> Dict[UUID, Optional[str]]:
+        """
+        Send several stored notifications to the same provider over a single negotiated transfer.
+
+        The catalog request, contract negotiation and transfer happen at most once for the whole
+        batch (none while the provider's EDR is still valid), every notification is then posted
+        with the same EDR. The arguments have the same meaning
+        as in ``send_notification``. The notification status is not updated, that is left to the
+        caller (see NotificationOutboxDispatcher), so it can be recorded together with its own state.
+
+        Returns:
+            Dict[UUID, Optional[str]]: The error of every notification that could not be sent, None for the sent ones.
+
+        Raises:
+            NotificationSendingError: If the provider could not be reached at all.
+        """
+        resolved_dsp_url = self._resolve_dsp_url(provider_bpn, provider_dsp_url)
+        resolved_policies = self._resolve_policies(list_policies)
+
+        with RepositoryManagerFactory().create() as repos:
+            stored_ids = {db_notification.message_id for db_notification in repos.notification_repository.find_by_message_ids(message_ids)}
+        payloads = self.submodel_service_manager.get_twin_aspect_documents(
+            submodel_ids=message_ids,
+            semantic_id=SEM_ID_NOTIFICATION
+        )
+
+        results: Dict[UUID, Optional[str]] = {}
+        notifications: List[Tuple[UUID, Notification]] = []
+        for message_id in message_ids:
+            payload = payloads.get(message_id)
+            if message_id not in stored_ids or payload is None:
+                results[message_id] = "Notification not found"
+                continue
+            notifications.append((message_id, Notification.model_validate(payload)))
+        if not notifications:
+            return results
+
+        resolved_dct_type = dct_type or DIGITAL_TWIN_EVENT_API_TYPE
+        notification_service = NotificationConsumerService(
+            self.connector_consumer_service,
+            verbose=True
+        )
+        edr_key = edr_reuse_policy.key(provider_bpn, resolved_dsp_url, resolved_dct_type, resolved_policies)
+        negotiate = lambda: self._negotiate_notification_endpoint(notification_service, provider_bpn, resolved_dsp_url, resolved_policies, resolved_dct_type)
+        try:
+            edr_session = edr_reuse_policy.session(
+                edr_key,
+                negotiate,
+                on_rejected=lambda: self._purge_edrs_for_notification(provider_bpn),
+            )
+        except Exception as e:
+            logger.error(f"Error negotiating the notification endpoint of [{provider_bpn}]: {e}")
+            raise NotificationSendingError(
+                message=f"Failed to negotiate the notification endpoint: {e}",
+                details=[
+                    f"Provider BPN: {provider_bpn}",
+                    f"DSP URL attempted: {resolved_dsp_url}",
+                ]
+            )
+
+        for message_id, notification in notifications:
+            try:
+                notification.header.sent_date_time = datetime.now(timezone.utc)
+                self.submodel_service_manager.upload_twin_aspect_document(
+                    submodel_id=message_id,
+                    semantic_id=SEM_ID_NOTIFICATION,
+                    payload=notification.model_dump(mode="json", by_alias=True)
+                )
+                edr_session.call(
+                    lambda edc_endpoint, access_token, notification=notification: notification_service.send_notification_to_endpoint(
+                        endpoint_url=edc_endpoint,
+                        access_token=access_token,
+                        notification=notification,
+                        endpoint_path=endpoint_url or self._derive_endpoint_path(notification.header.context),
+                    )
+                )
+                results[message_id] = None
+            except Exception as e:
+                logger.warning(f"Error sending notification [{message_id}] to [{provider_bpn}]: {e}")
+                results[message_id] = str(e)
+
+        logger.info(f"Sent {sum(error is None for error in results.values())}/{len(message_ids)} notification(s) to [{provider_bpn}]")
+        return results
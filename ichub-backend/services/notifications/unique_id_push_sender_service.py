@@ -105,14 +105,28 @@ class UniqueIdPushSenderService:
 
             notification = request.to_notification()
 
+            uid_push_policy = ConfigManager.get_config("provider.uniqueIdPush.policy.consumption")
+            list_policies: Optional[List] = [uid_push_policy] if uid_push_policy else []
+
+            if ConfigManager.get_config("provider.notificationOutbox.enabled", default=True):
+                # Sent in a batch with the other notifications to the receiver by the NotificationOutboxDispatcher
+                entity = self.notifications_management_service.enqueue_notification(
+                    notification,
+                    use_case=INDUSTRY_CORE_HUB,
+                    list_policies=list_policies,
+                    dct_type=UNIQUE_ID_PUSH_DCT_TYPE,
+                )
+                logger.info(
+                    f"UniqueIdPush connect-to-parent queued "
+                    f"[message_id={entity.message_id}, receiver={receiver_bpn}]"
+                )
+                return entity.message_id
+
             # Persist as outgoing notification
             entity = self.notifications_management_service.create_notification(
                 notification, NotificationDirection.OUTGOING, INDUSTRY_CORE_HUB
             )
 
-            uid_push_policy = ConfigManager.get_config("provider.uniqueIdPush.policy.consumption")
-            list_policies: Optional[List] = [uid_push_policy] if uid_push_policy else []
-
             # Send via EDC data plane (DSP URL resolved automatically from BPN)
             self.notifications_management_service.send_notification(
                 message_id=entity.message_id,
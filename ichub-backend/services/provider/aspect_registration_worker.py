@@ -0,0 +1,256 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import os
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Optional, Set
+
+from managers.config.config_manager import ConfigManager
+from managers.config.log_manager import LoggingManager
+from managers.metadata_database.manager import RepositoryManagerFactory
+from models.metadata_database.provider.models import TwinAspectRegistrationJobStatus
+from tools.datetime_tools import utc_now_naive
+from services.provider.twin_management_service import TwinManagementService
+
+logger = LoggingManager.get_logger(__name__)
+
+
+class AspectRegistrationWorker:
+    """
+    Processes the queued twin aspect registrations (see TwinManagementService.enqueue_twin_aspect).
+
+    A polling thread claims due jobs from the twin_aspect_registration_job table with
+    SELECT ... FOR UPDATE SKIP LOCKED and hands them to a bounded pool of workers, so any
+    number of backend replicas and separate worker processes can share the queue. A failed
+    job is retried with exponential backoff and continues from the registration status it
+    reached; after ``max_attempts`` it is marked as failed.
+
+    The polling thread renews the lease of the running jobs every third of ``lease_seconds``,
+    and the outcome of a job is only written while this worker still holds its lease.
+    """
+
+    _instance: Optional['AspectRegistrationWorker'] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, twin_management_service: Optional[TwinManagementService] = None, workers: int = 2, poll_interval: float = 2,
+                 lease_seconds: float = 300, max_attempts: int = 5, retry_backoff: float = 10, max_retry_backoff: float = 600):
+        """
+        Initialize the worker.
+
+        Args:
+            twin_management_service (TwinManagementService, optional): Service running the registrations. Defaults to a new service.
+            workers (int, optional): Maximum number of registrations running at the same time. Defaults to 2.
+            poll_interval (float, optional): Seconds to wait before polling again when no job was due. Defaults to 2.
+            lease_seconds (float, optional): Seconds a claimed job stays with this worker before another one may take it over. Defaults to 300.
+            max_attempts (int, optional): Attempts after which a failing job is marked as failed. Defaults to 5.
+            retry_backoff (float, optional): Seconds before the first retry, doubled with every further attempt. Defaults to 10.
+            max_retry_backoff (float, optional): Upper bound of the retry delay in seconds. Defaults to 600.
+        """
+        self.twin_management_service = twin_management_service or TwinManagementService()
+        self.workers = max(1, workers)
+        self.poll_interval = max(0.1, poll_interval)
+        self.lease_seconds = max(1.0, lease_seconds)
+        self.max_attempts = max(1, max_attempts)
+        self.retry_backoff = max(0.0, retry_backoff)
+        self.max_retry_backoff = max(self.retry_backoff, max_retry_backoff)
+        self.worker_id = f"{socket.gethostname()}-{os.getpid()}"
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="aspect-registration")
+        self._slots = threading.Semaphore(self.workers)
+        self._running: Set[int] = set()
+        self._running_lock = threading.Lock()
+        self._heartbeat_interval = self.lease_seconds / 3
+        self._last_heartbeat = time.monotonic()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def get_instance(cls) -> 'AspectRegistrationWorker':
+        """Return the process-wide worker, creating it from the configuration on first use."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls(
+                    workers=int(ConfigManager.get_config("provider.twinManagement.aspectQueue.workers", default=2)),
+                    poll_interval=float(ConfigManager.get_config("provider.twinManagement.aspectQueue.poll_interval", default=2)),
+                    lease_seconds=float(ConfigManager.get_config("provider.twinManagement.aspectQueue.lease_seconds", default=300)),
+                    max_attempts=int(ConfigManager.get_config("provider.twinManagement.aspectQueue.max_attempts", default=5)),
+                    retry_backoff=float(ConfigManager.get_config("provider.twinManagement.aspectQueue.retry_backoff", default=10)),
+                    max_retry_backoff=float(ConfigManager.get_config("provider.twinManagement.aspectQueue.max_retry_backoff", default=600)),
+                )
+            return cls._instance
+
+    @classmethod
+    def shutdown_instance(cls) -> None:
+        """Stop the process-wide worker, if it was created."""
+        with cls._instance_lock:
+            if cls._instance is not None:
+                cls._instance.stop()
+                cls._instance = None
+
+    def start(self) -> None:
+        """Start polling the queue in the background."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._loop, name="aspect-registration-poller", daemon=True)
+        self._thread.start()
+        logger.info(f"[AspectRegistrationWorker] Started worker [{self.worker_id}] with {self.workers} slot(s).")
+
+    def stop(self) -> None:
+        """Stop polling and wait for the running registrations. Jobs still queued stay in the table."""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=self.poll_interval + 5)
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def wait(self) -> None:
+        """Block until the worker is stopped (used by the standalone worker process)."""
+        while self._thread and self._thread.is_alive():
+            self._thread.join(timeout=1)
+
+    def _loop(self) -> None:
+        while not self._stop_event.is_set():
+            claimed = 0
+            try:
+                claimed = self.run_once()
+            except Exception as e:
+                logger.warning(f"[AspectRegistrationWorker] Polling the aspect registration queue failed: {e}")
+            try:
+                self.renew_leases()
+            except Exception as e:
+                logger.warning(f"[AspectRegistrationWorker] Renewing the leases of the running jobs failed: {e}")
+            if not claimed:
+                self._stop_event.wait(min(self.poll_interval, self._heartbeat_interval))
+
+    def renew_leases(self, force: bool = False) -> None:
+        """
+        Extend the lease of the running jobs, so that no other worker takes them over while they run.
+
+        Args:
+            force (bool, optional): Renew even if the heartbeat interval did not pass yet. Defaults to False.
+        """
+        now = time.monotonic()
+        if not force and now - self._last_heartbeat < self._heartbeat_interval:
+            return
+        self._last_heartbeat = now
+        with self._running_lock:
+            job_ids = list(self._running)
+        if not job_ids:
+            return
+
+        with RepositoryManagerFactory.create() as repo:
+            renewed = repo.twin_aspect_registration_job_repository.renew_leases(
+                job_ids,
+                worker_id=self.worker_id,
+                lease_seconds=self.lease_seconds
+            )
+            repo.commit()
+
+        lost = set(job_ids) - set(renewed)
+        if lost:
+            logger.warning(f"[AspectRegistrationWorker] Lost the lease of aspect registration job(s) {sorted(lost)} to another worker.")
+            with self._running_lock:
+                self._running -= lost
+
+    def run_once(self) -> int:
+        """
+        Claim as many due jobs as there are idle worker slots and hand them to the pool.
+
+        Returns:
+            int: The number of claimed jobs.
+        """
+        free_slots = 0
+        while free_slots < self.workers and self._slots.acquire(blocking=False):
+            free_slots += 1
+        if not free_slots:
+            return 0
+
+        job_ids = []
+        try:
+            with RepositoryManagerFactory.create() as repo:
+                jobs = repo.twin_aspect_registration_job_repository.claim_next(
+                    worker_id=self.worker_id,
+                    limit=free_slots,
+                    lease_seconds=self.lease_seconds
+                )
+                job_ids = [job.id for job in jobs]
+                repo.commit()
+        finally:
+            for _ in range(free_slots - len(job_ids)):
+                self._slots.release()
+
+        with self._running_lock:
+            self._running.update(job_ids)
+        for job_id in job_ids:
+            self._executor.submit(self._process, job_id)
+        return len(job_ids)
+
+    def _process(self, job_id: int) -> None:
+        try:
+            if self.twin_management_service.process_twin_aspect_registration_job(job_id, worker_id=self.worker_id):
+                logger.debug(f"[AspectRegistrationWorker] Completed aspect registration job [{job_id}].")
+        except Exception as e:
+            self._handle_failure(job_id, e)
+        finally:
+            with self._running_lock:
+                self._running.discard(job_id)
+            self._slots.release()
+
+    def _handle_failure(self, job_id: int, error: Exception) -> None:
+        """Queue the job again with backoff, or mark it as failed once it used up its attempts."""
+        try:
+            with RepositoryManagerFactory.create() as repo:
+                job_repository = repo.twin_aspect_registration_job_repository
+                db_job = job_repository.find_by_id(job_id)
+                if not db_job:
+                    return
+                public_job_id, attempts = db_job.job_id, db_job.attempts
+
+                if attempts >= self.max_attempts:
+                    status, next_attempt_date, log = TwinAspectRegistrationJobStatus.FAILED.value, None, logger.error
+                    message = f"failed after {attempts} attempt(s): {error}"
+                else:
+                    delay = min(self.retry_backoff * 2 ** (attempts - 1), self.max_retry_backoff)
+                    status, log = TwinAspectRegistrationJobStatus.QUEUED.value, logger.warning
+                    next_attempt_date = utc_now_naive() + timedelta(seconds=delay)
+                    message = f"failed (attempt {attempts}), retrying in {delay:.0f}s: {error}"
+
+                released = job_repository.release(
+                    job_id,
+                    worker_id=self.worker_id,
+                    status=status,
+                    last_error=str(error),
+                    next_attempt_date=next_attempt_date
+                )
+                repo.commit()
+
+            if released:
+                log(f"[AspectRegistrationWorker] Aspect registration job [{public_job_id}] {message}")
+            else:
+                logger.warning(f"[AspectRegistrationWorker] Aspect registration job [{public_job_id}] was taken over by another worker, its failure is dropped: {error}")
+        except Exception as e:
+            # The lease expires and another worker picks the job up again
+            logger.error(f"[AspectRegistrationWorker] Could not record the failure of aspect registration job [{job_id}]: {e}")
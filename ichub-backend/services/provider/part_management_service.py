@@ -22,7 +22,7 @@
 # SPDX-License-Identifier: Apache-2.0
 #################################################################################
 
-from typing import List, Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
 from models.services.provider.part_management import (
     BatchCreate,
     BatchRead,
@@ -52,6 +52,7 @@ from managers.metadata_database.manager import RepositoryManagerFactory, Reposit
 from models.metadata_database.provider.models import CatalogPart, SerializedPart, PartnerCatalogPart, LegalEntity
 from managers.config.log_manager import LoggingManager
 from tools.exceptions import InvalidError, NotFoundError, AlreadyExistsError
+from tools.pagination_tools import decode_keyset_cursor, encode_keyset_cursor
 
 logger = LoggingManager.get_logger(__name__)
 
@@ -288,27 +289,54 @@ class PartManagementService():
             return result
 
     def get_catalog_parts(self, manufacturer_id: Optional[str] = None, manufacturer_part_id: Optional[str] = None) -> List[CatalogPartReadWithStatus]:
+        result, _ = self.get_catalog_parts_page(manufacturer_id, manufacturer_part_id)
+        return result
+
+    def get_catalog_parts_page(self, manufacturer_id: Optional[str] = None, manufacturer_part_id: Optional[str] = None, cursor: Optional[str] = None, limit: Optional[int] = None) -> Tuple[List[CatalogPartReadWithStatus], Optional[str]]:
+        """
+        Retrieve a page of catalog parts, continuing after the given cursor.
+        Without a limit all the remaining catalog parts are returned.
+
+        Returns:
+            The catalog parts of the page and the cursor of the next page (None on the last page).
+        """
+        after_id = decode_keyset_cursor(cursor)
         with RepositoryManagerFactory.create() as repos:
-            result = []
-            
+            # One row more than requested tells whether there is a next page
             db_catalog_parts: List[tuple[CatalogPart, int]] = repos.catalog_part_repository.find_by_manufacturer_id_manufacturer_part_id(
-                manufacturer_id, manufacturer_part_id, join_partner_catalog_parts=True
+                manufacturer_id, manufacturer_part_id, join_partner_catalog_parts=True,
+                after_id=after_id, limit=limit + 1 if limit is not None else None
             )
-            
-            if db_catalog_parts:
-                for db_catalog_part, status in db_catalog_parts:
-                    result.append(
-                        CatalogPartReadWithStatus(
-                            manufacturerId=db_catalog_part.legal_entity.bpnl,
-                            manufacturerPartId=db_catalog_part.manufacturer_part_id,
-                            name=db_catalog_part.name,
-                            category=db_catalog_part.category,
-                            bpns=db_catalog_part.bpns,
-                            status=status
-                        )
-                    )
-            
-            return result
+
+            next_cursor = None
+            if limit is not None and len(db_catalog_parts) > limit:
+                db_catalog_parts = db_catalog_parts[:limit]
+                next_cursor = encode_keyset_cursor(db_catalog_parts[-1][0].id)
+
+            result = [self._to_catalog_part_read_with_status(db_catalog_part, status) for db_catalog_part, status in db_catalog_parts]
+            return result, next_cursor
+
+    def stream_catalog_parts(self, manufacturer_id: Optional[str] = None, manufacturer_part_id: Optional[str] = None, yield_per: int = 500) -> Iterator[CatalogPartReadWithStatus]:
+        """
+        Yield all the catalog parts one by one, reading them in batches of yield_per rows
+        so that the memory use does not depend on the number of catalog parts.
+        """
+        with RepositoryManagerFactory.create() as repos:
+            for db_catalog_part, status in repos.catalog_part_repository.iter_by_manufacturer_id_manufacturer_part_id(
+                manufacturer_id, manufacturer_part_id, join_partner_catalog_parts=True, yield_per=yield_per
+            ):
+                yield self._to_catalog_part_read_with_status(db_catalog_part, status)
+
+    @staticmethod
+    def _to_catalog_part_read_with_status(db_catalog_part: CatalogPart, status: int) -> CatalogPartReadWithStatus:
+        return CatalogPartReadWithStatus(
+            manufacturerId=db_catalog_part.legal_entity.bpnl,
+            manufacturerPartId=db_catalog_part.manufacturer_part_id,
+            name=db_catalog_part.name,
+            category=db_catalog_part.category,
+            bpns=db_catalog_part.bpns,
+            status=status
+        )
 
     def get_catalog_part_details(self, manufacturer_id: str, manufacturer_part_id: str) -> Optional[CatalogPartDetailsReadWithStatus]:
         """
@@ -540,36 +568,73 @@ class PartManagementService():
         """
         Retrieves serialized parts from the system according to given parameters.
         """
+        result, _ = self.get_serialized_parts_page(query)
+        return result
+
+    def get_serialized_parts_page(self, query: SerializedPartQuery = SerializedPartQuery(), cursor: Optional[str] = None, limit: Optional[int] = None) -> Tuple[List[SerializedPartReadWithStatus], Optional[str]]:
+        """
+        Retrieves a page of serialized parts according to given parameters, continuing after the given cursor.
+        Without a limit all the remaining serialized parts are returned.
+
+        Returns:
+            The serialized parts of the page and the cursor of the next page (None on the last page).
+        """
+        after_id = decode_keyset_cursor(cursor)
         with RepositoryManagerFactory.create() as repos:
+            # One row more than requested tells whether there is a next page
             db_serialized_parts: List[tuple[SerializedPart, int]] = repos.serialized_part_repository.find_with_status(
                 manufacturer_id=query.manufacturer_id,
                 manufacturer_part_id=query.manufacturer_part_id,
                 part_instance_id=query.part_instance_id,
                 business_partner_number=query.business_partner_number,
                 customer_part_id=query.customer_part_id,
-                van=query.van
+                van=query.van,
+                after_id=after_id,
+                limit=limit + 1 if limit is not None else None
             )
 
-            result = []
-            for db_serialized_part, status in db_serialized_parts:
-                result.append(
-                    SerializedPartReadWithStatus(
-                        manufacturerId=db_serialized_part.partner_catalog_part.catalog_part.legal_entity.bpnl,
-                        manufacturerPartId=db_serialized_part.partner_catalog_part.catalog_part.manufacturer_part_id,
-                        name=db_serialized_part.partner_catalog_part.catalog_part.name,
-                        category=db_serialized_part.partner_catalog_part.catalog_part.category,
-                        bpns=db_serialized_part.partner_catalog_part.catalog_part.bpns,
-                        partInstanceId=db_serialized_part.part_instance_id,
-                        customerPartId=db_serialized_part.partner_catalog_part.customer_part_id,
-                        businessPartner=BusinessPartnerRead(
-                            name=db_serialized_part.partner_catalog_part.business_partner.name,
-                            bpnl=db_serialized_part.partner_catalog_part.business_partner.bpnl
-                        ),
-                        van=db_serialized_part.van,
-                        status=SharingStatus(status)
-                    )
-                )
-            return result
+            next_cursor = None
+            if limit is not None and len(db_serialized_parts) > limit:
+                db_serialized_parts = db_serialized_parts[:limit]
+                next_cursor = encode_keyset_cursor(db_serialized_parts[-1][0].id)
+
+            result = [self._to_serialized_part_read_with_status(db_serialized_part, status) for db_serialized_part, status in db_serialized_parts]
+            return result, next_cursor
+
+    def stream_serialized_parts(self, query: SerializedPartQuery = SerializedPartQuery(), yield_per: int = 500) -> Iterator[SerializedPartReadWithStatus]:
+        """
+        Yield the serialized parts matching the given parameters one by one, reading them in batches
+        of yield_per rows so that the memory use does not depend on the number of serialized parts.
+        """
+        with RepositoryManagerFactory.create() as repos:
+            for db_serialized_part, status in repos.serialized_part_repository.iter_with_status(
+                manufacturer_id=query.manufacturer_id,
+                manufacturer_part_id=query.manufacturer_part_id,
+                part_instance_id=query.part_instance_id,
+                business_partner_number=query.business_partner_number,
+                customer_part_id=query.customer_part_id,
+                van=query.van,
+                yield_per=yield_per
+            ):
+                yield self._to_serialized_part_read_with_status(db_serialized_part, status)
+
+    @staticmethod
+    def _to_serialized_part_read_with_status(db_serialized_part: SerializedPart, status: int) -> SerializedPartReadWithStatus:
+        return SerializedPartReadWithStatus(
+            manufacturerId=db_serialized_part.partner_catalog_part.catalog_part.legal_entity.bpnl,
+            manufacturerPartId=db_serialized_part.partner_catalog_part.catalog_part.manufacturer_part_id,
+            name=db_serialized_part.partner_catalog_part.catalog_part.name,
+            category=db_serialized_part.partner_catalog_part.catalog_part.category,
+            bpns=db_serialized_part.partner_catalog_part.catalog_part.bpns,
+            partInstanceId=db_serialized_part.part_instance_id,
+            customerPartId=db_serialized_part.partner_catalog_part.customer_part_id,
+            businessPartner=BusinessPartnerRead(
+                name=db_serialized_part.partner_catalog_part.business_partner.name,
+                bpnl=db_serialized_part.partner_catalog_part.business_partner.bpnl
+            ),
+            van=db_serialized_part.van,
+            status=SharingStatus(status)
+        )
 
     def create_jis_part(self, jis_part_create: JISPartCreate) -> JISPartRead:
         """
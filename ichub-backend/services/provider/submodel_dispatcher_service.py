@@ -34,8 +34,7 @@ class SubmodelDispatcherService:
     """
 
     def __init__(self):
-        # TODO: Deal with the proper config => Submodel Service is normally a singleton
-        self.submodel_service_manager = SubmodelServiceManager()
+        self.submodel_service_manager = SubmodelServiceManager.get_instance()
 
     def get_submodel_content(self, edc_bpn: Optional[str],
                              edc_contract_agreement_id: Optional[str], semantic_id: str,
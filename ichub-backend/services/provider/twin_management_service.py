@@ -24,6 +24,7 @@
 #################################################################################
 
 from typing import Optional, Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from uuid import UUID, uuid4
 from datetime import datetime, timezone
 
@@ -58,9 +59,13 @@ from models.services.provider.twin_management import (
     TwinAspectRegistrationStatus,
     TwinsAspectRegistrationMode,
     TwinDetailsReadBase,
+    TwinBulkCreateItemResult,
+    TwinBulkCreateRead,
+    TwinAspectRegistrationJobRead,
 )
-from models.metadata_database.provider.models import CatalogPart, EnablementServiceStack, Twin, BusinessPartner, TwinAspect, TwinAspectRegistration
-from tools.exceptions import NotFoundError, NotAvailableError
+from models.metadata_database.provider.models import CatalogPart, EnablementServiceStack, Twin, BusinessPartner, TwinAspect, TwinAspectRegistration, TwinAspectRegistrationJob, TwinAspectRegistrationJobStatus
+from tools.datetime_tools import utc_now_naive
+from tools.exceptions import InvalidError, NotFoundError, NotAvailableError
 from utils.pcf_utils import get_pcf_submodel_overrides
 
 from managers.config.log_manager import LoggingManager
@@ -441,6 +446,302 @@ class TwinManagementService:
                 modifiedDate=db_twin.modified_date
             )
 
+    def create_catalog_part_twins_bulk(self, create_inputs: List[CatalogPartTwinCreate], auto_create_part_type_information: bool = False) -> TwinBulkCreateRead:
+        """
+        Create the twins of a batch of catalog parts.
+
+        Works like create_catalog_part_twin, but the catalog parts are resolved with a single query, the missing
+        twins and twin registrations are inserted with one flush and the shell descriptors are pushed to the DTR
+        by a bounded pool of workers. A failing item does not abort the batch, its error is reported in the result.
+        """
+        self._check_bulk_size(create_inputs)
+        errors: Dict[int, str] = {}
+        jobs: Dict[int, Dict[str, Any]] = {}
+
+        with RepositoryManagerFactory.create() as repo:
+            # Step 1: Retrieve all catalog parts of the batch with one query
+            keys = [(create_input.manufacturer_id, create_input.manufacturer_part_id) for create_input in create_inputs]
+            db_catalog_parts = {
+                (db_catalog_part.legal_entity.bpnl, db_catalog_part.manufacturer_part_id): db_catalog_part
+                for db_catalog_part in repo.catalog_part_repository.find_by_manufacturer_keys(list(set(keys)))
+            }
+
+            entries = {}
+            for index, key in self._unique_bulk_keys(keys, errors):
+                db_catalog_part = db_catalog_parts.get(key)
+                if not db_catalog_part:
+                    errors[index] = "Catalog part not found."
+                else:
+                    entries[index] = db_catalog_part
+
+            # Step 2: Create the missing twins and twin registrations
+            twins = self._prepare_twins_bulk(repo, create_inputs, entries)
+
+            # Step 3: Collect everything the DTR calls need while the entities are still loaded
+            for index, db_catalog_part in entries.items():
+                create_input = create_inputs[index]
+                twin, _ = twins[index]
+                customer_part_ids = {partner_catalog_part.customer_part_id: partner_catalog_part.business_partner.bpnl
+                                        for partner_catalog_part in db_catalog_part.partner_catalog_parts}
+
+                aspect = None
+                if auto_create_part_type_information:
+                    aspect = TwinAspectCreate(
+                        globalId=twin.global_id,
+                        semanticId=SEM_ID_PART_TYPE_INFORMATION_V1,
+                        payload=self.submodel_document_generator.generate_part_type_information_v1(
+                            global_id=twin.global_id,
+                            manufacturer_part_id=create_input.manufacturer_part_id,
+                            name=db_catalog_part.name,
+                            bpns=db_catalog_part.bpns
+                        )
+                    )
+
+                jobs[index] = {
+                    "descriptor": dict(
+                        global_id=twin.global_id,
+                        aas_id=twin.dtr_aas_id,
+                        asset_kind="Type",
+                        display_name=db_catalog_part.name,
+                        description=db_catalog_part.description,
+                        id_short=create_input.id_short or db_catalog_part.name or None,
+                        manufacturer_id=create_input.manufacturer_id,
+                        manufacturer_part_id=create_input.manufacturer_part_id,
+                        customer_part_ids=customer_part_ids,
+                        asset_type=self._none_if_empty(db_catalog_part.category),
+                        digital_twin_type=CATALOG_DIGITAL_TWIN_TYPE
+                    ),
+                    "aspect": aspect,
+                }
+
+            repo.commit()
+
+        # Step 4: Register the twins in the DTR and flag the successful ones
+        self._register_twins_bulk(jobs, twins, errors)
+        return self._to_bulk_result(create_inputs, twins, errors)
+
+    def create_serialized_part_twins_bulk(self, create_inputs: List[SerializedPartTwinCreate], auto_create_serial_part_aspect: bool = False) -> TwinBulkCreateRead:
+        """
+        Create the twins of a batch of serialized parts.
+
+        Works like create_serialized_part_twin, but the serialized parts are resolved with a single query, the missing
+        twins and twin registrations are inserted with one flush and the shell descriptors are pushed to the DTR
+        by a bounded pool of workers. A failing item does not abort the batch, its error is reported in the result.
+        """
+        self._check_bulk_size(create_inputs)
+        errors: Dict[int, str] = {}
+        jobs: Dict[int, Dict[str, Any]] = {}
+
+        with RepositoryManagerFactory.create() as repo:
+            # Step 1: Retrieve all serialized parts of the batch (with their partner catalog parts) with one query
+            keys = [(create_input.manufacturer_id, create_input.manufacturer_part_id, create_input.part_instance_id) for create_input in create_inputs]
+            db_serialized_parts = {
+                (
+                    db_serialized_part.partner_catalog_part.catalog_part.legal_entity.bpnl,
+                    db_serialized_part.partner_catalog_part.catalog_part.manufacturer_part_id,
+                    db_serialized_part.part_instance_id
+                ): db_serialized_part
+                for db_serialized_part in repo.serialized_part_repository.find_by_keys(list(set(keys)))
+            }
+
+            entries = {}
+            for index, key in self._unique_bulk_keys(keys, errors):
+                db_serialized_part = db_serialized_parts.get(key)
+                if not db_serialized_part:
+                    errors[index] = "Serialized Part not found."
+                elif not db_serialized_part.partner_catalog_part:
+                    errors[index] = "Serialized Part is not linked to a Catalog Part of a Business Partner."
+                else:
+                    entries[index] = db_serialized_part
+
+            # Step 2: Create the missing twins and twin registrations
+            twins = self._prepare_twins_bulk(repo, create_inputs, entries)
+
+            # Step 3: Collect everything the DTR calls need while the entities are still loaded
+            for index, db_serialized_part in entries.items():
+                create_input = create_inputs[index]
+                twin, _ = twins[index]
+                db_partner_catalog_part = db_serialized_part.partner_catalog_part
+                db_catalog_part = db_partner_catalog_part.catalog_part
+
+                aspect = None
+                if auto_create_serial_part_aspect:
+                    aspect = TwinAspectCreate(
+                        globalId=twin.global_id,
+                        semanticId=SEM_ID_SERIAL_PART_V3,
+                        payload=self.submodel_document_generator.generate_serial_part_v3(
+                            global_id=twin.global_id,
+                            manufacturer_id=create_input.manufacturer_id,
+                            manufacturer_part_id=create_input.manufacturer_part_id,
+                            customer_part_id=db_partner_catalog_part.customer_part_id,
+                            name=db_catalog_part.name,
+                            part_instance_id=create_input.part_instance_id,
+                            van=db_serialized_part.van,
+                            bpns=db_catalog_part.bpns
+                        )
+                    )
+
+                jobs[index] = {
+                    "descriptor": dict(
+                        global_id=twin.global_id,
+                        aas_id=twin.dtr_aas_id,
+                        asset_kind="Instance",
+                        display_name=db_catalog_part.name,
+                        description=db_catalog_part.description,
+                        id_short=db_catalog_part.name,
+                        manufacturer_id=create_input.manufacturer_id,
+                        manufacturer_part_id=create_input.manufacturer_part_id,
+                        customer_part_ids={db_partner_catalog_part.customer_part_id: db_partner_catalog_part.business_partner.bpnl},
+                        asset_type=self._none_if_empty(db_catalog_part.category),
+                        digital_twin_type=INSTANCE_DIGITAL_TWIN_TYPE,
+                        van=db_serialized_part.van,
+                        part_instance_id=create_input.part_instance_id
+                    ),
+                    "aspect": aspect,
+                }
+
+            repo.commit()
+
+        # Step 4: Register the twins in the DTR and flag the successful ones
+        self._register_twins_bulk(jobs, twins, errors)
+        return self._to_bulk_result(create_inputs, twins, errors)
+
+    @staticmethod
+    def _check_bulk_size(create_inputs: List[Any]) -> None:
+        """Reject bulk requests that exceed the configured maximum number of items."""
+        max_items = ConfigManager.get_config("provider.twinManagement.bulk.max_items", 1000)
+        if len(create_inputs) > max_items:
+            raise InvalidError(f"A bulk request must not contain more than {max_items} items.")
+
+    @staticmethod
+    def _unique_bulk_keys(keys: List[tuple], errors: Dict[int, str]):
+        """Yield the index and key of every item, reporting repeated keys of the batch as errors."""
+        seen = set()
+        for index, key in enumerate(keys):
+            if key in seen:
+                errors[index] = "Duplicate item within the bulk request."
+                continue
+            seen.add(key)
+            yield index, key
+
+    def _prepare_twins_bulk(self, repo: RepositoryManager, create_inputs: List[Any], entries: Dict[int, Any]) -> Dict[int, tuple[TwinRead, tuple[int, int]]]:
+        """
+        Make sure every part in entries has a twin and a twin registration for the enablement service stack of its manufacturer.
+
+        Existing registrations are looked up with one query, the missing twins and registrations are inserted with one flush.
+        Returns the twin and the (twin ID, enablement service stack ID) key of the registration per item index.
+        """
+        db_enablement_service_stacks: Dict[str, EnablementServiceStack] = {}
+        for index in entries:
+            manufacturer_id = create_inputs[index].manufacturer_id
+            if manufacturer_id not in db_enablement_service_stacks:
+                db_enablement_service_stacks[manufacturer_id] = self.get_or_create_enablement_stack(repo=repo, manufacturer_id=manufacturer_id)
+
+        existing_twin_ids = [db_part.twin_id for db_part in entries.values() if db_part.twin_id]
+        existing_registrations = {
+            (db_twin_registration.twin_id, db_twin_registration.enablement_service_stack_id)
+            for db_twin_registration in repo.twin_registration_repository.find_by_twin_ids(existing_twin_ids)
+        }
+
+        for index, db_part in entries.items():
+            create_input = create_inputs[index]
+            db_enablement_service_stack = db_enablement_service_stacks[create_input.manufacturer_id]
+            if not db_part.twin_id:
+                db_part.twin = repo.twin_repository.create_new(
+                    global_id=create_input.global_id,
+                    dtr_aas_id=create_input.dtr_aas_id)
+            elif (db_part.twin_id, db_enablement_service_stack.id) in existing_registrations:
+                continue
+            repo.twin_registration_repository.create_new_for_twin(
+                twin=db_part.twin,
+                enablement_service_stack_id=db_enablement_service_stack.id
+            )
+
+        repo.flush()
+
+        twins = {}
+        for index, db_part in entries.items():
+            db_twin = db_part.twin
+            twins[index] = (
+                TwinRead(
+                    globalId=db_twin.global_id,
+                    dtrAasId=db_twin.aas_id,
+                    createdDate=db_twin.created_date,
+                    modifiedDate=db_twin.modified_date
+                ),
+                (db_twin.id, db_enablement_service_stacks[create_inputs[index].manufacturer_id].id)
+            )
+        return twins
+
+    def _register_twins_bulk(self, jobs: Dict[int, Dict[str, Any]], twins: Dict[int, tuple[TwinRead, tuple[int, int]]], errors: Dict[int, str]) -> None:
+        """
+        Push the shell descriptors of the jobs to the DTR (and create their aspects, if requested) with a bounded
+        number of parallel workers, then set the dtr_registered flag of all successful twins with one update.
+        """
+        if not jobs:
+            return
+
+        max_workers = min(len(jobs), ConfigManager.get_config("provider.twinManagement.bulk.max_workers", 10))
+        registered = []
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="twin-bulk") as executor:
+            futures = {executor.submit(self._register_twin_bulk_job, **job): index for index, job in jobs.items()}
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    aspect_error = future.result()
+                except Exception as e:
+                    logger.warning(f"[TwinManagementService] Bulk registration of twin [{twins[index][0].global_id}] failed: {e}")
+                    errors[index] = str(e)
+                    continue
+
+                registered.append(twins[index][1])
+                if aspect_error:
+                    errors[index] = aspect_error
+
+        with RepositoryManagerFactory.create() as repo:
+            repo.twin_registration_repository.set_dtr_registered(registered)
+            repo.commit()
+
+        logger.info(f"[TwinManagementService] Registered {len(registered)} of {len(jobs)} twins of a bulk request in the DTR.")
+
+    def _register_twin_bulk_job(self, descriptor: Dict[str, Any], aspect: Optional[TwinAspectCreate]) -> Optional[str]:
+        """Register one twin of a bulk request in the DTR. Returns an error message if only its aspect could not be created."""
+        dtr_provider_manager.create_or_update_shell_descriptor(**descriptor)
+        if aspect is None:
+            return None
+
+        try:
+            self.create_twin_aspect(aspect)
+        except Exception as e:
+            logger.warning(f"[TwinManagementService] Aspect [{aspect.semantic_id}] of twin [{aspect.global_id}] could not be created: {e}")
+            return f"Twin registered, but the aspect could not be created: {e}"
+        return None
+
+    @staticmethod
+    def _to_bulk_result(create_inputs: List[Any], twins: Dict[int, tuple[TwinRead, tuple[int, int]]], errors: Dict[int, str]) -> TwinBulkCreateRead:
+        """Build the per item response of a bulk request."""
+        results = []
+        for index, create_input in enumerate(create_inputs):
+            error = errors.get(index)
+            twin = twins.get(index)
+            results.append(TwinBulkCreateItemResult(
+                index=index,
+                manufacturerId=create_input.manufacturer_id,
+                manufacturerPartId=create_input.manufacturer_part_id,
+                partInstanceId=getattr(create_input, "part_instance_id", None),
+                success=error is None,
+                twin=twin[0] if twin else None,
+                error=error
+            ))
+
+        succeeded = sum(1 for result in results if result.success)
+        return TwinBulkCreateRead(
+            total=len(results),
+            succeeded=succeeded,
+            failed=len(results) - succeeded,
+            results=results
+        )
+
     def get_serialized_part_twins(self,
         serialized_part_query: SerializedPartQuery = SerializedPartQuery(),
         global_id: Optional[UUID] = None,
@@ -549,51 +850,162 @@ class TwinManagementService:
         """
 
         with RepositoryManagerFactory.create() as repo:
-            
-            # Step 1: Retrieve the twin entity according to the global_id
-            db_twin = repo.twin_repository.find_by_global_id(twin_aspect_create.global_id)
-            if not db_twin:
-                raise NotFoundError(f"Twin for global ID '{twin_aspect_create.global_id}' not found.")
 
-            # Step 2: Get associated manufacturer id
-            manufacturer_id = self._get_manufacturer_id_from_twin(db_twin)
+            # Step 1-4: Retrieve or create the twin aspect and its registration
+            db_twin, db_enablement_service_stack, db_twin_aspect, db_twin_aspect_registration = self._prepare_twin_aspect(repo, twin_aspect_create)
 
-            # Step 3: Retrieve the enablement service stack entity from the DB according to the given manufacturer ID
-            # (if not there => raise error)
-            # TODO: later the stack needs to be passed as an argument
-            db_enablement_service_stack = self.get_or_create_enablement_stack(repo=repo, manufacturer_id=manufacturer_id)
-            
-            # Step 3: Retrieve a potentially existing twin aspect entity for the given twin_id and semantic_id
-            db_twin_aspect = repo.twin_aspect_repository.get_by_twin_id_semantic_id(
-                db_twin.id,
-                twin_aspect_create.semantic_id,
-                include_registrations=True
+            # Step 5-7: Store the document and register the aspect in the EDC and the DTR
+            self._run_twin_aspect_registration(
+                repo, db_twin_aspect_registration, db_enablement_service_stack, db_twin, db_twin_aspect, twin_aspect_create
             )
-            if not db_twin_aspect:
-                # Step 3a: Create a new twin aspect entity in the database
-                db_twin_aspect = self._create_twin_aspect_entity_db(twin_aspect_create, repo, db_twin)
 
-            # Step 4: Check if there is already a registration for the given enablement service stack and create it if not
+            return self._create_twin_aspect_read_response(db_twin_aspect, db_enablement_service_stack, db_twin_aspect_registration)
+
+    def enqueue_twin_aspect(self, twin_aspect_create: TwinAspectCreate) -> TwinAspectRegistrationJobRead:
+        """
+        Queue the creation of a new twin aspect for a given twin.
+
+        The twin aspect and its registration are created right away. Storing the document in the submodel service
+        and registering the aspect in the EDC and the DTR is left to the aspect registration workers.
+        """
+
+        with RepositoryManagerFactory.create() as repo:
+
+            # Step 1-4: Retrieve or create the twin aspect and its registration
+            db_twin, db_enablement_service_stack, db_twin_aspect, db_twin_aspect_registration = self._prepare_twin_aspect(repo, twin_aspect_create)
+
+            # Step 5: Queue the registration (a job not picked up by a worker yet just gets the new document)
+            db_job = repo.twin_aspect_registration_job_repository.find_queued_by_twin_aspect_id_enablement_service_stack_id(
+                db_twin_aspect.id,
+                db_enablement_service_stack.id
+            )
+            if db_job:
+                db_job.payload = twin_aspect_create.payload
+                db_job.modified_date = utc_now_naive()
+            else:
+                db_job = repo.twin_aspect_registration_job_repository.create_new(
+                    twin_aspect_id=db_twin_aspect.id,
+                    enablement_service_stack_id=db_enablement_service_stack.id,
+                    payload=twin_aspect_create.payload
+                )
+            repo.commit()
+            repo.refresh(db_job)
+
+            return self._create_twin_aspect_registration_job_read(db_job, db_twin, db_twin_aspect, db_twin_aspect_registration)
+
+    def get_twin_aspect_registration_job(self, job_id: UUID) -> TwinAspectRegistrationJobRead:
+        """
+        Retrieve the processing status of a queued twin aspect registration.
+        """
+
+        with RepositoryManagerFactory.create() as repo:
+            db_job = repo.twin_aspect_registration_job_repository.find_by_job_id(job_id)
+            if not db_job:
+                raise NotFoundError(f"Twin aspect registration job '{job_id}' not found.")
+
+            db_twin_aspect_registration = repo.twin_aspect_registration_repository.get_by_twin_aspect_id_enablement_service_stack_id(
+                db_job.twin_aspect_id,
+                db_job.enablement_service_stack_id
+            )
+            return self._create_twin_aspect_registration_job_read(db_job, db_job.twin_aspect.twin, db_job.twin_aspect, db_twin_aspect_registration)
+
+    def process_twin_aspect_registration_job(self, job_id: int, worker_id: str) -> bool:
+        """
+        Run a queued twin aspect registration claimed by an aspect registration worker.
+
+        Every step commits the registration status it reached, so a failed job continues from there on its next attempt.
+
+        Returns:
+            bool: False if the lease of the worker was lost meanwhile, the job is then left to the worker that took it over.
+        """
+
+        with RepositoryManagerFactory.create() as repo:
+            db_job = repo.twin_aspect_registration_job_repository.find_by_id(job_id)
+            if not db_job:
+                raise NotFoundError(f"Twin aspect registration job '{job_id}' not found.")
+
+            db_twin_aspect = db_job.twin_aspect
+            db_twin = db_twin_aspect.twin
+            db_enablement_service_stack = db_job.enablement_service_stack
             db_twin_aspect_registration = self._get_or_create_twin_aspect_registration(
                 repo, db_twin_aspect, db_enablement_service_stack
             )
 
-            # Step 4b: Ensure DTR asset is registered
-            self._ensure_dtr_asset_registration()
+            twin_aspect_create = TwinAspectCreate(
+                globalId=db_twin.global_id,
+                semanticId=db_twin_aspect.semantic_id,
+                submodelId=db_twin_aspect.submodel_id,
+                payload=db_job.payload or {}
+            )
+            self._run_twin_aspect_registration(
+                repo, db_twin_aspect_registration, db_enablement_service_stack, db_twin, db_twin_aspect, twin_aspect_create
+            )
 
-            # Step 5: Handle the submodel service
-            self._handle_submodel_service_upload(
-                repo, db_twin_aspect_registration, db_enablement_service_stack, db_twin_aspect, twin_aspect_create
+            # The document is stored in the submodel service now, so the queue does not need to keep it
+            completed = repo.twin_aspect_registration_job_repository.release(
+                job_id,
+                worker_id=worker_id,
+                status=TwinAspectRegistrationJobStatus.COMPLETED.value,
+                clear_payload=True
             )
-            
-            # Step 6: Handle the EDC registration
-            asset_id = self._handle_edc_registration(repo, db_twin_aspect_registration, db_twin_aspect)
-            
-            # Step 7: Handle the DTR registration
-            self._handle_dtr_registration(repo, db_twin_aspect_registration, db_twin, db_twin_aspect, asset_id)
+            repo.commit()
+            if not completed:
+                logger.warning(f"[TwinManagementService] Aspect registration job [{job_id}] was taken over by another worker, its result is dropped.")
+            return completed
+
+    def _prepare_twin_aspect(self, repo: RepositoryManager, twin_aspect_create: TwinAspectCreate) -> tuple[Twin, EnablementServiceStack, TwinAspect, TwinAspectRegistration]:
+        """
+        Retrieve the twin of a new twin aspect and retrieve or create the twin aspect and its registration.
+        """
+
+        # Step 1: Retrieve the twin entity according to the global_id
+        db_twin = repo.twin_repository.find_by_global_id(twin_aspect_create.global_id)
+        if not db_twin:
+            raise NotFoundError(f"Twin for global ID '{twin_aspect_create.global_id}' not found.")
+
+        # Step 2: Get associated manufacturer id
+        manufacturer_id = self._get_manufacturer_id_from_twin(db_twin)
+
+        # Step 3: Retrieve the enablement service stack entity from the DB according to the given manufacturer ID
+        # (if not there => raise error)
+        # TODO: later the stack needs to be passed as an argument
+        db_enablement_service_stack = self.get_or_create_enablement_stack(repo=repo, manufacturer_id=manufacturer_id)
+
+        # Step 3: Retrieve a potentially existing twin aspect entity for the given twin_id and semantic_id
+        db_twin_aspect = repo.twin_aspect_repository.get_by_twin_id_semantic_id(
+            db_twin.id,
+            twin_aspect_create.semantic_id,
+            include_registrations=True
+        )
+        if not db_twin_aspect:
+            # Step 3a: Create a new twin aspect entity in the database
+            db_twin_aspect = self._create_twin_aspect_entity_db(twin_aspect_create, repo, db_twin)
+
+        # Step 4: Check if there is already a registration for the given enablement service stack and create it if not
+        db_twin_aspect_registration = self._get_or_create_twin_aspect_registration(
+            repo, db_twin_aspect, db_enablement_service_stack
+        )
+        return db_twin, db_enablement_service_stack, db_twin_aspect, db_twin_aspect_registration
+
+    def _run_twin_aspect_registration(self, repo: RepositoryManager, db_twin_aspect_registration: TwinAspectRegistration, db_enablement_service_stack: EnablementServiceStack, db_twin: Twin, db_twin_aspect: TwinAspect, twin_aspect_create: TwinAspectCreate) -> None:
+        """
+        Store the twin aspect document and register the aspect in the EDC and the DTR, skipping the steps its registration status already reached.
+        """
+
+        # Step 4b: Ensure DTR asset is registered
+        self._ensure_dtr_asset_registration()
+
+        # Step 5: Handle the submodel service
+        self._handle_submodel_service_upload(
+            repo, db_twin_aspect_registration, db_enablement_service_stack, db_twin_aspect, twin_aspect_create
+        )
+
+        # Step 6: Handle the EDC registration
+        asset_id = self._handle_edc_registration(repo, db_twin_aspect_registration, db_twin_aspect)
+
+        # Step 7: Handle the DTR registration
+        self._handle_dtr_registration(repo, db_twin_aspect_registration, db_twin, db_twin_aspect, asset_id)
 
-            return self._create_twin_aspect_read_response(db_twin_aspect, db_enablement_service_stack, db_twin_aspect_registration)
-        
     def create_or_update_twin_aspect_not_default(self, twin_aspect_create: TwinAspectCreate) -> TwinAspectRead:
         """
         Create or update a twin aspect for a give twin without using the default enablement service stack.
@@ -642,19 +1054,10 @@ class TwinManagementService:
                 repo, db_twin_aspect, db_enablement_service_stack
             )
 
-            # Step 4b: Ensure DTR asset is registered
-            self._ensure_dtr_asset_registration()
-
-            # Step 5: Handle the submodel service
-            self._handle_submodel_service_upload(
-                repo, db_twin_aspect_registration, db_enablement_service_stack, db_twin_aspect, twin_aspect_create
+            # Step 5-7: Store the document and register the aspect in the EDC and the DTR
+            self._run_twin_aspect_registration(
+                repo, db_twin_aspect_registration, db_enablement_service_stack, db_twin, db_twin_aspect, twin_aspect_create
             )
-            
-            # Step 6: Handle the EDC registration
-            asset_id = self._handle_edc_registration(repo, db_twin_aspect_registration, db_twin_aspect)
-            
-            # Step 7: Handle the DTR registration
-            self._handle_dtr_registration(repo, db_twin_aspect_registration, db_twin, db_twin_aspect, asset_id)
 
             return self._create_twin_aspect_read_response(db_twin_aspect, db_enablement_service_stack, db_twin_aspect_registration)
 
@@ -789,6 +1192,24 @@ class TwinManagementService:
             registrations={db_enablement_service_stack.name: registration_data}
         )
 
+    @staticmethod
+    def _create_twin_aspect_registration_job_read(db_job: TwinAspectRegistrationJob, db_twin: Twin, db_twin_aspect: TwinAspect, db_twin_aspect_registration: Optional[TwinAspectRegistration]) -> TwinAspectRegistrationJobRead:
+        """
+        Create and return the TwinAspectRegistrationJobRead response object.
+        """
+        return TwinAspectRegistrationJobRead(
+            jobId=db_job.job_id,
+            globalId=db_twin.global_id,
+            semanticId=db_twin_aspect.semantic_id,
+            submodelId=db_twin_aspect.submodel_id,
+            status=TwinAspectRegistrationJobStatus(db_job.status),
+            registrationStatus=TwinAspectRegistrationStatus(db_twin_aspect_registration.status if db_twin_aspect_registration else TwinAspectRegistrationStatus.PLANNED.value),
+            attempts=db_job.attempts,
+            lastError=db_job.last_error,
+            createdDate=db_job.created_date,
+            modifiedDate=db_job.modified_date
+        )
+
     def _create_twin_aspect_entity_db(self, twin_aspect_create: TwinAspectCreate, repo: RepositoryManager, db_twin: Twin) -> TwinAspect:
         db_twin_aspect = repo.twin_aspect_repository.create_new(
                     twin_id=db_twin.id,
@@ -991,7 +1412,6 @@ class TwinManagementService:
 
 def _create_submodel_service_manager(connection_settings: Optional[Dict[str, Any]]) -> SubmodelServiceManager:
     """
-    Create a new instance of the SubmodelServiceManager class.
+    Get the shared SubmodelServiceManager for the connection settings of an enablement service stack.
     """
-    # TODO: later we can configure the manager via the connection settings from the DB here
-    return SubmodelServiceManager()
+    return SubmodelServiceManager.get_instance(connection_settings)
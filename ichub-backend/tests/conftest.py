@@ -54,3 +54,18 @@ def mock_connector_globally():
         mock_connector.consumer.connector_service = Mock()
         yield mock_connector
 
+
+
+def _clear_reused_edrs():
+    # Only when a test imported the policy: importing it here would require the connector SDK in every test
+    module = sys.modules.get('managers.enablement_services.consumer.edr_reuse_policy')
+    if module is not None:
+        module.edr_reuse_policy.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_reused_edrs():
+    """Drop the EDRs reused between sends, so a token cached by one test is not used by the next."""
+    _clear_reused_edrs()
+    yield
+    _clear_reused_edrs()
@@ -75,6 +75,9 @@ def app_client():
     value before the connector setup function runs.  We patch that local reference
     so that ``NotificationsManagementService.__init__`` succeeds when the router
     is imported.
+
+    The background clients (database, connector, Keycloak...) are not started by
+    the app lifespan, a Keycloak connection would enable the OAuth2 authentication.
     """
     _restore_real_modules()
 
@@ -87,10 +90,13 @@ def app_client():
     for _mod in _PCF_SDK_SUBMODULES:
         sys.modules.setdefault(_mod, MagicMock())
 
+    from utils.service_container import ServiceContainer
+
     with patch("services.notifications.notifications_management_service.connector_manager") as mock_conn, \
          patch("services.notifications.notifications_management_service.dtr_manager") as mock_dtr, \
          patch("controllers.fastapi.routers.authentication.auth_api.api_key_manager", None), \
-         patch("controllers.fastapi.routers.authentication.auth_api.oauth2_manager", None):
+         patch("controllers.fastapi.routers.authentication.auth_api.oauth2_manager", None), \
+         patch.object(ServiceContainer.get_instance(), "start"):
         mock_conn.consumer.connector_service = Mock()
         mock_dtr.purge_edrs_matching.return_value = 0
 
@@ -80,6 +80,7 @@ def app_client():
     _restore_real_modules()
 
     import controllers.fastapi.app  # noqa: F401 - pre-warm sys.modules
+    from utils.service_container import ServiceContainer
 
     with (
         patch(
@@ -90,6 +91,8 @@ def app_client():
             "controllers.fastapi.routers.authentication.auth_api.oauth2_manager",
             None,
         ),
+        # The background clients (database, connector, Keycloak...) are not started in the tests
+        patch.object(ServiceContainer.get_instance(), "start"),
         patch(
             "controllers.fastapi.routers.addons.pcf_kit.v1.consumption.consumption_manager",
             MagicMock(),
@@ -150,6 +150,7 @@ class TestAddSubpartAndCreateRequest:
             main_manufacturer_part_id=PART_ID,
             sub_manufacturer_part_id=SUB_PART_BODY["manufacturerPartId"],
             responding_bpn=SUB_PART_BODY["bpn"],
+            quantity=1.0,
         )
 
     def test_missing_body_returns_400(self, app_client, mock_consumption_mgr):
@@ -0,0 +1,178 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+"""
+Regression test for blocking work inside the async API routers.
+
+Every ``async def`` route of the API routers is called with its module level
+managers and services replaced by stubs that sleep for ``STUB_DELAY`` seconds,
+like a slow database or EDC would do. While the route runs, a heartbeat task
+measures how late the event loop wakes it up. A route that calls a manager or
+service directly instead of through the executors of ``utils.async_utils``
+stalls the heartbeat for the whole stub delay and makes the test fail.
+"""
+
+import asyncio
+import gc
+import inspect
+import sys
+import time
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+STUB_DELAY = 0.1
+MAX_LOOP_BLOCKING_MS = 50
+HEARTBEAT_INTERVAL = 0.005
+ROUTE_TIMEOUT = 5
+
+ROUTERS_PACKAGE = "controllers.fastapi.routers"
+
+# Module level objects which only hold in-memory state and may be used on the event loop
+IN_MEMORY_OBJECTS = {
+    # Its task store may be in the database, the routes only reach it through the DB executor
+    ("controllers.fastapi.routers.addons.ecopass_kit.v1.discovery", "discovery_manager"),
+}
+
+_MODULES_NEEDING_REAL_IMPL = [
+    "managers.config.config_manager",
+    "managers.config.log_manager",
+    "tools.exceptions",
+    "tools.constants",
+]
+
+
+class SlowStub:
+    """Stands in for a manager or service, every method call blocks the calling thread."""
+
+    def __getattr__(self, name):
+        def slow_method(*args, **kwargs):
+            time.sleep(STUB_DELAY)
+            return MagicMock()
+        return slow_method
+
+
+@pytest.fixture(scope="module")
+def app():
+    for mod_name in _MODULES_NEEDING_REAL_IMPL:
+        if isinstance(sys.modules.get(mod_name), MagicMock):
+            sys.modules.pop(mod_name)
+
+    with patch("services.notifications.notifications_management_service.connector_manager") as mock_conn, \
+         patch("services.notifications.notifications_management_service.dtr_manager"):
+        mock_conn.consumer.connector_service = Mock()
+        from controllers.fastapi.app import app
+        yield app
+
+
+def _async_routes(app):
+    for route in app.routes:
+        endpoint = getattr(route, "endpoint", None)
+        if endpoint is None or not inspect.iscoroutinefunction(endpoint):
+            continue
+        if not endpoint.__module__.startswith(ROUTERS_PACKAGE):
+            continue
+        yield route, endpoint
+
+
+def _stub_targets(module):
+    """Yield the (object, attribute) pairs of the blocking collaborators of a router module."""
+    from utils.async_utils import AsyncManagerWrapper
+
+    for name, value in list(vars(module).items()):
+        if (module.__name__, name) in IN_MEMORY_OBJECTS:
+            continue
+        if isinstance(value, AsyncManagerWrapper):
+            yield value, "_manager"
+        elif name.endswith(("_manager", "_service")) and not inspect.ismodule(value) and not inspect.isclass(value):
+            yield module, name
+
+
+async def _max_loop_lag(coro) -> float:
+    """Run the coroutine and return the longest time (ms) the event loop was blocked meanwhile."""
+    max_lag = 0.0
+    done = asyncio.Event()
+
+    async def heartbeat():
+        nonlocal max_lag
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(HEARTBEAT_INTERVAL)
+            max_lag = max(max_lag, (time.perf_counter() - start - HEARTBEAT_INTERVAL) * 1000)
+
+    monitor = asyncio.create_task(heartbeat())
+    await asyncio.sleep(0)
+    try:
+        await asyncio.wait_for(coro, timeout=ROUTE_TIMEOUT)
+    except Exception:
+        # Only the blocking behaviour matters here, the stubs do not return valid data
+        pass
+    finally:
+        done.set()
+        await monitor
+    return max_lag
+
+
+def _measure_route(endpoint) -> float:
+    kwargs = {name: MagicMock() for name in inspect.signature(endpoint).parameters}
+    return asyncio.run(_max_loop_lag(endpoint(**kwargs)))
+
+
+def test_async_routes_do_not_block_event_loop(app):
+    routes = list(_async_routes(app))
+    assert routes, "No async routes found"
+
+    # A full garbage collection of the loaded app would show up as loop lag as well
+    gc.collect()
+    gc.disable()
+    try:
+        offenders = _blocking_routes(routes)
+    finally:
+        gc.enable()
+
+    assert not offenders, "Routes blocking the event loop:\n" + "\n".join(offenders)
+
+
+def _blocking_routes(routes) -> list:
+    offenders = []
+    for route, endpoint in routes:
+        module = sys.modules[endpoint.__module__]
+        patches = [patch.object(target, attribute, SlowStub()) for target, attribute in _stub_targets(module)]
+        if not patches:
+            continue
+
+        for patcher in patches:
+            patcher.start()
+        try:
+            lag = _measure_route(endpoint)
+            if lag > MAX_LOOP_BLOCKING_MS:
+                # A blocking call stalls the loop on every run, a busy test machine only once in a while
+                lag = min(lag, _measure_route(endpoint))
+        finally:
+            for patcher in patches:
+                patcher.stop()
+
+        if lag > MAX_LOOP_BLOCKING_MS:
+            offenders.append(f"{sorted(route.methods)} {route.path} ({endpoint.__module__}.{endpoint.__name__}): {lag:.0f} ms")
+
+    return offenders
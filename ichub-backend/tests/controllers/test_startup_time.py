@@ -0,0 +1,173 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+"""
+Startup time benchmark of the backend.
+
+The clients the backend depends on are replaced by stubs that sleep like a slow
+database, IAM or connector would do. The application lifespan must complete
+(i.e. Uvicorn can bind) without waiting for them, the clients must be started in
+parallel as far as their dependencies allow, and the readiness endpoint must
+report them per dependency.
+"""
+
+import asyncio
+import sys
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from tools.exceptions import NotAvailableError
+from utils.service_container import ServiceContainer, ServiceProxy, ServiceState
+
+STUB_DELAY = 0.3
+MAX_LIFESPAN_STARTUP_SECONDS = 0.1
+
+_MODULES_NEEDING_REAL_IMPL = [
+    "managers.config.config_manager",
+    "managers.config.log_manager",
+    "tools.exceptions",
+    "tools.constants",
+]
+
+
+def _slow(value=True, delay=STUB_DELAY, error=None):
+    def initializer():
+        time.sleep(delay)
+        if error:
+            raise error
+        return value
+    return initializer
+
+
+def _register_backend_stubs(container: ServiceContainer) -> float:
+    """Register stubs shaped like the real clients, return the time a sequential startup would take."""
+    container.register("database", _slow())
+    container.register("discovery", _slow())
+    container.register("keycloak", _slow(), critical=False)
+    container.register("connector", _slow({"connector_manager": "connector"}), depends_on=("database",), wait_for=("discovery",))
+    container.register("dtr", _slow(), wait_for=("connector",))
+    container.register("pcf_kit", _slow(), depends_on=("database",), critical=False, lazy=True)
+    return 5 * STUB_DELAY
+
+
+class TestServiceContainer:
+
+    def test_services_start_in_parallel_respecting_dependencies(self):
+        container = ServiceContainer(wait_timeout=5)
+        sequential_seconds = _register_backend_stubs(container)
+
+        started = time.perf_counter()
+        container.start()
+        assert container.wait_until_ready(timeout=5), container.get_status()
+        startup_seconds = time.perf_counter() - started
+
+        # database/discovery/keycloak -> connector -> dtr
+        assert 3 * STUB_DELAY <= startup_seconds < sequential_seconds - STUB_DELAY
+        assert container.get_status()["services"]["pcf_kit"]["state"] == ServiceState.PENDING.value
+
+    def test_lazy_service_starts_on_first_use(self):
+        container = ServiceContainer(wait_timeout=5)
+        container.register("database", _slow(delay=0))
+        container.register("pcf_kit", _slow("schemas", delay=0), depends_on=("database",), critical=False, lazy=True)
+
+        assert container.get("pcf_kit") == "schemas"
+        assert container.get_status()["services"]["database"]["state"] == ServiceState.READY.value
+
+    def test_failed_dependency_fails_dependent_service_only(self):
+        container = ServiceContainer(wait_timeout=5)
+        container.register("database", _slow(delay=0, error=ConnectionError("db down")))
+        container.register("discovery", _slow(delay=0, error=ConnectionError("iam down")))
+        container.register("connector", _slow(delay=0), depends_on=("database",))
+        container.register("dtr", _slow("dtr", delay=0), wait_for=("discovery",))
+        container.start()
+
+        assert not container.wait_until_ready(timeout=5)
+        assert container.get("dtr") == "dtr"
+        with pytest.raises(NotAvailableError):
+            container.get("connector")
+        status = container.get_status()
+        assert status["status"] == "FAILED"
+        assert "db down" in status["services"]["connector"]["error"]
+
+    def test_service_still_starting_is_not_available(self):
+        container = ServiceContainer(wait_timeout=0.01)
+        container.register("database", _slow())
+        container.start()
+
+        with pytest.raises(NotAvailableError):
+            container.get("database")
+        assert container.get_status()["status"] == "STARTING"
+        with patch.object(ServiceContainer, "_instance", container):
+            assert not ServiceProxy("database")
+
+    def test_proxy_resolves_the_client_on_use(self):
+        container = ServiceContainer(wait_timeout=5)
+        container.register("connector", _slow({"connector_manager": MagicMock(name="manager")}, delay=0))
+
+        with patch.object(ServiceContainer, "_instance", container):
+            proxy = ServiceProxy("connector", "connector_manager")
+            proxy.provider.register_dtr_offer("x")
+            container.get("connector")["connector_manager"].provider.register_dtr_offer.assert_called_once_with("x")
+
+
+@pytest.fixture(scope="module")
+def app():
+    for mod_name in _MODULES_NEEDING_REAL_IMPL:
+        if isinstance(sys.modules.get(mod_name), MagicMock):
+            sys.modules.pop(mod_name)
+
+    with patch("services.notifications.notifications_management_service.connector_manager"), \
+         patch("services.notifications.notifications_management_service.dtr_manager"):
+        from controllers.fastapi.app import app
+        yield app
+
+
+def test_lifespan_does_not_wait_for_slow_clients(app):
+    from fastapi.testclient import TestClient
+
+    container = ServiceContainer(wait_timeout=5)
+    _register_backend_stubs(container)
+
+    async def lifespan_startup_seconds() -> float:
+        started = time.perf_counter()
+        async with app.router.lifespan_context(app):
+            return time.perf_counter() - started
+
+    with patch.object(ServiceContainer, "_instance", container), \
+         patch("controllers.fastapi.app.AspectRegistrationWorker"), \
+         patch("controllers.fastapi.app.NotificationOutboxDispatcher"), \
+         patch("controllers.fastapi.app.op.timestamp", return_value="2026-01-01T00:00:00"):
+        startup_seconds = asyncio.run(lifespan_startup_seconds())
+        assert startup_seconds < MAX_LIFESPAN_STARTUP_SECONDS, f"Lifespan startup took {startup_seconds:.3f}s"
+
+        client = TestClient(app)
+        response = client.get("/ready")
+        assert response.status_code == 503
+        assert response.json()["services"]["database"]["state"] in (ServiceState.STARTING.value, ServiceState.READY.value)
+
+        assert container.wait_until_ready(timeout=5)
+        response = client.get("/ready")
+        assert response.status_code == 200
+        assert response.json()["status"] == "READY"
@@ -0,0 +1,80 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import base64
+
+from managers.addons_service.ccm_kit.v1.document_cache import CcmDocumentCache
+
+
+class TestCcmDocumentCache:
+    """Unit tests for the LRU cache of encoded certificate documents."""
+
+    def test_loader_only_called_on_miss(self):
+        cache = CcmDocumentCache()
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return b"%PDF"
+
+        first = cache.get_or_load(1, "v1", loader)
+        second = cache.get_or_load(1, "v1", loader)
+
+        assert first is second
+        assert first.content_base64 == base64.b64encode(b"%PDF").decode("ascii")
+        assert len(calls) == 1
+        assert cache.stats()["hits"] == 1
+
+    def test_new_version_is_loaded_again(self):
+        cache = CcmDocumentCache()
+        old = cache.get_or_load(1, "v1", lambda: b"old")
+        new = cache.get_or_load(1, "v2", lambda: b"new")
+
+        assert old.digest != new.digest
+        assert cache.invalidate(1) == 2
+        assert len(cache) == 0
+
+    def test_missing_document_is_empty(self):
+        document = CcmDocumentCache().get_or_load(1, "v1", lambda: None)
+
+        assert document.content_base64 == ""
+        assert document.digest == ""
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = CcmDocumentCache(max_entries=2)
+        cache.get_or_load(1, "v1", lambda: b"a")
+        cache.get_or_load(2, "v1", lambda: b"b")
+        cache.get_or_load(1, "v1", lambda: b"a")
+        cache.get_or_load(3, "v1", lambda: b"c")
+
+        assert len(cache) == 2
+        assert cache.evictions == 1
+        assert cache.get_or_load(1, "v1", lambda: b"x").content_base64 == base64.b64encode(b"a").decode("ascii")
+
+    def test_byte_budget_is_respected(self):
+        cache = CcmDocumentCache(max_bytes=16)
+        cache.get_or_load(1, "v1", lambda: b"0123456789")
+        cache.get_or_load(2, "v1", lambda: b"0123456789")
+
+        assert cache.stats()["bytes"] <= 16
+        assert len(cache) == 1
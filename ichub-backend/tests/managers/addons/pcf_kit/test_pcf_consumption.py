@@ -0,0 +1,136 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+"""
+Tests for the set-based PCF assembly progress and download queries, on an in-memory SQLite database.
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+from uuid import uuid4
+
+import pytest
+from sqlmodel import Session, SQLModel
+
+from managers.addons_service.pcf_kit.v1.consumption import PcfConsumptionManager, RESPONDED_STATUSES
+from managers.metadata_database.repositories import PCFRepository, PCFRelationshipRepository
+from models.metadata_database.pcf import PcfExchangeDirection, PcfExchangeStatus, PcfExchangeType
+from models.metadata_database.pcf.models import PcfExchangeEntity, PcfPartEdgeEntity, PcfRelationshipEntity, PcfRollupEntity
+from tests.test_managers.consumer.sqlite_engine import get_sqlite_engine
+
+MAIN_PART_ID = "MAIN-001"
+
+
+@pytest.fixture
+def session():
+    engine = get_sqlite_engine()
+    tables = [PcfExchangeEntity.__table__, PcfRelationshipEntity.__table__, PcfPartEdgeEntity.__table__, PcfRollupEntity.__table__]
+    SQLModel.metadata.create_all(engine, tables=tables)
+    with Session(engine) as session:
+        yield session
+    SQLModel.metadata.drop_all(engine, tables=tables)
+
+
+def _add_sub_part(repository: PCFRepository, part_id: str, response_status=None, created_at=None):
+    request_id = uuid4()
+    request = repository.create_new(
+        requesting_bpn="BPNL000000000001",
+        responding_bpn="BPNL000000000002",
+        direction=PcfExchangeDirection.OUTGOING,
+        type=PcfExchangeType.REQUEST,
+        manufacturer_part_id=part_id,
+        request_id=request_id,
+    )
+    if created_at:
+        request.created_at = created_at
+    if response_status:
+        repository.create_new(
+            requesting_bpn="BPNL000000000001",
+            responding_bpn="BPNL000000000002",
+            direction=PcfExchangeDirection.INCOMING,
+            type=PcfExchangeType.RESPONSE,
+            manufacturer_part_id=part_id,
+            request_id=request_id,
+            status=response_status,
+            version="v7.0.0",
+        )
+    return request
+
+
+def test_count_responses_by_part_ids(session):
+    repository = PCFRepository(session)
+    _add_sub_part(repository, "SUB-1", PcfExchangeStatus.DELIVERED)
+    _add_sub_part(repository, "SUB-2", PcfExchangeStatus.UPDATED)
+    _add_sub_part(repository, "SUB-3", PcfExchangeStatus.REJECTED)
+    _add_sub_part(repository, "SUB-4")
+    session.commit()
+
+    assert repository.count_responses_by_part_ids(["SUB-1", "SUB-2", "SUB-3", "SUB-4", "UNKNOWN"], RESPONDED_STATUSES) == (4, 2)
+    assert repository.count_responses_by_part_ids([], RESPONDED_STATUSES) == (0, 0)
+
+
+def test_find_latest_by_part_ids_with_response_uses_newest_request(session):
+    repository = PCFRepository(session)
+    _add_sub_part(repository, "SUB-1", PcfExchangeStatus.DELIVERED, created_at=datetime.now(timezone.utc) - timedelta(days=1))
+    newest = _add_sub_part(repository, "SUB-1")
+    session.commit()
+
+    exchange, response = repository.find_latest_by_part_ids_with_response(["SUB-1"])["SUB-1"]
+
+    assert exchange.request_id == newest.request_id
+    assert response is None
+
+
+def test_download_pcf_data_reads_all_payloads(session):
+    repository = PCFRepository(session)
+    PCFRelationshipRepository(session).create_new(MAIN_PART_ID, ["SUB-1", "SUB-2"])
+    _add_sub_part(repository, "SUB-1", PcfExchangeStatus.DELIVERED)
+    _add_sub_part(repository, "SUB-2", PcfExchangeStatus.DELIVERED)
+    session.commit()
+    repo_manager = Mock(pcf_repository=repository, pcf_relationship_repository=PCFRelationshipRepository(session))
+
+    with patch("managers.addons_service.pcf_kit.v1.consumption.RepositoryManagerFactory.create") as create, \
+         patch("managers.addons_service.pcf_kit.v1.consumption.management_manager") as management:
+        create.return_value.__enter__.return_value = repo_manager
+        management.get_pcf_data_by_manufacturer_part_id.side_effect = lambda part_id, version: {"id": part_id, "version": version}
+        result = PcfConsumptionManager().download_pcf_data(MAIN_PART_ID)
+        progress = PcfConsumptionManager().consult_global_assembly_progress(MAIN_PART_ID)
+
+    assert [item.pcf_data for item in result] == [{"id": "SUB-1", "version": "v7.0.0"}, {"id": "SUB-2", "version": "v7.0.0"}]
+    assert (progress.total_sub_parts, progress.responded_sub_parts, progress.overall_status) == (2, 2, "COMPLETED")
+
+
+def test_download_pcf_data_requires_all_responses(session):
+    repository = PCFRepository(session)
+    PCFRelationshipRepository(session).create_new(MAIN_PART_ID, ["SUB-1", "SUB-2"])
+    _add_sub_part(repository, "SUB-1", PcfExchangeStatus.DELIVERED)
+    _add_sub_part(repository, "SUB-2")
+    session.commit()
+    repo_manager = Mock(pcf_repository=repository, pcf_relationship_repository=PCFRelationshipRepository(session))
+
+    with patch("managers.addons_service.pcf_kit.v1.consumption.RepositoryManagerFactory.create") as create, \
+         patch("managers.addons_service.pcf_kit.v1.consumption.management_manager") as management:
+        create.return_value.__enter__.return_value = repo_manager
+        with pytest.raises(ValueError, match="50.0%"):
+            PcfConsumptionManager().download_pcf_data(MAIN_PART_ID)
+
+    management.get_pcf_data_by_manufacturer_part_id.assert_not_called()
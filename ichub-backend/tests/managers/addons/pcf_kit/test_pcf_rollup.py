@@ -0,0 +1,181 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+"""
+Tests for the PCF part-relationship graph and the roll-up of PCF values over it, on an in-memory SQLite database.
+"""
+
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+from sqlmodel import Session, SQLModel
+
+from managers.addons_service.pcf_kit.v1.rollup import PcfRollupManager, roll_up
+from managers.metadata_database.repositories import PCFRelationshipRepository
+from models.metadata_database.pcf.models import PcfExchangeEntity, PcfPartEdgeEntity, PcfRelationshipEntity, PcfRollupEntity
+from tests.test_managers.consumer.sqlite_engine import get_sqlite_engine
+
+
+@pytest.fixture
+def session():
+    engine = get_sqlite_engine()
+    tables = [PcfExchangeEntity.__table__, PcfRelationshipEntity.__table__, PcfPartEdgeEntity.__table__, PcfRollupEntity.__table__]
+    SQLModel.metadata.create_all(engine, tables=tables)
+    with Session(engine) as session:
+        yield session
+    SQLModel.metadata.drop_all(engine, tables=tables)
+
+
+@pytest.fixture
+def repository(session):
+    # CAR -> 4x WHEEL -> 1x RIM + 2x TYRE, CAR -> 1x ENGINE
+    repository = PCFRelationshipRepository(session)
+    repository.create_new("CAR", [])
+    repository.create_new("WHEEL", ["RIM"])
+    repository.add_sub_manufacturer_part_id("CAR", "WHEEL", quantity=4)
+    repository.add_sub_manufacturer_part_id("CAR", "ENGINE")
+    repository.add_sub_manufacturer_part_id("WHEEL", "TYRE", quantity=2)
+    session.commit()
+    return repository
+
+
+def _pcf(value: float) -> dict:
+    return {"productLifeCycleStagesAndEmissions": {"productionStage": [{"pcfExcludingBiogenicUptake": value}]}}
+
+
+def test_find_descendant_edges_reads_all_levels(repository):
+    edges = repository.find_descendant_edges("CAR")
+
+    assert sorted(edges) == [("CAR", "ENGINE", 1.0), ("CAR", "WHEEL", 4.0), ("WHEEL", "RIM", 1.0), ("WHEEL", "TYRE", 2.0)]
+    assert sorted(repository.find_ancestor_ids(["TYRE"])) == ["CAR", "WHEEL"]
+
+
+def test_legacy_sub_parts_are_moved_to_edges(session):
+    session.add(PcfRelationshipEntity(main_manufacturer_part_id="MAIN", list_sub_manufacturer_part_id=["SUB-1", "SUB-2"]))
+    session.commit()
+    repository = PCFRelationshipRepository(session)
+
+    assert repository.find_sub_part_ids("MAIN") == ["SUB-1", "SUB-2"]
+    assert repository.find_by_main_manufacturer_part_id("MAIN").list_sub_manufacturer_part_id == []
+    assert repository.add_sub_manufacturer_part_id("MAIN", "SUB-1") is None
+
+
+def test_roll_up_weights_by_quantity_and_counts_missing_parts():
+    edges = [("CAR", "WHEEL", 4.0), ("CAR", "ENGINE", 1.0), ("WHEEL", "RIM", 1.0), ("WHEEL", "TYRE", 2.0)]
+
+    totals = roll_up(edges, {"RIM": (3.0, 0), "TYRE": (5.0, 0)})
+
+    assert totals["WHEEL"] == (13.0, 0)
+    assert totals["CAR"] == (52.0, 1)
+    assert totals["ENGINE"] == (None, 1)
+
+
+def test_roll_up_counts_a_shared_missing_part_once():
+    # A -> B -> D, A -> C -> D, D without a value
+    edges = [("A", "B", 1.0), ("A", "C", 1.0), ("B", "D", 1.0), ("C", "D", 1.0)]
+
+    totals = roll_up(edges, {})
+
+    assert totals["A"] == (0.0, 1)
+    assert totals["B"] == totals["C"] == (0.0, 1)
+
+
+def test_roll_up_rejects_cycles():
+    with pytest.raises(ValueError, match="cycle"):
+        roll_up([("A", "B", 1.0), ("B", "A", 1.0)], {})
+
+
+def test_roll_up_of_a_large_bill_of_materials():
+    # 4 levels of 10 sub-parts each: 11110 parts
+    edges, level = [], ["ROOT"]
+    for _ in range(4):
+        next_level = []
+        for parent_id in level:
+            for i in range(10):
+                child_id = f"{parent_id}.{i}"
+                edges.append((parent_id, child_id, 2.0))
+                next_level.append(child_id)
+        level = next_level
+    known = {part_id: (1.0, 0) for part_id in level}
+
+    started = time.monotonic()
+    totals = roll_up(edges, known)
+
+    assert time.monotonic() - started < 1
+    assert totals["ROOT"] == (20.0 ** 4, 0)
+
+
+def test_response_recomputes_the_ancestors(session, repository):
+    repo_manager = Mock(pcf_relationship_repository=repository, commit=session.commit)
+    manager = PcfRollupManager()
+
+    with patch("managers.addons_service.pcf_kit.v1.rollup.RepositoryManagerFactory.create") as create:
+        create.return_value.__enter__.return_value = repo_manager
+        manager.record_response("RIM", _pcf(3.0))
+        manager.record_response("TYRE", _pcf(5.0))
+        manager.record_response("ENGINE", _pcf(100.0))
+        rollups = repository.find_rollups(["CAR", "WHEEL"])
+        assert (rollups["WHEEL"].total_pcf, rollups["WHEEL"].missing_parts) == (13.0, 0)
+        assert (rollups["CAR"].total_pcf, rollups["CAR"].missing_parts) == (152.0, 0)
+
+        result = manager.rollup("CAR")
+
+    assert (result.pcf_excluding_biogenic, result.total_parts, result.complete) == (152.0, 4, True)
+
+
+def test_shared_sub_part_is_missing_once(session):
+    # A -> B -> D, A -> C -> D, D without a value
+    repository = PCFRelationshipRepository(session)
+    repository.create_new("A", ["B", "C"])
+    repository.create_new("B", ["D"])
+    repository.create_new("C", ["D"])
+    session.commit()
+    repo_manager = Mock(pcf_relationship_repository=repository, commit=session.commit)
+    repo_manager.pcf_repository.find_latest_by_part_ids_with_response.return_value = {}
+
+    with patch("managers.addons_service.pcf_kit.v1.rollup.RepositoryManagerFactory.create") as create:
+        create.return_value.__enter__.return_value = repo_manager
+        result = PcfRollupManager().rollup("A")
+
+    assert (result.total_parts, result.missing_parts, result.complete) == (3, 1, False)
+
+
+def test_legacy_tree_is_migrated_before_the_roll_up(session):
+    # Stored before the edges existed: MAIN -> SUB-1 -> SUB-1-A, MAIN -> SUB-2
+    session.add(PcfRelationshipEntity(main_manufacturer_part_id="MAIN", list_sub_manufacturer_part_id=["SUB-1", "SUB-2"]))
+    session.add(PcfRelationshipEntity(main_manufacturer_part_id="SUB-1", list_sub_manufacturer_part_id=["SUB-1-A"]))
+    session.commit()
+    repository = PCFRelationshipRepository(session)
+    repo_manager = Mock(pcf_relationship_repository=repository, commit=session.commit)
+    manager = PcfRollupManager()
+
+    with patch("managers.addons_service.pcf_kit.v1.rollup.RepositoryManagerFactory.create") as create:
+        create.return_value.__enter__.return_value = repo_manager
+        manager.record_response("SUB-1-A", _pcf(7.0))
+        assert (repository.find_rollups(["MAIN"])["MAIN"].total_pcf, repository.find_rollups(["MAIN"])["MAIN"].missing_parts) == (7.0, 1)
+
+        manager.record_response("SUB-2", _pcf(3.0))
+        result = manager.rollup("MAIN")
+
+    assert (result.pcf_excluding_biogenic, result.total_parts, result.missing_parts, result.complete) == (10.0, 3, 0, True)
+    assert repository.migrate_legacy_sub_parts() == 0
@@ -30,6 +30,7 @@ Covers the provider-side outbound operations:
 """
 
 import base64
+import json
 from datetime import date, datetime, timezone
 from unittest.mock import Mock, patch
 
@@ -50,6 +51,7 @@ from models.services.addons.ccm_kit.v1.notifications import (
     CcmAvailableRequest,
     CcmPushRequest,
 )
+from managers.addons_service.ccm_kit.v1.document_cache import ccm_document_cache
 from services.addons.ccm_kit.v1.ccm_provider_service import (
     CcmProviderService,
 )
@@ -89,6 +91,7 @@ def _make_ccm(**kwargs) -> Mock:
     m.issuer_bpn = kwargs.get("issuer_bpn", "BPNL000000000ISS")
     m.doc = kwargs.get("doc", b"%PDF-1.4 test content")
     m.created_at = kwargs.get("created_at", datetime(2024, 6, 1, tzinfo=timezone.utc))
+    m.updated_at = kwargs.get("updated_at", datetime(2024, 6, 2, tzinfo=timezone.utc))
     m.edc_asset_id = kwargs.get("edc_asset_id", None)
 
     # Sites
@@ -115,6 +118,13 @@ def service():
     return CcmProviderService()
 
 
+@pytest.fixture(autouse=True)
+def _clear_document_cache():
+    ccm_document_cache.clear()
+    yield
+    ccm_document_cache.clear()
+
+
 def _push_request(cert_id: int = CERT_ID) -> CcmPushRequest:
     return CcmPushRequest(
         sender_bpn=SENDER_BPN,
@@ -1051,6 +1061,103 @@ class TestGetCertificatePayload:
             service.get_certificate_payload(999)
 
 
+class TestStreamCertificatePayload:
+    """Tests for CcmProviderService.stream_certificate_payload"""
+
+    @patch(
+        "services.addons.ccm_kit.v1.ccm_provider_service"
+        ".RepositoryManagerFactory.create"
+    )
+    def test_streamed_body_matches_payload(self, mock_factory, service):
+        """
+        GIVEN a certificate with a document
+        WHEN the payload is streamed
+        THEN the joined chunks are the same JSON as get_certificate_payload.
+        """
+        ccm = _make_ccm()
+        repos = Mock()
+        repos.ccm_repository.find_by_id_with_relations.return_value = ccm
+        mock_factory.return_value.__enter__.return_value = repos
+
+        etag, chunks = service.stream_certificate_payload(CERT_ID)
+        body = json.loads(b"".join(chunks))
+
+        assert etag.startswith('"') and etag.endswith('"')
+        assert body == service.get_certificate_payload(CERT_ID)
+        assert body["document"]["contentBase64"] == base64.b64encode(ccm.doc).decode("ascii")
+
+    @patch(
+        "services.addons.ccm_kit.v1.ccm_provider_service"
+        ".PAYLOAD_CHUNK_SIZE", 4
+    )
+    @patch(
+        "services.addons.ccm_kit.v1.ccm_provider_service"
+        ".RepositoryManagerFactory.create"
+    )
+    def test_document_is_written_in_chunks(self, mock_factory, service):
+        """
+        GIVEN a chunk size smaller than the encoded document
+        WHEN the payload is streamed
+        THEN the document is split over several chunks and the body stays valid JSON.
+        """
+        repos = Mock()
+        repos.ccm_repository.find_by_id_with_relations.return_value = _make_ccm()
+        mock_factory.return_value.__enter__.return_value = repos
+
+        _, chunks = service.stream_certificate_payload(CERT_ID)
+        parts = list(chunks)
+
+        assert len(parts) > 3
+        assert json.loads(b"".join(parts))["businessPartnerNumber"] == "BPNL000000000001"
+
+    @patch(
+        "services.addons.ccm_kit.v1.ccm_provider_service"
+        ".RepositoryManagerFactory.create"
+    )
+    def test_etag_follows_certificate_version(self, mock_factory, service):
+        """
+        GIVEN the same certificate pulled twice and then updated
+        WHEN the payload is streamed
+        THEN the ETag is stable between pulls and changes with the document.
+        """
+        repos = Mock()
+        mock_factory.return_value.__enter__.return_value = repos
+
+        repos.ccm_repository.find_by_id_with_relations.return_value = _make_ccm()
+        first, _ = service.stream_certificate_payload(CERT_ID)
+        repos.ccm_repository.find_by_id_with_relations.return_value = _make_ccm()
+        second, _ = service.stream_certificate_payload(CERT_ID)
+        repos.ccm_repository.find_by_id_with_relations.return_value = _make_ccm(
+            doc=b"%PDF-1.4 new content",
+            updated_at=datetime(2024, 7, 1, tzinfo=timezone.utc),
+        )
+        updated, _ = service.stream_certificate_payload(CERT_ID)
+
+        assert first == second
+        assert updated != first
+
+    @patch(
+        "services.addons.ccm_kit.v1.ccm_provider_service"
+        ".RepositoryManagerFactory.create"
+    )
+    def test_document_is_encoded_once_per_version(self, mock_factory, service):
+        """
+        GIVEN a certificate pulled twice without changes
+        WHEN the payload is streamed
+        THEN the second pull is served from the document cache.
+        """
+        repos = Mock()
+        repos.ccm_repository.find_by_id_with_relations.return_value = _make_ccm()
+        mock_factory.return_value.__enter__.return_value = repos
+
+        service.stream_certificate_payload(CERT_ID)
+        hits = ccm_document_cache.hits
+        service.stream_certificate_payload(CERT_ID)
+
+        assert ccm_document_cache.hits == hits + 1
+        assert len(ccm_document_cache) == 1
+
+
 # ---------------------------------------------------------------------------
 # Get Published Certificate Tests
 # ---------------------------------------------------------------------------
@@ -0,0 +1,189 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import threading
+import unittest
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+from sqlmodel import Session
+
+from managers.metadata_database.repositories import NotificationOutboxRepository
+from models.metadata_database.notification.models import NotificationOutboxEntry, NotificationOutboxStatus, NotificationStatus
+from services.notifications.notification_outbox_dispatcher import NotificationOutboxDispatcher, _OutboxItem
+from tests.test_managers.consumer.sqlite_engine import get_sqlite_engine
+from tools.datetime_tools import utc_now_naive
+
+FACTORY = "services.notifications.notification_outbox_dispatcher.RepositoryManagerFactory.create"
+
+
+def _repo_with(outbox_repository):
+    repo = MagicMock()
+    repo.__enter__.return_value = repo
+    repo.notification_outbox_repository = outbox_repository
+    return repo
+
+
+def _entry(id, receiver_bpn="BPNL000000000001", dct_type=None, attempts=1):
+    return SimpleNamespace(id=id, message_id=uuid4(), receiver_bpn=receiver_bpn, provider_dsp_url=None, endpoint_path=None,
+                           policies=None, dct_type=dct_type, attempts=attempts, status="running", next_attempt_date=None,
+                           locked_by="w", locked_until=utc_now_naive(), last_error=None, modified_date=None)
+
+
+def _item(entry):
+    return _OutboxItem(id=entry.id, message_id=entry.message_id, receiver_bpn=entry.receiver_bpn, provider_dsp_url=entry.provider_dsp_url,
+                       endpoint_path=entry.endpoint_path, policies=entry.policies, dct_type=entry.dct_type)
+
+
+class TestNotificationOutboxDispatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.service = MagicMock()
+        self.outbox_repository = MagicMock()
+        self.repo = _repo_with(self.outbox_repository)
+        self.dispatcher = NotificationOutboxDispatcher(
+            notifications_service=self.service, workers=2, batch_size=10, retry_backoff=10, max_retry_backoff=25, max_attempts=3
+        )
+
+    def tearDown(self):
+        self.dispatcher.stop()
+
+    def test_run_once_sends_each_receiver_batch_over_one_transfer(self):
+        done = threading.Event()
+        entries = [_entry(1), _entry(2), _entry(3, dct_type="https://w3id.org/catenax/taxonomy#Other")]
+        self.outbox_repository.claim_next_group.side_effect = [entries, []]
+        self.service.send_notifications.side_effect = lambda message_ids, **kwargs: {message_id: None for message_id in message_ids}
+        self.outbox_repository.mark_sent.side_effect = lambda ids, worker_id: ids
+        self.repo.commit.side_effect = lambda: done.set() if self.outbox_repository.mark_sent.called else None
+
+        with patch(FACTORY, return_value=self.repo):
+            self.assertEqual(self.dispatcher.run_once(), 3)
+            self.assertTrue(done.wait(2))
+
+        self.assertEqual(self.outbox_repository.claim_next_group.call_args.kwargs["limit"], 10)
+        self.assertEqual(self.service.send_notifications.call_count, 2)
+        self.assertEqual(self.service.send_notifications.call_args_list[0].kwargs["message_ids"], [entries[0].message_id, entries[1].message_id])
+        self.outbox_repository.mark_sent.assert_called_once_with([1, 2, 3], worker_id=self.dispatcher.worker_id)
+        self.repo.notification_repository.update_status_by_message_ids.assert_any_call(
+            [entry.message_id for entry in entries], NotificationStatus.SENT
+        )
+
+    def test_failed_notification_is_requeued_with_backoff(self):
+        sent, failed = _entry(1), _entry(2, attempts=2)
+        self.outbox_repository.find_by_ids.return_value = [failed]
+        self.outbox_repository.mark_sent.return_value = [1]
+
+        with patch(FACTORY, return_value=self.repo):
+            self.dispatcher._record_results(
+                [_item(sent), _item(failed)],
+                {sent.message_id: None, failed.message_id: "dataplane down"}
+            )
+
+        self.outbox_repository.mark_sent.assert_called_once_with([1], worker_id=self.dispatcher.worker_id)
+        self.outbox_repository.find_by_ids.assert_called_once_with([2], locked_by=self.dispatcher.worker_id)
+        self.assertEqual(failed.status, NotificationOutboxStatus.QUEUED.value)
+        self.assertAlmostEqual((failed.next_attempt_date - failed.modified_date).total_seconds(), 20)
+        self.assertEqual(failed.last_error, "dataplane down")
+        self.assertIsNone(failed.locked_by)
+
+    def test_unreachable_receiver_fails_batch_after_max_attempts(self):
+        entries = [_entry(1, attempts=3), _entry(2, attempts=3)]
+        self.outbox_repository.find_by_ids.return_value = entries
+        self.outbox_repository.mark_sent.return_value = []
+        self.service.send_notifications.side_effect = ConnectionError("connector down")
+        self.dispatcher._running.update({1, 2})
+
+        with patch(FACTORY, return_value=self.repo):
+            self.dispatcher._slots.acquire()
+            self.dispatcher._process([_item(entry) for entry in entries])
+
+        self.service.send_notifications.assert_called_once()
+        self.assertEqual([entry.status for entry in entries], [NotificationOutboxStatus.FAILED.value] * 2)
+        self.repo.notification_repository.update_status_by_message_ids.assert_any_call(
+            [entry.message_id for entry in entries], NotificationStatus.FAILED
+        )
+
+    def test_entries_taken_over_are_neither_sent_nor_recorded(self):
+        entries = [_entry(1), _entry(2, receiver_bpn="BPNL000000000001", dct_type="https://w3id.org/catenax/taxonomy#Other")]
+        self.dispatcher._running.update({1, 2})
+        self.outbox_repository.renew_leases.return_value = [1]
+        self.outbox_repository.mark_sent.side_effect = lambda ids, worker_id: ids
+        self.service.send_notifications.side_effect = lambda message_ids, **kwargs: {message_id: None for message_id in message_ids}
+
+        with patch(FACTORY, return_value=self.repo):
+            self.dispatcher.renew_leases(force=True)
+            self.dispatcher._slots.acquire()
+            self.dispatcher._process([_item(entry) for entry in entries])
+
+        self.assertEqual(self.outbox_repository.renew_leases.call_args.kwargs["worker_id"], self.dispatcher.worker_id)
+        self.service.send_notifications.assert_called_once()
+        self.assertEqual(self.service.send_notifications.call_args.kwargs["message_ids"], [entries[0].message_id])
+        self.outbox_repository.mark_sent.assert_called_once_with([1], worker_id=self.dispatcher.worker_id)
+        self.assertEqual(self.dispatcher._running, set())
+
+
+class TestNotificationOutboxLeases(unittest.TestCase):
+    """The outcome of a batch is only written by the dispatcher holding the lease."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = get_sqlite_engine()
+        NotificationOutboxEntry.metadata.create_all(cls.engine, tables=[NotificationOutboxEntry.__table__])
+
+    def setUp(self):
+        self.session = Session(self.engine)
+        self.repository = NotificationOutboxRepository(self.session)
+        entry = self.repository.create_new(message_id=uuid4(), receiver_bpn="BPNL000000000001")
+        self.session.commit()
+        self.entry_id = entry.id
+
+    def tearDown(self):
+        self.session.delete(self.session.get(NotificationOutboxEntry, self.entry_id))
+        self.session.commit()
+        self.session.close()
+
+    def test_batch_taken_over_is_not_overwritten_by_the_first_dispatcher(self):
+        self.repository.claim_next_group(worker_id="dispatcher-a", lease_seconds=60)
+        self.session.commit()
+        self.session.get(NotificationOutboxEntry, self.entry_id).locked_until = utc_now_naive() - timedelta(seconds=1)
+        self.session.commit()
+        self.assertEqual(len(self.repository.claim_next_group(worker_id="dispatcher-b", lease_seconds=60)), 1)
+        self.session.commit()
+
+        self.assertEqual(self.repository.renew_leases([self.entry_id], worker_id="dispatcher-a"), [])
+        self.assertEqual(self.repository.mark_sent([self.entry_id], worker_id="dispatcher-a"), [])
+        self.assertEqual(self.repository.find_by_ids([self.entry_id], locked_by="dispatcher-a"), [])
+        self.session.commit()
+        self.session.expire_all()
+
+        entry = self.session.get(NotificationOutboxEntry, self.entry_id)
+        self.assertEqual(entry.status, NotificationOutboxStatus.RUNNING.value)
+        self.assertEqual(entry.locked_by, "dispatcher-b")
+        self.assertEqual(entry.attempts, 2)
+        self.assertEqual(self.repository.mark_sent([self.entry_id], worker_id="dispatcher-b"), [self.entry_id])
+
+
+if __name__ == "__main__":
+    unittest.main()
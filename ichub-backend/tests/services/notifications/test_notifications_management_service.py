@@ -254,9 +254,11 @@ class TestNotificationsManagementService:
         mock_repo_manager.__enter__.return_value = mock_repo_manager
         mock_repo_manager.__exit__.return_value = None
         mock_repo_factory.return_value.create.return_value = mock_repo_manager
-        self.service.submodel_service_manager.get_twin_aspect_document.return_value = {
-            "header": {"message_id": str(sample_notification_entity.message_id)},
-            "content": {"test": "data"}
+        self.service.submodel_service_manager.get_twin_aspect_documents.return_value = {
+            sample_notification_entity.message_id: {
+                "header": {"message_id": str(sample_notification_entity.message_id)},
+                "content": {"test": "data"}
+            }
         }
         
         # Act
@@ -288,13 +290,57 @@ class TestNotificationsManagementService:
         mock_repo_manager.__enter__.return_value = mock_repo_manager
         mock_repo_manager.__exit__.return_value = None
         mock_repo_factory.return_value.create.return_value = mock_repo_manager
-        self.service.submodel_service_manager.get_twin_aspect_document.return_value = {}
         
         # Act
         result = self.service.get_all_notifications(bpn=bpn)
         
         # Assert
         assert result == []
+        self.service.submodel_service_manager.get_twin_aspect_documents.assert_not_called()
+
+    @patch('services.notifications.notifications_management_service.RepositoryManagerFactory')
+    def test_get_all_notifications_reads_payloads_in_one_call(self, mock_repo_factory, sample_notification_entity):
+        """Test the payloads of a page are read with a single bulk call."""
+        # Arrange
+        mock_repo_manager = MagicMock()
+        mock_repo_manager.notification_repository.find_by_bpn.return_value = [sample_notification_entity]
+        mock_repo_manager.__enter__.return_value = mock_repo_manager
+        mock_repo_manager.__exit__.return_value = None
+        mock_repo_factory.return_value.create.return_value = mock_repo_manager
+        payload = {"header": {"message_id": str(sample_notification_entity.message_id)}, "content": {}}
+        self.service.submodel_service_manager.get_twin_aspect_documents.return_value = {
+            sample_notification_entity.message_id: payload
+        }
+        
+        # Act
+        result = self.service.get_all_notifications(bpn="BPNL00000000024R")
+        
+        # Assert
+        assert result[0].full_notification == payload
+        self.service.submodel_service_manager.get_twin_aspect_documents.assert_called_once_with(
+            submodel_ids=[sample_notification_entity.message_id],
+            semantic_id=SEM_ID_NOTIFICATION
+        )
+        self.service.submodel_service_manager.get_twin_aspect_document.assert_not_called()
+
+    @patch('services.notifications.notifications_management_service.RepositoryManagerFactory')
+    def test_get_all_notifications_headers_only(self, mock_repo_factory, sample_notification_entity):
+        """Test the payloads are not read when only the headers are requested."""
+        # Arrange
+        mock_repo_manager = MagicMock()
+        mock_repo_manager.notification_repository.find_by_bpn.return_value = [sample_notification_entity]
+        mock_repo_manager.__enter__.return_value = mock_repo_manager
+        mock_repo_manager.__exit__.return_value = None
+        mock_repo_factory.return_value.create.return_value = mock_repo_manager
+        
+        # Act
+        result = self.service.get_all_notifications(bpn="BPNL00000000024R", include_payload=False)
+        
+        # Assert
+        assert len(result) == 1
+        assert result[0].full_notification is None
+        assert result[0].message_id == sample_notification_entity.message_id
+        self.service.submodel_service_manager.get_twin_aspect_documents.assert_not_called()
 
     @patch('services.notifications.notifications_management_service.RepositoryManagerFactory')
     def test_get_all_notifications_with_filters(self, mock_repo_factory, sample_notification_entity):
@@ -307,9 +353,11 @@ class TestNotificationsManagementService:
         mock_repo_manager.__enter__.return_value = mock_repo_manager
         mock_repo_manager.__exit__.return_value = None
         mock_repo_factory.return_value.create.return_value = mock_repo_manager
-        self.service.submodel_service_manager.get_twin_aspect_document.return_value = {
-            "header": {"message_id": str(sample_notification_entity.message_id)},
-            "content": {"test": "data"}
+        self.service.submodel_service_manager.get_twin_aspect_documents.return_value = {
+            sample_notification_entity.message_id: {
+                "header": {"message_id": str(sample_notification_entity.message_id)},
+                "content": {"test": "data"}
+            }
         }
         
         # Act
@@ -875,6 +923,118 @@ class TestNotificationsManagementService:
         assert "Notification not found" in str(exc_info.value)
         mock_notification_consumer_service.return_value.send_notification.assert_not_called()
 
+    @patch('services.notifications.notifications_management_service.RepositoryManagerFactory')
+    def test_enqueue_notification_stores_outbox_entry_with_notification(self, mock_repo_factory, sample_notification_sdk, sample_notification_entity):
+        """The outbox entry is written in the same repository transaction as the notification."""
+        # Arrange
+        mock_repo_manager = MagicMock()
+        mock_repo_manager.notification_repository.create_new.return_value = sample_notification_entity
+        mock_repo_manager.__enter__.return_value = mock_repo_manager
+        mock_repo_manager.__exit__.return_value = None
+        mock_repo_factory.return_value.create.return_value = mock_repo_manager
+
+        # Act
+        result = self.service.enqueue_notification(
+            sample_notification_sdk,
+            use_case="Test Use Case",
+            list_policies=None,
+            dct_type="https://w3id.org/catenax/taxonomy#Test",
+        )
+
+        # Assert
+        assert result == sample_notification_entity
+        mock_repo_factory.return_value.create.assert_called_once()
+        call_kwargs = mock_repo_manager.notification_repository.create_new.call_args[1]
+        assert call_kwargs['direction'] == NotificationDirection.OUTGOING
+        assert call_kwargs['status'] == NotificationStatus.PENDING
+        mock_repo_manager.notification_outbox_repository.create_new.assert_called_once_with(
+            message_id=sample_notification_sdk.header.message_id,
+            receiver_bpn="BPNL000000000342",
+            provider_dsp_url=None,
+            endpoint_path=None,
+            policies=None,
+            dct_type="https://w3id.org/catenax/taxonomy#Test",
+        )
+
+    @patch('services.notifications.notifications_management_service.Notification')
+    @patch('services.notifications.notifications_management_service.NotificationConsumerService')
+    @patch('services.notifications.notifications_management_service.RepositoryManagerFactory')
+    def test_send_notifications_negotiates_once_per_batch(self, mock_repo_factory, mock_notification_consumer_service, mock_notification_cls):
+        """All notifications of a batch are posted with one negotiated EDR, failures are reported per message."""
+        # Arrange
+        sent_id, failing_id, missing_id = uuid4(), uuid4(), uuid4()
+        mock_repo_manager = MagicMock()
+        mock_repo_manager.notification_repository.find_by_message_ids.return_value = [
+            Mock(message_id=sent_id), Mock(message_id=failing_id)
+        ]
+        mock_repo_manager.__enter__.return_value = mock_repo_manager
+        mock_repo_manager.__exit__.return_value = None
+        mock_repo_factory.return_value.create.return_value = mock_repo_manager
+
+        self.service.submodel_service_manager.get_twin_aspect_documents.return_value = {
+            sent_id: {"id": "sent"}, failing_id: {"id": "failing"}, missing_id: None
+        }
+        notifications = {"sent": Mock(), "failing": Mock()}
+        for notification in notifications.values():
+            notification.header.context = "IndustryCore-UniqueIDPush-ConnectToParent:2.0.0"
+        mock_notification_cls.model_validate.side_effect = lambda payload: notifications[payload["id"]]
+
+        mock_service_instance = Mock()
+        mock_service_instance.get_notification_endpoint_with_bpnl.return_value = ("https://dataplane.example.com", "token123")
+
+        def send(notification, **kwargs):
+            if notification is notifications["failing"]:
+                raise ConnectionError("dataplane down")
+        mock_service_instance.send_notification_to_endpoint.side_effect = lambda **kwargs: send(**kwargs)
+        mock_notification_consumer_service.return_value = mock_service_instance
+        self.service.connector_consumer_service = Mock()
+
+        # Act
+        result = self.service.send_notifications(
+            message_ids=[sent_id, failing_id, missing_id],
+            provider_bpn="BPNL00000000024R",
+            provider_dsp_url="https://example.com/dsp",
+            list_policies=None,
+        )
+
+        # Assert
+        assert result == {sent_id: None, failing_id: "dataplane down", missing_id: "Notification not found"}
+        mock_service_instance.get_notification_endpoint_with_bpnl.assert_called_once_with(
+            bpnl="BPNL00000000024R",
+            counter_party_address="https://example.com/dsp",
+            policies=None,
+            dct_type=DIGITAL_TWIN_EVENT_API_TYPE,
+        )
+        assert mock_service_instance.send_notification_to_endpoint.call_count == 2
+        assert mock_service_instance.send_notification_to_endpoint.call_args[1]["endpoint_path"] == "/connect-to-parent"
+        mock_repo_manager.notification_repository.update_status.assert_not_called()
+
+    @patch('services.notifications.notifications_management_service.Notification')
+    @patch('services.notifications.notifications_management_service.NotificationConsumerService')
+    @patch('services.notifications.notifications_management_service.RepositoryManagerFactory')
+    def test_send_notifications_negotiation_failure_raises(self, mock_repo_factory, mock_notification_consumer_service, mock_notification_cls):
+        """If the provider cannot be reached, the whole batch fails with NotificationSendingError."""
+        # Arrange
+        message_id = uuid4()
+        mock_repo_manager = MagicMock()
+        mock_repo_manager.notification_repository.find_by_message_ids.return_value = [Mock(message_id=message_id)]
+        mock_repo_manager.__enter__.return_value = mock_repo_manager
+        mock_repo_manager.__exit__.return_value = None
+        mock_repo_factory.return_value.create.return_value = mock_repo_manager
+        self.service.submodel_service_manager.get_twin_aspect_documents.return_value = {message_id: {"id": "x"}}
+        mock_notification_consumer_service.return_value.get_notification_endpoint_with_bpnl.side_effect = Exception("no offer")
+        self.service.connector_consumer_service = Mock()
+
+        # Act & Assert
+        with pytest.raises(NotificationSendingError):
+            self.service.send_notifications(
+                message_ids=[message_id],
+                provider_bpn="BPNL00000000024R",
+                provider_dsp_url="https://example.com/dsp",
+                list_policies=None,
+            )
+        mock_notification_consumer_service.return_value.send_notification_to_endpoint.assert_not_called()
+
 
 class TestDeriveEndpointPath:
     """Unit tests for the _derive_endpoint_path static method.
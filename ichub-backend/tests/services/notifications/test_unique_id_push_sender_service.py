@@ -42,6 +42,14 @@ class TestUniqueIdPushSenderService:
         self.manufacturer_part_id = "MPN-12345"
         self.catena_x_id = str(uuid4())
 
+        # Send right away; the outbox is covered by TestUniqueIdPushSenderServiceOutbox
+        self.config = {"provider.notificationOutbox.enabled": False}
+        self.config_patcher = patch('services.notifications.unique_id_push_sender_service.ConfigManager')
+        self.config_patcher.start().get_config.side_effect = lambda key, default=None: self.config.get(key, default)
+
+    def teardown_method(self):
+        self.config_patcher.stop()
+
     @patch('services.notifications.unique_id_push_sender_service.ConfigManager')
     def test_send_connect_to_parent_success(self, mock_config_manager):
         """Test successful send creates and sends notification."""
@@ -55,7 +63,8 @@ class TestUniqueIdPushSenderService:
             "prohibition": [],
             "obligation": [],
         }
-        mock_config_manager.get_config.return_value = uid_push_policy
+        self.config["provider.uniqueIdPush.policy.consumption"] = uid_push_policy
+        mock_config_manager.get_config.side_effect = lambda key, default=None: self.config.get(key, default)
 
         entity = Mock(spec=NotificationEntity)
         entity.message_id = uuid4()
@@ -84,7 +93,7 @@ class TestUniqueIdPushSenderService:
         assert notification.header.sender_bpn == self.sender_bpn
         assert notification.header.receiver_bpn == self.receiver_bpn
 
-        mock_config_manager.get_config.assert_called_once_with("provider.uniqueIdPush.policy.consumption")
+        mock_config_manager.get_config.assert_any_call("provider.uniqueIdPush.policy.consumption")
         self.mock_notifications_service.send_notification.assert_called_once_with(
             message_id=entity.message_id,
             endpoint_url=None,
@@ -224,6 +233,57 @@ class TestUniqueIdPushSenderService:
         assert content_data.get("digitalTwinType") == "PartType"
 
 
+class TestUniqueIdPushSenderServiceOutbox:
+    """Test that UniqueIdPushSenderService queues the notification in the outbox when it is enabled."""
+
+    def setup_method(self):
+        self.mock_notifications_service = Mock()
+        self.service = UniqueIdPushSenderService(self.mock_notifications_service)
+        self.config = {
+            "provider.notificationOutbox.enabled": True,
+            "provider.uniqueIdPush.policy.consumption": {"permission": [], "prohibition": [], "obligation": []},
+        }
+
+    @patch('services.notifications.unique_id_push_sender_service.ConfigManager')
+    def test_send_connect_to_parent_enqueues_notification(self, mock_config_manager):
+        """Test that the notification is queued instead of sent in the request."""
+        mock_config_manager.get_config.side_effect = lambda key, default=None: self.config.get(key, default)
+        entity = Mock(spec=NotificationEntity)
+        entity.message_id = uuid4()
+        self.mock_notifications_service.enqueue_notification.return_value = entity
+
+        result = self.service.send_connect_to_parent(
+            sender_bpn="BPNL000000000001",
+            receiver_bpn="BPNL000000000002",
+            manufacturer_part_id="MPN-12345",
+            catena_x_id=str(uuid4()),
+        )
+
+        assert result == entity.message_id
+        call_args = self.mock_notifications_service.enqueue_notification.call_args
+        assert call_args[0][0].header.receiver_bpn == "BPNL000000000002"
+        assert call_args.kwargs["use_case"] == INDUSTRY_CORE_HUB
+        assert call_args.kwargs["list_policies"] == [self.config["provider.uniqueIdPush.policy.consumption"]]
+        assert call_args.kwargs["dct_type"] == UNIQUE_ID_PUSH_DCT_TYPE
+        self.mock_notifications_service.create_notification.assert_not_called()
+        self.mock_notifications_service.send_notification.assert_not_called()
+
+    @patch('services.notifications.unique_id_push_sender_service.ConfigManager')
+    def test_enqueue_failure_returns_none(self, mock_config_manager):
+        """Test that a failure to queue the notification does not raise but returns None."""
+        mock_config_manager.get_config.side_effect = lambda key, default=None: self.config.get(key, default)
+        self.mock_notifications_service.enqueue_notification.side_effect = Exception("DB error")
+
+        result = self.service.send_connect_to_parent(
+            sender_bpn="BPNL000000000001",
+            receiver_bpn="BPNL000000000002",
+            manufacturer_part_id="MPN-12345",
+            catena_x_id=str(uuid4()),
+        )
+
+        assert result is None
+
+
 class TestSharingServiceUniqueIdPushIntegration:
     """Test that sharing_service correctly triggers Unique ID Push when enabled."""
 
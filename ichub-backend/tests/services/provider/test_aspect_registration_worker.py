@@ -0,0 +1,177 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import threading
+import unittest
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from sqlmodel import Session
+
+from managers.metadata_database.repositories import TwinAspectRegistrationJobRepository
+from models.metadata_database.provider.models import TwinAspectRegistrationJob, TwinAspectRegistrationJobStatus
+from services.provider.aspect_registration_worker import AspectRegistrationWorker
+from tests.test_managers.consumer.sqlite_engine import get_sqlite_engine
+from tools.datetime_tools import utc_now_naive
+
+FACTORY = "services.provider.aspect_registration_worker.RepositoryManagerFactory.create"
+
+
+def _repo_with(job_repository):
+    repo = MagicMock()
+    repo.__enter__.return_value = repo
+    repo.twin_aspect_registration_job_repository = job_repository
+    return repo
+
+
+class TestAspectRegistrationWorker(unittest.TestCase):
+
+    def setUp(self):
+        self.service = MagicMock()
+        self.job_repository = MagicMock()
+        self.worker = AspectRegistrationWorker(
+            twin_management_service=self.service, workers=2, retry_backoff=10, max_retry_backoff=25, max_attempts=3
+        )
+
+    def tearDown(self):
+        self.worker.stop()
+
+    def test_run_once_claims_one_job_per_idle_slot(self):
+        done = threading.Event()
+        self.service.process_twin_aspect_registration_job.side_effect = lambda job_id, worker_id: done.set()
+        self.job_repository.claim_next.return_value = [SimpleNamespace(id=7)]
+
+        with patch(FACTORY, return_value=_repo_with(self.job_repository)):
+            self.assertEqual(self.worker.run_once(), 1)
+            self.assertTrue(done.wait(2))
+
+        self.assertEqual(self.job_repository.claim_next.call_args.kwargs["limit"], 2)
+        self.service.process_twin_aspect_registration_job.assert_called_once_with(7, worker_id=self.worker.worker_id)
+
+    def test_failed_job_is_requeued_with_backoff(self):
+        self.job_repository.find_by_id.return_value = SimpleNamespace(job_id="j", attempts=2)
+
+        with patch(FACTORY, return_value=_repo_with(self.job_repository)):
+            self.worker._handle_failure(1, ConnectionError("dtr down"))
+
+        kwargs = self.job_repository.release.call_args.kwargs
+        self.assertEqual(kwargs["worker_id"], self.worker.worker_id)
+        self.assertEqual(kwargs["status"], TwinAspectRegistrationJobStatus.QUEUED.value)
+        self.assertAlmostEqual((kwargs["next_attempt_date"] - utc_now_naive()).total_seconds(), 20, delta=1)
+        self.assertEqual(kwargs["last_error"], "dtr down")
+
+    def test_job_fails_after_max_attempts(self):
+        self.job_repository.find_by_id.return_value = SimpleNamespace(job_id="j", attempts=3)
+
+        with patch(FACTORY, return_value=_repo_with(self.job_repository)):
+            self.worker._handle_failure(1, ConnectionError("dtr down"))
+
+        kwargs = self.job_repository.release.call_args.kwargs
+        self.assertEqual(kwargs["status"], TwinAspectRegistrationJobStatus.FAILED.value)
+        self.assertIsNone(kwargs["next_attempt_date"])
+
+    def test_leases_of_running_jobs_are_renewed(self):
+        started, finish = threading.Event(), threading.Event()
+        self.service.process_twin_aspect_registration_job.side_effect = lambda job_id, worker_id: started.set() or finish.wait(2)
+        self.job_repository.claim_next.return_value = [SimpleNamespace(id=7), SimpleNamespace(id=8)]
+        self.job_repository.renew_leases.return_value = [7]
+
+        with patch(FACTORY, return_value=_repo_with(self.job_repository)):
+            self.worker.run_once()
+            self.assertTrue(started.wait(2))
+            self.worker.renew_leases(force=True)
+            self.worker.renew_leases(force=True)
+            finish.set()
+
+        first, second = self.job_repository.renew_leases.call_args_list
+        self.assertEqual(sorted(first.args[0]), [7, 8])
+        self.assertEqual(first.kwargs["worker_id"], self.worker.worker_id)
+        # A lease lost to another worker is not renewed again
+        self.assertEqual(second.args[0], [7])
+
+
+class TestTwinAspectRegistrationJobLeases(unittest.TestCase):
+    """The job outcome is only written by the worker holding the lease."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = get_sqlite_engine()
+        TwinAspectRegistrationJob.metadata.create_all(cls.engine, tables=[TwinAspectRegistrationJob.__table__])
+
+    def setUp(self):
+        self.session = Session(self.engine)
+        self.repository = TwinAspectRegistrationJobRepository(self.session)
+        job = self.repository.create_new(twin_aspect_id=1, enablement_service_stack_id=1, payload={"a": 1})
+        self.session.commit()
+        self.job_id = job.id
+
+    def tearDown(self):
+        self.session.delete(self.session.get(TwinAspectRegistrationJob, self.job_id))
+        self.session.commit()
+        self.session.close()
+
+    def _claim(self, worker_id):
+        jobs = self.repository.claim_next(worker_id=worker_id, lease_seconds=60)
+        self.session.commit()
+        return jobs
+
+    def test_job_taken_over_after_an_expired_lease_keeps_its_new_owner(self):
+        self._claim("worker-a")
+        self.session.get(TwinAspectRegistrationJob, self.job_id).locked_until = utc_now_naive() - timedelta(seconds=1)
+        self.session.commit()
+        self.assertEqual(len(self._claim("worker-b")), 1)
+
+        self.assertEqual(self.repository.renew_leases([self.job_id], worker_id="worker-a"), [])
+        self.assertFalse(self.repository.release(self.job_id, worker_id="worker-a",
+                                                 status=TwinAspectRegistrationJobStatus.COMPLETED.value, clear_payload=True))
+        self.session.commit()
+        self.session.expire_all()
+
+        job = self.session.get(TwinAspectRegistrationJob, self.job_id)
+        self.assertEqual(job.status, TwinAspectRegistrationJobStatus.RUNNING.value)
+        self.assertEqual(job.locked_by, "worker-b")
+        self.assertEqual(job.attempts, 2)
+        self.assertEqual(job.payload, {"a": 1})
+
+    def test_owner_renews_and_releases_its_job(self):
+        self._claim("worker-a")
+
+        self.assertEqual(self.repository.renew_leases([self.job_id], worker_id="worker-a", lease_seconds=600), [self.job_id])
+        self.session.commit()
+        self.session.expire_all()
+        self.assertGreater(self.session.get(TwinAspectRegistrationJob, self.job_id).locked_until, utc_now_naive() + timedelta(seconds=300))
+
+        self.assertTrue(self.repository.release(self.job_id, worker_id="worker-a",
+                                                status=TwinAspectRegistrationJobStatus.COMPLETED.value, clear_payload=True))
+        self.session.commit()
+        self.session.expire_all()
+
+        job = self.session.get(TwinAspectRegistrationJob, self.job_id)
+        self.assertEqual(job.status, TwinAspectRegistrationJobStatus.COMPLETED.value)
+        self.assertIsNone(job.locked_by)
+        self.assertIsNone(job.payload)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -37,6 +37,7 @@ from models.services.provider.part_management import (
 )
 from models.metadata_database.provider.models import CatalogPart, SerializedPart, LegalEntity
 from tools.exceptions import InvalidError, NotFoundError, AlreadyExistsError
+from tools.pagination_tools import decode_keyset_cursor
 
 
 class TestPartManagementService:
@@ -218,6 +219,68 @@ class TestPartManagementService:
         assert result[0].manufacturer_part_id == "PART001"
         assert result[0].status == 1
 
+    @patch('services.provider.part_management_service.RepositoryManagerFactory.create')
+    def test_get_catalog_parts_page_returns_next_cursor(self, mock_repo_factory, mock_repos, sample_catalog_part):
+        """Test that a full page returns the cursor of the next page and is continued after its last part."""
+        # Arrange
+        mock_repo_factory.return_value.__enter__.return_value = mock_repos
+        second_catalog_part = Mock(spec=CatalogPart)
+        second_catalog_part.id = 2
+        mock_repos.catalog_part_repository.find_by_manufacturer_id_manufacturer_part_id.return_value = [
+            (sample_catalog_part, 1), (second_catalog_part, 0)
+        ]
+
+        # Act
+        result, next_cursor = self.service.get_catalog_parts_page(limit=1)
+        self.service.get_catalog_parts_page(cursor=next_cursor, limit=1)
+
+        # Assert
+        assert len(result) == 1
+        assert result[0].manufacturer_part_id == "PART001"
+        assert decode_keyset_cursor(next_cursor) == sample_catalog_part.id
+        first_call, second_call = mock_repos.catalog_part_repository.find_by_manufacturer_id_manufacturer_part_id.call_args_list
+        assert first_call.kwargs["after_id"] is None
+        assert first_call.kwargs["limit"] == 2
+        assert second_call.kwargs["after_id"] == sample_catalog_part.id
+
+    @patch('services.provider.part_management_service.RepositoryManagerFactory.create')
+    def test_get_catalog_parts_page_last_page(self, mock_repo_factory, mock_repos, sample_catalog_part):
+        """Test that the last page has no next cursor and that invalid cursors are rejected."""
+        # Arrange
+        mock_repo_factory.return_value.__enter__.return_value = mock_repos
+        mock_repos.catalog_part_repository.find_by_manufacturer_id_manufacturer_part_id.return_value = [
+            (sample_catalog_part, 1)
+        ]
+
+        # Act
+        result, next_cursor = self.service.get_catalog_parts_page(limit=10)
+
+        # Assert
+        assert len(result) == 1
+        assert next_cursor is None
+        with pytest.raises(InvalidError, match="Invalid pagination cursor"):
+            self.service.get_catalog_parts_page(cursor="not-a-cursor", limit=10)
+
+    @patch('services.provider.part_management_service.RepositoryManagerFactory.create')
+    def test_stream_catalog_parts(self, mock_repo_factory, mock_repos, sample_catalog_part):
+        """Test that streaming reads the catalog parts through the batched repository iterator."""
+        # Arrange
+        mock_repo_factory.return_value.__enter__.return_value = mock_repos
+        mock_repos.catalog_part_repository.iter_by_manufacturer_id_manufacturer_part_id.return_value = iter([
+            (sample_catalog_part, 2)
+        ])
+
+        # Act
+        result = list(self.service.stream_catalog_parts(yield_per=100))
+
+        # Assert
+        assert len(result) == 1
+        assert isinstance(result[0], CatalogPartReadWithStatus)
+        assert result[0].status == 2
+        mock_repos.catalog_part_repository.iter_by_manufacturer_id_manufacturer_part_id.assert_called_once_with(
+            None, None, join_partner_catalog_parts=True, yield_per=100
+        )
+
     @patch('services.provider.part_management_service.RepositoryManagerFactory.create')
     def test_get_catalog_part_details_success(self, mock_repo_factory, mock_repos, sample_catalog_part):
         """Test successful retrieval of catalog part details."""
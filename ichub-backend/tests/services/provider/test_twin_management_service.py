@@ -1068,3 +1068,172 @@ class TestTwinManagementService:
         )
         mock_repo.commit.assert_called_once()
         mock_repo.refresh.assert_called_once_with(mock_new_aspect)
+
+    @staticmethod
+    def _bulk_config(key, default=None):
+        """Config lookup returning the defaults of the bulk settings."""
+        return default
+
+    @patch('services.provider.twin_management_service.ConfigManager.get_config', side_effect=_bulk_config)
+    @patch('services.provider.twin_management_service.RepositoryManagerFactory.create')
+    @patch('services.provider.twin_management_service.dtr_provider_manager')
+    def test_create_catalog_part_twins_bulk(self, mock_dtr_provider, mock_repo_factory, mock_config,
+                                            mock_catalog_part, mock_enablement_service_stack, sample_manufacturer_id):
+        """Test bulk catalog part twin creation reports the outcome per item."""
+        # Arrange
+        mock_other_part = Mock(twin_id=None, manufacturer_part_id="PART002", name="Other Part", category=None,
+                               description=None, bpns=None, partner_catalog_parts=[])
+        mock_other_part.legal_entity.bpnl = sample_manufacturer_id
+
+        mock_repo = Mock()
+        mock_repo_factory.return_value.__enter__.return_value = mock_repo
+        mock_repo.catalog_part_repository.find_by_manufacturer_keys.return_value = [mock_catalog_part, mock_other_part]
+        mock_repo.twin_registration_repository.find_by_twin_ids.return_value = []
+        mock_repo.twin_repository.create_new.side_effect = lambda global_id, dtr_aas_id: Mock(
+            id=id(global_id), global_id=global_id or UUID(int=len(mock_repo.twin_repository.create_new.mock_calls)),
+            aas_id=UUID(int=0), created_date=datetime.now(), modified_date=datetime.now())
+
+        def create_or_update_shell_descriptor(**kwargs):
+            if kwargs["manufacturer_part_id"] == "PART002":
+                raise RuntimeError("DTR not reachable")
+        mock_dtr_provider.create_or_update_shell_descriptor.side_effect = create_or_update_shell_descriptor
+
+        create_inputs = [
+            CatalogPartTwinCreate(manufacturerId=sample_manufacturer_id, manufacturerPartId="PART001"),
+            CatalogPartTwinCreate(manufacturerId=sample_manufacturer_id, manufacturerPartId="PART002"),
+            CatalogPartTwinCreate(manufacturerId=sample_manufacturer_id, manufacturerPartId="UNKNOWN"),
+            CatalogPartTwinCreate(manufacturerId=sample_manufacturer_id, manufacturerPartId="PART001"),
+        ]
+
+        # Act
+        with patch.object(self.service, 'get_or_create_enablement_stack', return_value=mock_enablement_service_stack) as mock_get_stack:
+            result = self.service.create_catalog_part_twins_bulk(create_inputs)
+
+        # Assert
+        assert (result.total, result.succeeded, result.failed) == (4, 1, 3)
+        assert [item.success for item in result.results] == [True, False, False, False]
+        assert result.results[1].error == "DTR not reachable"
+        assert result.results[1].twin is not None
+        assert result.results[2].error == "Catalog part not found."
+        assert result.results[3].error == "Duplicate item within the bulk request."
+        mock_repo.catalog_part_repository.find_by_manufacturer_keys.assert_called_once()
+        mock_get_stack.assert_called_once()
+        assert mock_repo.twin_registration_repository.create_new_for_twin.call_count == 2
+        mock_repo.flush.assert_called_once()
+        assert mock_dtr_provider.create_or_update_shell_descriptor.call_count == 2
+        mock_repo.twin_registration_repository.set_dtr_registered.assert_called_once_with(
+            [(mock_catalog_part.twin.id, mock_enablement_service_stack.id)])
+
+    @patch('services.provider.twin_management_service.ConfigManager.get_config', side_effect=_bulk_config)
+    @patch('services.provider.twin_management_service.RepositoryManagerFactory.create')
+    @patch('services.provider.twin_management_service.dtr_provider_manager')
+    def test_create_serialized_part_twins_bulk_existing_registration(self, mock_dtr_provider, mock_repo_factory, mock_config,
+                                                                     mock_twin, mock_enablement_service_stack,
+                                                                     sample_manufacturer_id, sample_manufacturer_part_id,
+                                                                     sample_part_instance_id):
+        """Test bulk serialized part twin creation reuses existing twins and registrations."""
+        # Arrange
+        mock_twin.aas_id = UUID("987fcdeb-51a2-43d8-9765-123456789abc")
+        mock_serialized_part = Mock(twin_id=mock_twin.id, twin=mock_twin, part_instance_id=sample_part_instance_id, van="VAN123")
+        mock_serialized_part.partner_catalog_part.customer_part_id = "CUST001"
+        mock_serialized_part.partner_catalog_part.business_partner.bpnl = "BPNL987654321098"
+        mock_serialized_part.partner_catalog_part.catalog_part.legal_entity.bpnl = sample_manufacturer_id
+        mock_serialized_part.partner_catalog_part.catalog_part.manufacturer_part_id = sample_manufacturer_part_id
+        mock_serialized_part.partner_catalog_part.catalog_part.name = "Test Part"
+        mock_serialized_part.partner_catalog_part.catalog_part.category = " "
+
+        mock_repo = Mock()
+        mock_repo_factory.return_value.__enter__.return_value = mock_repo
+        mock_repo.serialized_part_repository.find_by_keys.return_value = [mock_serialized_part]
+        mock_repo.twin_registration_repository.find_by_twin_ids.return_value = [
+            Mock(twin_id=mock_twin.id, enablement_service_stack_id=mock_enablement_service_stack.id)]
+
+        create_inputs = [SerializedPartTwinCreate(
+            manufacturerId=sample_manufacturer_id,
+            manufacturerPartId=sample_manufacturer_part_id,
+            partInstanceId=sample_part_instance_id
+        )]
+
+        # Act
+        with patch.object(self.service, 'get_or_create_enablement_stack', return_value=mock_enablement_service_stack):
+            result = self.service.create_serialized_part_twins_bulk(create_inputs)
+
+        # Assert
+        assert result.succeeded == 1
+        assert result.results[0].part_instance_id == sample_part_instance_id
+        assert result.results[0].twin.global_id == mock_twin.global_id
+        mock_repo.twin_repository.create_new.assert_not_called()
+        mock_repo.twin_registration_repository.create_new_for_twin.assert_not_called()
+        descriptor = mock_dtr_provider.create_or_update_shell_descriptor.call_args.kwargs
+        assert descriptor["asset_kind"] == "Instance"
+        assert descriptor["asset_type"] is None
+        assert descriptor["customer_part_ids"] == {"CUST001": "BPNL987654321098"}
+
+    @patch('services.provider.twin_management_service.ConfigManager.get_config', return_value=1)
+    def test_create_catalog_part_twins_bulk_too_many_items(self, mock_config, sample_manufacturer_id):
+        """Test bulk requests above the configured maximum are rejected."""
+        from tools.exceptions import InvalidError
+
+        create_inputs = [
+            CatalogPartTwinCreate(manufacturerId=sample_manufacturer_id, manufacturerPartId="PART001"),
+            CatalogPartTwinCreate(manufacturerId=sample_manufacturer_id, manufacturerPartId="PART002"),
+        ]
+
+        with pytest.raises(InvalidError):
+            self.service.create_catalog_part_twins_bulk(create_inputs)
+
+    @patch('services.provider.twin_management_service.RepositoryManagerFactory.create')
+    @patch('services.provider.twin_management_service.dtr_provider_manager')
+    @patch('services.provider.twin_management_service._create_submodel_service_manager')
+    def test_enqueue_twin_aspect(self, mock_submodel_manager, mock_dtr_provider, mock_repo_factory,
+                                 mock_twin, mock_enablement_service_stack, sample_global_id, sample_semantic_id, sample_payload):
+        """Test queuing a twin aspect stores a job instead of registering it right away."""
+        from models.metadata_database.provider.models import TwinAspectRegistrationJobStatus
+
+        twin_aspect_create = TwinAspectCreate(globalId=sample_global_id, semanticId=sample_semantic_id, payload=sample_payload)
+
+        mock_repo = Mock()
+        mock_repo_factory.return_value.__enter__.return_value = mock_repo
+        mock_repo.twin_aspect_registration_job_repository.find_queued_by_twin_aspect_id_enablement_service_stack_id.return_value = None
+
+        mock_twin_aspect = Mock()
+        mock_twin_aspect.semantic_id = sample_semantic_id
+        mock_twin_aspect.submodel_id = UUID("12345678-1234-1234-1234-123456789012")
+        mock_registration = Mock()
+        mock_registration.status = TwinAspectRegistrationStatus.PLANNED.value
+
+        mock_job = Mock()
+        mock_job.job_id = UUID("87654321-4321-4321-4321-210987654321")
+        mock_job.status = TwinAspectRegistrationJobStatus.QUEUED.value
+        mock_job.attempts = 0
+        mock_job.last_error = None
+        mock_job.created_date = datetime.now()
+        mock_job.modified_date = datetime.now()
+        mock_repo.twin_aspect_registration_job_repository.create_new.return_value = mock_job
+
+        with patch.object(self.service, '_prepare_twin_aspect',
+                          return_value=(mock_twin, mock_enablement_service_stack, mock_twin_aspect, mock_registration)):
+            result = self.service.enqueue_twin_aspect(twin_aspect_create)
+
+        assert result.job_id == mock_job.job_id
+        assert result.status == TwinAspectRegistrationJobStatus.QUEUED
+        assert result.registration_status == TwinAspectRegistrationStatus.PLANNED
+        mock_repo.twin_aspect_registration_job_repository.create_new.assert_called_once_with(
+            twin_aspect_id=mock_twin_aspect.id,
+            enablement_service_stack_id=mock_enablement_service_stack.id,
+            payload=sample_payload
+        )
+        mock_submodel_manager.assert_not_called()
+        mock_dtr_provider.create_submodel_descriptor.assert_not_called()
+
+    @patch('services.provider.twin_management_service.RepositoryManagerFactory.create')
+    def test_get_twin_aspect_registration_job_not_found(self, mock_repo_factory):
+        """Test an unknown twin aspect registration job is reported as not found."""
+        from tools.exceptions import NotFoundError
+
+        mock_repo = Mock()
+        mock_repo_factory.return_value.__enter__.return_value = mock_repo
+        mock_repo.twin_aspect_registration_job_repository.find_by_job_id.return_value = None
+
+        with pytest.raises(NotFoundError):
+            self.service.get_twin_aspect_registration_job(UUID("87654321-4321-4321-4321-210987654321"))
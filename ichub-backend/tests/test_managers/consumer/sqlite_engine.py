@@ -0,0 +1,47 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+from functools import lru_cache
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import StaticPool
+
+
+def _attach_schemas(dbapi_connection, connection_record):
+    # The metadata also holds the tables of the "public" and "ichub" schemas
+    for schema in ("public", "ichub"):
+        dbapi_connection.execute(f"ATTACH DATABASE ':memory:' AS {schema}")
+
+
+@lru_cache(maxsize=1)
+def get_sqlite_engine() -> Engine:
+    """
+    In-memory SQLite engine shared by the persistence tests.
+
+    The managers register their dynamic table models in the shared SQLModel
+    metadata every time they are built, so the tables are only created once.
+    """
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    event.listen(engine, "connect", _attach_schemas)
+    return engine
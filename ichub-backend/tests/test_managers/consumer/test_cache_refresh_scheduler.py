@@ -0,0 +1,135 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+from managers.enablement_services.consumer.cache_refresh_scheduler import CacheAccessTracker, CacheRefreshScheduler
+from managers.enablement_services.consumer.connector.memory.connector_consumer_memory_manager import ConnectorConsumerMemoryManager
+
+
+class _FakeCache:
+    def __init__(self, expiring, fail=False):
+        self.access_tracker = CacheAccessTracker()
+        self.expiring = expiring
+        self.fail = fail
+        self.refreshed = []
+        self.done = threading.Event()
+
+    def get_expiring_bpns(self, within_seconds):
+        return [(bpn, seconds_left) for bpn, seconds_left in self.expiring if seconds_left <= within_seconds]
+
+    def refresh_bpn(self, bpn):
+        self.refreshed.append(bpn)
+        self.done.set()
+        if self.fail:
+            raise ConnectionError("discovery down")
+
+
+class TestCacheAccessTracker(unittest.TestCase):
+
+    def test_counts_outcomes_and_cold_ratio(self):
+        tracker = CacheAccessTracker()
+        tracker.record("a", CacheAccessTracker.HIT)
+        tracker.record("a", CacheAccessTracker.HIT)
+        tracker.record("b", CacheAccessTracker.STALE)
+        tracker.record("c", CacheAccessTracker.COLD)
+
+        stats = tracker.get_stats()
+        self.assertEqual((stats["hits"], stats["stale_hits"], stats["cold_misses"]), (2, 1, 1))
+        self.assertAlmostEqual(stats["cold_miss_ratio"], 0.25)
+
+    def test_score_decays_over_time(self):
+        tracker = CacheAccessTracker(half_life_seconds=10)
+        with patch("managers.enablement_services.consumer.cache_refresh_scheduler.time.monotonic", return_value=100.0):
+            tracker.record("a", CacheAccessTracker.HIT)
+            tracker.record("a", CacheAccessTracker.HIT)
+        with patch("managers.enablement_services.consumer.cache_refresh_scheduler.time.monotonic", return_value=110.0):
+            self.assertAlmostEqual(tracker.score("a"), 1.0)
+
+    def test_least_used_key_is_dropped(self):
+        tracker = CacheAccessTracker(max_keys=2)
+        tracker.record("a", CacheAccessTracker.HIT)
+        tracker.record("a", CacheAccessTracker.HIT)
+        tracker.record("b", CacheAccessTracker.HIT)
+        tracker.record("c", CacheAccessTracker.HIT)
+        self.assertEqual(tracker.get_stats()["tracked_keys"], 2)
+        self.assertGreater(tracker.score("a"), 1.5)
+
+
+class TestCacheRefreshScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.scheduler = CacheRefreshScheduler(interval=60, refresh_ahead=120, max_workers=2, jitter=0, max_refreshes_per_cycle=2, min_access_score=0.5)
+        self.addCleanup(self.scheduler.stop)
+
+    def _wait_idle(self):
+        deadline = time.time() + 2
+        while self.scheduler.get_stats()["in_progress"] and time.time() < deadline:
+            time.sleep(0.01)
+
+    def test_refreshes_hot_expiring_entries_most_used_first(self):
+        cache = _FakeCache([("hot", 30), ("hotter", 60), ("cold", 30), ("later", 600)])
+        for bpn, accesses in (("hot", 2), ("hotter", 5), ("later", 5)):
+            for _ in range(accesses):
+                cache.access_tracker.record(bpn, CacheAccessTracker.HIT)
+        self.scheduler.register("fake", cache)
+
+        candidates = [candidate[3] for candidate in self.scheduler._select_candidates()]
+        self.assertEqual(candidates, ["hotter", "hot"])
+
+        self.assertEqual(self.scheduler.run_once(), 2)
+        self._wait_idle()
+        self.assertCountEqual(cache.refreshed, ["hotter", "hot"])
+        self.assertEqual(cache.access_tracker.get_stats()["refreshes"], 2)
+
+    def test_refresh_errors_are_counted(self):
+        cache = _FakeCache([("hot", 10)], fail=True)
+        cache.access_tracker.record("hot", CacheAccessTracker.HIT)
+        self.scheduler.register("fake", cache)
+
+        self.scheduler.run_once()
+        self._wait_idle()
+
+        self.assertEqual(cache.access_tracker.get_stats()["refresh_errors"], 1)
+
+    def test_connector_manager_is_refreshed_before_expiry(self):
+        discovery = Mock()
+        discovery.find_connector_by_bpn.return_value = ["https://edc.example.com"]
+        manager = ConnectorConsumerMemoryManager(connector_consumer_service=Mock(), connector_discovery=discovery, logger=Mock())
+        manager.get_connectors("BPNL00000003AYRE")
+        manager.known_connectors["BPNL00000003AYRE"][manager.REFRESH_INTERVAL_KEY] = time.time() + 30
+        self.scheduler.register("connectors", manager)
+
+        self.assertEqual(self.scheduler.run_once(), 1)
+        self._wait_idle()
+
+        self.assertEqual(discovery.find_connector_by_bpn.call_count, 2)
+        self.assertGreater(manager.known_connectors["BPNL00000003AYRE"][manager.REFRESH_INTERVAL_KEY], time.time() + 120)
+        self.assertEqual(manager.access_tracker.get_stats()["cold_misses"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
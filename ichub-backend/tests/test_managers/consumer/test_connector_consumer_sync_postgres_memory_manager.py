@@ -0,0 +1,157 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import json
+import unittest
+from unittest.mock import Mock, patch
+
+from sqlalchemy import event
+
+from managers.enablement_services.consumer.connector.database.connector_consumer_sync_postgres_memory_manager import ConsumerConnectorSyncPostgresMemoryManager
+
+from .sqlite_engine import get_sqlite_engine
+
+
+BPN_A = "BPNL00000003AYRE"
+BPN_B = "BPNL00000003CML1"
+
+
+class TestConsumerConnectorSyncPersistence(unittest.TestCase):
+    """Tests for the row-level persistence and change-feed reload of the connector cache."""
+
+    statements = []
+
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = get_sqlite_engine()
+        event.listen(cls.engine, "before_cursor_execute", cls._record_statement)
+
+    @classmethod
+    def tearDownClass(cls):
+        event.remove(cls.engine, "before_cursor_execute", cls._record_statement)
+
+    @classmethod
+    def _record_statement(cls, conn, cursor, statement, parameters, context, executemany):
+        cls.statements.append(statement)
+
+    def setUp(self):
+        self.replica_a = self._create_replica()
+        with self.engine.begin() as connection:
+            connection.exec_driver_sql("DELETE FROM known_connectors")
+        self.replica_a.known_connectors = {}
+        self.replica_b = self._create_replica()
+        self.statements.clear()
+
+    def _create_replica(self) -> ConsumerConnectorSyncPostgresMemoryManager:
+        # Background threads are not started, saves and reloads are triggered explicitly
+        with patch.object(ConsumerConnectorSyncPostgresMemoryManager, "_start_background_tasks"):
+            replica = ConsumerConnectorSyncPostgresMemoryManager(
+                connector_consumer_service=Mock(),
+                engine=self.engine,
+                connector_discovery=Mock(),
+                logger=Mock()
+            )
+        patcher = patch.object(replica, "_trigger_save")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return replica
+
+    def _statement_types(self):
+        return [statement.strip().split()[0].upper() for statement in self.statements]
+
+    def test_save_only_writes_changed_rows(self):
+        self.replica_a.add_connectors(BPN_A, ["https://a.example.com"])
+        self.replica_a.add_connectors(BPN_B, ["https://b.example.com"])
+        self.assertTrue(self.replica_a._save_to_db())
+        self.statements.clear()
+
+        self.replica_a.delete_connector(BPN_B, "https://b.example.com")
+        self.replica_a._save_to_db()
+        self.assertEqual(self._statement_types(), ["INSERT"])
+
+        self.statements.clear()
+        self.assertTrue(self.replica_a._save_to_db())
+        self.assertEqual(self.statements, [])
+
+    def test_purge_bpn_deletes_only_its_row(self):
+        self.replica_a.add_connectors(BPN_A, ["https://a.example.com"])
+        self.replica_a.add_connectors(BPN_B, ["https://b.example.com"])
+        self.replica_a._save_to_db()
+
+        self.replica_a.purge_bpn(BPN_A)
+        self.replica_a._save_to_db()
+
+        with self.engine.connect() as connection:
+            rows = connection.exec_driver_sql("SELECT bpnl FROM known_connectors").fetchall()
+        self.assertEqual(rows, [(BPN_B,)])
+
+    def test_changes_of_other_replica_are_pulled(self):
+        self.replica_a.add_connectors(BPN_A, ["https://a.example.com"])
+        self.replica_a._save_to_db()
+        self.replica_b._load_changes_from_db()
+        self.assertEqual(self.replica_b.known_connectors[BPN_A][self.replica_b.CONNECTOR_LIST_KEY], ["https://a.example.com"])
+
+        self.statements.clear()
+        self.replica_a.add_connectors(BPN_B, ["https://b.example.com"])
+        self.replica_a._save_to_db()
+        self.replica_b._load_changes_from_db()
+
+        self.assertIn(BPN_B, self.replica_b.known_connectors)
+        self.assertTrue(any("updated_at >" in statement for statement in self.statements))
+
+    def test_pending_local_changes_are_not_overwritten(self):
+        self.replica_a.add_connectors(BPN_A, ["https://a.example.com"])
+        self.replica_a._save_to_db()
+        self.replica_b._load_changes_from_db()
+
+        self.replica_b.purge_bpn(BPN_A)
+        self.replica_b.add_connectors(BPN_A, ["https://local.example.com"])
+        self.replica_a.add_connectors(BPN_B, ["https://b.example.com"])
+        self.replica_a._save_to_db()
+        self.replica_b._load_changes_from_db()
+
+        self.assertEqual(self.replica_b.known_connectors[BPN_A][self.replica_b.CONNECTOR_LIST_KEY], ["https://local.example.com"])
+
+    def test_notification_of_other_replica_purges_bpn(self):
+        self.replica_b.known_connectors = {BPN_A: {self.replica_b.REFRESH_INTERVAL_KEY: 0, self.replica_b.CONNECTOR_LIST_KEY: ["https://a.example.com"]}}
+
+        self.replica_b._handle_notification(json.dumps({"origin": self.replica_b._instance_id, "purged": [BPN_A]}))
+        self.assertIn(BPN_A, self.replica_b.known_connectors)
+
+        self.replica_b._handle_notification(json.dumps({"origin": self.replica_a._instance_id, "purged": [BPN_A]}))
+        self.assertNotIn(BPN_A, self.replica_b.known_connectors)
+
+    def test_notify_is_disabled_without_postgres(self):
+        with patch.object(ConsumerConnectorSyncPostgresMemoryManager, "_start_background_tasks"):
+            replica = ConsumerConnectorSyncPostgresMemoryManager(
+                connector_consumer_service=Mock(),
+                engine=self.engine,
+                connector_discovery=Mock(),
+                logger=Mock(),
+                notify_channel="ichub_known_connectors"
+            )
+        self.assertIsNone(replica.notify_channel)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import threading
+import time
+import unittest
+
+from managers.enablement_services.consumer.connector_delivery import ConnectorDelivery, ConnectorHealth
+
+DEAD = "https://dead.example.com/api/v1/dsp"
+SLOW = "https://slow.example.com/api/v1/dsp"
+FAST = "https://fast.example.com/api/v1/dsp"
+
+
+class TestConnectorHealth(unittest.TestCase):
+    """Tests for the ordering of connectors by health."""
+
+    def test_failed_connectors_are_ordered_last(self):
+        health = ConnectorHealth(failure_penalty=30)
+        health.record_failure(DEAD)
+        health.record_success(SLOW, 2.0)
+        health.record_success(FAST, 0.1)
+
+        self.assertEqual(health.order([DEAD, SLOW, FAST]), [FAST, SLOW, DEAD])
+
+    def test_failures_decay(self):
+        health = ConnectorHealth(failure_half_life=1, failure_penalty=10)
+        health.record_failure(DEAD)
+        health._stats[DEAD].updated -= 1
+
+        self.assertAlmostEqual(health.score(DEAD), 5.0, places=1)
+
+
+class TestConnectorDelivery(unittest.TestCase):
+    """Tests for the hedged delivery across connectors."""
+
+    def setUp(self):
+        self.delivery = ConnectorDelivery(hedge_delay=0.05, max_attempts=2, retry_backoff=0.01)
+
+    def tearDown(self):
+        self.delivery.shutdown()
+
+    def test_next_connector_is_started_while_the_first_hangs(self):
+        release = threading.Event()
+
+        def attempt(connector_url):
+            if connector_url == DEAD:
+                release.wait(5)
+                raise TimeoutError("no answer")
+            return connector_url
+
+        started = time.monotonic()
+        self.assertEqual(self.delivery.deliver([DEAD, FAST], attempt), FAST)
+        self.assertLess(time.monotonic() - started, 1)
+        release.set()
+
+    def test_failed_connector_is_retried_after_backoff(self):
+        calls = []
+
+        def attempt(connector_url):
+            calls.append(connector_url)
+            if len(calls) == 1:
+                raise ConnectionError("reset")
+            return "ok"
+
+        self.assertEqual(self.delivery.deliver([FAST], attempt), "ok")
+        self.assertEqual(calls, [FAST, FAST])
+
+    def test_non_retryable_error_is_not_retried(self):
+        calls = []
+
+        def attempt(connector_url):
+            calls.append(connector_url)
+            raise ValueError("HTTP 400")
+
+        with self.assertRaises(ValueError):
+            self.delivery.deliver([FAST, SLOW], attempt, retryable=lambda error: False)
+        self.assertEqual(sorted(calls), sorted([FAST, SLOW]))
+
+    def test_outcomes_update_the_health(self):
+        def attempt(connector_url):
+            if connector_url == DEAD:
+                raise ConnectionError("refused")
+            return connector_url
+
+        self.delivery.deliver([DEAD, FAST], attempt, retryable=lambda error: False)
+
+        self.assertEqual(self.delivery.health.order([DEAD, FAST]), [FAST, DEAD])
+
+
+if __name__ == "__main__":
+    unittest.main()
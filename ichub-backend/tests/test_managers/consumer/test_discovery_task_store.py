@@ -0,0 +1,144 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import asyncio
+import threading
+import unittest
+from datetime import datetime, timedelta
+
+from sqlmodel import Session
+
+from managers.addons_service.ecopass_kit.v1.discovery import DiscoveryTaskManager
+from managers.addons_service.ecopass_kit.v1.discovery_task_store import DiscoveryTaskStore, DiscoveryTaskPostgresStore
+from .sqlite_engine import get_sqlite_engine
+
+
+class TestDiscoveryTaskStore(unittest.TestCase):
+    """Tests for the in-memory LRU+TTL discovery task store."""
+
+    def test_update_merges_changes_and_increments_version(self):
+        """Every change increments the version and keeps the untouched fields."""
+        store = DiscoveryTaskStore()
+        store.create("task-1", {"status": "in_progress", "step": "parsing", "progress": 0})
+
+        task = store.update("task-1", {"step": "discovering_bpn", "progress": 25})
+
+        self.assertEqual(task, {"status": "in_progress", "step": "discovering_bpn", "progress": 25, "version": 2})
+        self.assertEqual(store.get("task-1"), task)
+        self.assertIsNone(store.update("missing", {"progress": 10}))
+
+    def test_least_recently_used_task_is_evicted(self):
+        """Once full, the task not read or changed for the longest time is evicted."""
+        store = DiscoveryTaskStore(max_entries=2)
+        store.create("task-1", {"status": "in_progress"})
+        store.create("task-2", {"status": "in_progress"})
+        store.get("task-1")
+
+        store.create("task-3", {"status": "in_progress"})
+
+        self.assertIsNotNone(store.get("task-1"))
+        self.assertIsNone(store.get("task-2"))
+        self.assertEqual(store.get_stats(), {"size": 2, "evictions": 1, "expirations": 0})
+
+    def test_expired_task_is_dropped(self):
+        """A task is gone once it was not changed for longer than the TTL."""
+        store = DiscoveryTaskStore(ttl_seconds=0)
+        store.create("task-1", {"status": "in_progress"})
+
+        self.assertIsNone(store.get("task-1"))
+        self.assertEqual(store.get_stats()["expirations"], 1)
+
+
+class TestDiscoveryTaskPostgresStore(unittest.TestCase):
+    """Tests for the discovery task store shared through the database."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = get_sqlite_engine()
+
+    def test_tasks_are_shared_between_workers(self):
+        """A task created and changed by one worker is read by another one."""
+        worker_1 = DiscoveryTaskPostgresStore(engine=self.engine, table_name="discovery_tasks_test")
+        worker_2 = DiscoveryTaskPostgresStore(engine=self.engine, table_name="discovery_tasks_test")
+
+        worker_1.create("task-1", {"status": "in_progress", "progress": 0})
+        worker_1.update("task-1", {"progress": 50})
+
+        self.assertEqual(worker_2.get("task-1"), {"status": "in_progress", "progress": 50, "version": 2})
+
+    def test_expired_tasks_are_deleted_on_create(self):
+        """Creating a task removes the expired ones from the table."""
+        store = DiscoveryTaskPostgresStore(engine=self.engine, table_name="discovery_tasks_test")
+        store.create("old-task", {"status": "in_progress"})
+        with Session(self.engine) as session:
+            row = session.get(store.DiscoveryTasksModel, "old-task")
+            row.expires_at = datetime.now() - timedelta(seconds=1)
+            session.add(row)
+            session.commit()
+
+        store.create("new-task", {"status": "in_progress"})
+
+        with Session(self.engine) as session:
+            self.assertIsNone(session.get(store.DiscoveryTasksModel, "old-task"))
+        self.assertIsNone(store.get("old-task"))
+
+
+class TestDiscoveryTaskManager(unittest.TestCase):
+    """Tests for the discovery task manager on top of the store."""
+
+    def test_too_large_result_fails_the_task(self):
+        """A discovered passport bigger than the limit is not kept."""
+        manager = DiscoveryTaskManager(max_result_bytes=100)
+        manager.create_task("task-1")
+
+        manager.update_task("task-1", "complete", "Discovery completed successfully", 100, status="completed", data={"passport": "x" * 200})
+
+        task = manager.get_task("task-1")
+        self.assertEqual(task["status"], "failed")
+        self.assertIsNone(task["data"])
+        self.assertIn("too large", task["error"])
+
+    def test_wait_for_update_returns_on_change(self):
+        """A long-poll returns as soon as the task changes, not at the timeout."""
+        manager = DiscoveryTaskManager(poll_interval=0.01)
+        version = manager.create_task("task-1")["version"]
+        threading.Timer(0.05, manager.update_task, args=("task-1", "discovering_bpn", "Looking up BPN owner...", 25)).start()
+
+        task = asyncio.run(manager.wait_for_update("task-1", version, timeout=5))
+
+        self.assertEqual(task["progress"], 25)
+        self.assertEqual(task["version"], version + 1)
+
+    def test_wait_for_update_returns_current_state_after_timeout(self):
+        """Without changes the long-poll answers with the unchanged task once the wait is over."""
+        manager = DiscoveryTaskManager(poll_interval=0.01)
+        version = manager.create_task("task-1")["version"]
+
+        task = asyncio.run(manager.wait_for_update("task-1", version, timeout=0.05))
+
+        self.assertEqual(task["version"], version)
+        self.assertIsNone(asyncio.run(manager.wait_for_update("missing", None, timeout=0)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,200 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+from managers.enablement_services.consumer.dtr.memory.dtr_consumer_memory_manager import DtrConsumerMemoryManager
+from managers.enablement_services.consumer.dtr.pagination_manager import PaginationManager
+
+
+BPN = "BPNL00000003AYRE"
+
+
+def _dtr(asset_id: str) -> dict:
+    return {"connector_url": f"https://{asset_id}.example.com/api/v1/dsp", "asset_id": asset_id, "policies": [{"odrl:permission": []}]}
+
+
+class TestDiscoverShellsFanOut(unittest.TestCase):
+    """Tests for the concurrent DTR fan-out in discover_shells."""
+
+    def setUp(self):
+        self.manager = DtrConsumerMemoryManager(
+            connector_consumer_manager=Mock(),
+            logger=Mock(),
+            max_dtr_workers_per_partner=2,
+            max_dtr_workers_global=10,
+        )
+        self.active = 0
+        self.max_active = 0
+        self.counter_lock = threading.Lock()
+
+    def _fake_process(self, delays: dict, shells: dict, cursors: dict):
+        def process(connector_service, counter_party_id, dtr, query_spec, dtr_policies=None, limit=None, cursor=None):
+            asset_id = dtr["asset_id"]
+            with self.counter_lock:
+                self.active += 1
+                self.max_active = max(self.max_active, self.active)
+            time.sleep(delays.get(asset_id, 0))
+            with self.counter_lock:
+                self.active -= 1
+            return {
+                "connectorUrl": dtr["connector_url"],
+                "assetId": asset_id,
+                "status": "connected",
+                "shellsFound": len(shells[asset_id]),
+                "shells": shells[asset_id][:limit] if limit else shells[asset_id],
+                "paging_metadata": {"cursor": cursors.get(asset_id)} if cursors.get(asset_id) else {},
+            }
+        return process
+
+    def test_shells_are_merged_in_dtr_order(self):
+        """Slow DTRs answering last do not change the order of the merged shells."""
+        dtrs = [_dtr("dtr-a"), _dtr("dtr-b"), _dtr("dtr-c")]
+        shells = {"dtr-a": ["a1", "a2"], "dtr-b": ["b1"], "dtr-c": ["c1"]}
+        delays = {"dtr-a": 0.15, "dtr-b": 0.05, "dtr-c": 0.0}
+
+        with patch.object(self.manager, "get_dtrs", return_value=dtrs), \
+             patch.object(self.manager, "_process_dtr_with_retry", side_effect=self._fake_process(delays, shells, {})):
+            result = self.manager.discover_shells(BPN, [{"name": "manufacturerPartId", "value": "MPI"}])
+
+        self.assertEqual([d["assetId"] for d in result["dtrs"]], ["dtr-a", "dtr-b", "dtr-c"])
+        self.assertEqual([s for d in result["dtrs"] for s in d["shells"]], ["a1", "a2", "b1", "c1"])
+
+    def test_per_partner_worker_limit_is_respected(self):
+        """No more than max_dtr_workers_per_partner DTRs are queried at once."""
+        dtrs = [_dtr(f"dtr-{i}") for i in range(5)]
+        shells = {d["asset_id"]: [] for d in dtrs}
+        delays = {d["asset_id"]: 0.05 for d in dtrs}
+
+        with patch.object(self.manager, "get_dtrs", return_value=dtrs), \
+             patch.object(self.manager, "_process_dtr_with_retry", side_effect=self._fake_process(delays, shells, {})):
+            self.manager.discover_shells(BPN, [])
+
+        self.assertGreater(self.max_active, 1)
+        self.assertLessEqual(self.max_active, 2)
+
+    def test_failing_dtr_does_not_abort_discovery(self):
+        """An unexpected exception in one DTR is reported as failed, others still return."""
+        dtrs = [_dtr("dtr-a"), _dtr("dtr-b")]
+
+        def process(connector_service, counter_party_id, dtr, query_spec, dtr_policies=None, limit=None, cursor=None):
+            if dtr["asset_id"] == "dtr-a":
+                raise ValueError("boom")
+            return {"assetId": "dtr-b", "status": "connected", "shells": ["b1"], "shellsFound": 1}
+
+        with patch.object(self.manager, "get_dtrs", return_value=dtrs), \
+             patch.object(self.manager, "_process_dtr_with_retry", side_effect=process):
+            result = self.manager.discover_shells(BPN, [])
+
+        self.assertEqual(result["dtrs"][0]["status"], "failed")
+        self.assertIn("boom", result["dtrs"][0]["error"])
+        self.assertEqual(result["dtrs"][1]["shells"], ["b1"])
+
+    def test_pagination_limit_and_cursors(self):
+        """The per-DTR limit is distributed and the per-DTR cursors end up in the next token."""
+        dtrs = [_dtr("dtr-a"), _dtr("dtr-b")]
+        shells = {"dtr-a": ["a1", "a2", "a3"], "dtr-b": ["b1", "b2", "b3"]}
+        cursors = {"dtr-a": "cursor-a"}
+        received_limits = []
+
+        process = self._fake_process({}, shells, cursors)
+
+        def recording_process(*args, **kwargs):
+            received_limits.append(kwargs.get("limit"))
+            return process(*args, **kwargs)
+
+        with patch.object(self.manager, "get_dtrs", return_value=dtrs), \
+             patch.object(self.manager, "_process_dtr_with_retry", side_effect=recording_process):
+            result = self.manager.discover_shells(BPN, [], limit=4)
+
+        self.assertEqual(received_limits, [2, 2])
+        next_page = PaginationManager.decode_page_token(result["pagination"]["next"])
+        self.assertEqual(next_page.dtr_states["dtr-a"].cursor, "cursor-a")
+        self.assertFalse(next_page.dtr_states["dtr-a"].exhausted)
+        self.assertTrue(next_page.dtr_states["dtr-b"].exhausted)
+
+        # Exhausted DTRs are skipped on the next page
+        received_limits.clear()
+        with patch.object(self.manager, "get_dtrs", return_value=dtrs), \
+             patch.object(self.manager, "_process_dtr_with_retry", side_effect=recording_process) as mocked:
+            self.manager.discover_shells(BPN, [], limit=4, cursor=result["pagination"]["next"])
+
+        self.assertEqual(mocked.call_count, 1)
+        self.assertEqual(mocked.call_args.kwargs["cursor"], "cursor-a")
+        self.assertEqual(received_limits, [4])
+
+
+
+class TestGetDtrsCoalescing(unittest.TestCase):
+    """Tests for the single-flight DTR discovery in get_dtrs."""
+
+    def test_concurrent_misses_discover_once(self):
+        manager = DtrConsumerMemoryManager(connector_consumer_manager=Mock(), logger=Mock())
+        results = []
+
+        with patch.object(manager, "_discover_dtrs", side_effect=lambda bpn, timeout: time.sleep(0.2) or [_dtr("dtr-a")]) as discover:
+            threads = [threading.Thread(target=lambda: results.append(manager.get_dtrs(BPN))) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        discover.assert_called_once()
+        self.assertEqual(results, [[_dtr("dtr-a")]] * 4)
+
+    def test_stale_dtrs_are_served_while_refreshing(self):
+        manager = DtrConsumerMemoryManager(connector_consumer_manager=Mock(), logger=Mock(), stale_while_revalidate=True)
+        manager.known_dtrs[BPN] = {manager.REFRESH_INTERVAL_KEY: time.time() - 10, manager.DTR_DATA_KEY: {"dtr-a": _dtr("dtr-a")}}
+        refreshed = threading.Event()
+
+        with patch.object(manager, "_discover_dtrs", side_effect=lambda bpn, timeout: refreshed.set() or []):
+            self.assertEqual(manager.get_dtrs(BPN), [_dtr("dtr-a")])
+            self.assertTrue(refreshed.wait(2))
+
+
+
+class TestFrozenDtrEntries(unittest.TestCase):
+    """Cached DTR entries are frozen and handed out without copying."""
+
+    def test_cached_entries_are_shared_and_read_only(self):
+        manager = DtrConsumerMemoryManager(connector_consumer_manager=Mock(), logger=Mock())
+        dtr = _dtr("dtr-a")
+        manager.add_dtr(BPN, dtr["connector_url"], dtr["asset_id"], dtr["policies"])
+
+        first = manager.get_dtrs(BPN)
+        second = manager.get_dtrs(BPN)
+
+        self.assertEqual(first, [dtr])
+        self.assertIs(first[0], second[0])
+        with self.assertRaises(TypeError):
+            first[0]["policies"][0]["odrl:permission"].append("changed")
+        # The caller's input is not frozen in place
+        dtr["policies"].append({"odrl:prohibition": []})
+        self.assertEqual(len(manager.get_dtrs(BPN)[0]["policies"]), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
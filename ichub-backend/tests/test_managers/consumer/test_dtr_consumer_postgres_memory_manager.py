@@ -0,0 +1,128 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import unittest
+from unittest.mock import Mock, patch
+
+from sqlalchemy import event
+
+from managers.enablement_services.consumer.dtr.database.dtr_consumer_postgres_memory_manager import DtrConsumerPostgresMemoryManager
+
+from .sqlite_engine import get_sqlite_engine
+
+
+BPN_A = "BPNL00000003AYRE"
+BPN_B = "BPNL00000003CML1"
+
+
+class TestDtrConsumerPostgresPersistence(unittest.TestCase):
+    """Tests for the row-level persistence of the DTR consumer manager."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = get_sqlite_engine()
+        event.listen(cls.engine, "before_cursor_execute", cls._record_statement)
+        cls.manager = DtrConsumerPostgresMemoryManager(engine=cls.engine, connector_consumer_manager=Mock(), logger=Mock())
+
+    @classmethod
+    def tearDownClass(cls):
+        event.remove(cls.engine, "before_cursor_execute", cls._record_statement)
+
+    def setUp(self):
+        with self.engine.begin() as connection:
+            connection.exec_driver_sql("DELETE FROM known_dtrs")
+        self.manager.known_dtrs = {}
+        self.statements.clear()
+        # Saves are triggered explicitly so the written statements can be inspected
+        patcher = patch.object(self.manager, "_trigger_save")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    statements = []
+
+    @classmethod
+    def _record_statement(cls, conn, cursor, statement, parameters, context, executemany):
+        cls.statements.append(statement.strip().split()[0].upper())
+
+    def _rows(self):
+        with self.engine.connect() as connection:
+            return sorted(connection.exec_driver_sql("SELECT bpnl, asset_id, edc_url FROM known_dtrs").fetchall())
+
+    def test_multiple_dtrs_of_one_bpn_are_persisted(self):
+        self.manager.add_dtr(BPN_A, "https://a.example.com", "dtr-1", ["p1"])
+        self.manager.add_dtr(BPN_A, "https://b.example.com", "dtr-2", ["p2"])
+        self.assertTrue(self.manager._save_to_db())
+        self.assertEqual(self._rows(), [(BPN_A, "dtr-1", "https://a.example.com"), (BPN_A, "dtr-2", "https://b.example.com")])
+
+    def test_save_only_writes_changed_rows(self):
+        self.manager.add_dtr(BPN_A, "https://a.example.com", "dtr-1", ["p1"])
+        self.manager.add_dtr(BPN_B, "https://b.example.com", "dtr-2", ["p2"])
+        self.manager._save_to_db()
+
+        self.statements.clear()
+        self.manager.add_dtr(BPN_B, "https://b.example.com", "dtr-3", ["p2"])
+        self.manager._save_to_db()
+
+        self.assertNotIn("DELETE", self.statements)
+        self.assertEqual(self.statements.count("INSERT"), 1)
+        self.assertEqual([row[1] for row in self._rows()], ["dtr-1", "dtr-2", "dtr-3"])
+
+    def test_save_without_changes_does_not_touch_db(self):
+        self.manager.add_dtr(BPN_A, "https://a.example.com", "dtr-1", ["p1"])
+        self.manager._save_to_db()
+        self.statements.clear()
+
+        self.assertTrue(self.manager._save_to_db())
+        self.assertEqual(self.statements, [])
+
+    def test_delete_and_purge_remove_only_affected_rows(self):
+        self.manager.add_dtr(BPN_A, "https://a.example.com", "dtr-1", ["p1"])
+        self.manager.add_dtr(BPN_A, "https://a.example.com", "dtr-2", ["p1"])
+        self.manager.add_dtr(BPN_B, "https://b.example.com", "dtr-3", ["p2"])
+        self.manager._save_to_db()
+
+        self.manager.delete_dtr(BPN_A, "dtr-1")
+        self.manager._save_to_db()
+        self.assertEqual([row[1] for row in self._rows()], ["dtr-2", "dtr-3"])
+
+        self.manager.purge_bpn(BPN_B)
+        self.manager._save_to_db()
+        self.assertEqual([row[1] for row in self._rows()], ["dtr-2"])
+
+        self.manager.purge_cache()
+        self.manager._save_to_db()
+        self.assertEqual(self._rows(), [])
+
+    def test_changes_are_reloaded_from_db(self):
+        self.manager.add_dtr(BPN_A, "https://a.example.com", "dtr-1", ["p1"])
+        self.manager.add_dtr(BPN_A, "https://a.example.com", "dtr-2", ["p1"])
+        self.manager._save_to_db()
+
+        self.manager.known_dtrs = {}
+        self.manager._load_from_db()
+
+        self.assertEqual(set(self.manager.known_dtrs[BPN_A][self.manager.DTR_DATA_KEY]), {"dtr-1", "dtr-2"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import base64
+import json
+import time
+import unittest
+from unittest.mock import Mock
+
+from tractusx_sdk.industry.services.notifications.exceptions import NotificationError
+
+from managers.enablement_services.consumer.edr_reuse_policy import EdrReusePolicy, is_rejected
+
+BPN = "BPNL00000003AYRE"
+DSP = "https://provider.example.com/api/v1/dsp"
+ASSET = "https://w3id.org/catenax/taxonomy#DigitalTwinEventAPI"
+
+
+def _jwt(exp: float) -> str:
+    claims = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).decode().rstrip("=")
+    return f"eyJhbGciOiJub25lIn0.{claims}.signature"
+
+
+class TestEdrReusePolicy(unittest.TestCase):
+    """Tests for the reuse of negotiated EDRs."""
+
+    def test_edr_is_reused_until_the_token_expires(self):
+        policy = EdrReusePolicy(expiry_margin=30)
+        key = policy.key(BPN, DSP, ASSET, [{"odrl:permission": []}])
+        negotiate = Mock(return_value=("https://dp.example.com", _jwt(time.time() + 300)))
+
+        self.assertEqual(policy.acquire(key, negotiate), policy.acquire(key, negotiate))
+        self.assertEqual(negotiate.call_count, 1)
+        self.assertEqual(policy.stats(), {"entries": 1, "hits": 1, "misses": 1, "invalidations": 0})
+
+    def test_token_within_the_expiry_margin_is_negotiated_again(self):
+        policy = EdrReusePolicy(expiry_margin=30)
+        key = policy.key(BPN, DSP, ASSET, None)
+        negotiate = Mock(return_value=("https://dp.example.com", _jwt(time.time() + 10)))
+
+        policy.acquire(key, negotiate)
+        policy.acquire(key, negotiate)
+
+        self.assertEqual(negotiate.call_count, 2)
+
+    def test_policies_are_part_of_the_key(self):
+        policy = EdrReusePolicy()
+        negotiate = Mock(return_value=("https://dp.example.com", "opaque-token"))
+
+        policy.acquire(policy.key(BPN, DSP, ASSET, [{"a": 1}]), negotiate)
+        policy.acquire(policy.key(BPN, DSP, ASSET, [{"a": 2}]), negotiate)
+
+        self.assertEqual(negotiate.call_count, 2)
+        self.assertEqual(len(policy), 2)
+
+    def test_rejected_token_is_evicted_and_negotiated_once_more(self):
+        policy = EdrReusePolicy()
+        key = policy.key(BPN, DSP, ASSET, None)
+        negotiate = Mock(side_effect=[("https://dp.example.com", "old-token"), ("https://dp.example.com", "new-token")])
+        on_rejected = Mock()
+
+        def request(endpoint, token):
+            if token == "old-token":
+                raise NotificationError("Failed to send notification. Status code: 401")
+            return {"token": token}
+
+        self.assertEqual(policy.call(key, negotiate, request, on_rejected=on_rejected), {"token": "new-token"})
+        self.assertEqual(policy.call(key, negotiate, request, on_rejected=on_rejected), {"token": "new-token"})
+        self.assertEqual(negotiate.call_count, 2)
+        on_rejected.assert_called_once()
+        self.assertEqual(policy.stats()["invalidations"], 1)
+
+    def test_other_errors_are_raised_without_renegotiation(self):
+        policy = EdrReusePolicy()
+        key = policy.key(BPN, DSP, ASSET, None)
+        negotiate = Mock(return_value=("https://dp.example.com", "token"))
+
+        with self.assertRaises(ConnectionError):
+            policy.call(key, negotiate, Mock(side_effect=ConnectionError("unreachable")))
+        self.assertEqual(negotiate.call_count, 1)
+        self.assertEqual(len(policy), 1)
+
+    def test_disabled_policy_negotiates_every_time(self):
+        policy = EdrReusePolicy(enabled=False)
+        key = policy.key(BPN, DSP, ASSET, None)
+        negotiate = Mock(return_value=("https://dp.example.com", "token"))
+
+        policy.acquire(key, negotiate)
+        policy.acquire(key, negotiate)
+
+        self.assertEqual(negotiate.call_count, 2)
+        self.assertEqual(len(policy), 0)
+
+    def test_disabled_policy_session_negotiates_once_per_batch(self):
+        policy = EdrReusePolicy(enabled=False)
+        key = policy.key(BPN, DSP, ASSET, None)
+        negotiate = Mock(side_effect=[("https://dp.example.com", "old-token"), ("https://dp.example.com", "new-token")])
+        on_rejected = Mock()
+        requests = []
+
+        def request(endpoint, token):
+            requests.append(token)
+            if token == "old-token" and len(requests) == 3:
+                raise NotificationError("Failed to send notification. Status code: 401")
+            return token
+
+        session = policy.session(key, negotiate, on_rejected=on_rejected)
+        results = [session.call(request) for _ in range(4)]
+
+        self.assertEqual(results, ["old-token", "old-token", "new-token", "new-token"])
+        self.assertEqual(negotiate.call_count, 2)
+        on_rejected.assert_called_once()
+        self.assertEqual(len(policy), 0)
+
+    def test_is_rejected(self):
+        self.assertTrue(is_rejected(Mock(status_code=403)))
+        self.assertTrue(is_rejected(Exception("Status code: 401")))
+        self.assertFalse(is_rejected(Mock(status_code=200)))
+        self.assertFalse(is_rejected(Exception("Status code: 500")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import unittest
+from unittest.mock import Mock, patch
+
+from managers.enablement_services.consumer.dtr.memory.dtr_consumer_memory_manager import DtrConsumerMemoryManager
+from managers.enablement_services.consumer.dtr.shell_descriptor_cache import ShellDescriptorCache
+
+BPN = "BPNL00000003AYRE"
+
+
+class TestShellDescriptorCache(unittest.TestCase):
+    """Tests for the LRU+TTL shell descriptor cache."""
+
+    def test_hit_and_miss_counters(self):
+        cache = ShellDescriptorCache()
+        cache.put((BPN, "dtr", "shell-1"), {"id": "shell-1"})
+
+        self.assertEqual(cache.get((BPN, "dtr", "shell-1")), {"id": "shell-1"})
+        self.assertIsNone(cache.get((BPN, "other-dtr", "shell-1")))
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = ShellDescriptorCache(max_entries=2)
+        cache.put((BPN, "dtr", "a"), {"id": "a"})
+        cache.put((BPN, "dtr", "b"), {"id": "b"})
+        cache.get((BPN, "dtr", "a"))
+        cache.put((BPN, "dtr", "c"), {"id": "c"})
+
+        self.assertIn((BPN, "dtr", "a"), cache)
+        self.assertNotIn((BPN, "dtr", "b"), cache)
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_memory_budget_eviction(self):
+        cache = ShellDescriptorCache(max_bytes=200)
+        for i in range(10):
+            cache.put((BPN, "dtr", f"shell-{i}"), {"id": f"shell-{i}", "payload": "x" * 50})
+
+        self.assertLessEqual(cache.stats()["bytes"], 200)
+        self.assertIn((BPN, "dtr", "shell-9"), cache)
+        self.assertNotIn((BPN, "dtr", "shell-0"), cache)
+
+    def test_expired_entries_are_misses(self):
+        cache = ShellDescriptorCache(ttl_seconds=10)
+        with patch("managers.enablement_services.consumer.dtr.shell_descriptor_cache.time.monotonic", return_value=100.0):
+            cache.put((BPN, "dtr", "a"), {"id": "a"})
+        with patch("managers.enablement_services.consumer.dtr.shell_descriptor_cache.time.monotonic", return_value=111.0):
+            self.assertIsNone(cache.get((BPN, "dtr", "a")))
+
+        self.assertEqual(cache.stats()["expirations"], 1)
+        self.assertEqual(len(cache), 0)
+
+    def test_invalidate_counter_party(self):
+        cache = ShellDescriptorCache()
+        cache.put((BPN, "dtr", "a"), {"id": "a"})
+        cache.put(("BPNL000000000OTHER", "dtr", "b"), {"id": "b"})
+
+        self.assertEqual(cache.invalidate_counter_party(BPN), 1)
+        self.assertEqual(len(cache), 1)
+
+
+class TestDiscoverShellFromCache(unittest.TestCase):
+    """discover_shell and discover_submodels reuse cached descriptors."""
+
+    def setUp(self):
+        self.connector_manager = Mock()
+        self.manager = DtrConsumerMemoryManager(connector_consumer_manager=self.connector_manager, logger=Mock())
+        self.dtrs = [{"connector_url": "https://edc.example.com/api/v1/dsp", "asset_id": "dtr-asset", "policies": [{"p": 1}]}]
+        self.connector_service = self.connector_manager.connector_service
+        self.connector_service.do_dsp_with_bpnl.return_value = ("https://dataplane.example.com", "token")
+
+    def test_second_discover_shell_skips_dsp(self):
+        shell = {"id": "shell-1", "submodelDescriptors": []}
+        with patch.object(self.manager, "get_dtrs", return_value=self.dtrs), \
+             patch.object(self.manager, "_fetch_shell_descriptor", return_value=shell) as fetch:
+            first = self.manager.discover_shell(BPN, "shell-1")
+            second = self.manager.discover_submodels(BPN, "shell-1")
+
+        self.assertEqual(first["shell_descriptor"], shell)
+        self.assertEqual(second["dtr"]["assetId"], "dtr-asset")
+        self.assertEqual(fetch.call_count, 1)
+        self.assertEqual(self.connector_service.do_dsp_with_bpnl.call_count, 1)
+        self.assertEqual(self.manager.get_shell_cache_stats()["hits"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
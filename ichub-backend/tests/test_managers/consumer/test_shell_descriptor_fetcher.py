@@ -0,0 +1,142 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import unittest
+from unittest.mock import Mock, patch
+
+from managers.enablement_services.consumer.dtr.shell_descriptor_fetcher import ShellDescriptorFetcher
+
+DATAPLANE = "https://dataplane.example.com/api/public"
+HTTP_TOOLS = "managers.enablement_services.consumer.dtr.shell_descriptor_fetcher.HttpTools"
+
+
+def _response(status_code: int, body=None):
+    return Mock(status_code=status_code, json=Mock(return_value=body))
+
+
+class TestShellDescriptorFetcher(unittest.TestCase):
+    """Tests for the shared shell descriptor fetcher."""
+
+    def setUp(self):
+        self.fetcher = ShellDescriptorFetcher(max_workers=4)
+
+    def tearDown(self):
+        self.fetcher.shutdown()
+
+    @patch(HTTP_TOOLS)
+    def test_fetch_many_keeps_order_and_reports_failures(self, mock_http):
+        """Descriptors come back in lookup order and failed shells are reported."""
+        encoded_to_response = {
+            ShellDescriptorFetcher.encode_id("shell-1"): _response(200, {"id": "shell-1"}),
+            ShellDescriptorFetcher.encode_id("shell-2"): _response(404),
+            ShellDescriptorFetcher.encode_id("shell-3"): _response(200, {"id": "shell-3"}),
+        }
+        mock_http.do_get_with_session.side_effect = lambda url, **kwargs: encoded_to_response[url.rsplit("/", 1)[1]]
+
+        shells, errors = self.fetcher.fetch_many(["shell-1", "shell-2", "shell-3"], DATAPLANE, "token")
+
+        self.assertEqual([s["id"] for s in shells], ["shell-1", "shell-3"])
+        self.assertEqual(errors, {"shell-2": "HTTP 404"})
+
+    @patch(HTTP_TOOLS)
+    def test_exceptions_are_reported_per_shell(self, mock_http):
+        """Network errors are not silently dropped."""
+        mock_http.do_get_with_session.side_effect = ConnectionError("refused")
+
+        shells, errors = self.fetcher.fetch_many(["shell-1"], DATAPLANE, "token")
+
+        self.assertEqual(shells, [])
+        self.assertIn("refused", errors["shell-1"])
+
+    @patch(HTTP_TOOLS)
+    def test_session_is_reused_per_dataplane(self, mock_http):
+        """All requests to the same dataplane host share one session."""
+        mock_http.do_get_with_session.return_value = _response(200, {"id": "x"})
+
+        self.fetcher.fetch_many(["a", "b", "c"], DATAPLANE, "token")
+        self.fetcher.fetch_one("d", f"{DATAPLANE}/other", "token")
+
+        sessions = {id(call.kwargs["session"]) for call in mock_http.do_get_with_session.call_args_list}
+        self.assertEqual(len(sessions), 1)
+
+    @patch(HTTP_TOOLS)
+    def test_batch_lookup_with_fallback_for_missing(self, mock_http):
+        """The batch endpoint is used first, unknown shells are filtered and missing ones fetched singly."""
+        fetcher = ShellDescriptorFetcher(max_workers=2, batch_lookup=True)
+
+        def do_get(url, **kwargs):
+            if url.endswith("/shell-descriptors"):
+                return _response(200, {"result": [{"id": "shell-1"}, {"id": "unrelated"}]})
+            return _response(200, {"id": "shell-2"})
+
+        mock_http.do_get_with_session.side_effect = do_get
+
+        shells, errors = fetcher.fetch_many(["shell-1", "shell-2"], DATAPLANE, "token")
+        fetcher.shutdown()
+
+        self.assertEqual([s["id"] for s in shells], ["shell-1", "shell-2"])
+        self.assertEqual(errors, {})
+        self.assertEqual(mock_http.do_get_with_session.call_count, 2)
+
+    @patch(HTTP_TOOLS)
+    def test_batch_lookup_unsupported_is_remembered(self, mock_http):
+        """A registry rejecting the batch filter only receives single GETs afterwards."""
+        fetcher = ShellDescriptorFetcher(max_workers=2, batch_lookup=True)
+
+        def do_get(url, **kwargs):
+            if url.endswith("/shell-descriptors"):
+                return _response(400)
+            return _response(200, {"id": url.rsplit("/", 1)[1]})
+
+        mock_http.do_get_with_session.side_effect = do_get
+
+        fetcher.fetch_many(["shell-1"], DATAPLANE, "token")
+        fetcher.fetch_many(["shell-2"], DATAPLANE, "token")
+        fetcher.shutdown()
+
+        batch_calls = [c for c in mock_http.do_get_with_session.call_args_list if c.kwargs["url"].endswith("/shell-descriptors")]
+        self.assertEqual(len(batch_calls), 1)
+
+    @patch(HTTP_TOOLS)
+    def test_batch_lookup_ignoring_filter_is_remembered(self, mock_http):
+        """A registry answering the batch filter with only unrelated shells is not asked again."""
+        fetcher = ShellDescriptorFetcher(max_workers=2, batch_lookup=True)
+
+        def do_get(url, **kwargs):
+            if url.endswith("/shell-descriptors"):
+                return _response(200, {"result": [{"id": "unrelated"}]})
+            return _response(200, {"id": url.rsplit("/", 1)[1]})
+
+        mock_http.do_get_with_session.side_effect = do_get
+
+        fetcher.fetch_many(["shell-1"], DATAPLANE, "token")
+        fetcher.fetch_many(["shell-2"], DATAPLANE, "token")
+        fetcher.shutdown()
+
+        self.assertIn(DATAPLANE, fetcher._batch_unsupported)
+        batch_calls = [c for c in mock_http.do_get_with_session.call_args_list if c.kwargs["url"].endswith("/shell-descriptors")]
+        self.assertEqual(len(batch_calls), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import threading
+import time
+import unittest
+from unittest.mock import Mock
+
+from managers.enablement_services.consumer.connector.memory.connector_consumer_memory_manager import ConnectorConsumerMemoryManager
+from managers.enablement_services.consumer.single_flight import SingleFlight
+
+
+BPN = "BPNL00000003AYRE"
+
+
+class TestSingleFlight(unittest.TestCase):
+    """Tests for the per-key request coalescing."""
+
+    def _run_concurrently(self, target, count):
+        results = [None] * count
+        errors = [None] * count
+        start = threading.Barrier(count)
+
+        def run(index):
+            start.wait()
+            try:
+                results[index] = target()
+            except Exception as e:
+                errors[index] = e
+
+        threads = [threading.Thread(target=run, args=(index,)) for index in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results, errors
+
+    def test_concurrent_calls_share_one_execution(self):
+        flight = SingleFlight()
+        fn = Mock(side_effect=lambda: time.sleep(0.2) or ["result"])
+
+        results, errors = self._run_concurrently(lambda: flight.do(BPN, fn), 5)
+
+        fn.assert_called_once()
+        self.assertEqual(results, [["result"]] * 5)
+        self.assertEqual(errors, [None] * 5)
+        self.assertEqual(flight.get_stats(), {"executions": 1, "coalesced": 4, "in_flight": 0})
+
+    def test_error_is_raised_in_every_waiter(self):
+        flight = SingleFlight()
+
+        def fail():
+            time.sleep(0.2)
+            raise ConnectionError("discovery down")
+
+        results, errors = self._run_concurrently(lambda: flight.do(BPN, fail), 3)
+
+        self.assertTrue(all(isinstance(error, ConnectionError) for error in errors))
+        self.assertFalse(flight.in_flight(BPN))
+
+    def test_waiter_times_out(self):
+        flight = SingleFlight(timeout=0.05)
+        release = threading.Event()
+        leader = threading.Thread(target=flight.do, args=(BPN, release.wait, 5))
+        leader.start()
+        while not flight.in_flight(BPN):
+            time.sleep(0.01)
+
+        with self.assertRaises(TimeoutError):
+            flight.do(BPN, Mock())
+        release.set()
+        leader.join()
+
+    def test_different_keys_run_independently(self):
+        flight = SingleFlight()
+        self.assertEqual(flight.do("a", lambda: 1), 1)
+        self.assertEqual(flight.do("b", lambda: 2), 2)
+        self.assertEqual(flight.get_stats()["executions"], 2)
+
+    def test_do_async_skips_key_in_flight(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        fn = Mock(side_effect=lambda: release.wait(5))
+
+        self.assertTrue(flight.do_async(BPN, fn))
+        self.assertFalse(flight.do_async(BPN, fn))
+        release.set()
+        while flight.in_flight(BPN):
+            time.sleep(0.01)
+        fn.assert_called_once()
+
+
+class TestConnectorDiscoveryCoalescing(unittest.TestCase):
+    """Tests for the single-flight discovery in ConnectorConsumerMemoryManager.get_connectors."""
+
+    def test_concurrent_misses_discover_once(self):
+        discovery = Mock()
+        discovery.find_connector_by_bpn.side_effect = lambda bpn: time.sleep(0.2) or ["https://edc.example.com"]
+        manager = ConnectorConsumerMemoryManager(connector_consumer_service=Mock(), connector_discovery=discovery, logger=Mock())
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(manager.get_connectors(BPN))) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        discovery.find_connector_by_bpn.assert_called_once_with(bpn=BPN)
+        self.assertEqual(results, [["https://edc.example.com"]] * 4)
+
+    def test_stale_entry_is_served_while_refreshing(self):
+        discovery = Mock()
+        refreshed = threading.Event()
+        discovery.find_connector_by_bpn.side_effect = lambda bpn: refreshed.set() or ["https://new.example.com"]
+        manager = ConnectorConsumerMemoryManager(connector_consumer_service=Mock(), connector_discovery=discovery, logger=Mock(), stale_while_revalidate=True)
+        manager.known_connectors[BPN] = {manager.REFRESH_INTERVAL_KEY: time.time() - 10, manager.CONNECTOR_LIST_KEY: ["https://old.example.com"]}
+
+        self.assertEqual(manager.get_connectors(BPN), ["https://old.example.com"])
+        self.assertTrue(refreshed.wait(2))
+
+    def test_discovery_timeout_returns_cached_or_empty(self):
+        manager = ConnectorConsumerMemoryManager(connector_consumer_service=Mock(), connector_discovery=Mock(), logger=Mock(), verbose=True)
+        manager._discovery_flight = Mock(do=Mock(side_effect=TimeoutError("waited too long")))
+
+        self.assertEqual(manager.get_connectors(BPN), [])
+
+        manager.known_connectors[BPN] = {manager.REFRESH_INTERVAL_KEY: time.time() - 10, manager.CONNECTOR_LIST_KEY: ["https://old.example.com"]}
+        self.assertEqual(manager.get_connectors(BPN), ["https://old.example.com"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,221 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import unittest
+from unittest.mock import Mock, patch
+
+from managers.enablement_services.provider.connector_provider_manager import ConnectorProviderManager
+from managers.enablement_services.provider.known_offer_cache import KnownOfferCache, KnownOfferPostgresCache
+from ..consumer.sqlite_engine import get_sqlite_engine
+
+SEMANTIC_ID = "urn:samm:io.catenax.part_type_information:1.0.0#PartTypeInformation"
+AGREEMENTS = [{"semanticid": SEMANTIC_ID, "usage": {}, "access": {}}]
+
+
+class TestKnownOfferCache(unittest.TestCase):
+    """Tests for the in-memory known offer cache."""
+
+    def setUp(self):
+        self.cache = KnownOfferCache()
+
+    def test_known_after_add(self):
+        """Added components are known with the same type and fingerprint only."""
+        self.cache.add(KnownOfferCache.ASSET, "asset-1", "fp-1")
+
+        self.assertTrue(self.cache.is_known(KnownOfferCache.ASSET, "asset-1", "fp-1"))
+        self.assertFalse(self.cache.is_known(KnownOfferCache.ASSET, "asset-1", "fp-2"))
+        self.assertFalse(self.cache.is_known(KnownOfferCache.POLICY, "asset-1", "fp-1"))
+        self.assertEqual(self.cache.get_stats(), {"size": 1, "hits": 1, "misses": 2})
+
+    def test_invalidate_asset_drops_its_contracts(self):
+        """Invalidating an asset also forgets the contracts offering it."""
+        self.cache.add(KnownOfferCache.ASSET, "asset-1")
+        self.cache.add(KnownOfferCache.CONTRACT, "contract-1", KnownOfferCache.fingerprint("asset-1"))
+        self.cache.add(KnownOfferCache.CONTRACT, "contract-2", KnownOfferCache.fingerprint("asset-2"))
+
+        self.cache.invalidate_asset("asset-1")
+
+        self.assertFalse(self.cache.is_known(KnownOfferCache.ASSET, "asset-1"))
+        self.assertFalse(self.cache.is_known(KnownOfferCache.CONTRACT, "contract-1", KnownOfferCache.fingerprint("asset-1")))
+        self.assertTrue(self.cache.is_known(KnownOfferCache.CONTRACT, "contract-2", KnownOfferCache.fingerprint("asset-2")))
+
+    def test_disabled_cache_knows_nothing(self):
+        """A disabled cache never reports a component as known."""
+        cache = KnownOfferCache(enabled=False)
+        cache.add(KnownOfferCache.POLICY, "policy-1")
+
+        self.assertFalse(cache.is_known(KnownOfferCache.POLICY, "policy-1"))
+
+    def test_expired_component_is_not_known(self):
+        """Components verified longer than the TTL ago are verified again."""
+        cache = KnownOfferCache(ttl_seconds=60)
+        with patch("managers.enablement_services.provider.known_offer_cache.time.monotonic", return_value=1000.0):
+            cache.add(KnownOfferCache.POLICY, "policy-1")
+        with patch("managers.enablement_services.provider.known_offer_cache.time.monotonic", return_value=1030.0):
+            self.assertTrue(cache.is_known(KnownOfferCache.POLICY, "policy-1"))
+        with patch("managers.enablement_services.provider.known_offer_cache.time.monotonic", return_value=1061.0):
+            self.assertFalse(cache.is_known(KnownOfferCache.POLICY, "policy-1"))
+        self.assertEqual(cache.get_stats()["size"], 0)
+
+
+class TestKnownOfferPostgresCache(unittest.TestCase):
+    """Tests for the known offer cache persisted in the database."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = get_sqlite_engine()
+        cls.cache = KnownOfferPostgresCache(engine=cls.engine, table_name="known_offers_test")
+
+    def setUp(self):
+        self.cache.clear()
+
+    def test_components_seeded_by_another_process_are_known(self):
+        """Components written by another cache instance are found in the table on a memory miss."""
+        self.cache.add(KnownOfferCache.POLICY, "policy-1")
+        other = KnownOfferCache()
+        other.add(KnownOfferCache.POLICY, "policy-2")
+        # Simulate a fresh process by forgetting the memory state only
+        KnownOfferCache.clear(self.cache)
+
+        self.assertTrue(self.cache.is_known(KnownOfferCache.POLICY, "policy-1"))
+        self.assertFalse(self.cache.is_known(KnownOfferCache.POLICY, "policy-2"))
+
+    def test_invalidate_removes_rows(self):
+        """Invalidated components are also removed from the table."""
+        self.cache.add(KnownOfferCache.ASSET, "asset-1")
+        self.cache.add(KnownOfferCache.CONTRACT, "contract-1", KnownOfferCache.fingerprint("asset-1"))
+
+        self.cache.invalidate_asset("asset-1")
+        KnownOfferCache.clear(self.cache)
+
+        self.assertFalse(self.cache.is_known(KnownOfferCache.ASSET, "asset-1"))
+        self.assertFalse(self.cache.is_known(KnownOfferCache.CONTRACT, "contract-1", KnownOfferCache.fingerprint("asset-1")))
+
+    def test_reset_by_another_process_reaches_memory_after_ttl(self):
+        """A replica stops trusting its memory once the table was reset and its entries expired."""
+        replica = KnownOfferPostgresCache(engine=self.engine, table_name="known_offers_test", ttl_seconds=60)
+        job = KnownOfferPostgresCache(engine=self.engine, table_name="known_offers_test")
+        clock = "managers.enablement_services.provider.known_offer_cache.time.monotonic"
+        with patch(clock, return_value=1000.0):
+            replica.add(KnownOfferCache.POLICY, "policy-1")
+
+        job.clear()
+
+        with patch(clock, return_value=1030.0):
+            self.assertTrue(replica.is_known(KnownOfferCache.POLICY, "policy-1"))
+        with patch(clock, return_value=1061.0):
+            self.assertFalse(replica.is_known(KnownOfferCache.POLICY, "policy-1"))
+
+
+class TestConnectorProviderManagerKnownOffers(unittest.TestCase):
+    """Tests for the use of the known offer cache in ConnectorProviderManager."""
+
+    def setUp(self):
+        self.mock_connector_service = Mock()
+        self.mock_connector_service.assets.get_by_id.return_value = Mock(status_code=404)
+        self.mock_connector_service.policies.get_by_id.return_value = Mock(status_code=404)
+        self.mock_connector_service.contract_definitions.get_by_id.return_value = Mock(status_code=404)
+        self.mock_connector_service.create_asset.side_effect = lambda **kwargs: {"@id": kwargs["asset_id"]}
+        self.mock_connector_service.create_policy.side_effect = lambda **kwargs: {"@id": kwargs["policy_id"]}
+        self.mock_connector_service.create_contract.side_effect = lambda **kwargs: {"@id": kwargs["contract_id"]}
+
+        self.manager = ConnectorProviderManager(
+            connector_provider_service=self.mock_connector_service,
+            ichub_url="http://localhost:9000",
+            agreements=AGREEMENTS,
+        )
+
+    def _edc_lookups(self) -> int:
+        return (
+            self.mock_connector_service.assets.get_by_id.call_count
+            + self.mock_connector_service.policies.get_by_id.call_count
+            + self.mock_connector_service.contract_definitions.get_by_id.call_count
+        )
+
+    def test_registered_offer_is_not_looked_up_again(self):
+        """Once registered, an offer is returned without any EDC lookup."""
+        first = self.manager.register_submodel_bundle_circular_offer(semantic_id=SEMANTIC_ID)
+        lookups = self._edc_lookups()
+
+        second = self.manager.register_submodel_bundle_circular_offer(semantic_id=SEMANTIC_ID)
+
+        self.assertEqual(first, second)
+        self.assertEqual(self._edc_lookups(), lookups)
+        self.mock_connector_service.create_contract.assert_called_once()
+
+    def test_changed_headers_verify_the_asset_again(self):
+        """An asset known with other headers is looked up and its headers are synchronized."""
+        self.manager.register_submodel_bundle_circular_offer(semantic_id=SEMANTIC_ID)
+        self.mock_connector_service.assets.get_by_id.reset_mock()
+        self.mock_connector_service.assets.get_by_id.return_value = Mock(status_code=200)
+
+        with patch.object(self.manager, "update_asset_headers") as mock_update:
+            self.manager.get_or_create_circular_submodel_asset(SEMANTIC_ID, headers={"X-Api-Key": "new"})
+            self.manager.get_or_create_circular_submodel_asset(SEMANTIC_ID, headers={"X-Api-Key": "new"})
+
+        self.mock_connector_service.assets.get_by_id.assert_called_once()
+        mock_update.assert_called_once()
+
+    def test_invalidated_offer_is_verified_again(self):
+        """An invalidated offer is looked up in the EDC on the next registration."""
+        asset_id, usage_policy_id, _, contract_id = self.manager.register_submodel_bundle_circular_offer(semantic_id=SEMANTIC_ID)
+
+        self.manager.invalidate_known_offer(asset_id)
+        self.manager.register_submodel_bundle_circular_offer(semantic_id=SEMANTIC_ID)
+
+        self.assertEqual(self.mock_connector_service.create_asset.call_count, 2)
+        self.assertEqual(self.mock_connector_service.create_contract.call_count, 2)
+        self.mock_connector_service.create_policy.assert_called_once()
+
+    def test_asset_not_found_on_header_update_invalidates(self):
+        """A 404 while synchronizing the asset headers forgets the asset."""
+        asset_id, _, _, _ = self.manager.register_submodel_bundle_circular_offer(semantic_id=SEMANTIC_ID)
+
+        self.manager.update_asset_headers(asset_id=asset_id, desired_headers={})
+
+        self.assertFalse(self.manager.known_offer_cache.is_known(KnownOfferCache.ASSET, asset_id, KnownOfferCache.fingerprint({})))
+
+    def test_asset_not_found_on_lookup_verifies_its_contract_again(self):
+        """An asset recreated after a 404 lookup also gets its contract verified again."""
+        self.manager.register_submodel_bundle_circular_offer(semantic_id=SEMANTIC_ID)
+        contract_lookups = self.mock_connector_service.contract_definitions.get_by_id.call_count
+
+        # Other headers force an asset lookup, which answers that the asset is gone
+        self.manager.register_submodel_bundle_circular_offer(semantic_id=SEMANTIC_ID, headers={"X-Api-Key": "new"})
+
+        self.assertEqual(self.mock_connector_service.create_asset.call_count, 2)
+        self.assertEqual(self.mock_connector_service.contract_definitions.get_by_id.call_count, contract_lookups + 1)
+        self.assertEqual(self.mock_connector_service.create_contract.call_count, 2)
+
+    def test_policy_not_found_on_lookup_is_invalidated(self):
+        """A 404 on a policy lookup drops the policy from the known offers."""
+        policy_id = self.manager.get_or_create_policy(qualifier="test")
+        self.manager.known_offer_cache = Mock(wraps=self.manager.known_offer_cache, is_known=Mock(return_value=False))
+
+        self.manager.get_or_create_policy(qualifier="test")
+
+        self.manager.known_offer_cache.invalidate.assert_called_once_with(policy_id)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,167 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import importlib.util
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+from uuid import uuid4
+
+_ENABLEMENT_SERVICES_PATH = Path(__file__).resolve().parents[3] / "managers" / "enablement_services"
+
+
+def _load_module(name: str, path: Path):
+    """Load a module from its file, bypassing the mocks other test modules put in sys.modules."""
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# The tests conftest replaces the submodel service manager module with a mock, load the real implementation
+_http_submodel_adapter = _load_module(
+    "_real_http_submodel_adapter", _ENABLEMENT_SERVICES_PATH / "adapters" / "http_submodel_adapter.py"
+)
+with patch.dict(sys.modules, {"managers.enablement_services.adapters.http_submodel_adapter": _http_submodel_adapter}):
+    submodel_service_manager = _load_module(
+        "_real_submodel_service_manager", _ENABLEMENT_SERVICES_PATH / "submodel_service_manager.py"
+    )
+SubmodelServiceManager = submodel_service_manager.SubmodelServiceManager
+
+
+class TestSubmodelServiceManagerRegistry(unittest.TestCase):
+    """Tests for the process-wide registry of submodel service managers."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.config = {
+            "mode": "filesystem",
+            "path": os.path.join(self.tmp_dir.name, "default"),
+            "http": {"base_url": "https://submodels.example.com", "timeout": 5}
+        }
+        patcher = patch.object(
+            submodel_service_manager.ConfigManager,
+            "get_config",
+            side_effect=lambda key=None, default=None: self.config if key == "provider.submodel_dispatcher" else default
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.addCleanup(SubmodelServiceManager.shutdown_instances)
+
+    def test_same_settings_share_instance(self):
+        """Stacks without submodel service overrides share the default manager."""
+        first = SubmodelServiceManager.get_instance(None)
+        second = SubmodelServiceManager.get_instance({})
+        third = SubmodelServiceManager.get_instance({"dtr": {"url": "https://dtr.example.com"}})
+
+        self.assertIs(first, second)
+        self.assertIs(first, third)
+
+    def test_overrides_create_separate_instance(self):
+        """Stacks with their own submodel service settings get their own manager."""
+        other_path = os.path.join(self.tmp_dir.name, "other")
+        settings = {"submodel_service": {"path": other_path}}
+
+        default = SubmodelServiceManager.get_instance(None)
+        custom = SubmodelServiceManager.get_instance(settings)
+
+        self.assertIsNot(default, custom)
+        self.assertIs(custom, SubmodelServiceManager.get_instance({"submodel_service": {"path": other_path}}))
+        self.assertEqual(custom.settings["path"], other_path)
+        self.assertTrue(os.path.isdir(other_path))
+
+    def test_overrides_are_merged_with_configuration(self):
+        """Nested overrides only replace the given keys of the configuration."""
+        manager = SubmodelServiceManager.get_instance(
+            {"submodel_service": {"mode": "http", "http": {"timeout": 10}}}
+        )
+
+        self.assertEqual(manager.adapter_mode, "http")
+        self.assertEqual(manager.adapter.base_url, "https://submodels.example.com")
+        self.assertEqual(manager.adapter.timeout, 10)
+
+    def test_http_managers_reuse_one_client(self):
+        """All users of an HTTP backend share the same connection pool."""
+        self.config["mode"] = "http"
+
+        first = SubmodelServiceManager.get_instance(None)
+        second = SubmodelServiceManager.get_instance(None)
+
+        self.assertIs(first.adapter.client, second.adapter.client)
+
+    def test_shutdown_closes_clients_and_clears_registry(self):
+        """Shutting down closes the HTTP pools and new requests build a new manager."""
+        self.config["mode"] = "http"
+        manager = SubmodelServiceManager.get_instance(None)
+        client = manager.adapter.client
+
+        SubmodelServiceManager.shutdown_instances()
+
+        self.assertTrue(client.is_closed)
+        self.assertIsNot(manager, SubmodelServiceManager.get_instance(None))
+
+
+
+class TestSubmodelServiceManagerBulkRead(unittest.TestCase):
+    """Tests for reading many submodels in one call."""
+
+    SEMANTIC_ID = "urn:samm:io.catenax.test:1.0.0#Test"
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        config = {"mode": "filesystem", "path": self.tmp_dir.name, "max_read_workers": 4}
+        patcher = patch.object(
+            submodel_service_manager.ConfigManager,
+            "get_config",
+            side_effect=lambda key=None, default=None: config if key == "provider.submodel_dispatcher" else default
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.manager = SubmodelServiceManager()
+        self.addCleanup(self.manager.close)
+
+    def test_reads_all_submodels_by_id(self):
+        """Every stored submodel is returned under its UUID and missing ones are None."""
+        ids = [uuid4() for _ in range(5)]
+        for index, submodel_id in enumerate(ids):
+            self.manager.upload_twin_aspect_document(submodel_id, self.SEMANTIC_ID, {"index": index})
+        missing = uuid4()
+
+        documents = self.manager.get_twin_aspect_documents(ids + [missing], self.SEMANTIC_ID)
+
+        self.assertEqual([documents[submodel_id]["index"] for submodel_id in ids], list(range(5)))
+        self.assertIsNone(documents[missing])
+        self.assertEqual(self.manager.max_read_workers, 4)
+
+    def test_empty_request_does_not_start_threads(self):
+        self.assertEqual(self.manager.get_twin_aspect_documents([], self.SEMANTIC_ID), {})
+        self.assertIsNone(self.manager._read_executor)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from requests import HTTPError
+
+# Other test modules replace parts of the tractusx_sdk package with mocks, import the registry with the real one
+with patch.dict(sys.modules):
+    for name in [name for name, module in sys.modules.items() if name.startswith("tractusx_sdk") and isinstance(module, MagicMock)]:
+        del sys.modules[name]
+    from managers.submodels import schema_registry
+SchemaRegistry = schema_registry.SchemaRegistry
+
+SEMANTIC_ID = "urn:samm:io.catenax.test:1.0.0#Test"
+PCF_SEMANTIC_ID = "urn:samm:io.catenax.pcf:9.0.0#Pcf"
+
+SCHEMA = {
+    "$schema": "http://json-schema.org/draft-04/schema",
+    "x-samm-aspect-model-urn": SEMANTIC_ID,
+    "type": "object",
+    "properties": {"amount": {"type": "number", "minimum": 0, "exclusiveMinimum": True}},
+    "required": ["amount"],
+}
+
+
+class TestSchemaRegistry(unittest.TestCase):
+    """Tests for the local aspect model schema registry."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        schema_dir = os.path.join(self.tmp_dir.name, "io.catenax.test", "1.0.0", "gen")
+        os.makedirs(schema_dir)
+        with open(os.path.join(schema_dir, "Test-schema.json"), "w") as file:
+            json.dump(SCHEMA, file)
+        with open(os.path.join(schema_dir, "Test-example.json"), "w") as file:
+            json.dump({"amount": 1}, file)
+
+    def test_loads_schemas_by_semantic_id(self):
+        """Schemas are indexed by their aspect model URN and only *-schema.json files are read."""
+        registry = SchemaRegistry(directories=[self.tmp_dir.name], allow_download=False)
+
+        self.assertTrue(registry.has_schema(SEMANTIC_ID))
+        self.assertEqual(registry.get_schema(SEMANTIC_ID), SCHEMA)
+        self.assertEqual(len(registry._schemas), 1)
+
+    def test_validator_is_built_once(self):
+        """The validator of a semantic ID is reused and uses the draft declared by the schema."""
+        registry = SchemaRegistry(directories=[self.tmp_dir.name], allow_download=False)
+
+        validator = registry.get_validator(SEMANTIC_ID)
+
+        self.assertIs(registry.get_validator(SEMANTIC_ID), validator)
+        self.assertTrue(registry.is_valid(SEMANTIC_ID, {"amount": 1}))
+        # Draft-04 boolean exclusiveMinimum
+        self.assertFalse(registry.is_valid(SEMANTIC_ID, {"amount": 0}))
+
+    def test_validate_reports_errors(self):
+        """Validation passes for valid payloads and reports every error of invalid ones."""
+        registry = SchemaRegistry(directories=[self.tmp_dir.name], allow_download=False)
+
+        self.assertEqual(registry.validate(SEMANTIC_ID, {"amount": 2})["status"], "ok")
+        with self.assertRaises(HTTPError) as context:
+            registry.validate(SEMANTIC_ID, {"amount": "a lot"})
+        self.assertIn("1 validation errors found", str(context.exception))
+        self.assertIn("'path': 'amount'", str(context.exception))
+
+    def test_missing_schema_without_download(self):
+        """Schemas missing locally are not downloaded when downloads are disabled."""
+        registry = SchemaRegistry(directories=[self.tmp_dir.name], allow_download=False)
+
+        with patch.object(schema_registry, "submodel_schema_finder") as finder:
+            with self.assertRaises(HTTPError):
+                registry.get_validator("urn:samm:io.catenax.unknown:1.0.0#Unknown")
+            finder.assert_not_called()
+
+    def test_missing_schema_is_downloaded_once(self):
+        """Schemas missing locally are downloaded on first use and then kept."""
+        registry = SchemaRegistry(directories=[], allow_download=True)
+        other_id = "urn:samm:io.catenax.other:1.0.0#Other"
+
+        with patch.object(schema_registry, "submodel_schema_finder", return_value={"status": "ok", "schema": SCHEMA}) as finder:
+            self.assertTrue(registry.is_valid(other_id, {"amount": 3}))
+            self.assertTrue(registry.is_valid(other_id, {"amount": 4}))
+
+        finder.assert_called_once_with(other_id)
+
+    def test_bundled_pcf_schema(self):
+        """The PCF schema is bundled, so PCF payloads are validated without network access."""
+        registry = SchemaRegistry(allow_download=False)
+
+        self.assertTrue(registry.has_schema(PCF_SEMANTIC_ID))
+        self.assertFalse(registry.is_valid(PCF_SEMANTIC_ID, {"specVersion": 1}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import copy
+import json
+import pickle
+import unittest
+
+from tools.frozen_tools import FrozenDict, FrozenList, freeze, thaw
+
+
+class TestFrozenTools(unittest.TestCase):
+
+    def setUp(self):
+        self.policy = {"odrl:permission": [{"odrl:action": "use", "odrl:constraint": {"and": [1, 2]}}], "odrl:prohibition": []}
+
+    def test_freeze_is_recursive_and_read_only(self):
+        frozen = freeze(self.policy)
+        self.assertIsInstance(frozen, FrozenDict)
+        self.assertIsInstance(frozen["odrl:permission"], FrozenList)
+        self.assertEqual(frozen, self.policy)
+        with self.assertRaises(TypeError):
+            frozen["odrl:obligation"] = []
+        with self.assertRaises(TypeError):
+            frozen["odrl:permission"][0]["odrl:constraint"]["and"].append(3)
+        with self.assertRaises(TypeError):
+            frozen.update({})
+
+    def test_copies_share_the_frozen_value(self):
+        frozen = freeze(self.policy)
+        self.assertIs(copy.deepcopy(frozen), frozen)
+        self.assertIs(copy.copy(frozen["odrl:permission"]), frozen["odrl:permission"])
+        self.assertIs(freeze(frozen), frozen)
+
+    def test_serialization_matches_plain_values(self):
+        frozen = freeze(self.policy)
+        self.assertEqual(json.loads(json.dumps(frozen)), self.policy)
+        self.assertEqual(pickle.loads(pickle.dumps(frozen)), self.policy)
+
+    def test_thaw_returns_mutable_copy(self):
+        thawed = thaw(freeze(self.policy))
+        self.assertIs(type(thawed), dict)
+        self.assertIs(type(thawed["odrl:permission"]), list)
+        thawed["odrl:permission"].append({})
+        self.assertEqual(len(self.policy["odrl:permission"]), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
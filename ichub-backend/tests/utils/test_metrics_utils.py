@@ -0,0 +1,95 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import pytest
+from prometheus_client import REGISTRY
+
+from utils import metrics_utils
+from utils.async_utils import DB_EXECUTOR, get_executor
+from utils.metrics_utils import EDC, track_stage, timed_stage
+
+
+def _count(stage: str, counter_party: str = "", outcome: str = "success") -> float:
+    labels = {"component": EDC, "stage": stage, "counter_party": counter_party, "outcome": outcome}
+    return REGISTRY.get_sample_value("ichub_stage_duration_seconds_count", labels) or 0.0
+
+
+@pytest.fixture
+def metrics_enabled(monkeypatch):
+    monkeypatch.setattr(metrics_utils, "_settings", lambda: {"enabled": True, "counter_party": True, "tracing": False})
+
+
+class TestTrackStage:
+
+    def test_records_duration_per_counter_party(self, metrics_enabled):
+        before = _count("test_dsp", "BPNL000000000001")
+
+        with track_stage(EDC, "test_dsp", "BPNL000000000001"):
+            pass
+
+        assert _count("test_dsp", "BPNL000000000001") == before + 1
+
+    def test_records_failures_as_errors(self, metrics_enabled):
+        before = _count("test_failure", outcome="error")
+
+        with pytest.raises(ValueError):
+            with track_stage(EDC, "test_failure"):
+                raise ValueError("boom")
+
+        assert _count("test_failure", outcome="error") == before + 1
+
+    def test_nothing_is_recorded_when_disabled(self, monkeypatch):
+        monkeypatch.setattr(metrics_utils, "_settings", lambda: {"enabled": False, "counter_party": True, "tracing": False})
+
+        with track_stage(EDC, "test_disabled"):
+            pass
+
+        assert _count("test_disabled") == 0.0
+
+    def test_decorator_reads_counter_party_argument(self, metrics_enabled):
+        @timed_stage(EDC, "test_decorated", counter_party_arg="bpn")
+        def discover(bpn: str, retries: int = 0) -> str:
+            return bpn
+
+        before = _count("test_decorated", "BPNL000000000002")
+
+        assert discover("BPNL000000000002") == "BPNL000000000002"
+        assert _count("test_decorated", "BPNL000000000002") == before + 1
+
+
+class TestRuntimeCollector:
+
+    def test_collects_cache_and_executor_metrics(self):
+        metrics_utils.register_cache("test_cache", lambda: {"hits": 3, "misses": 1, "entries": 2})
+        get_executor(DB_EXECUTOR)
+
+        samples = {
+            (sample.name, tuple(sorted(sample.labels.items()))): sample.value
+            for family in metrics_utils._RuntimeCollector().collect()
+            for sample in family.samples
+        }
+
+        assert samples[("ichub_cache_hits_total", (("cache", "test_cache"),))] == 3
+        assert samples[("ichub_cache_hit_ratio", (("cache", "test_cache"),))] == 0.75
+        assert samples[("ichub_cache_entries", (("cache", "test_cache"),))] == 2
+        assert samples[("ichub_executor_queue_depth", (("executor", DB_EXECUTOR),))] == 0
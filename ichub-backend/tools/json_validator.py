@@ -37,7 +37,7 @@ Reference:
     - JSON Schema Draft specifications
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, List, Type
 import logging
 
 import jsonschema
@@ -47,6 +47,54 @@ from requests import HTTPError
 logger = logging.getLogger(__name__)
 
 
+def get_validator_class(schema: Dict[str, Any]) -> Type[jsonschema.protocols.Validator]:
+    """
+    Get the jsonschema validator class of the JSON Schema draft declared in the $schema property.
+    Catena-X schemas often omit it or use Draft-04, which is the default.
+    """
+    schema_uri = schema.get("$schema", "")
+    
+    if "draft-04" in schema_uri:
+        return jsonschema.Draft4Validator
+    elif "draft-06" in schema_uri:
+        return jsonschema.Draft6Validator
+    elif "draft-07" in schema_uri or "draft-7" in schema_uri:
+        return jsonschema.Draft7Validator
+    elif "draft/2019-09" in schema_uri:
+        return jsonschema.Draft201909Validator
+    elif "draft/2020-12" in schema_uri:
+        return jsonschema.Draft202012Validator
+
+    # Default to Draft-04 for Catena-X schemas which often omit or use draft-04
+    logger.debug(f"No recognized $schema found ('{schema_uri}'), defaulting to Draft4Validator")
+    return jsonschema.Draft4Validator
+
+
+def collect_validation_errors(validator: jsonschema.protocols.Validator, json_to_validate: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Collect the detailed records of all the validation errors of a JSON object.
+    """
+    return [
+        {
+            "path": ".".join(str(p) for p in error.path) if error.path else "root",
+            "message": error.message,
+            "validator": error.validator,
+            "expected": error.schema.get("type", "N/A"),
+            "invalid_value": error.instance
+        }
+        for error in validator.iter_errors(json_to_validate)
+    ]
+
+
+def raise_validation_errors(error_records: List[Dict[str, Any]]) -> None:
+    """
+    Raise the HTTPError reporting the given validation error records.
+    """
+    raise HTTPError(
+        f"422 Client Error: Validation error - {len(error_records)} validation errors found: {error_records}"
+    )
+
+
 def json_validator_draft_aware(schema: Dict[str, Any], json_to_validate: Dict[str, Any]) -> Dict[str, str]:
     """
     Validates a JSON object against a schema, auto-detecting the JSON Schema draft version.
@@ -71,40 +119,11 @@ def json_validator_draft_aware(schema: Dict[str, Any], json_to_validate: Dict[st
     Raises:
         HTTPError: If validation errors are found
     """
-    error_records = []
-    
     # Detect schema draft version from $schema property
-    schema_uri = schema.get("$schema", "")
-    
-    if "draft-04" in schema_uri:
-        validator_cls = jsonschema.Draft4Validator
-    elif "draft-06" in schema_uri:
-        validator_cls = jsonschema.Draft6Validator
-    elif "draft-07" in schema_uri or "draft-7" in schema_uri:
-        validator_cls = jsonschema.Draft7Validator
-    elif "draft/2019-09" in schema_uri:
-        validator_cls = jsonschema.Draft201909Validator
-    elif "draft/2020-12" in schema_uri:
-        validator_cls = jsonschema.Draft202012Validator
-    else:
-        # Default to Draft-04 for Catena-X schemas which often omit or use draft-04
-        validator_cls = jsonschema.Draft4Validator
-        logger.debug(f"No recognized $schema found ('{schema_uri}'), defaulting to Draft4Validator")
-    
-    validator = validator_cls(schema)
-    
-    for error in validator.iter_errors(json_to_validate):
-        error_records.append({
-            "path": ".".join(str(p) for p in error.path) if error.path else "root",
-            "message": error.message,
-            "validator": error.validator,
-            "expected": error.schema.get("type", "N/A"),
-            "invalid_value": error.instance
-        })
+    validator = get_validator_class(schema)(schema)
     
+    error_records = collect_validation_errors(validator, json_to_validate)
     if error_records:
-        raise HTTPError(
-            f"422 Client Error: Validation error - {len(error_records)} validation errors found: {error_records}"
-        )
+        raise_validation_errors(error_records)
     
     return {"status": "ok", "message": "JSON validation passed"}
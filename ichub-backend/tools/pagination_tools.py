@@ -0,0 +1,56 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import base64
+import json
+from typing import Optional
+
+from tools.exceptions import InvalidError
+
+# Header carrying the cursor of the next page of a keyset-paginated listing
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_keyset_cursor(last_id: int) -> str:
+    """
+    Encode the ID of the last row of a page into an opaque cursor for the next page.
+    """
+    return base64.urlsafe_b64encode(json.dumps({"id": last_id}).encode()).decode()
+
+
+def decode_keyset_cursor(cursor: Optional[str]) -> Optional[int]:
+    """
+    Decode a cursor created with encode_keyset_cursor back into the ID to continue after.
+
+    Raises:
+        InvalidError: If the cursor was not created by encode_keyset_cursor.
+    """
+    if not cursor:
+        return None
+    try:
+        last_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))["id"]
+    except Exception:
+        raise InvalidError("Invalid pagination cursor.")
+    if not isinstance(last_id, int):
+        raise InvalidError("Invalid pagination cursor.")
+    return last_id
@@ -21,16 +21,143 @@
 #################################################################################
 
 import asyncio
+import contextvars
 import functools
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
-from typing import Callable, Any
+from typing import AsyncIterator, Callable, Any, Dict, Iterator, List, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
-def async_blocking(func: Callable) -> Callable:
+## Workload classes, each one runs in its own named and size-limited executor so that
+## a burst of slow EDC/DTR calls cannot starve the database or validation work.
+DB_EXECUTOR = "db"    # SQLModel sessions and other local database work
+IO_EXECUTOR = "io"    # EDC, DTR, submodel service and other remote calls
+CPU_EXECUTOR = "cpu"  # CPU heavy work, e.g. payload and schema validation
+
+DEFAULT_EXECUTOR = IO_EXECUTOR
+
+_DEFAULT_MAX_WORKERS: Dict[str, int] = {
+    DB_EXECUTOR: 20,
+    IO_EXECUTOR: 50,
+    CPU_EXECUTOR: 4
+}
+
+_executors: Dict[str, ThreadPoolExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def _get_max_workers(name: str) -> int:
+    """Get the configured size of an executor (server.executors.<name>.max_workers)."""
+    from managers.config.config_manager import ConfigManager
+
+    max_workers = ConfigManager.get_config(f"server.executors.{name}.max_workers", default=None)
+    if not isinstance(max_workers, int) or max_workers < 1:
+        max_workers = _DEFAULT_MAX_WORKERS.get(name, _DEFAULT_MAX_WORKERS[DEFAULT_EXECUTOR])
+    return max_workers
+
+
+def get_executor(name: str = DEFAULT_EXECUTOR) -> ThreadPoolExecutor:
+    """
+    Get the named executor of a workload class, creating it on first use.
+
+    Args:
+        name: The workload class, one of DB_EXECUTOR, IO_EXECUTOR or CPU_EXECUTOR.
+
+    Returns:
+        ThreadPoolExecutor: The executor of the workload class.
+    """
+    if name not in _DEFAULT_MAX_WORKERS:
+        raise ValueError(f"Unknown executor '{name}'. Supported executors: {', '.join(_DEFAULT_MAX_WORKERS)}")
+
+    executor = _executors.get(name)
+    if executor is not None:
+        return executor
+
+    with _executors_lock:
+        executor = _executors.get(name)
+        if executor is None:
+            max_workers = _get_max_workers(name)
+            executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"ichub-{name}")
+            _executors[name] = executor
+            logger.info(f"Created the '{name}' executor with {max_workers} threads")
+        return executor
+
+
+def shutdown_executors(wait: bool = True) -> None:
+    """
+    Shut down all the named executors. They are created again if used afterwards.
+    """
+    with _executors_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=wait)
+
+
+def get_executor_stats() -> Dict[str, Dict[str, int]]:
+    """
+    Get the number of queued tasks and started threads of each created executor.
+    """
+    with _executors_lock:
+        executors = dict(_executors)
+    # ThreadPoolExecutor does not expose its queue, the private attributes are stable since Python 3.8
+    return {
+        name: {"queued": executor._work_queue.qsize(), "threads": len(executor._threads)}
+        for name, executor in executors.items()
+    }
+
+
+async def run_in_executor(executor_name: str, func: Callable, *args, **kwargs) -> Any:
     """
-    Decorator to automatically run blocking functions in the default thread pool.
+    Run a blocking function in the named executor of its workload class.
+
+    The context variables of the caller are propagated, like with asyncio.to_thread.
+
+    Usage:
+        result = await run_in_executor(DB_EXECUTOR, blocking_function, arg1, kwarg1=value1)
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    # Use functools.partial to bind keyword arguments
+    bound_func = functools.partial(context.run, func, *args, **kwargs)
+    return await loop.run_in_executor(get_executor(executor_name), bound_func)
+
+
+def _next_batch(iterator: Iterator, batch_size: int) -> List:
+    return list(itertools.islice(iterator, batch_size))
+
+
+async def iterate_in_executor(executor_name: str, iterator: Iterator, batch_size: int = 100) -> AsyncIterator[List]:
+    """
+    Consume a blocking iterator (e.g. rows streamed from a database cursor) in the named executor.
+
+    The items are handed over in batches of batch_size, so the event loop does not pay an
+    executor round trip per item. The iterator is closed in the executor as well, also when
+    the consumer stops early (e.g. a client disconnecting from a streaming response).
+
+    Usage:
+        async for batch in iterate_in_executor(DB_EXECUTOR, service.stream_items()):
+            ...
+    """
+    try:
+        while True:
+            batch = await run_in_executor(executor_name, _next_batch, iterator, batch_size)
+            if not batch:
+                break
+            yield batch
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            await run_in_executor(executor_name, close)
+
+
+def async_blocking(func: Optional[Callable] = None, *, executor: str = DEFAULT_EXECUTOR) -> Callable:
+    """
+    Decorator to automatically run blocking functions in a named thread pool.
     
     This eliminates the need to manually call loop.run_in_executor in every endpoint.
     Simply decorate any blocking function call and it will automatically run asynchronously.
@@ -38,31 +165,34 @@ def async_blocking(func: Callable) -> Callable:
     Usage:
         @async_blocking
         def my_blocking_function(arg1, arg2):
-            # This will automatically run in thread pool
+            # This will automatically run in the default (I/O) thread pool
             return some_blocking_operation(arg1, arg2)
+
+        @async_blocking(executor=DB_EXECUTOR)
+        def my_database_function(arg1):
+            return some_query(arg1)
         
         # In your async endpoint:
         result = await my_blocking_function(value1, value2)
     """
-    @wraps(func)
-    async def wrapper(*args, **kwargs):
-        loop = asyncio.get_event_loop()
-        # Use functools.partial to bind keyword arguments
-        bound_func = functools.partial(func, *args, **kwargs)
-        return await loop.run_in_executor(None, bound_func)
-    return wrapper
+    def decorator(blocking_func: Callable) -> Callable:
+        @wraps(blocking_func)
+        async def wrapper(*args, **kwargs):
+            return await run_in_executor(executor, blocking_func, *args, **kwargs)
+        return wrapper
+
+    if func is not None:
+        return decorator(func)
+    return decorator
 
 async def run_blocking(func: Callable, *args, **kwargs) -> Any:
     """
-    Utility function to run any blocking function in the thread pool.
+    Utility function to run any blocking function in the default (I/O) thread pool.
     
     Usage:
         result = await run_blocking(blocking_function, arg1, arg2, kwarg1=value1)
     """
-    loop = asyncio.get_event_loop()
-    # Use functools.partial to bind keyword arguments
-    bound_func = functools.partial(func, *args, **kwargs)
-    return await loop.run_in_executor(None, bound_func)
+    return await run_in_executor(DEFAULT_EXECUTOR, func, *args, **kwargs)
 
 class AsyncManagerWrapper:
     """
@@ -70,30 +200,35 @@ class AsyncManagerWrapper:
     This provides a clean interface without modifying the original managers.
     
     Usage:
-        # Wrap any manager
-        async_manager = AsyncManagerWrapper(some_manager)
+        # Wrap any manager, its methods run in the executor of the given workload class
+        async_manager = AsyncManagerWrapper(some_manager, executor=DB_EXECUTOR)
         
         # Call any method asynchronously
         result = await async_manager.call_method('method_name', arg1, arg2, kwarg1=value1)
         
         # Or use the more direct approach
         result = await async_manager.some_method(arg1, arg2)
+
+        # Run a single call in another executor
+        result = await async_manager.run_in(IO_EXECUTOR, 'method_name', arg1)
     """
     
-    def __init__(self, manager, name: str = "Manager"):
+    def __init__(self, manager, name: str = "Manager", executor: str = DEFAULT_EXECUTOR):
         self._manager = manager
         self._name = name
+        self._executor = executor
     
     async def call_method(self, method_name: str, *args, **kwargs):
-        """Generic method caller that runs any method in thread pool."""
+        """Generic method caller that runs any method in the wrapper executor."""
+        return await self.run_in(self._executor, method_name, *args, **kwargs)
+
+    async def run_in(self, executor_name: str, method_name: str, *args, **kwargs):
+        """Run a method in the given executor."""
         if not hasattr(self._manager, method_name):
             raise AttributeError(f"{self._name} has no method '{method_name}'")
         
         method = getattr(self._manager, method_name)
-        loop = asyncio.get_event_loop()
-        # Use functools.partial to bind keyword arguments
-        bound_method = functools.partial(method, *args, **kwargs)
-        return await loop.run_in_executor(None, bound_method)
+        return await run_in_executor(executor_name, method, *args, **kwargs)
     
     def __getattr__(self, name):
         """Dynamically create async versions of manager methods."""
@@ -101,10 +236,6 @@ class AsyncManagerWrapper:
             original_method = getattr(self._manager, name)
             if callable(original_method):
                 async def async_method(*args, **kwargs):
-                    loop = asyncio.get_event_loop()
-                    # Use functools.partial to bind keyword arguments
-                    bound_method = functools.partial(original_method, *args, **kwargs)
-                    return await loop.run_in_executor(None, bound_method)
+                    return await run_in_executor(self._executor, original_method, *args, **kwargs)
                 return async_method
         raise AttributeError(f"'{self._name}' object has no attribute '{name}'")
-
@@ -0,0 +1,204 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+"""
+Per-stage timings, cache statistics and executor queue depth of the hot paths.
+
+The stage histograms are published next to the HTTP metrics of the
+``/metrics`` endpoint (``metrics.enabled``). OpenTelemetry spans are opened for
+every stage as well when ``metrics.tracing.enabled`` is set and the
+``opentelemetry-api`` package is installed.
+"""
+
+import functools
+import inspect
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+from typing import Callable, Dict, Iterator, Optional
+
+from managers.config.config_manager import ConfigManager
+from managers.config.log_manager import LoggingManager
+
+logger = LoggingManager.get_logger(__name__)
+
+try:
+    from prometheus_client import REGISTRY, Histogram
+    from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+except ImportError:  # pragma: no cover - shipped with prometheus-fastapi-instrumentator
+    REGISTRY = None
+    Histogram = None
+
+try:
+    from opentelemetry import trace as otel_trace
+except ImportError:
+    otel_trace = None
+
+## Components whose stages are timed
+EDC = "edc"
+DTR = "dtr"
+SUBMODEL_SERVICE = "submodel_service"
+DB = "db"
+
+_STAGE_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+STAGE_DURATION = Histogram(
+    "ichub_stage_duration_seconds",
+    "Duration of the EDC, DTR, submodel service and database stages",
+    ["component", "stage", "counter_party", "outcome"],
+    buckets=_STAGE_BUCKETS,
+) if Histogram is not None else None
+
+_cache_stats: Dict[str, Callable[[], Dict]] = {}
+_cache_stats_lock = threading.Lock()
+_collector_registered = False
+
+
+@functools.lru_cache(maxsize=1)
+def _settings() -> Dict[str, bool]:
+    """Read the metric settings once, the configuration does not change at runtime."""
+    return {
+        "enabled": bool(ConfigManager.get_config("metrics.enabled", default=False)) and STAGE_DURATION is not None,
+        "counter_party": bool(ConfigManager.get_config("metrics.stages.counter_party_label", default=True)),
+        "tracing": bool(ConfigManager.get_config("metrics.tracing.enabled", default=False)) and otel_trace is not None,
+    }
+
+
+@contextmanager
+def track_stage(component: str, stage: str, counter_party: Optional[str] = None) -> Iterator[None]:
+    """
+    Time a stage of a hot path, e.g. an EDC negotiation or a DTR lookup.
+
+    Usage:
+        with track_stage(EDC, "dsp", counter_party_id):
+            connector_service.do_dsp_with_bpnl(...)
+
+    Args:
+        component: The component the stage belongs to, e.g. EDC or DB.
+        stage: Name of the stage within the component.
+        counter_party: BPN of the business partner the stage talks to, if any.
+    """
+    settings = _settings()
+    if not settings["enabled"] and not settings["tracing"]:
+        yield
+        return
+
+    party = (counter_party or "") if settings["counter_party"] else ""
+    with ExitStack() as stack:
+        if settings["tracing"]:
+            attributes = {"ichub.component": component, "ichub.stage": stage}
+            if party:
+                attributes["ichub.counter_party"] = party
+            stack.enter_context(otel_trace.get_tracer(__name__).start_as_current_span(f"{component}.{stage}", attributes=attributes))
+
+        outcome = "success"
+        start = time.perf_counter()
+        try:
+            yield
+        except BaseException:
+            outcome = "error"
+            raise
+        finally:
+            if settings["enabled"]:
+                STAGE_DURATION.labels(component, stage, party, outcome).observe(time.perf_counter() - start)
+
+
+def timed_stage(component: str, stage: str, counter_party_arg: Optional[str] = None) -> Callable:
+    """
+    Decorator variant of track_stage.
+
+    Args:
+        component: The component the stage belongs to.
+        stage: Name of the stage within the component.
+        counter_party_arg: Name of the argument holding the counter party BPN, if any.
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func) if counter_party_arg else None
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            counter_party = None
+            if signature is not None:
+                counter_party = signature.bind_partial(*args, **kwargs).arguments.get(counter_party_arg)
+            with track_stage(component, stage, counter_party):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def register_cache(name: str, stats: Callable[[], Dict]) -> None:
+    """
+    Publish the statistics of a cache. The callable returns a dict with ``hits``,
+    ``misses`` and the number of ``entries`` (or ``size``), optionally the number
+    of ``invalidations``; a cache registered again under the same name replaces
+    the previous one.
+    """
+    with _cache_stats_lock:
+        _cache_stats[name] = stats
+
+
+class _RuntimeCollector:
+    """Collects the cache statistics and the executor queue depth on every scrape."""
+
+    def collect(self):
+        from utils.async_utils import get_executor_stats
+
+        hits = CounterMetricFamily("ichub_cache_hits", "Cache lookups served from the cache", labels=["cache"])
+        misses = CounterMetricFamily("ichub_cache_misses", "Cache lookups not served from the cache", labels=["cache"])
+        entries = GaugeMetricFamily("ichub_cache_entries", "Entries currently held by the cache", labels=["cache"])
+        hit_ratio = GaugeMetricFamily("ichub_cache_hit_ratio", "Share of the lookups served from the cache", labels=["cache"])
+        invalidations = CounterMetricFamily("ichub_cache_invalidations", "Cached entries dropped because they were no longer valid", labels=["cache"])
+        with _cache_stats_lock:
+            caches = list(_cache_stats.items())
+        for name, stats_fn in caches:
+            try:
+                stats = stats_fn()
+            except Exception as e:
+                logger.debug(f"[Metrics] Could not read the statistics of the [{name}] cache: {e}")
+                continue
+            cache_hits = stats.get("hits", 0)
+            cache_misses = stats.get("misses", 0)
+            lookups = cache_hits + cache_misses
+            hits.add_metric([name], cache_hits)
+            misses.add_metric([name], cache_misses)
+            entries.add_metric([name], stats.get("entries", stats.get("size", 0)))
+            hit_ratio.add_metric([name], (cache_hits / lookups) if lookups else 0.0)
+            if "invalidations" in stats:
+                invalidations.add_metric([name], stats["invalidations"])
+        yield from (hits, misses, entries, hit_ratio, invalidations)
+
+        queue_depth = GaugeMetricFamily("ichub_executor_queue_depth", "Tasks waiting for a thread of the executor", labels=["executor"])
+        threads = GaugeMetricFamily("ichub_executor_threads", "Threads started by the executor", labels=["executor"])
+        for name, stats in get_executor_stats().items():
+            queue_depth.add_metric([name], stats["queued"])
+            threads.add_metric([name], stats["threads"])
+        yield from (queue_depth, threads)
+
+
+def register_runtime_metrics() -> None:
+    """Publish the cache and executor metrics in the default Prometheus registry, once."""
+    global _collector_registered
+    if REGISTRY is None or _collector_registered:
+        return
+    REGISTRY.register(_RuntimeCollector())
+    _collector_registered = True
@@ -124,6 +124,30 @@ def pcf_submodel_id(manufacturer_part_id: str, version: str = DEFAULT_PCF_VERSIO
     return uuid5(NAMESPACE_URL, f"{manufacturer_part_id}:{version}")
 
 
+def get_pcf_excluding_biogenic(pcf_data: dict) -> float | None:
+    """Return the cradle-to-gate PCF excluding biogenic uptake of a PCF payload.
+
+    * v9.0.0: sum of ``pcfExcludingBiogenicUptake`` over the entries of
+      ``productLifeCycleStagesAndEmissions.productionStage``
+    * v7.0.0: ``pcf.pcfExcludingBiogenic``
+
+    Args:
+        pcf_data: The PCF payload.
+
+    Returns:
+        The value in kg CO2e per declared unit, or ``None`` if the payload does not carry it.
+    """
+    stages = (pcf_data.get("productLifeCycleStagesAndEmissions") or {}).get("productionStage")
+    if isinstance(stages, dict):
+        stages = [stages]
+    if stages:
+        values = [stage.get("pcfExcludingBiogenicUptake") for stage in stages if isinstance(stage, dict)]
+        values = [value for value in values if isinstance(value, (int, float))]
+        return float(sum(values)) if values else None
+    value = (pcf_data.get("pcf") or {}).get("pcfExcludingBiogenic")
+    return float(value) if isinstance(value, (int, float)) else None
+
+
 def get_pcf_submodel_overrides(semantic_id: str) -> dict[str, str] | None:
     """Return ``id_short_override`` and ``interface`` for PCF submodel descriptors.
 
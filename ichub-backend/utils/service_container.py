@@ -0,0 +1,275 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import threading
+import time
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, Optional
+import logging
+
+from tools.exceptions import NotAvailableError
+
+logger = logging.getLogger(__name__)
+
+
+class ServiceState(str, Enum):
+    PENDING = "pending"    # Registered, not started yet (lazy services stay here until first used)
+    STARTING = "starting"
+    READY = "ready"
+    FAILED = "failed"
+
+
+class _Service:
+    def __init__(self, name: str, initializer: Callable[[], Any], depends_on: Iterable[str], wait_for: Iterable[str], critical: bool, lazy: bool):
+        self.name = name
+        self.initializer = initializer
+        self.depends_on = tuple(depends_on)
+        self.wait_for = tuple(wait_for)
+        self.critical = critical
+        self.lazy = lazy
+        self.state = ServiceState.PENDING
+        self.value: Any = None
+        self.error: Optional[str] = None
+        self.startup_seconds: Optional[float] = None
+        self.done = threading.Event()
+
+
+class ServiceContainer:
+    """
+    Lifecycle of the clients the backend depends on (database, connector, DTR, IAM, add-ons).
+
+    Every client is registered with a blocking initializer. On start() the eager ones are
+    initialized in parallel in background threads, each one as soon as the services it depends
+    on are ready, so the server can accept connections while slow dependencies are still coming up.
+    Lazy services are only initialized the first time they are used.
+    """
+
+    _instance: Optional['ServiceContainer'] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, wait_timeout: float = 30):
+        """
+        Args:
+            wait_timeout: Seconds a caller waits for a service that is still starting before giving up.
+        """
+        self.wait_timeout = wait_timeout
+        self._services: Dict[str, _Service] = {}
+        self._lock = threading.Lock()
+        self._started_at: Optional[float] = None
+
+    @classmethod
+    def get_instance(cls) -> 'ServiceContainer':
+        """Return the process-wide container, creating it from the configuration on first use."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                from managers.config.config_manager import ConfigManager
+                cls._instance = cls(
+                    wait_timeout=float(ConfigManager.get_config("server.startup.wait_timeout", default=30))
+                )
+            return cls._instance
+
+    def register(self, name: str, initializer: Callable[[], Any], depends_on: Iterable[str] = (), wait_for: Iterable[str] = (),
+                 critical: bool = True, lazy: bool = False) -> None:
+        """
+        Register a service. Registering a name again replaces it, unless it is already starting or started.
+
+        Args:
+            name: The name of the service, reported in the readiness information.
+            initializer: Blocking function creating the service, its return value is what get() returns.
+            depends_on: Services to be ready before initializing this one. Names not registered
+                (e.g. modules that are disabled) are ignored.
+            wait_for: Services to be started, successfully or not, before initializing this one.
+            critical: Whether the backend is not ready without this service.
+            lazy: Initialize the service on first use instead of on start().
+        """
+        with self._lock:
+            current = self._services.get(name)
+            if current is not None and current.state != ServiceState.PENDING:
+                logger.debug(f"[ServiceContainer] Service [{name}] is already {current.state.value}, keeping it.")
+                return
+            self._services[name] = _Service(name, initializer, depends_on, wait_for, critical, lazy)
+            start_now = self._started_at is not None and not lazy
+        if start_now:
+            self._launch(name)
+
+    def start(self) -> None:
+        """Start initializing all the eager services in the background. It does not wait for them."""
+        with self._lock:
+            if self._started_at is None:
+                self._started_at = time.monotonic()
+            names = [service.name for service in self._services.values() if not service.lazy]
+        for name in names:
+            self._launch(name)
+
+    def _launch(self, name: str) -> Optional[_Service]:
+        with self._lock:
+            service = self._services.get(name)
+            if service is None or service.state != ServiceState.PENDING:
+                return service
+            service.state = ServiceState.STARTING
+        threading.Thread(target=self._initialize, args=(service,), name=f"startup-{name}", daemon=True).start()
+        return service
+
+    def _initialize(self, service: _Service) -> None:
+        started = time.monotonic()
+        try:
+            dependencies = {name: self._launch(name) for name in (*service.depends_on, *service.wait_for)}
+            for dependency_name, dependency in dependencies.items():
+                if dependency is None:
+                    continue
+                dependency.done.wait()
+                if dependency_name in service.depends_on and dependency.state != ServiceState.READY:
+                    raise RuntimeError(f"Dependency [{dependency_name}] is not available: {dependency.error}")
+
+            service.value = service.initializer()
+            service.state = ServiceState.READY
+            service.startup_seconds = time.monotonic() - started
+            logger.info(f"[ServiceContainer] Service [{service.name}] ready in {service.startup_seconds:.2f}s")
+        except Exception as e:
+            service.error = str(e)
+            service.state = ServiceState.FAILED
+            service.startup_seconds = time.monotonic() - started
+            if service.critical:
+                logger.critical(f"[ServiceContainer] Service [{service.name}] failed to start. The application will not work properly without it: {e}")
+            else:
+                logger.warning(f"[ServiceContainer] Optional service [{service.name}] failed to start: {e}")
+        finally:
+            service.done.set()
+
+    def get(self, name: str, timeout: Optional[float] = None) -> Any:
+        """
+        Get a service, initializing it if it was not started yet and waiting while it is starting.
+
+        Args:
+            name: The name of the service.
+            timeout: Seconds to wait for a service still starting. Defaults to the container wait_timeout.
+
+        Raises:
+            NotAvailableError: If the service is unknown, failed to start or is still starting after the timeout.
+        """
+        service = self._launch(name)
+        if service is None:
+            raise NotAvailableError(f"Service '{name}' is not registered.")
+
+        if not service.done.wait(self.wait_timeout if timeout is None else timeout):
+            raise NotAvailableError(f"Service '{name}' is still starting, please try again later.")
+        if service.state != ServiceState.READY:
+            raise NotAvailableError(f"Service '{name}' is not available: {service.error}")
+        return service.value
+
+    def is_ready(self) -> bool:
+        """Whether all the critical eager services are ready."""
+        with self._lock:
+            services = list(self._services.values())
+        return all(service.state == ServiceState.READY for service in services if service.critical and not service.lazy)
+
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until all the eager services finished starting, successfully or not.
+
+        Returns:
+            bool: Whether all the critical eager services are ready.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            services = [service for service in self._services.values() if not service.lazy]
+        for service in services:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not service.done.wait(remaining):
+                return False
+        return self.is_ready()
+
+    def get_status(self) -> Dict[str, Any]:
+        """Readiness information of the backend and of each one of its services."""
+        with self._lock:
+            services = list(self._services.values())
+
+        critical_states = [service.state for service in services if service.critical and not service.lazy]
+        if any(state == ServiceState.FAILED for state in critical_states):
+            status = "FAILED"
+        elif all(state == ServiceState.READY for state in critical_states):
+            status = "READY"
+        else:
+            status = "STARTING"
+
+        return {
+            "status": status,
+            "services": {
+                service.name: {
+                    "state": service.state.value,
+                    "critical": service.critical,
+                    "lazy": service.lazy,
+                    "startupSeconds": round(service.startup_seconds, 3) if service.startup_seconds is not None else None,
+                    "error": service.error
+                }
+                for service in services
+            }
+        }
+
+
+class ServiceProxy:
+    """
+    Stand-in for a module level client created by a container service, resolved on every use.
+
+    Allows modules to keep importing the client (e.g. `from connector import connector_manager`)
+    without creating it at import time.
+    """
+
+    __slots__ = ("_service_name", "_attribute")
+
+    def __init__(self, service_name: str, attribute: Optional[str] = None):
+        """
+        Args:
+            service_name: The name of the container service.
+            attribute: Key of the client in the dictionary returned by the service, if any.
+        """
+        object.__setattr__(self, "_service_name", service_name)
+        object.__setattr__(self, "_attribute", attribute)
+
+    def _resolve(self) -> Any:
+        value = ServiceContainer.get_instance().get(self._service_name)
+        return value[self._attribute] if self._attribute else value
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._resolve(), name)
+
+    def __bool__(self) -> bool:
+        try:
+            return bool(self._resolve())
+        except NotAvailableError:
+            return False
+
+    def __repr__(self) -> str:
+        target = f"{self._service_name}.{self._attribute}" if self._attribute else self._service_name
+        return f"<ServiceProxy {target}>"
+
+
+def require_service(name: str) -> Callable[[], None]:
+    """
+    FastAPI dependency making the routes of a router wait for a service, initializing it if lazy.
+
+    Answers 503 (NotAvailableError) if the service failed or is still starting after the container wait_timeout.
+    """
+    def dependency() -> None:
+        ServiceContainer.get_instance().get(name)
+    return dependency